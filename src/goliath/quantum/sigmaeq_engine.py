@@ -9,6 +9,11 @@ from enum import Enum
 import time
 import json
 from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from nqba_stack.quantum.adapters.annealer import NumpySimulatedAnnealer
+from nqba_stack.quantum.sparse_qubo import SparseQUBO
+from .qaoa_simulator import MAX_STATEVECTOR_QUBITS, QAOASimulator
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +42,7 @@ class ProblemType(Enum):
 class OptimizationProblem:
     """Represents an optimization problem"""
     problem_type: ProblemType
-    data: np.ndarray
+    data: Union[np.ndarray, SparseQUBO]
     constraints: Optional[Dict[str, Any]] = None
     parameters: Optional[Dict[str, Any]] = None
     metadata: Optional[Dict[str, Any]] = None
@@ -111,7 +116,7 @@ class SigmaEQEngine:
         
         try:
             # Validate problem
-            validation = self._validate_problem(problem)
+            validation = self._validate_problem(problem, algorithm)
             if not validation["valid"]:
                 return OptimizationResult(
                     success=False,
@@ -164,44 +169,36 @@ class SigmaEQEngine:
             max_iterations = parameters.get("max_iterations", 100)
             shots = parameters.get("shots", 1000)
             
-            # Initialize parameters
-            gamma = np.random.uniform(0, 2*np.pi, p)
-            beta = np.random.uniform(0, np.pi, p)
-            
-            # Optimization loop
-            convergence_history = []
-            best_solution = None
-            best_value = float('inf')
-            
-            for iteration in range(max_iterations):
-                # Create QAOA circuit
-                circuit = self._create_qaoa_circuit(qubo_matrix, gamma, beta)
-                
-                # Execute circuit
-                result = await self._execute_quantum_circuit(circuit, shots)
-                
-                # Process results
-                solution = self._extract_solution_from_counts(result)
-                value = self._calculate_qubo_value(solution, qubo_matrix)
-                
-                convergence_history.append(value)
-                
-                if value < best_value:
-                    best_value = value
-                    best_solution = solution
-                
-                # Update parameters (simplified gradient descent)
-                if iteration < max_iterations - 1:
-                    gamma += 0.1 * np.random.randn(p)
-                    beta += 0.1 * np.random.randn(p)
+            # Statevector simulation; angles are tuned with SPSA off the event loop
+            simulator = QAOASimulator(
+                qubo_matrix, max_qubits=min(self.max_qubits, MAX_STATEVECTOR_QUBITS)
+            )
+            qaoa = await asyncio.get_running_loop().run_in_executor(
+                None,
+                partial(
+                    simulator.optimize,
+                    p=p,
+                    max_iterations=max_iterations,
+                    shots=shots,
+                    seed=parameters.get("seed"),
+                ),
+            )
             
             return OptimizationResult(
                 success=True,
-                solution=best_solution,
-                optimal_value=best_value,
-                iterations=max_iterations,
-                convergence_history=convergence_history,
-                metadata={"algorithm": "qaoa", "p": p, "shots": shots}
+                solution=qaoa.solution,
+                optimal_value=qaoa.energy,
+                iterations=qaoa.iterations,
+                convergence_history=qaoa.history,
+                metadata={
+                    "algorithm": "qaoa",
+                    "p": p,
+                    "shots": shots,
+                    "backend": "statevector",
+                    "gamma": qaoa.gamma.tolist(),
+                    "beta": qaoa.beta.tolist(),
+                    "expectation": qaoa.expectation,
+                }
             )
             
         except Exception as e:
@@ -373,41 +370,48 @@ class SigmaEQEngine:
         """Quantum annealing optimization implementation"""
         try:
             # Annealing parameters
-            temperature = parameters.get("temperature", 1.0)
-            cooling_rate = parameters.get("cooling_rate", 0.95)
-            max_iterations = parameters.get("max_iterations", 1000)
-            
-            # Initialize system
-            current_state = self._initialize_annealing_state(problem)
-            current_energy = self._calculate_energy(current_state, problem)
+            mode = parameters.get("mode", "anneal")
+            num_sweeps = parameters.get("num_sweeps", parameters.get("max_iterations", 1000))
+            annealer = NumpySimulatedAnnealer(
+                num_reads=parameters.get("num_reads", 16),
+                num_sweeps=num_sweeps,
+                beta_range=self._annealing_beta_range(parameters, num_sweeps),
+                seed=parameters.get("seed"),
+            )
             
-            best_state = current_state.copy()
-            best_energy = current_energy
+            # Many chains as one (variables x chains) batch, off the event loop
+            if mode == "parallel_tempering":
+                sample = partial(
+                    annealer.parallel_tempering,
+                    num_temperatures=parameters.get("num_temperatures", 8),
+                )
+            elif mode == "anneal":
+                sample = annealer.sample_qubo
+            else:
+                return OptimizationResult(
+                    success=False,
+                    error_message=f"Unsupported annealing mode: {mode}"
+                )
+            result = await asyncio.get_running_loop().run_in_executor(
+                None, partial(sample, problem.data, timeout=self.optimization_timeout)
+            )
             
-            # Annealing loop
-            for iteration in range(max_iterations):
-                # Generate neighbor state
-                neighbor_state = self._generate_neighbor_state(current_state)
-                neighbor_energy = self._calculate_energy(neighbor_state, problem)
-                
-                # Accept or reject based on Metropolis criterion
-                if self._accept_transition(current_energy, neighbor_energy, temperature):
-                    current_state = neighbor_state
-                    current_energy = neighbor_energy
-                    
-                    if current_energy < best_energy:
-                        best_state = current_state.copy()
-                        best_energy = current_energy
-                
-                # Cool down
-                temperature *= cooling_rate
+            # Samples are in the annealer's variable order
+            solution = np.zeros(len(result.variables), dtype=int)
+            solution[np.asarray(result.variables)] = result.samples[result.best_index]
             
             return OptimizationResult(
                 success=True,
-                solution=best_state,
-                optimal_value=best_energy,
-                iterations=max_iterations,
-                metadata={"algorithm": "quantum_annealing", "final_temperature": temperature}
+                solution=solution,
+                optimal_value=result.best_energy,
+                iterations=result.num_sweeps,
+                metadata={
+                    "algorithm": "quantum_annealing",
+                    "mode": mode,
+                    "beta_range": list(result.beta_range),
+                    "timed_out": result.timed_out,
+                    **result.info,
+                }
             )
             
         except Exception as e:
@@ -417,6 +421,21 @@ class SigmaEQEngine:
                 error_message=str(e)
             )
     
+    @staticmethod
+    def _annealing_beta_range(parameters: Dict[str, Any], num_sweeps: int) -> Optional[Tuple[float, float]]:
+        """
+        Explicit ``beta_range``, or the one implied by geometric cooling from
+        ``temperature`` by ``cooling_rate`` per sweep; None picks it from the
+        problem's energy scale.
+        """
+        if "beta_range" in parameters:
+            return tuple(parameters["beta_range"])
+        if "temperature" in parameters:
+            temperature = parameters["temperature"]
+            cooling_rate = parameters.get("cooling_rate", 0.95)
+            return (1.0 / temperature, 1.0 / (temperature * cooling_rate ** num_sweeps))
+        return None
+    
     async def _hybrid_optimization(self, 
                                  problem: OptimizationProblem, 
                                  parameters: Dict[str, Any]) -> OptimizationResult:
@@ -471,7 +490,9 @@ class SigmaEQEngine:
                 error_message=str(e)
             )
     
-    def _validate_problem(self, problem: OptimizationProblem) -> Dict[str, Any]:
+    def _validate_problem(self,
+                          problem: OptimizationProblem,
+                          algorithm: Optional[OptimizationAlgorithm] = None) -> Dict[str, Any]:
         """Validate optimization problem"""
         errors = []
         warnings = []
@@ -479,8 +500,13 @@ class SigmaEQEngine:
         if problem.data is None:
             errors.append("Problem data is required")
         
-        if problem.data is not None and problem.data.size > self.max_qubits:
-            errors.append(f"Problem size {problem.data.size} exceeds max qubits {self.max_qubits}")
+        # A QUBO matrix needs one qubit per row, not per entry. Annealing is
+        # sampled classically, so it is not bound by the qubit budget.
+        if problem.data is not None and algorithm != OptimizationAlgorithm.QUANTUM_ANNEALING:
+            shape = problem.data.shape
+            size = shape[0] if len(shape) == 2 else problem.data.size
+            if size > self.max_qubits:
+                errors.append(f"Problem size {size} exceeds max qubits {self.max_qubits}")
         
         if problem.problem_type not in ProblemType:
             errors.append(f"Unsupported problem type: {problem.problem_type}")
@@ -495,39 +521,27 @@ class SigmaEQEngine:
         """Create QAOA circuit for QUBO optimization"""
         n_variables = qubo_matrix.shape[0]
         
-        circuit = {
+        # The cost layer is diagonal, so the QUBO itself describes it
+        return {
             "qubits": n_variables,
-            "gates": [],
+            "qubo": qubo_matrix,
+            "gamma": np.asarray(gamma, dtype=float),
+            "beta": np.asarray(beta, dtype=float),
             "measurements": list(range(n_variables)),
             "type": "qaoa"
         }
-        
-        # Add parameterized gates
-        for p in range(len(gamma)):
-            # Cost Hamiltonian (phase separator)
-            for i in range(n_variables):
-                for j in range(n_variables):
-                    if qubo_matrix[i, j] != 0:
-                        circuit["gates"].append({
-                            "type": "rz",
-                            "target": i,
-                            "parameter": f"gamma_{p}_{i}_{j}",
-                            "value": gamma[p] * qubo_matrix[i, j]
-                        })
-            
-            # Mixing Hamiltonian
-            for i in range(n_variables):
-                circuit["gates"].append({
-                    "type": "rx",
-                    "target": i,
-                    "parameter": f"beta_{p}_{i}",
-                    "value": beta[p]
-                })
-        
-        return circuit
     
     async def _execute_quantum_circuit(self, circuit: Dict[str, Any], shots: int) -> Dict[str, Any]:
-        """Execute quantum circuit (placeholder for actual quantum execution)"""
+        """Execute quantum circuit; QAOA circuits run on the statevector simulator"""
+        if circuit.get("type") == "qaoa":
+            simulator = QAOASimulator(
+                circuit["qubo"], max_qubits=min(self.max_qubits, MAX_STATEVECTOR_QUBITS)
+            )
+            counts = await asyncio.get_running_loop().run_in_executor(
+                None, simulator.measure, circuit["gamma"], circuit["beta"], shots
+            )
+            return {"counts": counts, "success": True, "backend": "statevector"}
+        
         # This would integrate with the quantum adapter
         return {
             "counts": {"0" * circuit["qubits"]: shots},
@@ -610,24 +624,6 @@ class SigmaEQEngine:
     def _extract_adiabatic_solution(self, final_state: np.ndarray) -> np.ndarray:
         return np.array([int(bit > 0.5) for bit in final_state])
     
-    def _initialize_annealing_state(self, problem: OptimizationProblem) -> np.ndarray:
-        return np.random.randint(0, 2, problem.data.shape[0])
-    
-    def _calculate_energy(self, state: np.ndarray, problem: OptimizationProblem) -> float:
-        return np.random.random()
-    
-    def _generate_neighbor_state(self, state: np.ndarray) -> np.ndarray:
-        neighbor = state.copy()
-        flip_idx = np.random.randint(0, len(neighbor))
-        neighbor[flip_idx] = 1 - neighbor[flip_idx]
-        return neighbor
-    
-    def _accept_transition(self, current_energy: float, neighbor_energy: float, temperature: float) -> bool:
-        if neighbor_energy < current_energy:
-            return True
-        probability = np.exp((current_energy - neighbor_energy) / temperature)
-        return np.random.random() < probability
-    
     def _initialize_quantum_state(self, problem: OptimizationProblem) -> Dict[str, Any]:
         return {"type": "quantum", "data": np.random.random(problem.data.shape[0])}
     
@@ -230,22 +230,13 @@ __all__ = [
 
 # Initialize core components on import
 try:
-    # Get global instances
+    # Get global instances; nothing is written to the LTC database here so
+    # that importing the package (e.g. in spawned worker processes) has no
+    # side effects on the audit chain
     orchestrator = get_orchestrator()
     ltc_logger = get_ltc_logger()
     settings = get_settings()
 
-    # Log successful initialization
-    ltc_logger.log_operation(
-        operation_type="nqba_stack_initialized",
-        operation_data={
-            "version": __version__,
-            "components": ["orchestrator", "ltc_logger", "settings"],
-            "status": "ready",
-        },
-        thread_ref="NQBA_STACK_INIT",
-    )
-
 except Exception as e:
     # Log initialization error
     print(f"Warning: NQBA Stack initialization failed: {e}")
@@ -21,6 +21,7 @@ from .high_council import router as high_council_router
 from .monitoring import router as monitoring_router
 from .auth import router as auth_router
 from .qih import router as qih_router
+from ..quantum.qih import get_qih
 from ..business_integration import business_unit_manager
 from ..business_integration.flyfox_ai import FLYFOXAIBusinessUnit
 from ..core.settings import get_settings
@@ -67,6 +68,10 @@ async def lifespan(app: FastAPI):
         _ = AuthManager()  # Initialize AuthManager
         logger.info("✅ Authentication system initialized")
 
+        # Open the QIH job store and reclaim unowned unfinished jobs
+        get_qih()
+        logger.info("✅ Quantum Integration Hub ready")
+
         logger.info("🚀 NQBA Stack API startup complete!")
 
     except Exception as e:
@@ -83,6 +88,10 @@ async def lifespan(app: FastAPI):
         await business_unit_manager.shutdown()
         logger.info("✅ Business unit manager shutdown complete")
 
+        # Release QIH job leases so another process can pick them up
+        get_qih().job_store.close()
+        logger.info("✅ QIH job store closed")
+
         logger.info("✅ NQBA Stack API shutdown complete!")
 
     except Exception as e:
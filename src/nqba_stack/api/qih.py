@@ -3,21 +3,28 @@ Quantum Integration Hub (QIH) API Endpoints
 
 This module provides FastAPI endpoints for the QIH system, including:
 - Job submission and management
+- Batch submission, polling and streamed results
 - Job status queries
 - Usage metrics and analytics
 - Solver information and health checks
 """
 
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Dict, List, Optional, Any
 from pydantic import BaseModel, Field
+import asyncio
+import hashlib
+import json
 import logging
 
 from ..quantum.qih import (
     get_qih,
     submit_optimization_job,
+    submit_optimization_batch,
     get_job_status,
+    get_batch_status,
     get_user_jobs,
     OptimizationRequest,
     JobStatus,
@@ -48,6 +55,17 @@ class OptimizationRequestModel(BaseModel):
     )
 
 
+class BatchOptimizationRequestModel(BaseModel):
+    """API model for batch optimization requests"""
+
+    requests: List[OptimizationRequestModel] = Field(
+        ..., min_length=1, max_length=1000, description="Optimization requests"
+    )
+    idempotency_key: Optional[str] = Field(
+        None, description="Key that makes resubmitting the whole batch a no-op"
+    )
+
+
 class JobResponseModel(BaseModel):
     """API model for job responses"""
 
@@ -146,41 +164,10 @@ async def submit_job(
     """
     try:
         # Convert API model to internal model
-        solver_pref = None
-        if request.solver_preference:
-            try:
-                solver_pref = SolverType(request.solver_preference)
-            except ValueError:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid solver preference: {request.solver_preference}",
-                )
-
-        priority = JobPriority.NORMAL
-        if request.priority:
-            try:
-                priority = JobPriority(request.priority)
-            except ValueError:
-                raise HTTPException(
-                    status_code=400, detail=f"Invalid priority: {request.priority}"
-                )
-
-        # Create internal optimization request
-        opt_request = OptimizationRequest(
-            operation=request.operation,
-            inputs=request.inputs,
-            solver_preference=solver_pref,
-            timeout_seconds=request.timeout_seconds,
-            priority=priority,
-            metadata=request.metadata,
-        )
+        opt_request = _to_optimization_request(request)
 
         # Generate idempotency key from request content
-        import hashlib
-
-        request_hash = hashlib.sha256(
-            f"{current_user}:{request.operation}:{str(request.inputs)}".encode()
-        ).hexdigest()
+        request_hash = _request_idempotency_key(current_user, request)
 
         # Submit job
         job_id = submit_optimization_job(current_user, opt_request, request_hash)
@@ -198,6 +185,133 @@ async def submit_job(
         raise HTTPException(status_code=500, detail=f"Failed to submit job: {str(e)}")
 
 
+def _request_idempotency_key(user_id: str, request: OptimizationRequestModel) -> str:
+    """Content-derived idempotency key shared by job and batch submission"""
+    return hashlib.sha256(
+        f"{user_id}:{request.operation}:{str(request.inputs)}".encode()
+    ).hexdigest()
+
+
+def _to_optimization_request(request: OptimizationRequestModel) -> OptimizationRequest:
+    """Convert an API request model, rejecting unknown solvers and priorities"""
+    try:
+        solver_pref = (
+            SolverType(request.solver_preference) if request.solver_preference else None
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid solver preference: {request.solver_preference}",
+        )
+
+    try:
+        priority = JobPriority(request.priority) if request.priority else None
+    except ValueError:
+        raise HTTPException(
+            status_code=400, detail=f"Invalid priority: {request.priority}"
+        )
+
+    return OptimizationRequest(
+        operation=request.operation,
+        inputs=request.inputs,
+        solver_preference=solver_pref,
+        timeout_seconds=request.timeout_seconds,
+        priority=priority or JobPriority.NORMAL,
+        metadata=request.metadata,
+    )
+
+
+@router.post("/batches", response_model=Dict[str, Any])
+@require_feature(Feature.API_ACCESS)
+async def submit_batch(
+    batch: BatchOptimizationRequestModel,
+    current_user: str = Depends(get_current_user),
+):
+    """
+    Submit several optimization jobs as one batch
+
+    Each item is deduplicated against previously submitted jobs exactly as
+    POST /jobs would; compatible QUBO jobs are solved together in one pass.
+    Poll GET /batches/{batch_id} or stream GET /batches/{batch_id}/results.
+    """
+    try:
+        opt_requests = [_to_optimization_request(item) for item in batch.requests]
+        item_keys = [
+            _request_idempotency_key(current_user, item) for item in batch.requests
+        ]
+        batch_key = (
+            f"{current_user}:{batch.idempotency_key}" if batch.idempotency_key else None
+        )
+
+        batch_id = submit_optimization_batch(
+            current_user, opt_requests, batch_key, item_keys
+        )
+        batch_data = get_batch_status(batch_id)
+
+        logger.info(f"Batch submitted successfully: {batch_id} for user {current_user}")
+
+        return {
+            "batch_id": batch_id,
+            "job_ids": [job["job_id"] for job in batch_data["jobs"]],
+            "status": "submitted",
+            "message": "Batch submitted successfully and queued for processing",
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error submitting batch: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to submit batch: {str(e)}")
+
+
+def _owned_batch(batch_id: str, current_user: str) -> Dict[str, Any]:
+    """Batch status, or 404/403 if it is missing or belongs to someone else"""
+    batch_data = get_batch_status(batch_id)
+    if not batch_data:
+        raise HTTPException(status_code=404, detail="Batch not found")
+    if batch_data["user_id"] != current_user:
+        raise HTTPException(status_code=403, detail="Access denied to this batch")
+    return batch_data
+
+
+@router.get("/batches/{batch_id}", response_model=Dict[str, Any])
+@require_feature(Feature.API_ACCESS)
+async def get_batch_status_endpoint(
+    batch_id: str, current_user: str = Depends(get_current_user)
+):
+    """
+    Get per-status counts and per-job status for a batch
+    """
+    return _owned_batch(batch_id, current_user)
+
+
+@router.get("/batches/{batch_id}/results")
+@require_feature(Feature.API_ACCESS)
+async def stream_batch_results(
+    batch_id: str,
+    timeout_seconds: float = 300,
+    current_user: str = Depends(get_current_user),
+):
+    """
+    Stream batch results as newline-delimited JSON
+
+    Each line is one finished job, written as soon as it completes or fails.
+    The stream ends when every job has finished or no job finished within
+    ``timeout_seconds``.
+    """
+    _owned_batch(batch_id, current_user)
+    qih = get_qih()
+
+    async def result_lines():
+        try:
+            async for job_data in qih.iter_batch_results(batch_id, timeout_seconds):
+                yield json.dumps(job_data, default=str) + "\n"
+        except asyncio.TimeoutError:
+            yield json.dumps({"batch_id": batch_id, "error": "timeout"}) + "\n"
+
+    return StreamingResponse(result_lines(), media_type="application/x-ndjson")
+
+
 @router.get("/jobs/{job_id}", response_model=JobStatusResponseModel)
 @require_feature(Feature.API_ACCESS)
 async def get_job_status_endpoint(
@@ -508,14 +622,8 @@ async def cancel_job(job_id: str, current_user: str = Depends(get_current_user))
                 status_code=400, detail=f"Cannot cancel job in {job.status.value} state"
             )
 
-        # Remove from queue if queued
-        if job_id in qih.job_queue:
-            qih.job_queue.remove(job_id)
-
-        # Mark as cancelled
-        job.status = JobStatus.FAILED
-        job.error = "Cancelled by user"
-        job.completed_at = qih.jobs[job_id].__class__.completed_at.__class__.utcnow()
+        # Dequeue, or stop the solver if the job is already running
+        await qih.cancel_job(job_id)
 
         logger.info(f"Job {job_id} cancelled by user {current_user}")
 
@@ -565,6 +673,7 @@ async def retry_job(job_id: str, current_user: str = Depends(get_current_user)):
         job.completed_at = None
         job.error = None
         job.retry_count = 0
+        qih.persist_job(job)
 
         # Re-add to queue
         qih._add_to_queue(job_id)
@@ -594,12 +703,12 @@ async def get_global_metrics():
         # Add additional system metrics
         metrics.update(
             {
-                "active_jobs": len(
-                    [j for j in qih.jobs.values() if j.status.value == "running"]
-                ),
+                "active_jobs": qih.count_jobs(JobStatus.RUNNING),
                 "queued_jobs": len(qih.job_queue),
                 "circuit_breaker_status": qih.circuit_breaker.state,
                 "available_solvers": len(qih.solvers),
+                "queue": qih.get_queue_metrics(),
+                "result_cache": qih.get_cache_stats(),
             }
         )
 
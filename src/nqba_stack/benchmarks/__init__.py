@@ -6,19 +6,23 @@ over classical solvers for optimization problems.
 """
 
 from .benchmark_runner import BenchmarkRunner, BenchmarkConfig, BenchmarkResult
+from .harness import BenchmarkCell, BenchmarkCheckpoint, BenchmarkHarness
 from .problems import (
     PortfolioOptimization,
     TravelingSalesman,
     KnapsackProblem,
     get_all_problems,
 )
-from .solvers import ClassicalSolver, QuantumSolver, DynexSolver
+from .solvers import ClassicalSolver, QuantumSolver, DynexSolver, ReferenceSolver
 from .reports import BenchmarkReport, PerformanceMetrics, generate_all_reports
 
 __all__ = [
     "BenchmarkRunner",
     "BenchmarkConfig",
     "BenchmarkResult",
+    "BenchmarkCell",
+    "BenchmarkCheckpoint",
+    "BenchmarkHarness",
     "PortfolioOptimization",
     "TravelingSalesman",
     "KnapsackProblem",
@@ -26,6 +30,7 @@ __all__ = [
     "ClassicalSolver",
     "QuantumSolver",
     "DynexSolver",
+    "ReferenceSolver",
     "BenchmarkReport",
     "PerformanceMetrics",
     "generate_all_reports",
@@ -15,6 +15,7 @@ from pathlib import Path
 
 from .problems import OptimizationProblem
 from .solvers import ClassicalSolver, QuantumSolver
+from .harness import DEFAULT_SOLVERS, BenchmarkHarness
 from .reports import BenchmarkReport, PerformanceMetrics
 
 logger = logging.getLogger(__name__)
@@ -30,6 +31,9 @@ class BenchmarkConfig:
     output_dir: str = "benchmark_results"
     save_detailed: bool = True
     compare_solutions: bool = True
+    base_seed: int = 42
+    max_workers: Optional[int] = None
+    checkpoint_file: str = "benchmark_checkpoint.jsonl"
 
 
 @dataclass
@@ -106,6 +110,54 @@ class BenchmarkRunner:
 
         return report
 
+    async def run_parallel_benchmark(
+        self,
+        problems: List[OptimizationProblem],
+        solvers: Optional[List[str]] = None,
+        resume: bool = True,
+    ) -> BenchmarkReport:
+        """
+        Run every problem × solver × iteration cell across a process pool.
+
+        Each finished cell is checkpointed under the output directory, so an
+        interrupted run picks up where it stopped when called again.
+        """
+        harness = BenchmarkHarness(
+            problems,
+            solvers=solvers or DEFAULT_SOLVERS,
+            problem_size=self.config.problem_size,
+            iterations=self.config.iterations,
+            timeout_seconds=self.config.timeout_seconds,
+            checkpoint_path=self.output_dir / self.config.checkpoint_file,
+            base_seed=self.config.base_seed,
+            max_workers=self.config.max_workers,
+        )
+
+        start_time = time.time()
+        records = await harness.run(resume=resume)
+        logger.info(
+            f"Parallel benchmark finished {harness.executed} cells "
+            f"({harness.skipped} resumed) in {time.time() - start_time:.2f} seconds"
+        )
+
+        for record in records:
+            result = BenchmarkResult(**record)
+            if "error" not in result.metadata:
+                result.energy_consumption = self._estimate_energy_consumption(
+                    result.execution_time, result.solver_name
+                )
+                result.cost_per_solution = self._estimate_cost(
+                    result.execution_time, result.solver_name
+                )
+            self.results.append(result)
+
+        report = self._generate_report()
+
+        if self.config.save_detailed:
+            self._save_detailed_results()
+
+        return report
+
     async def _run_single_benchmark(
         self, problem: OptimizationProblem, solver: Any, solver_name: str
     ) -> BenchmarkResult:
@@ -0,0 +1,395 @@
+"""
+Benchmark Harness - Parallel, Resumable Benchmark Execution
+
+Runs the problems × solvers × iterations grid of a benchmark as independent
+cells:
+- Cells execute across a process pool, each with a pinned seed derived from
+  (problem, size, iteration) so both solvers see the same instance
+- Per cell: wall time, CPU time, peak RSS and tracemalloc peak, and quality
+- Results are appended to a JSONL checkpoint as each cell finishes
+- A rerun loads the checkpoint and skips cells that already completed;
+  cells that errored or timed out are run again
+- The cell deadline is enforced from the parent process, and a worker
+  stuck in a solve that never yields is terminated and replaced
+"""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import time
+import tracemalloc
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from .problems import OptimizationProblem, get_problem_by_name
+from .solvers import (
+    BaseSolver,
+    ClassicalSolver,
+    QuantumSolver,
+    ReferenceSolver,
+    get_solver_by_name,
+)
+
+logger = logging.getLogger(__name__)
+
+# Solver labels used by BenchmarkRunner reports
+SOLVER_LABELS = {
+    "Classical": ClassicalSolver,
+    "Quantum": QuantumSolver,
+    "Reference": ReferenceSolver,
+}
+
+DEFAULT_SOLVERS = ("Classical", "Quantum")
+
+# Extra seconds a pool worker gets past the cell timeout before it is killed
+WORKER_GRACE_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class BenchmarkCell:
+    """One problem/solver/iteration unit of a benchmark grid"""
+
+    problem_name: str
+    solver_name: str
+    problem_size: int
+    iteration: int
+    seed: int
+
+    @property
+    def cell_id(self) -> str:
+        return (
+            f"{self.problem_name}:{self.solver_name}:"
+            f"{self.problem_size}:{self.iteration}:{self.seed}"
+        )
+
+
+def cell_seed(base_seed: int, problem_name: str, size: int, iteration: int) -> int:
+    """Deterministic seed shared by every solver on the same instance"""
+    key = f"{problem_name}:{size}:{iteration}".encode()
+    return (zlib.crc32(key) ^ base_seed) & 0x7FFFFFFF
+
+
+def _create_solver(name: str) -> BaseSolver:
+    solver_class = SOLVER_LABELS.get(name)
+    return solver_class() if solver_class else get_solver_by_name(name)
+
+
+def _reset_peak_rss():
+    """Reset the kernel's RSS high-water mark for this process (Linux only)"""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def measure_benchmark_cell(
+    cell: BenchmarkCell, timeout_seconds: float, trace_memory: bool = True
+) -> Dict[str, Any]:
+    """
+    Execute one cell and return its BenchmarkResult fields.
+
+    Tracing memory slows allocation-heavy solvers; disable it for pure
+    timing runs.
+    """
+    random.seed(cell.seed)
+    np.random.seed(cell.seed)
+
+    problem = get_problem_by_name(cell.problem_name)
+    solver = _create_solver(cell.solver_name)
+    problem_data = problem.prepare_data(cell.problem_size)
+    problem._set_current_data(problem_data)
+    # prepare_data seeds NumPy itself; re-pin so solver randomness is per cell
+    np.random.seed(cell.seed)
+
+    _reset_peak_rss()
+    if trace_memory:
+        tracemalloc.start()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    metadata: Dict[str, Any] = {
+        "cell_id": cell.cell_id,
+        "iteration": cell.iteration,
+        "seed": cell.seed,
+        "problem_size": cell.problem_size,
+        "solver_version": getattr(solver, "version", "unknown"),
+        "pid": os.getpid(),
+    }
+    quality = 0.0
+    try:
+        solution = await asyncio.wait_for(
+            solver.solve(problem_data.data), timeout_seconds
+        )
+        quality = float(problem.evaluate_solution(solution))
+        # e.g. whether a reference baseline is exact or approximate
+        metadata.update(getattr(solver, "last_solve_metadata", {}))
+    except asyncio.TimeoutError:
+        metadata["error"] = "timeout"
+    except Exception as e:
+        metadata["error"] = str(e)
+    finally:
+        wall_time = time.perf_counter() - wall_start
+        cpu_time = time.process_time() - cpu_start
+        if trace_memory:
+            metadata["tracemalloc_peak_mb"] = tracemalloc.get_traced_memory()[1] / 1e6
+            tracemalloc.stop()
+
+    metadata["cpu_time"] = cpu_time
+    metadata["timestamp"] = time.time()
+    return {
+        "problem_name": cell.problem_name,
+        "solver_name": cell.solver_name,
+        "execution_time": wall_time,
+        "solution_quality": quality,
+        "memory_usage": _peak_rss_mb(),
+        "metadata": metadata,
+    }
+
+
+def run_benchmark_cell(
+    cell: BenchmarkCell, timeout_seconds: float, trace_memory: bool = True
+) -> Dict[str, Any]:
+    """Process pool entry point for ``measure_benchmark_cell``"""
+    return asyncio.run(measure_benchmark_cell(cell, timeout_seconds, trace_memory))
+
+
+def failed_cell_record(
+    cell: BenchmarkCell, error: str, wall_time: float
+) -> Dict[str, Any]:
+    """Result for a cell whose worker had to be abandoned"""
+    return {
+        "problem_name": cell.problem_name,
+        "solver_name": cell.solver_name,
+        "execution_time": wall_time,
+        "solution_quality": 0.0,
+        "memory_usage": 0.0,
+        "metadata": {
+            "cell_id": cell.cell_id,
+            "iteration": cell.iteration,
+            "seed": cell.seed,
+            "problem_size": cell.problem_size,
+            "error": error,
+            "timestamp": time.time(),
+        },
+    }
+
+
+def _new_worker() -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def _kill_worker(executor: ProcessPoolExecutor):
+    """Terminate a worker that is stuck in a solve"""
+    # ProcessPoolExecutor has no public way to stop a running call
+    for process in list(getattr(executor, "_processes", {}).values()):
+        process.terminate()
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+class BenchmarkCheckpoint:
+    """Append-only JSONL record of finished cells"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Finished cell results keyed by cell id; a torn last line is ignored"""
+        completed: Dict[str, Dict[str, Any]] = {}
+        if not self.path.exists():
+            return completed
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(
+                        f"Skipping unreadable checkpoint line in {self.path}"
+                    )
+                    continue
+                completed[record["metadata"]["cell_id"]] = record
+        return completed
+
+    def append(self, record: Dict[str, Any]):
+        """Durably add one finished cell"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a") as f:
+            f.write(json.dumps(record, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def clear(self):
+        self.path.unlink(missing_ok=True)
+
+
+class BenchmarkHarness:
+    """
+    Runs benchmark cells in parallel with checkpointing and resume.
+
+    Each of ``max_workers`` slots owns one worker process. A cell that runs
+    ``WORKER_GRACE_SECONDS`` past its timeout is recorded as timed out and
+    its worker is replaced, so CPU-bound solves that never await cannot
+    block a slot. ``max_workers=0`` runs cells inline in the calling
+    process, which is useful for debugging and profiling but only enforces
+    the timeout on solvers that yield to the event loop.
+    """
+
+    def __init__(
+        self,
+        problems: Sequence[Union[str, OptimizationProblem]],
+        solvers: Sequence[str] = DEFAULT_SOLVERS,
+        problem_size: int = 100,
+        iterations: int = 10,
+        timeout_seconds: float = 300,
+        checkpoint_path: Union[str, Path] = "benchmark_checkpoint.jsonl",
+        base_seed: int = 42,
+        max_workers: Optional[int] = None,
+        trace_memory: bool = True,
+    ):
+        self.problem_names = [p if isinstance(p, str) else p.name for p in problems]
+        self.solvers = list(solvers)
+        self.problem_size = problem_size
+        self.iterations = iterations
+        self.timeout_seconds = timeout_seconds
+        self.checkpoint = BenchmarkCheckpoint(checkpoint_path)
+        self.base_seed = base_seed
+        self.max_workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+        self.trace_memory = trace_memory
+
+        self.executed = 0
+        self.skipped = 0
+
+    def cells(self) -> List[BenchmarkCell]:
+        """Every cell of the grid, interleaving solvers per instance"""
+        return [
+            BenchmarkCell(
+                problem_name=problem,
+                solver_name=solver,
+                problem_size=self.problem_size,
+                iteration=iteration,
+                seed=cell_seed(self.base_seed, problem, self.problem_size, iteration),
+            )
+            for problem in self.problem_names
+            for iteration in range(self.iterations)
+            for solver in self.solvers
+        ]
+
+    async def run(
+        self, resume: bool = True, retry_failed: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Run all unfinished cells and return every cell's result in grid order.
+
+        With ``retry_failed`` (the default) checkpointed cells that errored
+        or timed out are run again; their new result supersedes the old one.
+        """
+        if not resume:
+            self.checkpoint.clear()
+        completed = self.checkpoint.load()
+        cells = self.cells()
+        pending = [
+            cell
+            for cell in cells
+            if cell.cell_id not in completed
+            or (retry_failed and "error" in completed[cell.cell_id]["metadata"])
+        ]
+        self.skipped = len(cells) - len(pending)
+        logger.info(
+            f"Benchmark harness: {len(pending)} cells to run, "
+            f"{self.skipped} already checkpointed"
+        )
+
+        if pending:
+            if self.max_workers == 0:
+                for cell in pending:
+                    record = await measure_benchmark_cell(
+                        cell, self.timeout_seconds, self.trace_memory
+                    )
+                    self._record(completed, record)
+            else:
+                await self._run_pool(pending, completed)
+
+        return [completed[cell.cell_id] for cell in cells]
+
+    async def _run_pool(
+        self, pending: List[BenchmarkCell], completed: Dict[str, Dict[str, Any]]
+    ):
+        queue = deque(pending)
+        workers = min(self.max_workers, len(pending))
+        await asyncio.gather(
+            *(self._run_worker(queue, completed) for _ in range(workers))
+        )
+
+    async def _run_worker(
+        self, queue: "deque[BenchmarkCell]", completed: Dict[str, Dict[str, Any]]
+    ):
+        """Feed cells to one worker process, replacing it if a cell overruns"""
+        loop = asyncio.get_running_loop()
+        executor = _new_worker()
+        try:
+            while queue:
+                cell = queue.popleft()
+                start = time.perf_counter()
+                future = loop.run_in_executor(
+                    executor,
+                    run_benchmark_cell,
+                    cell,
+                    self.timeout_seconds,
+                    self.trace_memory,
+                )
+                try:
+                    record = await asyncio.wait_for(
+                        future, self.timeout_seconds + WORKER_GRACE_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    logger.warning(f"Cell {cell.cell_id} overran; restarting worker")
+                    record = failed_cell_record(
+                        cell, "timeout", time.perf_counter() - start
+                    )
+                    _kill_worker(executor)
+                    executor = _new_worker()
+                except BrokenProcessPool as e:
+                    record = failed_cell_record(
+                        cell, f"worker died: {e}", time.perf_counter() - start
+                    )
+                    executor = _new_worker()
+                self._record(completed, record)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _record(self, completed: Dict[str, Dict[str, Any]], record: Dict[str, Any]):
+        self.checkpoint.append(record)
+        completed[record["metadata"]["cell_id"]] = record
+        self.executed += 1
+        logger.info(
+            f"{record['solver_name']} on {record['problem_name']} "
+            f"(iteration {record['metadata']['iteration']}): "
+            f"{record['execution_time']:.3f}s, quality {record['solution_quality']:.3f}"
+        )
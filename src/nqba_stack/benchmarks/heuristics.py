@@ -0,0 +1,322 @@
+"""
+Reference Heuristics for NQBA Stack Benchmarks
+
+Fast classical baselines used by ReferenceSolver:
+- Vectorized tour evaluation for single tours and whole populations
+- Nearest-neighbour construction plus 2-opt and Or-opt local search driven
+  by k-nearest neighbour lists and don't-look bits
+- 0/1 knapsack by dynamic programming, exact on integral weights and over a
+  scaled integer capacity otherwise, with decisions kept in a packed bitset
+  for backtracking
+"""
+
+from collections import deque
+from typing import List, Sequence
+
+import numpy as np
+
+# Smallest improvement accepted by the local search
+EPSILON = 1e-10
+
+
+def tour_length(tour: Sequence[int], distance_matrix: np.ndarray) -> float:
+    """Length of a closed tour"""
+    tour = np.asarray(tour)
+    return float(distance_matrix[tour, np.roll(tour, -1)].sum())
+
+
+def tour_lengths(tours: np.ndarray, distance_matrix: np.ndarray) -> np.ndarray:
+    """Lengths of a (population, n) array of closed tours"""
+    tours = np.asarray(tours)
+    return distance_matrix[tours, np.roll(tours, -1, axis=1)].sum(axis=1)
+
+
+def neighbour_lists(distance_matrix: np.ndarray, k: int = 10) -> np.ndarray:
+    """The ``k`` nearest other cities of every city, closest first"""
+    n = len(distance_matrix)
+    k = max(1, min(k, n - 1))
+    masked = distance_matrix + np.diag(np.full(n, np.inf))
+    nearest = np.argpartition(masked, k - 1, axis=1)[:, :k]
+    order = np.take_along_axis(masked, nearest, axis=1).argsort(axis=1)
+    return np.take_along_axis(nearest, order, axis=1)
+
+
+def nearest_neighbour_tour(distance_matrix: np.ndarray, start: int = 0) -> List[int]:
+    """Greedy nearest-neighbour tour"""
+    n = len(distance_matrix)
+    visited = np.zeros(n, dtype=bool)
+    tour = [start]
+    visited[start] = True
+    current = start
+    for _ in range(n - 1):
+        row = np.where(visited, np.inf, distance_matrix[current])
+        current = int(row.argmin())
+        visited[current] = True
+        tour.append(current)
+    return tour
+
+
+def two_opt(
+    tour: Sequence[int],
+    distance_matrix: np.ndarray,
+    neighbours: np.ndarray,
+    max_moves: int = 1_000_000,
+) -> List[int]:
+    """
+    2-opt restricted to neighbour-list candidates.
+
+    For a city ``a`` only edges towards its nearest neighbours ``c`` are
+    tried, in both tour directions; cities whose surroundings did not change
+    are skipped via don't-look bits.
+    """
+    n = len(tour)
+    if n < 5:
+        return list(tour)
+    d = distance_matrix.tolist()
+    near = neighbours.tolist()
+    tour = list(tour)
+    pos = [0] * n
+    for i, city in enumerate(tour):
+        pos[city] = i
+
+    queue = deque(tour)
+    queued = [True] * n
+    moves = 0
+    while queue and moves < max_moves:
+        a = queue.popleft()
+        queued[a] = False
+        improved = False
+        for direction in (1, -1):
+            i = pos[a]
+            b = tour[(i + direction) % n]
+            d_ab = d[a][b]
+            for c in near[a]:
+                d_ac = d[a][c]
+                if d_ac >= d_ab:
+                    break
+                j = pos[c]
+                e = tour[(j + direction) % n]
+                if c == b or e == a:
+                    continue
+                delta = d_ac + d[b][e] - d_ab - d[c][e]
+                if delta < -EPSILON:
+                    # Replace (a,b),(c,e) with (a,c),(b,e)
+                    if direction == 1:
+                        _reverse(tour, pos, (i + 1) % n, j)
+                    else:
+                        _reverse(tour, pos, j, (i - 1) % n)
+                    for city in (a, b, c, e):
+                        if not queued[city]:
+                            queued[city] = True
+                            queue.append(city)
+                    moves += 1
+                    improved = True
+                    break
+            if improved:
+                break
+    return tour
+
+
+def or_opt(
+    tour: Sequence[int],
+    distance_matrix: np.ndarray,
+    neighbours: np.ndarray,
+    max_segment: int = 3,
+    max_passes: int = 10,
+) -> List[int]:
+    """
+    Or-opt: move segments of 1..``max_segment`` cities, possibly reversed,
+    next to a neighbour-list candidate of either segment end.
+    """
+    n = len(tour)
+    if n < max_segment + 3:
+        return list(tour)
+    d = distance_matrix.tolist()
+    near = neighbours.tolist()
+    tour = list(tour)
+    pos = [0] * n
+    for i, city in enumerate(tour):
+        pos[city] = i
+
+    for _ in range(max_passes):
+        improved = False
+        for length in range(1, max_segment + 1):
+            i = 0
+            while i < n:
+                moved = _or_move(tour, pos, d, near, i, length)
+                if moved:
+                    improved = True
+                else:
+                    i += 1
+        if not improved:
+            break
+    return tour
+
+
+def _or_move(
+    tour: List[int],
+    pos: List[int],
+    d: List[List[float]],
+    near: List[List[int]],
+    i: int,
+    length: int,
+) -> bool:
+    """Try to relocate the segment starting at position ``i``; True if moved"""
+    n = len(tour)
+    segment = [tour[(i + k) % n] for k in range(length)]
+    first, last = segment[0], segment[-1]
+    prev = tour[(i - 1) % n]
+    nxt = tour[(i + length) % n]
+    removal_gain = d[prev][first] + d[last][nxt] - d[prev][nxt]
+    if removal_gain <= EPSILON:
+        return False
+
+    members = set(segment)
+    best = None
+    best_delta = -EPSILON
+    for end in (first, last):
+        for c in near[end]:
+            if d[end][c] >= removal_gain or c in members:
+                continue
+            # Insert between c and each of its tour neighbours
+            j = pos[c]
+            for p, q in ((c, tour[(j + 1) % n]), (tour[(j - 1) % n], c)):
+                if p in members or q in members:
+                    continue
+                forward = d[p][first] + d[last][q] - d[p][q]
+                backward = d[p][last] + d[first][q] - d[p][q]
+                for cost, reverse in ((forward, False), (backward, True)):
+                    delta = cost - removal_gain
+                    if delta < best_delta:
+                        best_delta, best = delta, (p, q, reverse)
+
+    if best is None:
+        return False
+    p, q, reverse = best
+    rest = [city for city in tour if city not in members]
+    k = rest.index(p)
+    if rest[(k + 1) % len(rest)] != q:
+        k = (k - 1) % len(rest)
+    insert = segment[::-1] if reverse else segment
+    if rest[k] == q:
+        insert = insert[::-1]
+    tour[:] = rest[: k + 1] + insert + rest[k + 1 :]
+    for index, city in enumerate(tour):
+        pos[city] = index
+    return True
+
+
+def _reverse(tour: List[int], pos: List[int], i: int, j: int):
+    """Reverse the cyclic tour segment from position i to j inclusive"""
+    n = len(tour)
+    length = (j - i) % n + 1
+    if length * 2 > n:
+        # Reversing the complement gives the same cycle with less work
+        i, j = (j + 1) % n, (i - 1) % n
+        length = n - length
+    for _ in range(length // 2):
+        tour[i], tour[j] = tour[j], tour[i]
+        pos[tour[i]] = i
+        pos[tour[j]] = j
+        i = (i + 1) % n
+        j = (j - 1) % n
+
+
+def solve_tsp(
+    distance_matrix: np.ndarray, neighbours_k: int = 10, start: int = 0
+) -> List[int]:
+    """Nearest neighbour, then alternate 2-opt and Or-opt until neither helps"""
+    distance_matrix = np.asarray(distance_matrix, dtype=float)
+    n = len(distance_matrix)
+    if n <= 3:
+        return list(range(n))
+
+    neighbours = neighbour_lists(distance_matrix, neighbours_k)
+    tour = nearest_neighbour_tour(distance_matrix, start)
+    length = tour_length(tour, distance_matrix)
+    while True:
+        tour = two_opt(tour, distance_matrix, neighbours)
+        tour = or_opt(tour, distance_matrix, neighbours)
+        new_length = tour_length(tour, distance_matrix)
+        if new_length >= length - EPSILON:
+            break
+        length = new_length
+
+    k = tour.index(start)
+    return tour[k:] + tour[:k]
+
+
+def knapsack_is_exact(
+    weights: Sequence[float], capacity: float, resolution: int = 100_000
+) -> bool:
+    """True if ``solve_knapsack`` can run its DP on the unscaled weights"""
+    weights = np.asarray(weights, dtype=float)
+    return bool(
+        np.all(weights == np.round(weights)) and np.floor(capacity) <= resolution
+    )
+
+
+def solve_knapsack(
+    values: Sequence[float],
+    weights: Sequence[float],
+    capacity: float,
+    resolution: int = 100_000,
+) -> List[int]:
+    """
+    0/1 knapsack by DP over integer weight units.
+
+    Integral weights with a capacity of at most ``resolution`` are used as
+    the DP units directly, which makes the result optimal. Otherwise weights
+    are scaled to at most ``resolution`` units and rounded up, so the result
+    is always feasible and optimal up to that rounding; any slack left is
+    then filled greedily by value density. ``knapsack_is_exact`` tells the
+    two cases apart. Zero-weight items with positive value are always taken.
+    """
+    values = np.asarray(values, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    n = len(values)
+    solution = np.zeros(n, dtype=np.int64)
+    if n == 0 or capacity < 0:
+        return solution.tolist()
+
+    free = weights <= 0
+    solution[free & (values > 0)] = 1
+    items = np.flatnonzero(~free)
+    if capacity == 0 or len(items) == 0:
+        return solution.tolist()
+
+    exact = knapsack_is_exact(weights[items], capacity, resolution)
+    if exact:
+        units = weights[items].astype(np.int64)
+        cap = int(np.floor(capacity))
+    else:
+        scale = resolution / capacity
+        units = np.ceil(weights[items] * scale - 1e-9).astype(np.int64)
+        cap = int(np.floor(capacity * scale + 1e-9))
+
+    best = np.zeros(cap + 1)
+    taken = np.zeros((len(items), (cap + 8) // 8), dtype=np.uint8)
+    for k, i in enumerate(items):
+        w = units[k]
+        if w > cap:
+            continue
+        candidate = best[: cap + 1 - w] + values[i]
+        take = candidate > best[w:]
+        best[w:] = np.where(take, candidate, best[w:])
+        row = np.zeros(cap + 1, dtype=bool)
+        row[w:] = take
+        taken[k] = np.packbits(row)
+
+    c = cap
+    for k in range(len(items) - 1, -1, -1):
+        if taken[k, c >> 3] & (0x80 >> (c & 7)):
+            solution[items[k]] = 1
+            c -= units[k]
+
+    if not exact:
+        remaining = capacity - weights[solution == 1].sum()
+        for i in items[np.argsort(-values[items] / weights[items])]:
+            if not solution[i] and weights[i] <= remaining:
+                solution[i] = 1
+                remaining -= weights[i]
+    return solution.tolist()
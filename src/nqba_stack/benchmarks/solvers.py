@@ -5,7 +5,6 @@ Provides classical and quantum solvers for head-to-head performance comparison.
 """
 
 import asyncio
-import time
 import numpy as np
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional
@@ -13,6 +12,8 @@ from dataclasses import dataclass
 
 import logging
 
+from .heuristics import knapsack_is_exact, solve_knapsack, solve_tsp, tour_lengths
+
 # Set up logger
 logger = logging.getLogger(__name__)
 
@@ -308,6 +309,44 @@ class ClassicalSolver(BaseSolver):
         return solution
 
 
+class ReferenceSolver(ClassicalSolver):
+    """
+    High-performance classical baseline
+
+    Neighbour-list 2-opt/Or-opt for TSP and bitset DP for knapsack; scales
+    to thousands of cities/items. Portfolio problems use ClassicalSolver.
+    ``last_solve_metadata`` records whether the last knapsack solve was exact.
+    """
+
+    def __init__(self, neighbours_k: int = 10, knapsack_resolution: int = 100_000):
+        BaseSolver.__init__(self, "Classical_Reference", "1.0.0")
+        self.neighbours_k = neighbours_k
+        self.knapsack_resolution = knapsack_resolution
+        self.last_solve_metadata: Dict[str, Any] = {}
+
+    async def _solve_tsp(self, problem_data: Dict[str, Any]) -> List[int]:
+        """Solve TSP with nearest neighbour plus 2-opt/Or-opt local search"""
+        distance_matrix = np.asarray(problem_data["distance_matrix"], dtype=float)
+        return solve_tsp(distance_matrix, neighbours_k=self.neighbours_k)
+
+    async def _solve_knapsack(self, problem_data: Dict[str, Any]) -> List[int]:
+        """Solve knapsack with dynamic programming"""
+        weights = np.asarray(problem_data["weights"], dtype=float)
+        self.last_solve_metadata = {
+            "exact": knapsack_is_exact(
+                weights[weights > 0],
+                problem_data["capacity"],
+                self.knapsack_resolution,
+            )
+        }
+        return solve_knapsack(
+            problem_data["values"],
+            weights,
+            problem_data["capacity"],
+            resolution=self.knapsack_resolution,
+        )
+
+
 class QuantumSolver(BaseSolver):
     """
     Quantum optimization solver using Dynex and other quantum methods
@@ -394,8 +433,7 @@ class QuantumSolver(BaseSolver):
         # Quantum-inspired approach: use quantum annealing principles
         # Start with random solution and improve through local search
 
-        # Initial random weights
-        np.random.seed(int(time.time()) % 10000)
+        # Initial random weights (seeded by the caller for reproducible runs)
         weights = np.random.random(n_assets)
         weights = weights / np.sum(weights)
 
@@ -479,17 +517,15 @@ class QuantumSolver(BaseSolver):
         # In practice, this would use Dynex for larger instances
 
         n_cities = problem_data["size"]
-        distance_matrix = problem_data["distance_matrix"]
+        distance_matrix = np.asarray(problem_data["distance_matrix"], dtype=float)
 
         # Quantum-inspired genetic algorithm
         population_size = 20
         population = self._generate_tsp_population(n_cities, population_size)
 
         for generation in range(30):
-            # Evaluate fitness
-            fitness = [
-                self._evaluate_tsp_tour(tour, distance_matrix) for tour in population
-            ]
+            # Evaluate fitness of the whole population at once
+            fitness = (-tour_lengths(population, distance_matrix)).tolist()
 
             # Select parents
             parents = self._select_tsp_parents(population, fitness)
@@ -506,10 +542,8 @@ class QuantumSolver(BaseSolver):
             population = new_population
 
         # Return best solution
-        best_tour = max(
-            population, key=lambda tour: self._evaluate_tsp_tour(tour, distance_matrix)
-        )
-        return best_tour
+        best_index = int(tour_lengths(population, distance_matrix).argmin())
+        return population[best_index]
 
     def _generate_tsp_population(self, n_cities: int, size: int) -> List[List[int]]:
         """Generate initial TSP population"""
@@ -524,12 +558,8 @@ class QuantumSolver(BaseSolver):
         self, tour: List[int], distance_matrix: List[List[float]]
     ) -> float:
         """Evaluate TSP tour (negative distance for maximization)"""
-        total_distance = 0
-        for i in range(len(tour)):
-            current = tour[i]
-            next_city = tour[(i + 1) % len(tour)]
-            total_distance += distance_matrix[current][next_city]
-        return -total_distance
+        distance_matrix = np.asarray(distance_matrix, dtype=float)
+        return -float(tour_lengths([tour], distance_matrix)[0])
 
     def _select_tsp_parents(
         self, population: List[List[int]], fitness: List[float]
@@ -554,7 +584,8 @@ class QuantumSolver(BaseSolver):
         child = [-1] * n
         child[start:end] = parent1[start:end]
 
-        remaining = [x for x in parent2 if x not in child[start:end]]
+        copied = set(child[start:end])
+        remaining = [x for x in parent2 if x not in copied]
         j = 0
         for i in range(n):
             if child[i] == -1:
@@ -668,7 +699,7 @@ class DynexSolver(QuantumSolver):
 # Factory function to get solvers
 def get_all_solvers() -> List[BaseSolver]:
     """Get all available solvers"""
-    solvers = [ClassicalSolver()]
+    solvers = [ClassicalSolver(), ReferenceSolver()]
 
     if DYNEX_AVAILABLE:
         solvers.append(DynexSolver())
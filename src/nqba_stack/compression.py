@@ -0,0 +1,57 @@
+"""
+Compression Codecs - Shared Block Compression for NQBA Storage Formats
+
+Used by the LTC archive and the streaming row-group files:
+- zstd when ``zstandard`` is installed, zlib otherwise
+- a codec is identified by a 4-byte tag written into the file, so readers
+  pick the matching decompressor
+"""
+
+import zlib
+from typing import Optional
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+class Codec:
+    """Block compressor chosen by name"""
+
+    def __init__(self, name: str, level: Optional[int] = None):
+        if name == "zstd":
+            if not ZSTD_AVAILABLE:
+                raise RuntimeError("zstandard is required for the zstd codec")
+            self._compressor = zstandard.ZstdCompressor(level=level or 9)
+            self._decompressor = zstandard.ZstdDecompressor()
+        elif name != "zlib":
+            raise ValueError(f"Unknown compression codec: {name!r}")
+        self.name = name
+        self.level = level or 6
+
+    @classmethod
+    def default(cls) -> "Codec":
+        """zstd if available, else zlib"""
+        return cls("zstd" if ZSTD_AVAILABLE else "zlib")
+
+    @property
+    def tag(self) -> bytes:
+        """4-byte identifier stored in file trailers"""
+        return self.name.encode().ljust(4)
+
+    @classmethod
+    def from_tag(cls, tag: bytes) -> "Codec":
+        return cls(tag.decode().strip())
+
+    def compress(self, data: bytes) -> bytes:
+        if self.name == "zstd":
+            return self._compressor.compress(data)
+        return zlib.compress(data, self.level)
+
+    def decompress(self, data: bytes) -> bytes:
+        if self.name == "zstd":
+            return self._decompressor.decompress(data)
+        return zlib.decompress(data)
@@ -9,7 +9,6 @@ import logging
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 import dimod
-import dynex
 from dataclasses import dataclass, asdict
 import os
 from .settings import get_settings
@@ -104,6 +103,10 @@ class DynexAdapter:
             annealing_time = annealing_time or self.config.default_annealing_time
             description = description or self.config.description
 
+            # The SDK pulls in pennylane and takes seconds to import, so it
+            # is loaded on first solve rather than with the package
+            import dynex
+
             # Initialize sampler and solve
             sampler = dynex.DynexSampler(
                 mainnet=self.config.mainnet, description=description
@@ -2,11 +2,29 @@
 Living Technical Codex (LTC) Logger
 Comprehensive logging and traceability for all NQBA operations
 Provides audit, compliance, and learning capabilities
+
+Writes are non-blocking: operations are queued and a background writer
+extends the hash chain and group-commits them over one persistent WAL
+connection. The database is opened on first use, by the writer.
+
+Hash-chain verification is incremental: verified prefixes are recorded as
+HMAC-signed checkpoints, rows are streamed in insertion order, and an
+optional parallel mode checks rowid segments on several processes.
+Checkpoints need a configured signing key; without one every audit
+verifies the full chain.
 """
+import atexit
+import hmac
 import json
 import logging
 import hashlib
-from typing import Dict, Any, Optional, List, Union
+import multiprocessing
+import os
+import queue
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Any, Iterable, Iterator, Optional, List, Tuple, Union
 from datetime import datetime, timedelta
 from pathlib import Path
 import sqlite3
@@ -18,6 +36,27 @@ from .settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+GENESIS_HASH = "0000000000000000000000000000000000000000000000000000000000000000"
+
+INSERT_OPERATION_SQL = """
+    INSERT INTO ltc_operations 
+    (operation_id, operation_type, operation_data, thread_ref, timestamp, hash_chain, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Queue marker that stops the writer thread
+_STOP = object()
+
+# Rows verified between signed checkpoints
+CHECKPOINT_INTERVAL = 100_000
+
+SEGMENT_QUERY_SQL = """
+    SELECT rowid, operation_id, hash_chain, operation_data, timestamp
+    FROM ltc_operations
+    WHERE rowid > ? AND rowid <= ?
+    ORDER BY rowid ASC
+"""
+
 @dataclass
 class LTCOperation:
     """LTC Operation record"""
@@ -30,30 +69,119 @@ class LTCOperation:
     ipfs_reference: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
 
+def _chain_hash(previous_hash: str, operation_data: str) -> str:
+    """Hash of one chain link from the stored JSON payload"""
+    data_string = json.dumps(json.loads(operation_data), sort_keys=True, default=str)
+    return hashlib.sha256(f"{previous_hash}{data_string}".encode()).hexdigest()
+
+
+def _previous_hash(conn: sqlite3.Connection, rowid: int) -> str:
+    """Stored hash of the last row at or before ``rowid``"""
+    row = conn.execute(
+        "SELECT hash_chain FROM ltc_operations WHERE rowid <= ? ORDER BY rowid DESC LIMIT 1",
+        (rowid,)
+    ).fetchone()
+    return row[0] if row else GENESIS_HASH
+
+
+def _verify_rows(rows: Iterable[Tuple], previous_hash: str) -> Dict[str, Any]:
+    """
+    Check each row against the stored hash of the row before it
+    
+    Using the stored (not recomputed) predecessor keeps a tampered row from
+    cascading into every later row, and lets segments be checked independently.
+    """
+    issues = []
+    count = 0
+    last_rowid = None
+    for rowid, operation_id, stored_hash, operation_data, timestamp in rows:
+        expected_hash = _chain_hash(previous_hash, operation_data)
+        if expected_hash != stored_hash:
+            issues.append({
+                "operation_id": operation_id,
+                "expected_hash": expected_hash,
+                "stored_hash": stored_hash,
+                "timestamp": timestamp
+            })
+        previous_hash = stored_hash
+        last_rowid = rowid
+        count += 1
+    return {
+        "verified_operations": count,
+        "last_rowid": last_rowid,
+        "last_hash": previous_hash,
+        "integrity_issues": issues
+    }
+
+
+def _verify_segment(db_path: str, after_rowid: int, until_rowid: int) -> Dict[str, Any]:
+    """Verify rows in (after_rowid, until_rowid] on a private read-only connection"""
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        previous_hash = _previous_hash(conn, after_rowid)
+        cursor = conn.execute(SEGMENT_QUERY_SQL, (after_rowid, until_rowid))
+        return _verify_rows(cursor, previous_hash)
+    finally:
+        conn.close()
+
+
 class LTCLogger:
     """Living Technical Codex Logger"""
     
-    def __init__(self):
-        """Initialize LTC Logger"""
+    def __init__(self, batch_size: int = 500, flush_interval: float = 0.05):
+        """
+        Initialize LTC Logger
+        
+        Args:
+            batch_size: Maximum operations written per commit
+            flush_interval: Seconds the writer waits to fill a batch
+        """
         self.settings = get_settings()
         self.db_path = self.settings.data_dir / "ltc_operations.db"
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
         
-        # Thread safety
-        self.lock = threading.Lock()
+        # Thread safety: `lock` guards the connection; the hash chain is only
+        # extended by the writer thread, in queue order
+        self.lock = threading.RLock()
+        self._writer_lock = threading.Lock()
         
-        # Initialize database
-        self._initialize_database()
+        # Opened lazily by _get_connection
+        self._conn: Optional[sqlite3.Connection] = None
         
-        # Hash chain for integrity
-        self.last_hash = "0000000000000000000000000000000000000000000000000000000000000000"
+        # Write-behind queue drained by the writer thread
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._atexit_registered = False
+        
+        # Hash chain for integrity; continued from the stored tip on first use
+        self.last_hash = GENESIS_HASH
+        self._chain_loaded = False
         
         logger.info("LTC Logger initialized successfully")
     
-    def _initialize_database(self):
+    def _get_connection(self) -> sqlite3.Connection:
+        """Return the persistent connection, creating the database on first use"""
+        with self.lock:
+            if self._conn is None:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                self._initialize_database(conn)
+                self._conn = conn
+            return self._conn
+    
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Connection for reads; pending writes are flushed first"""
+        self.flush()
+        with self.lock:
+            yield self._get_connection()
+    
+    def _initialize_database(self, conn: sqlite3.Connection):
         """Initialize SQLite database for LTC operations"""
         with self.lock:
-            conn = sqlite3.connect(str(self.db_path))
             cursor = conn.cursor()
             
             # Create operations table
@@ -87,8 +215,19 @@ class LTCLogger:
                 ON ltc_operations(thread_ref)
             """)
             
+            # Signed markers of chain prefixes that have been verified
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS ltc_checkpoints (
+                    checkpoint_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    last_rowid INTEGER NOT NULL,
+                    operation_count INTEGER NOT NULL,
+                    last_hash TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    signature TEXT NOT NULL
+                )
+            """)
+            
             conn.commit()
-            conn.close()
     
     def _generate_operation_id(self, operation_type: str, thread_ref: str) -> str:
         """Generate unique operation ID"""
@@ -96,13 +235,23 @@ class LTCLogger:
         unique_string = f"{operation_type}_{thread_ref}_{timestamp}"
         return hashlib.sha256(unique_string.encode()).hexdigest()[:16]
     
-    def _update_hash_chain(self, operation_data: Dict[str, Any]) -> str:
-        """Update hash chain for integrity verification"""
-        data_string = json.dumps(operation_data, sort_keys=True, default=str)
-        combined = f"{self.last_hash}{data_string}"
-        new_hash = hashlib.sha256(combined.encode()).hexdigest()
-        self.last_hash = new_hash
-        return new_hash
+    def _load_chain_tip(self):
+        """Continue the hash chain from the last stored operation"""
+        with self.lock:
+            row = self._get_connection().execute(
+                "SELECT hash_chain FROM ltc_operations ORDER BY rowid DESC LIMIT 1"
+            ).fetchone()
+        if row:
+            self.last_hash = row[0]
+        self._chain_loaded = True
+    
+    @staticmethod
+    def _chain_row(entry: Tuple, previous_hash: str) -> Tuple:
+        """Database row for a queued operation, linked to ``previous_hash``"""
+        fields, ltc_operation = entry
+        hash_chain = _chain_hash(previous_hash, fields[2])
+        ltc_operation.hash_chain = hash_chain
+        return fields[:5] + (hash_chain,) + fields[5:]
     
     def log_operation(self, 
                      operation_type: str, 
@@ -122,55 +271,37 @@ class LTCLogger:
             Operation ID for reference
         """
         try:
-            # Generate operation ID and hash chain
             operation_id = self._generate_operation_id(operation_type, thread_ref)
-            hash_chain = self._update_hash_chain(operation_data)
+            timestamp = datetime.now()
+            
+            # Serialize now so later changes by the caller are not recorded
+            operation_json = json.dumps(operation_data)
+            metadata_json = json.dumps(metadata) if metadata else None
             
-            # Create LTC operation record
+            # The writer thread assigns the hash chain in queue order
             ltc_operation = LTCOperation(
                 operation_id=operation_id,
                 operation_type=operation_type,
                 operation_data=operation_data,
                 thread_ref=thread_ref,
-                timestamp=datetime.now(),
-                hash_chain=hash_chain,
+                timestamp=timestamp,
+                hash_chain="",
                 metadata=metadata
             )
-            
-            # Store in database
-            with self.lock:
-                conn = sqlite3.connect(str(self.db_path))
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    INSERT INTO ltc_operations 
-                    (operation_id, operation_type, operation_data, thread_ref, timestamp, hash_chain, metadata)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    operation_id,
-                    operation_type,
-                    json.dumps(operation_data),
-                    thread_ref,
-                    ltc_operation.timestamp.isoformat(),
-                    hash_chain,
-                    json.dumps(metadata) if metadata else None
-                ))
-                
-                conn.commit()
-                conn.close()
+            fields = (
+                operation_id,
+                operation_type,
+                operation_json,
+                thread_ref,
+                timestamp.isoformat(),
+                metadata_json
+            )
+            self._ensure_writer()
+            self._queue.put((fields, ltc_operation))
             
             # Log to standard logging
             logger.info(f"LTC Operation logged: {operation_type} - {operation_id}")
             
-            # Attempt IPFS backup if configured
-            if self.settings.ipfs_configured:
-                try:
-                    ipfs_ref = self._backup_to_ipfs(ltc_operation)
-                    if ipfs_ref:
-                        self._update_ipfs_reference(operation_id, ipfs_ref)
-                except Exception as e:
-                    logger.warning(f"IPFS backup failed: {e}")
-            
             return operation_id
             
         except Exception as e:
@@ -178,6 +309,138 @@ class LTCLogger:
             # Return a fallback ID
             return f"fallback_{hashlib.md5(str(datetime.now()).encode()).hexdigest()[:8]}"
     
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Wait until every queued operation is committed; False on timeout"""
+        writer = self._writer
+        if writer is None or not writer.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+    
+    def close(self, timeout: Optional[float] = 5.0):
+        """Commit queued operations, stop the writer and close the database"""
+        writer = self._writer
+        if writer is not None and writer.is_alive():
+            self._queue.put(_STOP)
+            writer.join(timeout)
+        self._writer = None
+        with self.lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+    
+    def _ensure_writer(self):
+        """Start the writer thread if it is not running"""
+        writer = self._writer
+        if writer is not None and writer.is_alive():
+            return
+        with self._writer_lock:
+            if self._writer is not None and self._writer.is_alive():
+                return
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="ltc-writer", daemon=True
+            )
+            self._writer.start()
+            if not self._atexit_registered:
+                atexit.register(self.close)
+                self._atexit_registered = True
+    
+    def _writer_loop(self):
+        """Drain the queue, committing up to batch_size operations at a time"""
+        while True:
+            batch = []
+            waiters = []
+            stop = False
+            
+            item = self._queue.get()
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+                
+                # Flush requests and shutdown cut the wait short
+                if stop or waiters or len(batch) >= self.batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            
+            # Pick up anything already queued behind a flush or stop request
+            if stop or waiters:
+                while len(batch) < self.batch_size:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is _STOP:
+                        stop = True
+                    elif isinstance(item, threading.Event):
+                        waiters.append(item)
+                    else:
+                        batch.append(item)
+            
+            if batch:
+                self._write_batch(batch)
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                return
+    
+    def _write_batch(self, batch: List[Any]):
+        """Chain a batch of queued operations and insert it in one transaction"""
+        try:
+            with self.lock:
+                conn = self._get_connection()
+                if not self._chain_loaded:
+                    self._load_chain_tip()
+                
+                rows = []
+                previous_hash = self.last_hash
+                for entry in batch:
+                    rows.append(self._chain_row(entry, previous_hash))
+                    previous_hash = rows[-1][5]
+                try:
+                    with conn:
+                        conn.executemany(INSERT_OPERATION_SQL, rows)
+                    self.last_hash = previous_hash
+                    written = batch
+                except sqlite3.IntegrityError:
+                    # Do not let one conflicting row drop the whole batch, and
+                    # only chain the rows that are actually stored
+                    written = []
+                    for entry in batch:
+                        row = self._chain_row(entry, self.last_hash)
+                        try:
+                            with conn:
+                                conn.execute(INSERT_OPERATION_SQL, row)
+                        except sqlite3.Error as e:
+                            logger.error(f"Failed to log operation {row[0]} to LTC: {e}")
+                            continue
+                        self.last_hash = row[5]
+                        written.append(entry)
+        except Exception as e:
+            logger.error(f"Failed to write {len(batch)} operations to LTC: {e}")
+            return
+        
+        # Attempt IPFS backup if configured
+        if self.settings.ipfs_configured:
+            for _, ltc_operation in written:
+                try:
+                    ipfs_ref = self._backup_to_ipfs(ltc_operation)
+                    if ipfs_ref:
+                        self._update_ipfs_reference(ltc_operation.operation_id, ipfs_ref)
+                except Exception as e:
+                    logger.warning(f"IPFS backup failed: {e}")
+    
     def _backup_to_ipfs(self, ltc_operation: LTCOperation) -> Optional[str]:
         """Backup operation to IPFS"""
         try:
@@ -224,7 +487,7 @@ class LTCLogger:
         """Update IPFS reference in database"""
         try:
             with self.lock:
-                conn = sqlite3.connect(str(self.db_path))
+                conn = self._get_connection()
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -234,7 +497,6 @@ class LTCLogger:
                 """, (ipfs_reference, operation_id))
                 
                 conn.commit()
-                conn.close()
                 
         except Exception as e:
             logger.error(f"Failed to update IPFS reference: {e}")
@@ -259,8 +521,7 @@ class LTCLogger:
             List of LTC operations
         """
         try:
-            with self.lock:
-                conn = sqlite3.connect(str(self.db_path))
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 # Build query
@@ -303,8 +564,6 @@ class LTCLogger:
                         metadata=json.loads(row[7]) if row[7] else None
                     )
                     operations.append(operation)
-                
-                conn.close()
                 return operations
                 
         except Exception as e:
@@ -314,8 +573,7 @@ class LTCLogger:
     def get_operation_by_id(self, operation_id: str) -> Optional[LTCOperation]:
         """Get operation by ID"""
         try:
-            with self.lock:
-                conn = sqlite3.connect(str(self.db_path))
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -323,7 +581,6 @@ class LTCLogger:
                 """, (operation_id,))
                 
                 row = cursor.fetchone()
-                conn.close()
                 
                 if row:
                     return LTCOperation(
@@ -342,50 +599,72 @@ class LTCLogger:
             logger.error(f"Failed to get operation by ID: {e}")
             return None
     
-    def get_hash_chain_integrity(self) -> Dict[str, Any]:
-        """Verify hash chain integrity"""
+    def get_hash_chain_integrity(self,
+                                 full: bool = False,
+                                 parallel: bool = False,
+                                 max_workers: Optional[int] = None,
+                                 checkpoint_interval: int = CHECKPOINT_INTERVAL) -> Dict[str, Any]:
+        """
+        Verify hash chain integrity
+        
+        Only rows appended since the latest valid checkpoint are checked unless
+        ``full`` is set. Rows are streamed in insertion order; with ``parallel``
+        they are split into rowid segments verified in separate processes.
+        Without a checkpoint signing key checkpoints are neither read nor
+        written, so the whole chain is verified every time.
+        
+        Args:
+            full: Re-verify the whole history instead of resuming from a checkpoint
+            parallel: Verify segments on multiple processes
+            max_workers: Process count for parallel mode (default: CPU count)
+            checkpoint_interval: Rows verified between signed checkpoints
+        
+        Returns:
+            Integrity report
+        """
         try:
+            checkpoints_enabled = self._checkpoint_key() is not None
+            if not checkpoints_enabled:
+                logger.warning(
+                    "No LTC checkpoint signing key configured (set NQBA_LTC_CHECKPOINT_KEY "
+                    "or SECRET_KEY); verifying the full hash chain"
+                )
+                full = True
+            
+            self.flush()
             with self.lock:
-                conn = sqlite3.connect(str(self.db_path))
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    SELECT operation_id, hash_chain, operation_data, timestamp
-                    FROM ltc_operations 
-                    ORDER BY timestamp ASC
-                """)
-                
-                rows = cursor.fetchall()
-                conn.close()
-                
-                # Verify hash chain
-                verified_hash = "0000000000000000000000000000000000000000000000000000000000000000"
-                integrity_issues = []
-                
-                for row in rows:
-                    operation_id, stored_hash, operation_data, timestamp = row
-                    
-                    # Recalculate hash
-                    data_string = json.dumps(json.loads(operation_data), sort_keys=True, default=str)
-                    calculated_hash = hashlib.sha256(f"{verified_hash}{data_string}".encode()).hexdigest()
-                    
-                    if calculated_hash != stored_hash:
-                        integrity_issues.append({
-                            "operation_id": operation_id,
-                            "expected_hash": calculated_hash,
-                            "stored_hash": stored_hash,
-                            "timestamp": timestamp
-                        })
-                    
-                    verified_hash = calculated_hash
-                
-                return {
-                    "total_operations": len(rows),
-                    "integrity_verified": len(integrity_issues) == 0,
-                    "integrity_issues": integrity_issues,
-                    "last_verified_hash": verified_hash,
-                    "timestamp": datetime.now().isoformat()
-                }
+                conn = self._get_connection()
+                tip = conn.execute("SELECT MAX(rowid) FROM ltc_operations").fetchone()[0] or 0
+                integrity_issues: List[Dict[str, Any]] = []
+                checkpoint = None if full else self._latest_valid_checkpoint(conn, integrity_issues)
+            
+            start_rowid = checkpoint["last_rowid"] if checkpoint else 0
+            start_count = checkpoint["operation_count"] if checkpoint else 0
+            
+            if parallel:
+                result = self._verify_parallel(start_rowid, tip, max_workers)
+            else:
+                result = self._verify_serial(
+                    start_rowid, tip, start_count, checkpoint_interval,
+                    checkpoints_enabled and not integrity_issues
+                )
+            integrity_issues.extend(result["integrity_issues"])
+            
+            total_operations = start_count + result["verified_operations"]
+            last_hash = result["last_hash"] or (checkpoint["last_hash"] if checkpoint else GENESIS_HASH)
+            if checkpoints_enabled and result["last_rowid"] is not None and not integrity_issues:
+                self._save_checkpoint(result["last_rowid"], total_operations, last_hash)
+            
+            return {
+                "total_operations": total_operations,
+                "verified_operations": result["verified_operations"],
+                "integrity_verified": len(integrity_issues) == 0,
+                "integrity_issues": integrity_issues,
+                "last_verified_hash": last_hash,
+                "resumed_from_checkpoint": checkpoint["checkpoint_id"] if checkpoint else None,
+                "checkpoints_enabled": checkpoints_enabled,
+                "timestamp": datetime.now().isoformat()
+            }
                 
         except Exception as e:
             logger.error(f"Failed to verify hash chain integrity: {e}")
@@ -394,11 +673,127 @@ class LTCLogger:
                 "timestamp": datetime.now().isoformat()
             }
     
+    def _verify_serial(self,
+                       after_rowid: int,
+                       until_rowid: int,
+                       operation_count: int,
+                       checkpoint_interval: int,
+                       save_checkpoints: bool = True) -> Dict[str, Any]:
+        """Stream rows on a private connection, checkpointing as long as the chain is intact"""
+        result = {"verified_operations": 0, "last_rowid": None, "last_hash": None, "integrity_issues": []}
+        while after_rowid < until_rowid:
+            segment_end = min(after_rowid + checkpoint_interval, until_rowid)
+            segment = _verify_segment(str(self.db_path), after_rowid, segment_end)
+            after_rowid = segment_end
+            if segment["last_rowid"] is None:
+                continue
+            
+            result["verified_operations"] += segment["verified_operations"]
+            result["last_rowid"] = segment["last_rowid"]
+            result["last_hash"] = segment["last_hash"]
+            result["integrity_issues"].extend(segment["integrity_issues"])
+            
+            if save_checkpoints and not result["integrity_issues"] and segment_end < until_rowid:
+                self._save_checkpoint(
+                    segment["last_rowid"],
+                    operation_count + result["verified_operations"],
+                    segment["last_hash"]
+                )
+        return result
+    
+    def _verify_parallel(self,
+                         after_rowid: int,
+                         until_rowid: int,
+                         max_workers: Optional[int]) -> Dict[str, Any]:
+        """Verify equal rowid segments on a process pool"""
+        workers = max_workers or os.cpu_count() or 1
+        span = until_rowid - after_rowid
+        bounds = [after_rowid + span * i // workers for i in range(workers + 1)]
+        segments = [(lo, hi) for lo, hi in zip(bounds, bounds[1:]) if hi > lo]
+        
+        result = {"verified_operations": 0, "last_rowid": None, "last_hash": None, "integrity_issues": []}
+        if not segments:
+            return result
+        
+        with ProcessPoolExecutor(
+            max_workers=len(segments), mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            futures = [
+                executor.submit(_verify_segment, str(self.db_path), lo, hi)
+                for lo, hi in segments
+            ]
+            for future in futures:
+                segment = future.result()
+                result["verified_operations"] += segment["verified_operations"]
+                result["integrity_issues"].extend(segment["integrity_issues"])
+                if segment["last_rowid"] is not None:
+                    result["last_rowid"] = segment["last_rowid"]
+                    result["last_hash"] = segment["last_hash"]
+        return result
+    
+    def _checkpoint_key(self) -> Optional[bytes]:
+        """Checkpoint signing key, or None while only the public default is set"""
+        key = self.settings.ltc_checkpoint_signing_key
+        return key.encode() if key else None
+    
+    def _checkpoint_signature(self, last_rowid: int, operation_count: int, last_hash: str) -> str:
+        """HMAC of a checkpoint under the checkpoint signing key"""
+        message = f"{last_rowid}:{operation_count}:{last_hash}".encode()
+        return hmac.new(self._checkpoint_key(), message, hashlib.sha256).hexdigest()
+    
+    def _save_checkpoint(self, last_rowid: int, operation_count: int, last_hash: str):
+        """Record a verified chain prefix"""
+        with self.lock:
+            conn = self._get_connection()
+            with conn:
+                conn.execute("""
+                    INSERT INTO ltc_checkpoints
+                    (last_rowid, operation_count, last_hash, created_at, signature)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (
+                    last_rowid,
+                    operation_count,
+                    last_hash,
+                    datetime.now().isoformat(),
+                    self._checkpoint_signature(last_rowid, operation_count, last_hash)
+                ))
+    
+    def _latest_valid_checkpoint(self,
+                                 conn: sqlite3.Connection,
+                                 integrity_issues: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Newest checkpoint that is correctly signed and still matches the stored chain
+        
+        Rejected checkpoints are reported as integrity issues and verification
+        falls back to an older one.
+        """
+        cursor = conn.execute("""
+            SELECT c.checkpoint_id, c.last_rowid, c.operation_count, c.last_hash,
+                   c.signature, o.hash_chain
+            FROM ltc_checkpoints c
+            LEFT JOIN ltc_operations o ON o.rowid = c.last_rowid
+            ORDER BY c.checkpoint_id DESC
+        """)
+        for checkpoint_id, last_rowid, operation_count, last_hash, signature, stored_hash in cursor:
+            expected = self._checkpoint_signature(last_rowid, operation_count, last_hash)
+            if not hmac.compare_digest(expected, signature):
+                problem = "invalid checkpoint signature"
+            elif stored_hash != last_hash:
+                problem = "checkpoint does not match stored chain"
+            else:
+                return {
+                    "checkpoint_id": checkpoint_id,
+                    "last_rowid": last_rowid,
+                    "operation_count": operation_count,
+                    "last_hash": last_hash
+                }
+            integrity_issues.append({"checkpoint_id": checkpoint_id, "error": problem})
+        return None
+    
     def get_statistics(self) -> Dict[str, Any]:
         """Get LTC statistics"""
         try:
-            with self.lock:
-                conn = sqlite3.connect(str(self.db_path))
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 # Total operations
@@ -428,8 +823,6 @@ class LTCLogger:
                 """)
                 ipfs_backed_operations = cursor.fetchone()[0]
                 
-                conn.close()
-                
                 return {
                     "total_operations": total_operations,
                     "operations_by_type": operations_by_type,
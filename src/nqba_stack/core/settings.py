@@ -7,12 +7,15 @@ import os
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 from pydantic_settings import BaseSettings
-from pydantic import Field, field_validator
+from pydantic import AliasChoices, Field, field_validator
 from pydantic import ConfigDict
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Placeholder SECRET_KEY; anything signed with it can be forged
+DEFAULT_SECRET_KEY = "your-secret-key-change-this-in-production"
+
 
 class NQBASettings(BaseSettings):
     """NQBA Stack Configuration Settings"""
@@ -102,7 +105,7 @@ class NQBASettings(BaseSettings):
     )
     # Security Keys
     SECRET_KEY: str = Field(
-        default="your-secret-key-change-this-in-production",
+        default=DEFAULT_SECRET_KEY,
         json_schema_extra={
             "env": "SECRET_KEY",
             "description": "Secret key for JWT token signing",
@@ -174,6 +177,15 @@ class NQBASettings(BaseSettings):
     ltc_enable_ipfs: bool = Field(
         default=True, json_schema_extra={"env": "NQBA_LTC_ENABLE_IPFS"}
     )
+    ltc_checkpoint_key: Optional[str] = Field(
+        default=None,
+        # json_schema_extra["env"] is documentation only; this maps the variable
+        validation_alias=AliasChoices("NQBA_LTC_CHECKPOINT_KEY", "LTC_CHECKPOINT_KEY"),
+        json_schema_extra={
+            "env": "NQBA_LTC_CHECKPOINT_KEY",
+            "description": "HMAC key for LTC hash-chain verification checkpoints",
+        },
+    )
     # Security Configuration
     enable_cors: bool = Field(
         default=True, json_schema_extra={"env": "NQBA_ENABLE_CORS"}
@@ -290,6 +302,15 @@ class NQBASettings(BaseSettings):
         """Check if LLM is properly configured"""
         return bool(self.llm_api_key or self.openai_api_key)
 
+    @property
+    def ltc_checkpoint_signing_key(self) -> Optional[str]:
+        """Key for LTC checkpoints: the dedicated key, else a non-default SECRET_KEY"""
+        if self.ltc_checkpoint_key:
+            return self.ltc_checkpoint_key
+        if self.SECRET_KEY and self.SECRET_KEY != DEFAULT_SECRET_KEY:
+            return self.SECRET_KEY
+        return None
+
     @property
     def all_credentials_configured(self) -> bool:
         """Check if all critical credentials are configured"""
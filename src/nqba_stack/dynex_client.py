@@ -1,95 +1,240 @@
 """
-Dynex Quantum Backend Client (Stub)
-----------------------------------
+Dynex Quantum Backend Client
+----------------------------
 - Submits QUBO problems to Dynex network
 - Supports advanced algorithms (QAOA, VQE, custom)
+- The SDK is imported and the sampler created on first use, not at import
+- Sampler calls run on a bounded worker pool (``max_concurrency``)
+- Identical in-flight submissions share one sampler call
+- Per-request timeouts; cancelling the last waiter drops a queued call
 - Reference: DynexSDK Advanced Examples
 """
 
 import asyncio
 import logging
-from typing import Any, Dict, Optional
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from .quantum.result_cache import qubo_cache_key
+from .quantum.sparse_qubo import SparseQUBO
 
 logger = logging.getLogger("dynex_client")
 
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Parameters that change how a request is awaited, not what is sampled
+_REQUEST_ONLY_PARAMETERS = ("timeout",)
+
+
+def _create_dynex_sampler() -> Any:
+    """Create a DynexSDK sampler, or None when the SDK is unavailable."""
+    try:
+        import dynex
+    except ImportError:
+        logger.warning("DynexSDK not available, using mock client")
+        return None
+
+    logger.info("Initializing DynexSDK client...")
+    try:
+        # Try with model parameter (newer Dynex SDK versions)
+        try:
+            sampler = dynex.DynexSampler(
+                model="dynex",
+                mainnet=True,
+                description="NQBA Platform Quantum Client",
+            )
+            logger.info("DynexSDK client initialized successfully with model parameter")
+        except TypeError:
+            # Fallback for older versions without model parameter
+            sampler = dynex.DynexSampler(
+                mainnet=True, description="NQBA Platform Quantum Client"
+            )
+            logger.info("DynexSDK client initialized successfully (legacy mode)")
+        return sampler
+    except Exception as e:
+        logger.error(f"Failed to initialize DynexSDK client: {e}")
+        return None
+
 
 class DynexClient:
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: Optional[float] = None,
+        sampler_factory: Optional[Callable[[], Any]] = None,
+    ):
         self.api_key = api_key or "demo"
-        self.sampler = None
-        self._initialize_client()
-    
-    def _initialize_client(self):
-        """Initialize DynexSDK client with proper configuration."""
-        try:
-            import dynex
-            logger.info("Initializing DynexSDK client...")
-            
-            # Try with model parameter (newer Dynex SDK versions)
-            try:
-                self.sampler = dynex.DynexSampler(
-                    model="dynex", 
-                    mainnet=True, 
-                    description="NQBA Platform Quantum Client"
-                )
-                logger.info("DynexSDK client initialized successfully with model parameter")
-            except TypeError:
-                # Fallback for older versions without model parameter
-                self.sampler = dynex.DynexSampler(
-                    mainnet=True, 
-                    description="NQBA Platform Quantum Client"
-                )
-                logger.info("DynexSDK client initialized successfully (legacy mode)")
-                
-        except ImportError:
-            logger.warning("DynexSDK not available, using mock client")
-            self.sampler = None
-        except Exception as e:
-            logger.error(f"Failed to initialize DynexSDK client: {e}")
-            self.sampler = None
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._sampler_factory = sampler_factory or _create_dynex_sampler
+        self._sampler = None
+        self._sampler_ready = False
+        self._sampler_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # request key -> [shared future, number of waiters]
+        self._in_flight: Dict[str, list] = {}
+        self.stats = {
+            "submitted": 0,
+            "coalesced": 0,
+            "completed": 0,
+            "errors": 0,
+            "timeouts": 0,
+            "cancelled": 0,
+        }
+
+    @property
+    def sampler(self) -> Any:
+        """The DynexSDK sampler, created on first access"""
+        if not self._sampler_ready:
+            with self._sampler_lock:
+                if not self._sampler_ready:
+                    self._sampler = self._sampler_factory()
+                    self._sampler_ready = True
+        return self._sampler
+
+    @sampler.setter
+    def sampler(self, sampler: Any):
+        with self._sampler_lock:
+            self._sampler = sampler
+            self._sampler_ready = True
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._sampler_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_concurrency,
+                        thread_name_prefix="dynex",
+                    )
+        return self._executor
 
-    # Legacy stub code removed; now uses real Dynex SDK above.
     async def submit_qubo(
-        self, qubo: Any, algorithm: str = "qaoa", parameters: Optional[Dict] = None
+        self,
+        qubo: Any,
+        algorithm: str = "qaoa",
+        parameters: Optional[Dict] = None,
+        timeout: Optional[float] = None,
     ) -> Dict:
         """
         Submit QUBO to Dynex and return result using the real SDK.
-        - qubo: QUBO matrix or dimod.BinaryQuadraticModel
+        - qubo: SparseQUBO, QUBO dict or dimod.BinaryQuadraticModel
         - algorithm: QAOA, VQE, custom, etc. (currently ignored, DynexSampler used)
         - parameters: algorithm-specific params (num_reads, annealing_time, etc.)
+        - timeout: seconds to wait, defaulting to ``parameters["timeout"]`` and
+          then the client timeout; a timed-out request returns status "timeout"
+
+        Concurrent submissions of the same QUBO, algorithm and parameters are
+        served by a single sampler call.
         """
+        if timeout is None:
+            timeout = (parameters or {}).get("timeout", self.timeout)
         logger.info(f"Submitting QUBO to Dynex: algo={algorithm}, params={parameters}")
-        
-        # Check if client is properly initialized
-        if self.sampler is None:
+
+        loop = asyncio.get_running_loop()
+        key = self._request_key(qubo, algorithm, parameters)
+        slot = self._in_flight.get(key) if key is not None else None
+        if slot is not None and slot[0].get_loop() is not loop:
+            slot = None
+        if slot is None:
+            future = loop.run_in_executor(
+                self._get_executor(), self._sample, qubo, algorithm, parameters
+            )
+            slot = [future, 0]
+            if key is not None:
+                self._in_flight[key] = slot
+                future.add_done_callback(lambda _: self._release(key, slot))
+            self.stats["submitted"] += 1
+        else:
+            self.stats["coalesced"] += 1
+
+        future = slot[0]
+        slot[1] += 1
+        try:
+            result = await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            logger.warning(f"Dynex request timed out after {timeout}s")
+            return self._error_result(
+                parameters, algorithm, f"Timed out after {timeout}s", "timeout"
+            )
+        except asyncio.CancelledError:
+            self.stats["cancelled"] += 1
+            raise
+        finally:
+            slot[1] -= 1
+            if slot[1] == 0 and not future.done():
+                # Nobody is waiting any more; drop the call if it has not started
+                future.cancel()
+        # Coalesced waiters get their own copy to mutate
+        return dict(result)
+
+    def _release(self, key: str, slot: list):
+        if self._in_flight.get(key) is slot:
+            del self._in_flight[key]
+
+    @staticmethod
+    def _request_key(
+        qubo: Any, algorithm: str, parameters: Optional[Dict]
+    ) -> Optional[str]:
+        """Content hash identifying a submission, or None if it cannot be hashed"""
+        params = {
+            k: v
+            for k, v in (parameters or {}).items()
+            if k not in _REQUEST_ONLY_PARAMETERS
+        }
+        params["algorithm"] = algorithm
+        try:
+            if isinstance(qubo, dict) and ("linear" in qubo or "quadratic" in qubo):
+                return qubo_cache_key(
+                    qubo.get("quadratic", {}),
+                    qubo.get("offset", 0.0),
+                    params,
+                    linear=qubo.get("linear", {}),
+                )
+            if hasattr(qubo, "quadratic") and hasattr(qubo, "linear"):
+                # dimod.BinaryQuadraticModel
+                return qubo_cache_key(
+                    dict(qubo.quadratic),
+                    qubo.offset,
+                    params,
+                    linear=dict(qubo.linear),
+                )
+            return qubo_cache_key(qubo, 0.0, params)
+        except (TypeError, ValueError):
+            return None
+
+    def _sample(self, qubo: Any, algorithm: str, parameters: Optional[Dict]) -> Dict:
+        """Run one sampler call; executed on the worker pool"""
+        sampler = self.sampler
+        if sampler is None:
             logger.warning("DynexSDK client not available, returning mock result")
             return self._mock_result(parameters)
-        
+
         try:
             import dimod
-            
-            # Accept either a BQM or a dict for QUBO
-            if isinstance(qubo, dict):
+
+            # Accept a SparseQUBO, a BQM or a dict for QUBO
+            if isinstance(qubo, SparseQUBO):
+                bqm = qubo.to_bqm()
+            elif isinstance(qubo, dict):
                 linear = qubo.get("linear", {})
                 quadratic = qubo.get("quadratic", {})
                 offset = qubo.get("offset", 0.0)
-                bqm = dimod.BinaryQuadraticModel(linear, quadratic, offset, dimod.BINARY)
+                bqm = dimod.BinaryQuadraticModel(
+                    linear, quadratic, offset, dimod.BINARY
+                )
             else:
                 bqm = qubo
-            
-            # Extract parameters
-            num_reads = parameters.get("num_reads", 1000) if parameters else 1000
-            annealing_time = parameters.get("annealing_time", 100) if parameters else 100
-            
-            # Submit to Dynex using pre-initialized sampler
-            sampleset = await asyncio.to_thread(
-                self.sampler.sample, bqm, annealing_time=annealing_time
-            )
-            
-            # Process results
+
+            annealing_time = (parameters or {}).get("annealing_time", 100)
+            sampleset = sampler.sample(bqm, annealing_time=annealing_time)
+
             samples = [dict(s) for s in sampleset.samples()]
             energies = [e for e in sampleset.record.energy]
-            
+
             result = {
                 "samples": samples,
                 "energies": energies,
@@ -98,35 +243,57 @@ class DynexClient:
                 "job_id": getattr(sampleset, "job_id", None),
                 "parameters": parameters,
                 "status": "completed",
-                "algorithm": algorithm
+                "algorithm": algorithm,
             }
-            
-            logger.info(f"QUBO submission completed successfully, job_id: {result.get('job_id')}")
+
+            self.stats["completed"] += 1
+            logger.info(
+                f"QUBO submission completed successfully, job_id: {result.get('job_id')}"
+            )
             return result
-            
+
         except Exception as e:
+            self.stats["errors"] += 1
             logger.error(f"Error submitting QUBO to Dynex: {e}")
-            return {
-                "samples": [],
-                "energies": [],
-                "first_sample": {},
-                "first_energy": None,
-                "job_id": None,
-                "parameters": parameters,
-                "status": "error",
-                "error": str(e),
-                "algorithm": algorithm
-            }
-    
+            return self._error_result(parameters, algorithm, str(e))
+
+    @staticmethod
+    def _error_result(
+        parameters: Optional[Dict], algorithm: str, error: str, status: str = "error"
+    ) -> Dict:
+        return {
+            "samples": [],
+            "energies": [],
+            "first_sample": {},
+            "first_energy": None,
+            "job_id": None,
+            "parameters": parameters,
+            "status": status,
+            "error": error,
+            "algorithm": algorithm,
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Submission counters and the number of distinct in-flight requests"""
+        return {
+            **self.stats,
+            "in_flight": len(self._in_flight),
+            "max_concurrency": self.max_concurrency,
+        }
+
+    def close(self):
+        """Stop the worker pool; queued sampler calls are dropped"""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
     def _mock_result(self, parameters: Optional[Dict] = None) -> Dict:
         """Return a mock result when DynexSDK is not available."""
-        import random
-        
         # Generate mock binary solution
         num_vars = 10  # Default number of variables
         mock_sample = {i: random.choice([0, 1]) for i in range(num_vars)}
         mock_energy = random.uniform(-100, 100)
-        
+
         return {
             "samples": [mock_sample],
             "energies": [mock_energy],
@@ -135,13 +302,19 @@ class DynexClient:
             "job_id": f"mock_{random.randint(1000, 9999)}",
             "parameters": parameters,
             "status": "mock",
-            "algorithm": "mock"
+            "algorithm": "mock",
         }
 
 
-# Singleton for handler use
-_dynex_client = DynexClient()
+# Singleton for handler use, created on first request
+_dynex_client: Optional[DynexClient] = None
+_dynex_client_lock = threading.Lock()
 
 
-def get_dynex_client():
+def get_dynex_client() -> DynexClient:
+    global _dynex_client
+    if _dynex_client is None:
+        with _dynex_client_lock:
+            if _dynex_client is None:
+                _dynex_client = DynexClient()
     return _dynex_client
@@ -3,7 +3,7 @@
 import asyncio
 import logging
 import numpy as np
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 import time
@@ -12,6 +12,7 @@ import concurrent.futures
 # Import our components
 from .quantum_adapter import QuantumAdapter
 from .decision_logic import DecisionLogicEngine
+from .quantum.sparse_qubo import SparseQUBO
 
 logger = logging.getLogger(__name__)
 
@@ -135,7 +136,7 @@ class NQBAEngine:
 
     async def optimize_qubo(
         self,
-        qubo_matrix: np.ndarray,
+        qubo_matrix: Union[np.ndarray, SparseQUBO],
         algorithm: str = "qaoa",
         parameters: Optional[Dict[str, Any]] = None,
     ) -> ExecutionResult:
@@ -258,10 +259,17 @@ class NQBAEngine:
         if "gates" not in circuit_spec:
             raise ValueError("Circuit must specify gates")
 
-    def _validate_qubo_matrix(self, qubo_matrix: np.ndarray):
+    def _validate_qubo_matrix(self, qubo_matrix: Union[np.ndarray, SparseQUBO]):
         """Validate QUBO matrix"""
+        if isinstance(qubo_matrix, SparseQUBO):
+            if qubo_matrix.num_variables > self.max_qubits:
+                raise ValueError(
+                    f"QUBO size {qubo_matrix.num_variables} exceed max qubits {self.max_qubits}"
+                )
+            return
+
         if not isinstance(qubo_matrix, np.ndarray):
-            raise ValueError("QUBO matrix must be a numpy array")
+            raise ValueError("QUBO matrix must be a numpy array or SparseQUBO")
 
         if qubo_matrix.ndim != 2:
             raise ValueError("QUBO matrix must be 2-dimensional")
@@ -289,7 +297,7 @@ class NQBAEngine:
 
     def _qubo_to_circuit(
         self,
-        qubo_matrix: np.ndarray,
+        qubo_matrix: Union[np.ndarray, SparseQUBO],
         algorithm: str,
         parameters: Optional[Dict[str, Any]],
     ) -> Dict[str, Any]:
@@ -336,11 +344,14 @@ class NQBAEngine:
         return circuit
 
     def _create_qaoa_circuit(
-        self, qubo_matrix: np.ndarray, parameters: Optional[Dict[str, Any]]
+        self,
+        qubo_matrix: Union[np.ndarray, SparseQUBO],
+        parameters: Optional[Dict[str, Any]],
     ) -> List[Dict[str, Any]]:
         """Create QAOA circuit for QUBO optimization"""
         n = qubo_matrix.shape[0]
         p = parameters.get("p", 1) if parameters else 1
+        couplings = self._coupling_pairs(qubo_matrix)
 
         gates = []
 
@@ -351,20 +362,12 @@ class NQBAEngine:
         # QAOA layers
         for layer in range(p):
             # Cost Hamiltonian
-            for i in range(n):
-                for j in range(i + 1, n):
-                    if qubo_matrix[i, j] != 0:
-                        gates.append(
-                            {"type": "rz", "target": i, "angle": f"gamma_{layer}"}
-                        )
-                        gates.append(
-                            {"type": "rz", "target": j, "angle": f"gamma_{layer}"}
-                        )
-                        gates.append({"type": "cx", "control": i, "target": j})
-                        gates.append(
-                            {"type": "rz", "target": j, "angle": f"gamma_{layer}"}
-                        )
-                        gates.append({"type": "cx", "control": i, "target": j})
+            for i, j in couplings:
+                gates.append({"type": "rz", "target": i, "angle": f"gamma_{layer}"})
+                gates.append({"type": "rz", "target": j, "angle": f"gamma_{layer}"})
+                gates.append({"type": "cx", "control": i, "target": j})
+                gates.append({"type": "rz", "target": j, "angle": f"gamma_{layer}"})
+                gates.append({"type": "cx", "control": i, "target": j})
 
             # Mixing Hamiltonian
             for i in range(n):
@@ -372,8 +375,21 @@ class NQBAEngine:
 
         return gates
 
+    @staticmethod
+    def _coupling_pairs(
+        qubo_matrix: Union[np.ndarray, SparseQUBO],
+    ) -> List[Tuple[int, int]]:
+        """Upper-triangle (i, j) pairs with a non-zero coupling, row-major"""
+        if isinstance(qubo_matrix, SparseQUBO):
+            rows, cols = qubo_matrix.rows, qubo_matrix.cols
+        else:
+            rows, cols = np.nonzero(np.triu(qubo_matrix, k=1))
+        return list(zip(rows.tolist(), cols.tolist()))
+
     def _create_vqe_circuit(
-        self, qubo_matrix: np.ndarray, parameters: Optional[Dict[str, Any]]
+        self,
+        qubo_matrix: Union[np.ndarray, SparseQUBO],
+        parameters: Optional[Dict[str, Any]],
     ) -> List[Dict[str, Any]]:
         """Create VQE circuit for QUBO optimization"""
         n = qubo_matrix.shape[0]
@@ -0,0 +1,293 @@
+"""
+LTC Archive - Compressed, Columnar Storage for Closed LTC Log Files
+
+A closed ``ltc_*.jsonl`` file is converted into an ``ltc_*.ltca`` archive:
+- entries are grouped into blocks of ``block_size`` rows
+- every field of a block is stored as its own compressed column (zstd when
+  ``zstandard`` is installed, zlib otherwise), so a scan only decompresses
+  the columns it filters on
+- a footer keeps, per block, the min/max timestamp and the value counts of
+  the indexed fields, so whole blocks are pruned without being read
+
+Entries round-trip unchanged, including their integrity ``hash``; the
+archive is verified against its source before the source is removed.
+
+Layout::
+
+    MAGIC | column chunks ... | footer | footer length (u64) | codec | MAGIC
+"""
+
+import json
+import logging
+import os
+import struct
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .compression import Codec
+from .ltc_index import INDEXED_FIELDS, to_epoch
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_VERSION = 1
+ARCHIVE_SUFFIX = ".ltca"
+MAGIC = b"LTCA\x01"
+TRAILER = struct.Struct("<Q4s")
+DEFAULT_BLOCK_SIZE = 2048
+
+# Column holding the parsed timestamps as float64 epoch seconds
+EPOCH_COLUMN = "_epoch"
+
+
+def archive_path(log_file: Path) -> Path:
+    """Archive path for a log file"""
+    return log_file.with_suffix(ARCHIVE_SUFFIX)
+
+
+def _read_entries(log_file: Path) -> Iterator[Dict[str, Any]]:
+    """Entries of a JSONL log file, skipping headers and torn lines"""
+    with open(log_file, "rb") as f:
+        for line in f:
+            if not line.strip() or line.startswith(b"#"):
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                logger.warning(f"Skipping unreadable line in {log_file}")
+
+
+def _blocks(entries: Iterator[Dict[str, Any]], size: int) -> Iterator[List[dict]]:
+    block = []
+    for entry in entries:
+        block.append(entry)
+        if len(block) >= size:
+            yield block
+            block = []
+    if block:
+        yield block
+
+
+def write_archive(
+    log_file: Path,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    codec: Optional[str] = None,
+) -> Path:
+    """
+    Convert a closed JSONL log file into a verified archive next to it.
+
+    The archive is written to a temporary file, read back and compared entry
+    by entry with the source, and only then moved into place. The source
+    file is left for the caller to remove.
+    """
+    codec = Codec(codec) if codec else Codec.default()
+    target = archive_path(log_file)
+    tmp = target.with_name(target.name + ".tmp")
+
+    blocks = []
+    with open(tmp, "wb") as f:
+        f.write(MAGIC)
+        for entries in _blocks(_read_entries(log_file), block_size):
+            blocks.append(_write_block(f, entries, codec))
+        footer = {
+            "version": ARCHIVE_VERSION,
+            "source_file": log_file.name,
+            "source_size": log_file.stat().st_size,
+            "entries": sum(block["rows"] for block in blocks),
+            "blocks": blocks,
+        }
+        footer_bytes = codec.compress(json.dumps(footer).encode())
+        f.write(footer_bytes)
+        f.write(TRAILER.pack(len(footer_bytes), codec.tag))
+        f.write(MAGIC)
+
+    try:
+        _verify(tmp, log_file)
+    except Exception:
+        tmp.unlink()
+        raise
+    tmp.replace(target)
+    return target
+
+
+def _write_block(f, entries: List[Dict[str, Any]], codec: Codec) -> Dict[str, Any]:
+    """Write one block's columns and return its footer record"""
+    fields = dict.fromkeys(entries[0])
+    for entry in entries[1:]:
+        if entry.keys() != fields.keys():
+            fields.update(dict.fromkeys(entry))
+    fields = list(fields)
+
+    epochs = array("d", (to_epoch(entry["timestamp"]) for entry in entries))
+    columns = {}
+    for field in fields:
+        data = json.dumps([entry.get(field) for entry in entries], default=str)
+        columns[field] = data.encode()
+    columns[EPOCH_COLUMN] = epochs.tobytes()
+
+    locations = {}
+    for name, data in columns.items():
+        chunk = codec.compress(data)
+        locations[name] = [f.tell(), len(chunk)]
+        f.write(chunk)
+
+    value_counts = {}
+    for field in INDEXED_FIELDS:
+        counts: Dict[str, int] = {}
+        for entry in entries:
+            value = entry.get(field)
+            if value is not None:
+                counts[value] = counts.get(value, 0) + 1
+        value_counts[field] = counts
+
+    return {
+        "rows": len(entries),
+        "fields": fields,
+        "columns": locations,
+        "min_timestamp": min(epochs),
+        "max_timestamp": max(epochs),
+        "values": value_counts,
+    }
+
+
+def _verify(archive_file: Path, log_file: Path):
+    """Raise ValueError unless the archive holds exactly the source's entries"""
+    with LTCArchiveReader(archive_file) as reader:
+        archived = reader.entries()
+        for expected in _read_entries(log_file):
+            if next(archived, None) != expected:
+                raise ValueError(f"Archive of {log_file.name} does not match source")
+        if next(archived, None) is not None:
+            raise ValueError(f"Archive of {log_file.name} has extra entries")
+
+
+class LTCArchiveReader:
+    """Block- and column-wise access to an LTC archive"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._load_footer()
+        except Exception:
+            self._file.close()
+            raise
+        self._ids: Optional[Dict[str, Tuple[int, int]]] = None
+
+    def _load_footer(self):
+        f = self._file
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{self.path} is not an LTC archive")
+        f.seek(-(TRAILER.size + len(MAGIC)), 2)
+        footer_length, tag = TRAILER.unpack(f.read(TRAILER.size))
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{self.path} is truncated")
+        self.codec = Codec.from_tag(tag)
+        f.seek(-(TRAILER.size + len(MAGIC) + footer_length), 2)
+        footer = json.loads(self.codec.decompress(f.read(footer_length)))
+        if footer.get("version") != ARCHIVE_VERSION:
+            raise ValueError(f"Unsupported LTC archive version in {self.path}")
+        self.footer = footer
+        self.blocks: List[Dict[str, Any]] = footer["blocks"]
+
+    def __len__(self) -> int:
+        return self.footer["entries"]
+
+    @property
+    def min_timestamp(self) -> Optional[float]:
+        return min((b["min_timestamp"] for b in self.blocks), default=None)
+
+    @property
+    def max_timestamp(self) -> Optional[float]:
+        return max((b["max_timestamp"] for b in self.blocks), default=None)
+
+    def column(self, block: int, name: str) -> List[Any]:
+        """Decompress one column of a block"""
+        offset, length = self.blocks[block]["columns"][name]
+        # pread keeps concurrent readers of one archive from racing on seek
+        data = self.codec.decompress(os.pread(self._file.fileno(), length, offset))
+        if name == EPOCH_COLUMN:
+            return array("d", data).tolist()
+        return json.loads(data)
+
+    def block_entries(
+        self, block: int, rows: Optional[List[int]] = None
+    ) -> List[Dict[str, Any]]:
+        """Entries of a block in write order, or just the given rows"""
+        fields = self.blocks[block]["fields"]
+        columns = [self.column(block, field) for field in fields]
+        if rows is None:
+            return [dict(zip(fields, values)) for values in zip(*columns)]
+        return [{f: c[row] for f, c in zip(fields, columns)} for row in rows]
+
+    def entries(self) -> Iterator[Dict[str, Any]]:
+        """Every entry, oldest first"""
+        for block in range(len(self.blocks)):
+            yield from self.block_entries(block)
+
+    def search(
+        self,
+        filters: Dict[str, Optional[str]],
+        session_id: Optional[str] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Matching entries, newest first, decoding only blocks that may match"""
+        active = {field: value for field, value in filters.items() if value}
+        for block in range(len(self.blocks) - 1, -1, -1):
+            meta = self.blocks[block]
+            if start is not None and meta["max_timestamp"] < start:
+                continue
+            if end is not None and meta["min_timestamp"] > end:
+                continue
+            if any(value not in meta["values"][f] for f, value in active.items()):
+                continue
+
+            rows = range(meta["rows"] - 1, -1, -1)
+            if start is not None or end is not None:
+                epochs = self.column(block, EPOCH_COLUMN)
+                rows = [
+                    row
+                    for row in rows
+                    if (start is None or epochs[row] >= start)
+                    and (end is None or epochs[row] <= end)
+                ]
+            conditions = dict(active)
+            if session_id:
+                conditions["session_id"] = session_id
+            for field, value in conditions.items():
+                if not rows:
+                    break
+                column = self.column(block, field)
+                rows = [row for row in rows if column[row] == value]
+            if not rows:
+                continue
+
+            yield from self.block_entries(block, list(rows))
+
+    def locate(self, entry_id: str) -> Optional[Tuple[int, int]]:
+        """(block, row) of an entry, building the id map on first use"""
+        return self.ids.get(entry_id)
+
+    @property
+    def ids(self) -> Dict[str, Tuple[int, int]]:
+        if self._ids is None:
+            self._ids = {
+                entry_id: (block, row)
+                for block in range(len(self.blocks))
+                for row, entry_id in enumerate(self.column(block, "entry_id"))
+            }
+        return self._ids
+
+    def read(self, block: int, row: int) -> Dict[str, Any]:
+        """One entry, decoding only its block"""
+        return self.block_entries(block, [row])[0]
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self) -> "LTCArchiveReader":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
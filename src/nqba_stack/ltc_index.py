@@ -0,0 +1,216 @@
+"""
+LTC File Index - Sidecar Indexes for Rotated LTC JSONL Files
+
+Each closed ``ltc_*.jsonl`` file gets an ``ltc_*.jsonl.idx`` sidecar with:
+- entry_id -> byte offset of its line
+- per-line timestamps and the file's time range, for pruning whole files
+- postings (value -> line numbers) for component, operation_type and user_id
+
+The writer builds the index of the open file as it appends, so rotation
+only has to save it. Files without a (current) sidecar are indexed lazily.
+"""
+
+import json
+import logging
+import mmap
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+INDEX_SUFFIX = ".idx"
+
+# Entry fields with postings lists
+INDEXED_FIELDS = ("component", "operation_type", "user_id")
+
+
+def index_path(log_file: Path) -> Path:
+    """Sidecar path for a log file"""
+    return log_file.with_name(log_file.name + INDEX_SUFFIX)
+
+
+def to_epoch(value: Any) -> float:
+    """Seconds since the epoch for an ISO timestamp or datetime (naive = UTC)"""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class LTCFileIndex:
+    """Offsets, timestamps and postings for the entries of one LTC file"""
+
+    def __init__(self, file_size: int = 0):
+        self.file_size = file_size
+        self.offsets: List[int] = []
+        self.timestamps: List[float] = []
+        self.ids: Dict[str, int] = {}
+        self.postings: Dict[str, Dict[str, List[int]]] = {
+            field: {} for field in INDEXED_FIELDS
+        }
+        self.min_timestamp: Optional[float] = None
+        self.max_timestamp: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def add(self, entry: Dict[str, Any], offset: int, end: int):
+        """Record an entry whose line occupies bytes [offset, end)"""
+        row = len(self.offsets)
+        timestamp = to_epoch(entry["timestamp"])
+        self.offsets.append(offset)
+        self.timestamps.append(timestamp)
+        if self.min_timestamp is None or timestamp < self.min_timestamp:
+            self.min_timestamp = timestamp
+        if self.max_timestamp is None or timestamp > self.max_timestamp:
+            self.max_timestamp = timestamp
+        self.ids[entry["entry_id"]] = row
+        for field in INDEXED_FIELDS:
+            value = entry.get(field)
+            if value is not None:
+                self.postings[field].setdefault(value, []).append(row)
+        self.file_size = end
+
+    def overlaps(self, start: Optional[float], end: Optional[float]) -> bool:
+        """Whether any entry may fall inside [start, end]"""
+        if not self.timestamps:
+            return False
+        if start is not None and self.max_timestamp < start:
+            return False
+        if end is not None and self.min_timestamp > end:
+            return False
+        return True
+
+    def candidates(
+        self,
+        filters: Dict[str, Optional[str]],
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> List[int]:
+        """Line numbers matching the indexed filters and time range, newest first"""
+        rows = None
+        for field, value in filters.items():
+            if value is None:
+                continue
+            posting = self.postings[field].get(value, [])
+            rows = set(posting) if rows is None else rows.intersection(posting)
+            if not rows:
+                return []
+        ordered = (
+            range(len(self.offsets) - 1, -1, -1) if rows is None else sorted(rows)[::-1]
+        )
+        timestamps = self.timestamps
+        return [
+            row
+            for row in ordered
+            if (start is None or timestamps[row] >= start)
+            and (end is None or timestamps[row] <= end)
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        ids = [""] * len(self.offsets)
+        for entry_id, row in self.ids.items():
+            ids[row] = entry_id
+        return {
+            "version": INDEX_VERSION,
+            "file_size": self.file_size,
+            "offsets": self.offsets,
+            "timestamps": self.timestamps,
+            "ids": ids,
+            "postings": self.postings,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LTCFileIndex":
+        index = cls(data["file_size"])
+        index.offsets = data["offsets"]
+        index.timestamps = data["timestamps"]
+        index.ids = {entry_id: row for row, entry_id in enumerate(data["ids"])}
+        index.postings = data["postings"]
+        if index.timestamps:
+            index.min_timestamp = min(index.timestamps)
+            index.max_timestamp = max(index.timestamps)
+        return index
+
+    def save(self, log_file: Path):
+        """Write the sidecar atomically"""
+        path = index_path(log_file)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, log_file: Path) -> Optional["LTCFileIndex"]:
+        """Load a sidecar if it exists and matches the log file's size"""
+        path = index_path(log_file)
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != INDEX_VERSION:
+            return None
+        if data.get("file_size") != log_file.stat().st_size:
+            return None
+        return cls.from_dict(data)
+
+    @classmethod
+    def build(cls, log_file: Path) -> "LTCFileIndex":
+        """Index a log file by scanning it once"""
+        index = cls()
+        offset = 0
+        with open(log_file, "rb") as f:
+            for line in f:
+                end = offset + len(line)
+                if line.strip() and not line.startswith(b"#"):
+                    try:
+                        index.add(json.loads(line), offset, end)
+                    except (ValueError, KeyError):
+                        pass
+                offset = end
+        index.file_size = offset
+        return index
+
+    @classmethod
+    def load_or_build(cls, log_file: Path) -> "LTCFileIndex":
+        """Load the sidecar, rebuilding and saving it when missing or stale"""
+        index = cls.load(log_file)
+        if index is None:
+            index = cls.build(log_file)
+            try:
+                index.save(log_file)
+            except OSError as e:
+                logger.warning(f"Could not save LTC index for {log_file}: {e}")
+        return index
+
+
+class LTCFileReader:
+    """Memory-mapped random access to the lines of an LTC file"""
+
+    def __init__(self, log_file: Path):
+        self._file = open(log_file, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            self._map = None
+
+    def read(self, offset: int) -> Dict[str, Any]:
+        """Parse the JSON line starting at ``offset``"""
+        end = self._map.find(b"\n", offset)
+        return json.loads(self._map[offset : end if end >= 0 else len(self._map)])
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "LTCFileReader":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
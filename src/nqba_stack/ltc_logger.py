@@ -4,6 +4,11 @@ Living Technical Codex (LTC) Logger
 This module provides comprehensive logging and traceability for all NQBA operations,
 creating a living record of decisions, executions, and outcomes for audit,
 compliance, and learning purposes.
+
+Rotated log files are indexed by sidecar files (see ltc_index), so searches
+prune files by time range, seek straight to matching lines and return the
+newest entries first. Closed files can be archived into compressed, columnar
+block files (see ltc_archive) that searches and lookups read directly.
 """
 
 import asyncio
@@ -12,7 +17,7 @@ import json
 import time
 import uuid
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Iterator, Optional, List, Tuple, Union
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import hashlib
@@ -20,6 +25,15 @@ import threading
 from queue import Queue
 import os
 
+from .ltc_archive import (
+    ARCHIVE_SUFFIX,
+    DEFAULT_BLOCK_SIZE,
+    LTCArchiveReader,
+    archive_path,
+    write_archive,
+)
+from .ltc_index import LTCFileIndex, LTCFileReader, index_path, to_epoch
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -55,6 +69,8 @@ class LTCConfig:
     async_writing: bool = True
     batch_size: int = 100
     flush_interval: float = 5.0  # seconds
+    archive_rotated_files: bool = False  # archive each file once it is closed
+    archive_block_size: int = DEFAULT_BLOCK_SIZE
 
 class LTCLogger:
     """Living Technical Codex Logger for comprehensive traceability"""
@@ -79,6 +95,18 @@ class LTCLogger:
         self.write_thread = None
         self.running = False
         
+        # Indexes: the open file's is built while writing, closed files' are
+        # loaded from (or written to) sidecars on demand
+        self._index_lock = threading.Lock()
+        self._current_index = LTCFileIndex()
+        self._indexes: Dict[Path, LTCFileIndex] = {}
+        self._id_locations: Dict[str, Path] = {}
+        
+        # Archives of closed files; one conversion runs at a time
+        self._archives: Dict[Path, LTCArchiveReader] = {}
+        self._archive_lock = threading.Lock()
+        self._archive_threads: List[threading.Thread] = []
+        
         # Start background writer if async writing is enabled
         if self.config.async_writing:
             self._start_background_writer()
@@ -90,16 +118,22 @@ class LTCLogger:
     
     def _initialize_log_file(self):
         """Initialize the current log file"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"ltc_{timestamp}.jsonl"
-        self.current_file = self.storage_path / filename
+        self.current_file = self._create_log_file()
         self.current_file_entries = 0
+    
+    def _create_log_file(self) -> Path:
+        """Create a new log file with its header"""
+        # Microseconds keep two rotations within one second from colliding
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        filename = f"ltc_{timestamp}.jsonl"
+        log_file = self.storage_path / filename
         
         # Create file with header
-        with open(self.current_file, 'w') as f:
+        with open(log_file, 'w') as f:
             f.write(f"# LTC Log File: {filename}\n")
             f.write(f"# Created: {datetime.now().isoformat()}\n")
             f.write(f"# Format: JSON Lines\n\n")
+        return log_file
     
     def _start_background_writer(self):
         """Start background thread for async writing"""
@@ -441,55 +475,207 @@ class LTCLogger:
     async def _write_entry_async(self, entry: LTCEntry):
         """Write a single entry asynchronously"""
         try:
-            # Check if we need to rotate the log file
-            if (self.current_file_entries >= self.config.max_entries_per_file or
-                self.current_file.stat().st_size >= self.config.max_file_size):
-                self._rotate_log_file()
-            
-            # Write entry
-            entry_json = json.dumps(asdict(entry), default=str)
-            with open(self.current_file, 'a') as f:
-                f.write(entry_json + '\n')
-            
-            self.current_file_entries += 1
-            self.entry_counter += 1
-            
+            self._append_entries([entry])
         except Exception as e:
             logger.error(f"Failed to write LTC entry: {e}")
     
     def _write_entries_sync(self, entries: List[LTCEntry]):
         """Write multiple entries synchronously (for background writer)"""
         try:
-            # Check if we need to rotate the log file
-            if (self.current_file_entries >= self.config.max_entries_per_file or
-                self.current_file.stat().st_size >= self.config.max_file_size):
-                self._rotate_log_file()
-            
-            # Write all entries
-            with open(self.current_file, 'a') as f:
-                for entry in entries:
-                    entry_json = json.dumps(asdict(entry), default=str)
-                    f.write(entry_json + '\n')
-                    self.current_file_entries += 1
-                    self.entry_counter += 1
-                    
+            self._append_entries(entries)
         except Exception as e:
             logger.error(f"Failed to write LTC entries: {e}")
     
+    def _append_entries(self, entries: List[LTCEntry]):
+        """Append entries to the current file and add them to its index"""
+        # Check if we need to rotate the log file
+        if (self.current_file_entries >= self.config.max_entries_per_file or
+            self.current_file.stat().st_size >= self.config.max_file_size):
+            self._rotate_log_file()
+        
+        # Write all entries, remembering where each line starts and ends
+        written = []
+        with open(self.current_file, 'ab') as f:
+            offset = f.tell()
+            for entry in entries:
+                entry_data = asdict(entry)
+                line = (json.dumps(entry_data, default=str) + '\n').encode()
+                f.write(line)
+                written.append((entry_data, offset, offset + len(line)))
+                offset += len(line)
+        
+        # Index only after the lines are on disk so readers never see a gap
+        with self._index_lock:
+            for entry_data, start, end in written:
+                self._current_index.add(entry_data, start, end)
+        
+        self.current_file_entries += len(entries)
+        self.entry_counter += len(entries)
+    
     def _rotate_log_file(self):
         """Rotate to a new log file"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"ltc_{timestamp}.jsonl"
-        self.current_file = self.storage_path / filename
+        new_file = self._create_log_file()
+        
+        with self._index_lock:
+            closed_file, closed_index = self.current_file, self._current_index
+            self.current_file = new_file
+            self._current_index = LTCFileIndex()
         self.current_file_entries = 0
         
-        # Create new file with header
-        with open(self.current_file, 'w') as f:
-            f.write(f"# LTC Log File: {filename}\n")
-            f.write(f"# Created: {datetime.now().isoformat()}\n")
-            f.write(f"# Format: JSON Lines\n\n")
+        self._register_index(closed_file, closed_index)
+        try:
+            closed_index.save(closed_file)
+        except OSError as e:
+            logger.warning(f"Could not save LTC index for {closed_file}: {e}")
+        
+        if self.config.archive_rotated_files:
+            thread = threading.Thread(
+                target=self.archive_log_file, args=(closed_file,), daemon=True
+            )
+            self._archive_threads = [t for t in self._archive_threads if t.is_alive()]
+            self._archive_threads.append(thread)
+            thread.start()
+        
+        logger.info(f"Rotated LTC log file to: {new_file.name}")
+    
+    def archive_log_file(self, log_file: Path) -> Optional[Path]:
+        """Convert a closed log file into a compressed archive
+        
+        The JSONL file and its sidecar are removed once the archive has been
+        verified against them; on any failure they are kept as they are.
+        
+        Args:
+            log_file: Closed ``ltc_*.jsonl`` file to archive
+            
+        Returns:
+            Path of the archive, or None if the file was not archived
+        """
+        
+        log_file = Path(log_file)
+        if log_file == self.current_file:
+            raise ValueError("The open LTC log file cannot be archived")
         
-        logger.info(f"Rotated LTC log file to: {filename}")
+        with self._archive_lock:
+            if not log_file.exists():
+                return None
+            try:
+                archive = write_archive(log_file, self.config.archive_block_size)
+                reader = LTCArchiveReader(archive)
+            except Exception as e:
+                logger.error(f"Failed to archive LTC log file {log_file}: {e}")
+                return None
+            
+            with self._index_lock:
+                stale = self._archives.pop(archive, None)
+                self._archives[archive] = reader
+                index = self._indexes.pop(log_file, None)
+                if index is not None:
+                    for entry_id in index.ids:
+                        self._id_locations[entry_id] = archive
+            if stale is not None:
+                stale.close()
+            
+            log_file.unlink()
+            index_path(log_file).unlink(missing_ok=True)
+        
+        logger.info(f"Archived LTC log file {log_file.name} as {archive.name}")
+        return archive
+    
+    def archive_closed_files(self) -> List[Path]:
+        """Archive every closed log file in the storage directory
+        
+        Returns:
+            Paths of the archives written
+        """
+        
+        closed_files = sorted(
+            f for f in self.storage_path.glob("ltc_*.jsonl") if f != self.current_file
+        )
+        archives = []
+        for log_file in closed_files:
+            archive = self.archive_log_file(log_file)
+            if archive is not None:
+                archives.append(archive)
+        return archives
+    
+    def _register_index(self, log_file: Path, index: LTCFileIndex):
+        """Cache a closed file's index and its entry locations"""
+        self._indexes[log_file] = index
+        for entry_id in index.ids:
+            self._id_locations[entry_id] = log_file
+    
+    def _get_index(self, log_file: Path) -> LTCFileIndex:
+        """Index of a closed file, loading or building it if not cached"""
+        index = self._indexes.get(log_file)
+        if index is None or index.file_size != log_file.stat().st_size:
+            index = LTCFileIndex.load_or_build(log_file)
+            self._register_index(log_file, index)
+        return index
+    
+    def _get_archive(self, archive: Path) -> LTCArchiveReader:
+        """Reader of an archive, opening it if not cached"""
+        with self._index_lock:
+            reader = self._archives.get(archive)
+            if reader is None:
+                reader = self._archives[archive] = LTCArchiveReader(archive)
+            return reader
+    
+    def _sources_newest_first(self) -> Iterator[Tuple[Path, Union[LTCFileIndex, LTCArchiveReader]]]:
+        """The open file and then every closed file or archive, newest first"""
+        with self._index_lock:
+            current_file, current_index = self.current_file, self._current_index
+        yield current_file, current_index
+        
+        closed = {}
+        for path in self.storage_path.glob("ltc_*"):
+            if path == current_file or path.suffix not in (".jsonl", ARCHIVE_SUFFIX):
+                continue
+            # A file whose archive is complete is about to be removed
+            if path.suffix == ARCHIVE_SUFFIX or path.stem not in closed:
+                closed[path.stem] = path
+        
+        for stem in sorted(closed, reverse=True):
+            source = self._open_source(closed[stem])
+            if source is not None:
+                yield source
+    
+    def _open_source(self, path: Path) -> Optional[Tuple[Path, Union[LTCFileIndex, LTCArchiveReader]]]:
+        """Index or archive reader for a closed file"""
+        try:
+            if path.suffix == ARCHIVE_SUFFIX:
+                return path, self._get_archive(path)
+            try:
+                return path, self._get_index(path)
+            except FileNotFoundError:
+                # Archived since the directory was listed
+                archive = archive_path(path)
+                return archive, self._get_archive(archive)
+        except Exception as e:
+            logger.warning(f"Error indexing log file {path}: {e}")
+            return None
+    
+    def _search_log_file(self,
+                         log_file: Path,
+                         index: LTCFileIndex,
+                         filters: Dict[str, Optional[str]],
+                         session_id: Optional[str],
+                         start: Optional[float],
+                         end: Optional[float]) -> Iterator[Dict[str, Any]]:
+        """Matching entries of a JSONL file, newest first"""
+        # Prune the whole file by time range, then use the postings
+        if not index.overlaps(start, end):
+            return
+        with self._index_lock:
+            rows = index.candidates(filters, start, end)
+        if not rows:
+            return
+        
+        with LTCFileReader(log_file) as reader:
+            for row in rows:
+                entry_data = reader.read(index.offsets[row])
+                if session_id and entry_data.get("session_id") != session_id:
+                    continue
+                yield entry_data
     
     def _generate_entry_hash(self, entry: LTCEntry) -> str:
         """Generate hash for entry integrity"""
@@ -516,70 +702,54 @@ class LTCLogger:
                            session_id: Optional[str] = None,
                            start_time: Optional[datetime] = None,
                            end_time: Optional[datetime] = None,
-                           limit: int = 100) -> List[LTCEntry]:
-        """Search for LTC entries based on criteria
+                           limit: int = 100,
+                           offset: int = 0) -> List[LTCEntry]:
+        """Search for LTC entries based on criteria, newest first
         
         Args:
             operation_type: Filter by operation type
             component: Filter by component
             user_id: Filter by user ID
             session_id: Filter by session ID
-            start_time: Start time for search range
-            end_time: End time for search range
+            start_time: Start time for search range (naive times are UTC)
+            end_time: End time for search range (naive times are UTC)
             limit: Maximum number of results
+            offset: Number of matching entries to skip, for pagination
             
         Returns:
             List of matching LTC entries
         """
         
-        # This is a simplified search implementation
-        # In production, this would use a proper database or search engine
+        start = to_epoch(start_time) if start_time else None
+        end = to_epoch(end_time) if end_time else None
+        filters = {
+            "operation_type": operation_type,
+            "component": component,
+            "user_id": user_id
+        }
         
         results = []
-        search_count = 0
-        
-        # Search through all log files
-        for log_file in self.storage_path.glob("ltc_*.jsonl"):
+        skip = offset
+        
+        for log_file, source in self._sources_newest_first():
+            if isinstance(source, LTCArchiveReader):
+                # Archives prune by block and decode only the filtered columns
+                matches = source.search(filters, session_id, start, end)
+            else:
+                matches = self._search_log_file(
+                    log_file, source, filters, session_id, start, end
+                )
+            
             try:
-                with open(log_file, 'r') as f:
-                    for line in f:
-                        if line.startswith('#') or not line.strip():
-                            continue
-                        
-                        try:
-                            entry_data = json.loads(line.strip())
-                            entry = LTCEntry(**entry_data)
-                            
-                            # Apply filters
-                            if operation_type and entry.operation_type != operation_type:
-                                continue
-                            if component and entry.component != component:
-                                continue
-                            if user_id and entry.user_id != user_id:
-                                continue
-                            if session_id and entry.session_id != session_id:
-                                continue
-                            
-                            # Time range filter
-                            if start_time or end_time:
-                                entry_time = datetime.fromisoformat(entry.timestamp.replace('Z', '+00:00'))
-                                if start_time and entry_time < start_time:
-                                    continue
-                                if end_time and entry_time > end_time:
-                                    continue
-                            
-                            results.append(entry)
-                            search_count += 1
-                            
-                            if search_count >= limit:
-                                break
-                                
-                        except json.JSONDecodeError:
-                            continue
-                            
-                if search_count >= limit:
-                    break
+                for entry_data in matches:
+                    if skip:
+                        skip -= 1
+                        continue
                     
+                    results.append(LTCEntry(**entry_data))
+                    if len(results) >= limit:
+                        return results
+                        
             except Exception as e:
                 logger.warning(f"Error reading log file {log_file}: {e}")
                 continue
@@ -596,26 +766,43 @@ class LTCLogger:
             LTC entry if found, None otherwise
         """
         
-        # Search through all log files for the specific entry
-        for log_file in self.storage_path.glob("ltc_*.jsonl"):
-            try:
-                with open(log_file, 'r') as f:
-                    for line in f:
-                        if line.startswith('#') or not line.strip():
-                            continue
-                        
-                        try:
-                            entry_data = json.loads(line.strip())
-                            if entry_data.get('entry_id') == entry_id:
-                                return LTCEntry(**entry_data)
-                        except json.JSONDecodeError:
-                            continue
-                            
-            except Exception as e:
-                logger.warning(f"Error reading log file {log_file}: {e}")
-                continue
+        location = self._locate_entry(entry_id)
+        if location is None:
+            # Pick up files rotated or archived by other loggers sharing the
+            # directory; indexes register their ids as they are loaded
+            for path, source in self._sources_newest_first():
+                if isinstance(source, LTCArchiveReader) and source.locate(entry_id):
+                    with self._index_lock:
+                        self._id_locations[entry_id] = path
+                    break
+            location = self._locate_entry(entry_id)
+        if location is None:
+            return None
         
-        return None
+        log_file, position = location
+        try:
+            if log_file.suffix == ARCHIVE_SUFFIX:
+                return LTCEntry(**self._get_archive(log_file).read(*position))
+            with LTCFileReader(log_file) as reader:
+                return LTCEntry(**reader.read(position))
+        except Exception as e:
+            logger.warning(f"Error reading log file {log_file}: {e}")
+            return None
+    
+    def _locate_entry(self, entry_id: str) -> Optional[Tuple[Path, Any]]:
+        """File and byte offset, or archive and (block, row), of an entry"""
+        with self._index_lock:
+            row = self._current_index.ids.get(entry_id)
+            if row is not None:
+                return self.current_file, self._current_index.offsets[row]
+            
+            log_file = self._id_locations.get(entry_id)
+            if log_file is None:
+                return None
+            if log_file.suffix == ARCHIVE_SUFFIX:
+                return log_file, self._archives[log_file].locate(entry_id)
+            index = self._indexes[log_file]
+            return log_file, index.offsets[index.ids[entry_id]]
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get LTC logging statistics
@@ -625,16 +812,35 @@ class LTCLogger:
         """
         
         total_entries = self.entry_counter
-        total_files = len(list(self.storage_path.glob("ltc_*.jsonl")))
+        log_files = list(self.storage_path.glob("ltc_*.jsonl"))
+        archives = list(self.storage_path.glob(f"ltc_*{ARCHIVE_SUFFIX}"))
+        total_files = len(log_files) + len(archives)
         
         # Calculate storage size
-        total_size = sum(f.stat().st_size for f in self.storage_path.glob("ltc_*.jsonl"))
+        archive_size = sum(f.stat().st_size for f in archives)
+        total_size = sum(f.stat().st_size for f in log_files) + archive_size
+        
+        # Archive footers record their entry counts and original sizes
+        archived_entries = 0
+        source_size = 0
+        for archive in archives:
+            try:
+                reader = self._get_archive(archive)
+            except Exception as e:
+                logger.warning(f"Error reading archive {archive}: {e}")
+                continue
+            archived_entries += len(reader)
+            source_size += reader.footer["source_size"]
         
         return {
             "total_entries": total_entries,
             "total_files": total_files,
             "total_size_bytes": total_size,
             "total_size_mb": total_size / (1024 * 1024),
+            "archived_files": len(archives),
+            "archived_entries": archived_entries,
+            "archive_size_bytes": archive_size,
+            "archive_compression_ratio": source_size / archive_size if archive_size else None,
             "current_file": str(self.current_file),
             "current_file_entries": self.current_file_entries,
             "background_writer_running": self.running,
@@ -648,6 +854,9 @@ class LTCLogger:
         if self.write_thread and self.write_thread.is_alive():
             self.write_thread.join(timeout=5.0)
         
+        for thread in self._archive_threads:
+            thread.join()
+        
         # Final flush of any remaining entries
         remaining_entries = []
         while not self.write_queue.empty():
@@ -660,4 +869,18 @@ class LTCLogger:
         if remaining_entries:
             self._write_entries_sync(remaining_entries)
         
+        # The current file is closed from now on; keep its index
+        with self._index_lock:
+            current_index = self._current_index
+        if len(current_index):
+            try:
+                current_index.save(self.current_file)
+            except OSError as e:
+                logger.warning(f"Could not save LTC index for {self.current_file}: {e}")
+        
+        with self._index_lock:
+            readers, self._archives = list(self._archives.values()), {}
+        for reader in readers:
+            reader.close()
+        
         logger.info("LTC Logger shutdown complete")
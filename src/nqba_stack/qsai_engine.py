@@ -15,9 +15,17 @@ Core Features:
 """
 
 import asyncio
+import inspect
 import logging
 import json
 import hashlib
+import random
+import sys
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict, deque
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import time
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Tuple, Union
@@ -31,6 +39,14 @@ from .qtransformer import qtransformer
 from .qnlp import qnlp
 from .dynex_client import get_dynex_client
 from .core.ltc_logger import LTCLogger
+from .quantum.exact_solver import (
+    INLINE_EXACT_VARIABLES,
+    MAX_EXACT_VARIABLES,
+    solve_exact,
+)
+
+# Slotted dataclasses where supported (Python 3.10+), to keep stores compact
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 logger = logging.getLogger(__name__)
 
@@ -69,7 +85,7 @@ class DecisionState(Enum):
     SIMULATING = "simulating"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ContextVector:
     """Real-time context for decision making"""
 
@@ -129,7 +145,7 @@ class ActionProposal:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ActionDecision:
     """Final action decision with full metadata"""
 
@@ -165,7 +181,7 @@ class ActionDecision:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AuditEntry:
     """Immutable audit trail entry"""
 
@@ -182,6 +198,7 @@ class AuditEntry:
     qubo_snapshots: List[Dict[str, Any]]
     signature: str
     timestamp: datetime = field(default_factory=datetime.now)
+    user_id: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -198,14 +215,298 @@ class AuditEntry:
             "qubo_snapshots": self.qubo_snapshots,
             "signature": self.signature,
             "timestamp": self.timestamp.isoformat(),
+            "user_id": self.user_id,
         }
 
 
+class ContextStore(MutableMapping):
+    """Latest context per user, bounded by count and age
+
+    Users are kept in least-recently-updated order; the oldest are evicted
+    once ``max_entries`` is exceeded or after ``retention_seconds``.
+    """
+
+    def __init__(self, max_entries: int = 10_000, retention_seconds: float = 3600.0):
+        self.max_entries = max_entries
+        self.retention_seconds = retention_seconds
+        self._data: "OrderedDict[str, Tuple[float, ContextVector]]" = OrderedDict()
+
+    def __getitem__(self, user_id: str) -> ContextVector:
+        self._evict()
+        return self._data[user_id][1]
+
+    def __setitem__(self, user_id: str, context: ContextVector):
+        self._data[user_id] = (time.monotonic(), context)
+        self._data.move_to_end(user_id)
+        self._evict()
+
+    def __delitem__(self, user_id: str):
+        del self._data[user_id]
+
+    def __iter__(self):
+        self._evict()
+        return iter(list(self._data))
+
+    def __len__(self) -> int:
+        self._evict()
+        return len(self._data)
+
+    def _evict(self):
+        data = self._data
+        while len(data) > self.max_entries:
+            data.popitem(last=False)
+        cutoff = time.monotonic() - self.retention_seconds
+        while data and next(iter(data.values()))[0] < cutoff:
+            data.popitem(last=False)
+
+
+# A time bucket's entries and the same entries grouped by user
+_AuditBucket = Tuple[List[AuditEntry], Dict[str, List[AuditEntry]]]
+
+
+class AuditTrailStore:
+    """Audit entries in time buckets, indexed by user
+
+    Buckets older than ``retention_seconds`` are dropped whole, as are the
+    oldest buckets while more than ``max_entries`` entries are held.
+    """
+
+    def __init__(
+        self,
+        retention_seconds: float = 86400.0,
+        bucket_seconds: float = 60.0,
+        max_entries: int = 100_000,
+    ):
+        self.retention_seconds = retention_seconds
+        self.bucket_seconds = bucket_seconds
+        self.max_entries = max_entries
+        self._keys: List[int] = []
+        self._buckets: Dict[int, _AuditBucket] = {}
+        self._count = 0
+
+    def _key(self, timestamp: datetime) -> int:
+        return int(timestamp.timestamp() // self.bucket_seconds)
+
+    def append(self, entry: AuditEntry):
+        key = self._key(entry.timestamp)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = ([], {})
+            insort(self._keys, key)
+        entries, by_user = bucket
+        entries.append(entry)
+        if entry.user_id is not None:
+            by_user.setdefault(entry.user_id, []).append(entry)
+        self._count += 1
+        self._evict()
+
+    def _evict(self):
+        oldest = self._keys[-1] - int(self.retention_seconds // self.bucket_seconds)
+        while self._keys and (
+            self._keys[0] < oldest
+            or (self._count > self.max_entries and len(self._keys) > 1)
+        ):
+            entries, _ = self._buckets.pop(self._keys.pop(0))
+            self._count -= len(entries)
+
+    def query(
+        self,
+        user_id: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> List[AuditEntry]:
+        """The newest ``limit`` matching entries, oldest first"""
+        first = bisect_left(self._keys, self._key(start_time)) if start_time else 0
+        last = (
+            bisect_right(self._keys, self._key(end_time))
+            if end_time
+            else len(self._keys)
+        )
+
+        results: List[AuditEntry] = []
+        for key in reversed(self._keys[first:last]):
+            entries, by_user = self._buckets[key]
+            if user_id is not None:
+                entries = by_user.get(user_id, [])
+            for entry in reversed(entries):
+                if start_time and entry.timestamp < start_time:
+                    continue
+                if end_time and entry.timestamp > end_time:
+                    continue
+                results.append(entry)
+                if 0 < limit <= len(results):
+                    return results[::-1]
+        return results[::-1]
+
+    def __iter__(self):
+        for key in list(self._keys):
+            yield from self._buckets[key][0]
+
+    def __len__(self) -> int:
+        return self._count
+
+
+# Required resource -> snapshot field it is checked against
+RESOURCE_LIMITS = {
+    "cpu_cores": "cpu_cores_available",
+    "memory_mb": "memory_available_mb",
+    "gpu_memory_mb": "gpu_memory_available_mb",
+    "quantum_nodes": "dynex_nodes_available",
+    "bandwidth_mbps": "bandwidth_mbps",
+    "storage_mb": "storage_available_mb",
+}
+
+
+@dataclass
+class ResourceSnapshot:
+    """Point-in-time resource availability; unknown capacities are infinite"""
+
+    cpu_cores_available: float = float("inf")
+    memory_available_mb: float = float("inf")
+    gpu_memory_available_mb: float = float("inf")
+    dynex_nodes_available: float = float("inf")
+    bandwidth_mbps: float = float("inf")
+    storage_available_mb: float = float("inf")
+    timestamp: float = field(default_factory=time.time)
+
+    def limits(self) -> np.ndarray:
+        """Availability in RESOURCE_LIMITS order"""
+        return np.array([getattr(self, name) for name in RESOURCE_LIMITS.values()])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **{name: getattr(self, name) for name in RESOURCE_LIMITS.values()},
+            "timestamp": self.timestamp,
+        }
+
+
+class ResourceSampler:
+    """Background thread keeping a fresh ResourceSnapshot
+
+    Probes (psutil, GPUtil, the Dynex network) run on the sampler thread, so
+    readers only ever copy the latest snapshot and never wait on a probe.
+    """
+
+    def __init__(self, interval: float = 1.0):
+        self.interval = interval
+        self._snapshot: Optional[ResourceSnapshot] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start sampling; a no-op if already running"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="qsai-resource-sampler", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        """Stop sampling and wait for the thread to exit"""
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout=self.interval + 5.0)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def snapshot(self) -> ResourceSnapshot:
+        """Latest snapshot, sampling once inline before the first refresh"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self.refresh()
+        return snapshot
+
+    def refresh(self) -> ResourceSnapshot:
+        """Take a new sample and publish it"""
+        snapshot = self._sample()
+        self._snapshot = snapshot
+        return snapshot
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"Resource sampling failed: {e}")
+            self._stop.wait(self.interval)
+
+    def _sample(self) -> ResourceSnapshot:
+        snapshot = ResourceSnapshot()
+        try:
+            import psutil
+
+            # Non-blocking: usage since the previous call, i.e. over the
+            # last sampling interval
+            cpu_percent = psutil.cpu_percent(interval=None)
+            snapshot.cpu_cores_available = psutil.cpu_count() * (
+                (100 - cpu_percent) / 100
+            )
+            snapshot.memory_available_mb = psutil.virtual_memory().available / (
+                1024 * 1024
+            )
+            snapshot.storage_available_mb = psutil.disk_usage("/").free / (1024 * 1024)
+        except Exception as e:
+            logger.debug(f"psutil unavailable, skipping host resource sampling: {e}")
+
+        try:
+            import GPUtil
+
+            gpus = GPUtil.getGPUs()
+            snapshot.gpu_memory_available_mb = max(
+                (gpu.memoryFree for gpu in gpus), default=0.0
+            )
+        except ImportError:
+            # GPUtil not available, GPU checks pass
+            pass
+        except Exception as e:
+            logger.debug(f"GPU sampling failed: {e}")
+
+        snapshot.dynex_nodes_available = self._check_dynex_availability()
+        snapshot.bandwidth_mbps = self._estimate_network_bandwidth()
+        snapshot.timestamp = time.time()
+        return snapshot
+
+    def _check_dynex_availability(self) -> int:
+        """Check available Dynex quantum computing nodes"""
+        try:
+            # Simulate checking Dynex network status
+            # In a real implementation, this would query the Dynex network API
+            available_nodes = random.randint(10, 100)
+            logger.debug(f"Simulated Dynex nodes available: {available_nodes}")
+            return available_nodes
+
+        except Exception as e:
+            logger.error(f"Failed to check Dynex network: {e}")
+            return 0
+
+    def _estimate_network_bandwidth(self) -> float:
+        """Estimate available network bandwidth in Mbps"""
+        try:
+            # Simulate bandwidth estimation
+            # In a real implementation, this would perform actual bandwidth tests
+            estimated_bandwidth = random.uniform(10.0, 1000.0)
+            logger.debug(f"Estimated network bandwidth: {estimated_bandwidth:.2f}Mbps")
+            return estimated_bandwidth
+
+        except Exception as e:
+            logger.error(f"Failed to estimate bandwidth: {e}")
+            return 100.0  # Default conservative estimate
+
+
 class SafetyArbiter:
     """Deterministic safety and policy gating"""
 
-    def __init__(self, ltc_logger: LTCLogger):
+    def __init__(self, ltc_logger: LTCLogger, resource_sample_interval: float = 1.0):
         self.ltc_logger = ltc_logger
+        self.resource_sampler = ResourceSampler(resource_sample_interval)
         # Initialize with default safety policies
         self.safety_policies: Dict[str, Any] = {
             "vehicle_safety": {
@@ -238,172 +539,178 @@ class SafetyArbiter:
         self, action: ActionProposal, context: ContextVector
     ) -> Tuple[bool, List[str], str]:
         """Validate action against safety and compliance policies"""
-        violations = []
-        status = "compliant"
+        return (await self.validate_actions([action], context))[0]
+
+    async def validate_actions(
+        self, actions: List[ActionProposal], context: ContextVector
+    ) -> List[Tuple[bool, List[str], str]]:
+        """Validate proposals in one pass against the latest resource snapshot"""
+        self.resource_sampler.start()
+        shortfalls = self._resource_shortfalls(
+            [action.required_resources for action in actions],
+            self.resource_sampler.snapshot(),
+        )
 
-        # Safety checks
-        if context.safety_flags:
-            violations.append(f"Safety flags active: {context.safety_flags}")
-            status = "safety_violation"
+        results = []
+        for action, missing in zip(actions, shortfalls):
+            violations = []
+            status = "compliant"
 
-        # Compliance checks
-        if action.compliance_status != "compliant":
-            violations.append(f"Compliance violation: {action.compliance_status}")
-            status = "compliance_violation"
+            # Safety checks
+            if context.safety_flags:
+                violations.append(f"Safety flags active: {context.safety_flags}")
+                status = "safety_violation"
 
-        # Resource constraints
-        if not self._check_resource_availability(action.required_resources):
-            violations.append("Insufficient resources")
-            status = "resource_violation"
+            # Compliance checks
+            if action.compliance_status != "compliant":
+                violations.append(f"Compliance violation: {action.compliance_status}")
+                status = "compliance_violation"
 
-        is_valid = len(violations) == 0
-        return is_valid, violations, status
+            # Resource constraints
+            if missing:
+                violations.append(f"Insufficient resources: {', '.join(missing)}")
+                status = "resource_violation"
+
+            results.append((len(violations) == 0, violations, status))
+        return results
 
     def _check_resource_availability(self, required_resources: Dict[str, Any]) -> bool:
         """Check if required resources are available"""
-        try:
-            # Check computational resources
-            cpu_required = required_resources.get("cpu_cores", 0)
-            memory_required = required_resources.get("memory_mb", 0)
-            gpu_required = required_resources.get("gpu_memory_mb", 0)
-            
-            # Get current system resource usage
-            import psutil
-            
-            # Check CPU availability
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            available_cpu_percent = 100 - cpu_percent
-            cpu_cores_available = psutil.cpu_count() * (available_cpu_percent / 100)
-            
-            if cpu_required > cpu_cores_available:
-                logger.warning(f"Insufficient CPU: required {cpu_required}, available {cpu_cores_available:.2f}")
-                return False
-            
-            # Check memory availability
-            memory = psutil.virtual_memory()
-            available_memory_mb = memory.available / (1024 * 1024)
-            
-            if memory_required > available_memory_mb:
-                logger.warning(f"Insufficient memory: required {memory_required}MB, available {available_memory_mb:.2f}MB")
-                return False
-            
-            # Check GPU availability (if NVIDIA GPU is available)
-            if gpu_required > 0:
-                try:
-                    import GPUtil
-                    gpus = GPUtil.getGPUs()
-                    if not gpus:
-                        logger.warning("GPU required but no GPUs available")
-                        return False
-                    
-                    # Check if any GPU has sufficient memory
-                    gpu_available = False
-                    for gpu in gpus:
-                        available_gpu_memory = gpu.memoryFree
-                        if available_gpu_memory >= gpu_required:
-                            gpu_available = True
-                            break
-                    
-                    if not gpu_available:
-                        logger.warning(f"Insufficient GPU memory: required {gpu_required}MB")
-                        return False
-                        
-                except ImportError:
-                    # GPUtil not available, assume GPU check passes
-                    logger.info("GPUtil not available, skipping GPU resource check")
-            
-            # Check quantum computing resources
-            quantum_required = required_resources.get("quantum_nodes", 0)
-            if quantum_required > 0:
-                # Check Dynex network availability
-                try:
-                    # Simulate checking Dynex network status
-                    # In a real implementation, this would query the Dynex network
-                    dynex_nodes_available = self._check_dynex_availability()
-                    
-                    if quantum_required > dynex_nodes_available:
-                        logger.warning(f"Insufficient Dynex nodes: required {quantum_required}, available {dynex_nodes_available}")
-                        return False
-                        
-                except Exception as e:
-                    logger.error(f"Failed to check Dynex availability: {e}")
-                    # Allow execution to continue with classical fallback
-            
-            # Check network bandwidth requirements
-            bandwidth_required = required_resources.get("bandwidth_mbps", 0)
-            if bandwidth_required > 0:
-                # Simulate network bandwidth check
-                # In a real implementation, this would measure actual bandwidth
-                estimated_bandwidth = self._estimate_network_bandwidth()
-                
-                if bandwidth_required > estimated_bandwidth:
-                    logger.warning(f"Insufficient bandwidth: required {bandwidth_required}Mbps, estimated {estimated_bandwidth}Mbps")
-                    return False
-            
-            # Check storage requirements
-            storage_required = required_resources.get("storage_mb", 0)
-            if storage_required > 0:
-                disk_usage = psutil.disk_usage('/')
-                available_storage_mb = disk_usage.free / (1024 * 1024)
-                
-                if storage_required > available_storage_mb:
-                    logger.warning(f"Insufficient storage: required {storage_required}MB, available {available_storage_mb:.2f}MB")
-                    return False
-            
-            # All resource checks passed
-            logger.info(f"Resource availability check passed")
+        return not self._resource_shortfalls(
+            [required_resources], self.resource_sampler.snapshot()
+        )[0]
+
+    @staticmethod
+    def _resource_shortfalls(
+        requirements: List[Dict[str, Any]], snapshot: ResourceSnapshot
+    ) -> List[List[str]]:
+        """Names of the resources each requirement exceeds"""
+        if not requirements:
+            return []
+        required = np.array(
+            [
+                [
+                    value if isinstance(value, (int, float)) else 0.0
+                    for value in (
+                        (resources or {}).get(name, 0) for name in RESOURCE_LIMITS
+                    )
+                ]
+                for resources in requirements
+            ],
+            dtype=float,
+        )
+        exceeded = required > snapshot.limits()
+
+        names = list(RESOURCE_LIMITS)
+        shortfalls = [[] for _ in requirements]
+        for row, column in zip(*np.nonzero(exceeded)):
+            shortfalls[row].append(names[column])
+        return shortfalls
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with approximate percentiles"""
+
+    # Bucket upper bounds in seconds; the last bucket is unbounded
+    BUCKETS = (0.001, 0.002, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        self.counts[bisect_left(self.BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th percentile"""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for bound, count in zip(self.BUCKETS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "buckets": {
+                **{f"le_{b}": c for b, c in zip(self.BUCKETS, self.counts)},
+                "le_inf": self.counts[-1],
+            },
+        }
+
+
+@dataclass
+class AgentCircuitBreaker:
+    """Stops calling an agent after repeated failures or missed deadlines"""
+
+    failure_threshold: int = 3
+    reset_timeout: float = 30.0  # seconds before a single trial call
+    failures: int = 0
+    state: str = "closed"  # closed, open, half_open
+    opened_at: float = 0.0
+
+    def allow(self) -> bool:
+        if self.state == "closed":
             return True
-            
-        except Exception as e:
-            logger.error(f"Error checking resource availability: {e}")
-            # Default to allowing execution if resource check fails
+        if (
+            self.state == "open"
+            and time.monotonic() - self.opened_at >= self.reset_timeout
+        ):
+            self.state = "half_open"
             return True
-    
-    def _check_dynex_availability(self) -> int:
-        """Check available Dynex quantum computing nodes"""
-        try:
-            # Simulate checking Dynex network status
-            # In a real implementation, this would query the Dynex network API
-            import random
-            import time
-            
-            # Simulate network latency
-            time.sleep(0.1)
-            
-            # Return a simulated number of available nodes (10-100)
-            available_nodes = random.randint(10, 100)
-            logger.debug(f"Simulated Dynex nodes available: {available_nodes}")
-            return available_nodes
-            
-        except Exception as e:
-            logger.error(f"Failed to check Dynex network: {e}")
-            return 0
-    
-    def _estimate_network_bandwidth(self) -> float:
-        """Estimate available network bandwidth in Mbps"""
-        try:
-            # Simulate bandwidth estimation
-            # In a real implementation, this would perform actual bandwidth tests
-            import random
-            
-            # Return a simulated bandwidth (10-1000 Mbps)
-            estimated_bandwidth = random.uniform(10.0, 1000.0)
-            logger.debug(f"Estimated network bandwidth: {estimated_bandwidth:.2f}Mbps")
-            return estimated_bandwidth
-            
-        except Exception as e:
-            logger.error(f"Failed to estimate bandwidth: {e}")
-            return 100.0  # Default conservative estimate
+        return False
+
+    def record_success(self):
+        self.failures = 0
+        self.state = "closed"
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            self.state = "open"
+            self.opened_at = time.monotonic()
 
 
 class AgentManager:
     """Manages specialized decision agents"""
 
-    def __init__(self, ltc_logger: LTCLogger):
+    def __init__(
+        self,
+        ltc_logger: LTCLogger,
+        agent_timeout: float = 0.5,
+        failure_threshold: int = 3,
+        reset_timeout: float = 30.0,
+        max_workers: Optional[int] = None,
+    ):
         self.ltc_logger = ltc_logger
         self.agents: Dict[str, Any] = {}
         self.agent_states: Dict[str, Dict[str, Any]] = {}
 
+        # Fan-out: every agent gets the same deadline, sync agents run on
+        # a thread pool, repeatedly failing agents are skipped
+        self.agent_timeout = agent_timeout
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.circuit_breakers: Dict[str, AgentCircuitBreaker] = {}
+        self.latency: Dict[str, LatencyHistogram] = {}
+        self.timeouts: Dict[str, int] = {}
+
     async def register_agent(
         self, agent_id: str, agent_type: AgentType, agent_instance: Any
     ):
@@ -421,22 +728,109 @@ class AgentManager:
         )
 
     async def get_agent_proposals(
-        self, context: ContextVector, agent_types: List[AgentType]
+        self,
+        context: ContextVector,
+        agent_types: List[AgentType],
+        timeout: Optional[float] = None,
     ) -> List[ActionProposal]:
-        """Get proposals from specified agent types"""
-        proposals = []
+        """Get proposals from specified agent types
+
+        Agents are called concurrently; those that miss the deadline are
+        dropped from this decision and count as failures for their breaker.
+        """
+        timeout = self.agent_timeout if timeout is None else timeout
+        calls: Dict[str, asyncio.Future] = {}
 
         for agent_id, agent_info in self.agents.items():
             if agent_info["type"] in agent_types and agent_info["status"] == "active":
-                try:
-                    proposal = agent_info["instance"].propose_action(context)
-                    if proposal:
-                        proposals.append(proposal)
-                except Exception as e:
-                    logger.error(f"Agent {agent_id} failed to propose: {e}")
+                if not self._circuit_breaker(agent_id).allow():
+                    continue
+                calls[agent_id] = asyncio.ensure_future(
+                    self._call_agent(agent_id, agent_info["instance"], context)
+                )
+
+        if not calls:
+            return []
+        done, pending = await asyncio.wait(calls.values(), timeout=timeout)
+        for task in pending:
+            task.cancel()
+
+        proposals = []
+        for agent_id, task in calls.items():
+            breaker = self.circuit_breakers[agent_id]
+            if task in pending:
+                logger.warning(f"Agent {agent_id} missed its {timeout}s deadline")
+                self.timeouts[agent_id] = self.timeouts.get(agent_id, 0) + 1
+                breaker.record_failure()
+                continue
+            try:
+                proposal = task.result()
+            except Exception as e:
+                logger.error(f"Agent {agent_id} failed to propose: {e}")
+                breaker.record_failure()
+                continue
+            breaker.record_success()
+            if proposal:
+                proposals.append(proposal)
 
         return proposals
 
+    async def _call_agent(
+        self, agent_id: str, agent: Any, context: ContextVector
+    ) -> Optional[ActionProposal]:
+        """Run one agent's propose_action and record its latency"""
+        start = time.perf_counter()
+        if inspect.iscoroutinefunction(agent.propose_action):
+            proposal = await agent.propose_action(context)
+        else:
+            loop = asyncio.get_running_loop()
+            proposal = await loop.run_in_executor(
+                self._get_executor(), agent.propose_action, context
+            )
+            if inspect.isawaitable(proposal):
+                proposal = await proposal
+        self.latency.setdefault(agent_id, LatencyHistogram()).record(
+            time.perf_counter() - start
+        )
+        return proposal
+
+    def _circuit_breaker(self, agent_id: str) -> AgentCircuitBreaker:
+        breaker = self.circuit_breakers.get(agent_id)
+        if breaker is None:
+            breaker = self.circuit_breakers[agent_id] = AgentCircuitBreaker(
+                self.failure_threshold, self.reset_timeout
+            )
+        return breaker
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="qsai-agent"
+            )
+        return self._executor
+
+    def get_agent_metrics(self) -> Dict[str, Any]:
+        """Latency histogram, deadline misses and breaker state per agent"""
+        return {
+            agent_id: {
+                "latency": (
+                    self.latency[agent_id].to_dict()
+                    if agent_id in self.latency
+                    else LatencyHistogram().to_dict()
+                ),
+                "timeouts": self.timeouts.get(agent_id, 0),
+                "circuit_state": self._circuit_breaker(agent_id).state,
+            }
+            for agent_id in self.agents
+        }
+
+    def close(self):
+        """Release the agent thread pool"""
+        if self._executor is not None:
+            # Agents past their deadline may still be running; don't wait
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
 
 class MetaController:
     """Meta-learner that coordinates agent strategies and optimization"""
@@ -445,6 +839,10 @@ class MetaController:
         self.ltc_logger = ltc_logger
         self.dynex = get_dynex_client()
         self.optimization_history: List[Dict[str, Any]] = []
+        # Selections over at most this many proposals are solved exactly;
+        # above inline_exact_max_variables the enumeration runs off the loop
+        self.exact_max_variables = MAX_EXACT_VARIABLES
+        self.inline_exact_max_variables = INLINE_EXACT_VARIABLES
 
     async def optimize_action_selection(
         self, proposals: List[ActionProposal], context: ContextVector
@@ -455,6 +853,8 @@ class MetaController:
 
         # Build QUBO for action selection
         qubo_matrix = self._build_action_selection_qubo(proposals, context)
+        if len(proposals) <= self.exact_max_variables:
+            return await self._select_exact(proposals, context, qubo_matrix)
 
         try:
             # Quantum optimization via Dynex
@@ -477,6 +877,110 @@ class MetaController:
             )
             return self._classical_fallback(proposals, context)
 
+    async def optimize_action_selection_batch(
+        self, requests: List[Tuple[List[ActionProposal], ContextVector]]
+    ) -> List[Optional[ActionDecision]]:
+        """Select actions for several contexts with a single QUBO submission
+
+        Each context's action-selection QUBO becomes one block of a
+        block-diagonal problem; the solution is split back per context.
+        Contexts without proposals get None.
+        """
+        decisions: List[Optional[ActionDecision]] = [None] * len(requests)
+        blocks = []  # (request index, first variable, qubo)
+        num_variables = 0
+        for k, (proposals, context) in enumerate(requests):
+            if not proposals:
+                continue
+            if len(proposals) == 1:
+                decisions[k] = self._create_decision(proposals[0], context)
+                continue
+            qubo = self._build_action_selection_qubo(proposals, context)
+            if len(proposals) <= self.exact_max_variables:
+                decisions[k] = await self._select_exact(proposals, context, qubo)
+                continue
+            blocks.append((k, num_variables, qubo))
+            num_variables += len(qubo)
+
+        if not blocks:
+            return decisions
+
+        try:
+            qubo_result = await self.dynex.submit_qubo(
+                self._block_diagonal_qubo([qubo for _, _, qubo in blocks]),
+                algorithm="qaoa",
+                parameters={"timeout": 5.0},
+            )
+            if qubo_result.get("status") == "error":
+                raise RuntimeError(qubo_result.get("error"))
+            sample = qubo_result.get("first_sample") or {}
+        except Exception as e:
+            logger.warning(
+                f"Batched quantum optimization failed, falling back to classical: {e}"
+            )
+            qubo_result, sample = {}, {}
+
+        for k, first, qubo in blocks:
+            proposals, context = requests[k]
+            selected = [
+                i
+                for i in range(len(qubo))
+                if sample.get(first + i, sample.get(str(first + i))) == 1
+            ]
+            if selected:
+                decisions[k] = self._create_composite_decision(
+                    [proposals[i] for i in selected], context, qubo_result
+                )
+            else:
+                decisions[k] = self._classical_fallback(proposals, context)
+        return decisions
+
+    async def _select_exact(
+        self,
+        proposals: List[ActionProposal],
+        context: ContextVector,
+        qubo_matrix: np.ndarray,
+    ) -> ActionDecision:
+        """Pick the optimal proposal subset by exhaustive enumeration
+
+        Small selections are enumerated inline; larger ones take long enough
+        to stall the event loop and run on the default executor instead.
+        """
+        if len(proposals) <= self.inline_exact_max_variables:
+            solution, energy = solve_exact(qubo_matrix)
+        else:
+            loop = asyncio.get_running_loop()
+            solution, energy = await loop.run_in_executor(
+                None, solve_exact, qubo_matrix
+            )
+        selected = [proposals[i] for i in np.flatnonzero(solution)]
+        if not selected:
+            # Selecting nothing is optimal, e.g. when no proposal has a reward
+            return self._classical_fallback(proposals, context)
+        if len(selected) == 1:
+            return self._create_decision(selected[0], context)
+        return self._create_composite_decision(
+            selected,
+            context,
+            {"solver": "exact", "solution": solution.tolist(), "energy": energy},
+        )
+
+    @staticmethod
+    def _block_diagonal_qubo(qubos: List[np.ndarray]) -> Dict[str, Any]:
+        """Combine QUBO matrices into one block-diagonal QUBO in dict form"""
+        linear: Dict[int, float] = {}
+        quadratic: Dict[Tuple[int, int], float] = {}
+        first = 0
+        for qubo in qubos:
+            n = len(qubo)
+            for i, value in enumerate(np.diag(qubo)):
+                linear[first + i] = float(value)
+            upper = np.triu(qubo, 1) + np.tril(qubo, -1).T
+            for i, j in zip(*np.nonzero(upper)):
+                quadratic[(first + int(i), first + int(j))] = float(upper[i, j])
+            first += n
+        return {"linear": linear, "quadratic": quadratic, "offset": 0.0}
+
     def _build_action_selection_qubo(
         self, proposals: List[ActionProposal], context: ContextVector
     ) -> np.ndarray:
@@ -491,9 +995,10 @@ class MetaController:
         # Constraints: resource limits, safety, etc.
         constraint_strength = 10.0
         
-        # Resource constraint: penalize proposals that exceed available resources
-        available_resources = context.available_resources or {}
-        for i, proposal in enumerate(proposals):
+        # Resource constraint: penalize proposals that exceed available resources.
+        # Contexts without an inventory were already checked by the arbiter.
+        available_resources = getattr(context, "available_resources", None) or {}
+        for i, proposal in enumerate(proposals if available_resources else []):
             required_resources = proposal.required_resources or {}
             
             # Check each resource type
@@ -689,6 +1194,11 @@ class MetaController:
             total_uplift += proposal.estimated_reward
             total_confidence += proposal.confidence
 
+        if qubo_result.get("solver") == "exact":
+            method = "exact QUBO enumeration"
+        else:
+            method = "quantum optimization"
+
         return ActionDecision(
             decision_id=f"dec_{int(time.time() * 1000)}",
             action_id="composite",
@@ -700,7 +1210,7 @@ class MetaController:
             confidence=total_confidence / len(proposals),
             model_version="qsai_v1.0",
             policy_version="policy_v1.0",
-            rationale=f"Composite decision from {len(proposals)} agents via quantum optimization",
+            rationale=f"Composite decision from {len(proposals)} agents via {method}",
         )
 
     def _merge_resources(self, resource_lists: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -729,17 +1239,30 @@ class MetaController:
 class QSAIEngine:
     """Main Quantum Synthetic AI Decision Engine"""
 
-    def __init__(self, ltc_logger: LTCLogger):
+    def __init__(
+        self,
+        ltc_logger: LTCLogger,
+        batch_window: float = 0.005,
+        max_batch_size: int = 64,
+        max_decisions: int = 10_000,
+        max_contexts: int = 10_000,
+        context_retention_seconds: float = 3600.0,
+        audit_retention_seconds: float = 86400.0,
+        max_audit_entries: int = 100_000,
+    ):
         self.ltc_logger = ltc_logger
         self.safety_arbiter = SafetyArbiter(ltc_logger)
         self.agent_manager = AgentManager(ltc_logger)
         self.meta_controller = MetaController(ltc_logger)
 
-        # State management
+        # State management; stores are bounded so long-running workers stay
+        # flat, the LTC logger keeps the permanent record
         self.current_state = DecisionState.IDLE
-        self.context_store: Dict[str, ContextVector] = {}
-        self.decision_history: List[ActionDecision] = []
-        self.audit_store: List[AuditEntry] = []
+        self.context_store = ContextStore(max_contexts, context_retention_seconds)
+        self.decision_history: deque = deque(maxlen=max_decisions)
+        self.audit_store = AuditTrailStore(
+            retention_seconds=audit_retention_seconds, max_entries=max_audit_entries
+        )
 
         # Performance metrics
         self.metrics = {
@@ -749,6 +1272,14 @@ class QSAIEngine:
             "safety_violations": 0,
             "avg_decision_latency": 0.0,
         }
+        self.decision_latency = LatencyHistogram()
+
+        # Micro-batching: contexts submitted within one window share a solve
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self._batch: List[Tuple[ContextVector, asyncio.Future]] = []
+        self._batch_timer: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks: set = set()
 
         logger.info("QSAI Engine initialized")
 
@@ -797,6 +1328,14 @@ class QSAIEngine:
             "iso26262": {"asil_level": "B", "safety_gates": True},
         }
 
+    async def shutdown(self):
+        """Finish queued decisions and stop background workers"""
+        self._flush_batch()
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+        self.safety_arbiter.resource_sampler.stop()
+        self.agent_manager.close()
+
     async def process_context(self, context: ContextVector) -> Optional[ActionDecision]:
         """Main decision processing pipeline"""
         start_time = time.time()
@@ -808,34 +1347,8 @@ class QSAIEngine:
             # Store context
             self.context_store[context.user_id] = context
 
-            # Get agent proposals
-            self.current_state = DecisionState.PROPOSING
-            proposals = await self.agent_manager.get_agent_proposals(
-                context,
-                [AgentType.OFFER, AgentType.TIMING, AgentType.CHANNEL, AgentType.RISK],
-            )
-
-            if not proposals:
-                logger.info(f"No proposals for user {context.user_id}")
-                return None
-
-            # Validate proposals
-            self.current_state = DecisionState.VALIDATING
-            valid_proposals = []
-            for proposal in proposals:
-                is_valid, violations, status = (
-                    await self.safety_arbiter.validate_action(proposal, context)
-                )
-                if is_valid:
-                    valid_proposals.append(proposal)
-                else:
-                    logger.warning(
-                        f"Proposal {proposal.action_id} rejected: {violations}"
-                    )
-                    self.metrics["safety_violations"] += 1
-
+            proposals, valid_proposals = await self._collect_proposals(context)
             if not valid_proposals:
-                logger.warning(f"No valid proposals for user {context.user_id}")
                 return None
 
             # Optimize action selection
@@ -844,20 +1357,7 @@ class QSAIEngine:
                 valid_proposals, context
             )
 
-            # Update metrics
-            decision_latency = time.time() - start_time
-            self.metrics["decisions_made"] += 1
-            self.metrics["avg_decision_latency"] = (
-                self.metrics["avg_decision_latency"]
-                * (self.metrics["decisions_made"] - 1)
-                + decision_latency
-            ) / self.metrics["decisions_made"]
-
-            # Store decision
-            self.decision_history.append(decision)
-
-            # Create audit entry
-            await self._create_audit_entry(decision, proposals, context)
+            await self._record_decision(decision, proposals, context, start_time)
 
             # Update state
             self.current_state = DecisionState.IDLE
@@ -869,6 +1369,125 @@ class QSAIEngine:
             self.current_state = DecisionState.IDLE
             return None
 
+    async def submit_context(self, context: ContextVector) -> Optional[ActionDecision]:
+        """Queue a context for the next micro-batch and wait for its decision"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._batch.append((context, future))
+
+        if len(self._batch) >= self.max_batch_size:
+            self._flush_batch()
+        elif self._batch_timer is None:
+            self._batch_timer = loop.call_later(self.batch_window, self._flush_batch)
+
+        return await future
+
+    def _flush_batch(self):
+        """Start processing the queued contexts"""
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+        batch, self._batch = self._batch, []
+        if batch:
+            task = asyncio.ensure_future(self._run_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[ContextVector, asyncio.Future]]):
+        decisions = await self.process_batch([context for context, _ in batch])
+        for (_, future), decision in zip(batch, decisions):
+            if not future.done():
+                future.set_result(decision)
+
+    async def process_batch(
+        self, contexts: List[ContextVector]
+    ) -> List[Optional[ActionDecision]]:
+        """Decide for several contexts with one action-selection solve"""
+        start_time = time.time()
+
+        try:
+            self.current_state = DecisionState.OBSERVING
+            for context in contexts:
+                self.context_store[context.user_id] = context
+
+            collected = await asyncio.gather(
+                *(self._collect_proposals(context) for context in contexts)
+            )
+
+            self.current_state = DecisionState.DECIDING
+            decisions = await self.meta_controller.optimize_action_selection_batch(
+                [(valid, context) for (_, valid), context in zip(collected, contexts)]
+            )
+
+            for decision, (proposals, _), context in zip(
+                decisions, collected, contexts
+            ):
+                if decision is not None:
+                    await self._record_decision(
+                        decision, proposals, context, start_time
+                    )
+
+            self.current_state = DecisionState.IDLE
+            return decisions
+
+        except Exception as e:
+            logger.error(f"Batch decision processing failed: {e}")
+            self.current_state = DecisionState.IDLE
+            return [None] * len(contexts)
+
+    async def _collect_proposals(
+        self, context: ContextVector
+    ) -> Tuple[List[ActionProposal], List[ActionProposal]]:
+        """All agent proposals for a context and those passing validation"""
+        # Get agent proposals
+        self.current_state = DecisionState.PROPOSING
+        proposals = await self.agent_manager.get_agent_proposals(
+            context,
+            [AgentType.OFFER, AgentType.TIMING, AgentType.CHANNEL, AgentType.RISK],
+        )
+
+        if not proposals:
+            logger.info(f"No proposals for user {context.user_id}")
+            return proposals, []
+
+        # Validate proposals
+        self.current_state = DecisionState.VALIDATING
+        valid_proposals = []
+        validations = await self.safety_arbiter.validate_actions(proposals, context)
+        for proposal, (is_valid, violations, status) in zip(proposals, validations):
+            if is_valid:
+                valid_proposals.append(proposal)
+            else:
+                logger.warning(f"Proposal {proposal.action_id} rejected: {violations}")
+                self.metrics["safety_violations"] += 1
+
+        if not valid_proposals:
+            logger.warning(f"No valid proposals for user {context.user_id}")
+
+        return proposals, valid_proposals
+
+    async def _record_decision(
+        self,
+        decision: ActionDecision,
+        proposals: List[ActionProposal],
+        context: ContextVector,
+        start_time: float,
+    ):
+        """Update metrics, store the decision and audit it"""
+        decision_latency = time.time() - start_time
+        self.decision_latency.record(decision_latency)
+        self.metrics["decisions_made"] += 1
+        self.metrics["avg_decision_latency"] = (
+            self.metrics["avg_decision_latency"] * (self.metrics["decisions_made"] - 1)
+            + decision_latency
+        ) / self.metrics["decisions_made"]
+
+        # Store decision
+        self.decision_history.append(decision)
+
+        # Create audit entry
+        await self._create_audit_entry(decision, proposals, context)
+
     async def _create_audit_entry(
         self,
         decision: ActionDecision,
@@ -895,6 +1514,7 @@ class QSAIEngine:
             signature=hashlib.sha256(
                 json.dumps(decision.to_dict(), sort_keys=True).encode()
             ).hexdigest(),
+            user_id=context.user_id,
         )
 
         self.audit_store.append(audit_entry)
@@ -926,25 +1546,19 @@ class QSAIEngine:
             "contexts_stored": len(self.context_store),
             "decisions_stored": len(self.decision_history),
             "audit_entries": len(self.audit_store),
+            "decision_latency": self.decision_latency.to_dict(),
+            "agents": self.agent_manager.get_agent_metrics(),
         }
 
     async def get_audit_trail(
-        self, user_id: Optional[str] = None, limit: int = 100
+        self,
+        user_id: Optional[str] = None,
+        limit: int = 100,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
     ) -> List[Dict[str, Any]]:
-        """Get audit trail entries"""
-        entries = self.audit_store[-limit:] if limit > 0 else self.audit_store
-
-        if user_id:
-            # Filter by user context
-            filtered_entries = []
-            for entry in entries:
-                if any(
-                    proposal.get("user_id") == user_id
-                    for proposal in entry.agent_proposals
-                ):
-                    filtered_entries.append(entry)
-            entries = filtered_entries
-
+        """Get audit trail entries, optionally for one user and time range"""
+        entries = self.audit_store.query(user_id, start_time, end_time, limit)
         return [entry.to_dict() for entry in entries]
 
 
@@ -45,6 +45,8 @@ from .registry import (
     get_provider_capabilities,
 )
 
+from .sparse_qubo import SparseQUBO, SparseQUBOBuilder, as_sparse_qubo
+
 __version__ = "1.0.0"
 __author__ = "FLYFOX AI"
 __description__ = "FLYFOX AI Quantum Integration Hub - Powered by NQBA"
@@ -84,4 +86,8 @@ __all__ = [
     "list_providers",
     "unregister_provider",
     "get_provider_capabilities",
+    # Shared problem representation
+    "SparseQUBO",
+    "SparseQUBOBuilder",
+    "as_sparse_qubo",
 ]
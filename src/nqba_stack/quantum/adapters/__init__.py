@@ -6,8 +6,16 @@ allowing the Quantum Hub to interface with different quantum platforms
 while maintaining a consistent API.
 """
 
+from .annealer import AnnealResult, NumpySimulatedAnnealer
 from .base_adapter import QuantumAdapter, AdapterConfig
 from .dynex_adapter import DynexAdapter
 from .simulator_adapter import SimulatorAdapter
 
-__all__ = ["QuantumAdapter", "AdapterConfig", "DynexAdapter", "SimulatorAdapter"]
+__all__ = [
+    "QuantumAdapter",
+    "AdapterConfig",
+    "DynexAdapter",
+    "SimulatorAdapter",
+    "NumpySimulatedAnnealer",
+    "AnnealResult",
+]
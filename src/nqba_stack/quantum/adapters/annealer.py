@@ -0,0 +1,728 @@
+"""
+Vectorized Simulated Annealing - Native QUBO Sampler
+
+NumPy simulated annealer used by the classical fallback path:
+- Sparse (CSR-style) coupling storage, no dense n x n matrices
+- Many replicas annealed together as one (replicas x variables) batch
+- Incremental local-field updates: a flip only touches its neighbours
+- Graph colouring so non-interacting variables are updated together
+- Geometric or linear beta schedules, with an automatic beta range
+- Wall-clock timeout or a stop callback, returning the best state so far
+- Several independent QUBOs annealed in one block-diagonal pass
+- Parallel tempering: chains of replicas on a fixed temperature ladder that
+  swap temperatures between sweeps
+"""
+
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+from ..sparse_qubo import SparseQUBO, as_sparse_qubo
+
+logger = logging.getLogger(__name__)
+
+QUBOInput = Union[
+    SparseQUBO, Dict[Tuple[Hashable, Hashable], float], np.ndarray, List[List[float]]
+]
+
+# Above this average degree colouring buys nothing; sweep variables one by one
+_DENSE_DEGREE_FRACTION = 0.25
+
+
+@dataclass
+class AnnealResult:
+    """Result of an annealing run"""
+
+    samples: np.ndarray
+    energies: np.ndarray
+    variables: List[Hashable]
+    num_sweeps: int
+    timed_out: bool = False
+    beta_range: Tuple[float, float] = (0.0, 0.0)
+    info: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def best_index(self) -> int:
+        return int(np.argmin(self.energies))
+
+    @property
+    def best_energy(self) -> float:
+        return float(self.energies[self.best_index])
+
+    @property
+    def best_sample(self) -> Dict[Hashable, int]:
+        row = self.samples[self.best_index]
+        return {var: int(value) for var, value in zip(self.variables, row)}
+
+
+class _ScatterPlan:
+    """
+    Precomputed plan for ``out[cols] += x[rows] * vals`` (variables on axis
+    0, replicas on axis 1) with repeated columns, accumulated with one
+    ``np.bincount`` over the distinct target columns.
+    """
+
+    def __init__(self, rows: np.ndarray, cols: np.ndarray, vals: np.ndarray):
+        self.rows = rows
+        self.vals = vals[:, None]
+        self.cols, self.targets = np.unique(cols, return_inverse=True)
+        self._flat_targets: Dict[int, np.ndarray] = {}
+
+    def apply(self, x: np.ndarray, out: np.ndarray):
+        if not len(self.cols):
+            return
+        width = x.shape[1]
+        flat = self._flat_targets.get(width)
+        if flat is None:
+            flat = (self.targets[:, None] * width + np.arange(width)).ravel()
+            self._flat_targets[width] = flat
+        contrib = (x[self.rows] * self.vals).ravel()
+        totals = np.bincount(flat, weights=contrib, minlength=len(self.cols) * width)
+        out[self.cols] += totals.reshape(len(self.cols), width)
+
+
+class _SparseQUBO:
+    """Linear biases plus symmetric off-diagonal couplings in CSR form"""
+
+    def __init__(self, qubo: QUBOInput, variables: Optional[Sequence[Hashable]] = None):
+        if isinstance(qubo, SparseQUBO):
+            self._from_sparse(qubo)
+        elif isinstance(qubo, dict):
+            self._from_dict(qubo, variables)
+        else:
+            self._from_dense(np.asarray(qubo, dtype=float))
+
+    def _from_dict(self, qubo: Dict, variables: Optional[Sequence[Hashable]]):
+        labels: List[Hashable] = list(variables) if variables is not None else []
+        index: Dict[Hashable, int] = {var: i for i, var in enumerate(labels)}
+        for u, v in qubo:
+            for var in (u, v):
+                if var not in index:
+                    index[var] = len(labels)
+                    labels.append(var)
+
+        n = len(labels)
+        linear = np.zeros(n)
+        rows, cols, vals = [], [], []
+        for (u, v), bias in qubo.items():
+            i, j = index[u], index[v]
+            if i == j:
+                linear[i] += bias
+            elif bias:
+                rows.append(i)
+                cols.append(j)
+                vals.append(float(bias))
+
+        self.variables = labels
+        self.linear = linear
+        self._build_csr(
+            n,
+            np.asarray(rows, dtype=np.int64),
+            np.asarray(cols, dtype=np.int64),
+            np.asarray(vals, dtype=float),
+        )
+
+    def _from_sparse(self, qubo: SparseQUBO):
+        self.variables = list(qubo.labels)
+        self.linear = qubo.linear
+        self._build_csr(qubo.num_variables, qubo.rows, qubo.cols, qubo.data)
+
+    def _from_dense(self, matrix: np.ndarray):
+        if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+            raise ValueError("QUBO matrix must be square")
+        n = matrix.shape[0]
+        off_diagonal = matrix.copy()
+        np.fill_diagonal(off_diagonal, 0.0)
+        rows, cols = np.nonzero(off_diagonal)
+
+        self.variables = list(range(n))
+        self.linear = np.diag(matrix).astype(float).copy()
+        self._build_csr(n, rows, cols, off_diagonal[rows, cols])
+
+    def _build_csr(self, n: int, rows: np.ndarray, cols: np.ndarray, vals: np.ndarray):
+        """Symmetrise (i, j) and (j, i) terms and store as CSR"""
+        all_rows = np.concatenate([rows, cols])
+        all_cols = np.concatenate([cols, rows])
+        all_vals = np.concatenate([vals, vals])
+
+        # Merge duplicate (row, col) pairs
+        keys = all_rows * max(n, 1) + all_cols
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        merged = np.bincount(inverse, weights=all_vals, minlength=len(unique_keys))
+        keep = merged != 0.0
+        unique_keys, merged = unique_keys[keep], merged[keep]
+
+        self.num_variables = n
+        self.rows = unique_keys // max(n, 1)
+        self.indices = unique_keys % max(n, 1)
+        # Each coupling appears twice in the symmetric form
+        self.data = merged
+        self.indptr = np.concatenate(
+            ([0], np.cumsum(np.bincount(self.rows, minlength=n)))
+        ).astype(np.int64)
+
+    @property
+    def num_interactions(self) -> int:
+        return len(self.data) // 2
+
+    def neighbours(self, i: int) -> np.ndarray:
+        return self.indices[self.indptr[i] : self.indptr[i + 1]]
+
+    def coupling_field(self, x: np.ndarray) -> np.ndarray:
+        """``J @ x`` for a (variables x replicas) batch"""
+        field_ = np.zeros(x.shape, dtype=float)
+        _ScatterPlan(self.rows, self.indices, self.data).apply(x.astype(float), field_)
+        return field_
+
+    def energies(self, samples: np.ndarray, offset: float = 0.0) -> np.ndarray:
+        """Energies of a batch of samples (replicas x variables)"""
+        x = samples.T.astype(float)
+        field_ = self.coupling_field(x)
+        return offset + self.linear @ x + 0.5 * np.einsum("ij,ij->j", x, field_)
+
+    def permuted(self, order: np.ndarray) -> "_SparseQUBO":
+        """Copy with variables renumbered so that new index k is old order[k]"""
+        position = np.empty_like(order)
+        position[order] = np.arange(len(order))
+        clone = object.__new__(_SparseQUBO)
+        clone.variables = [self.variables[i] for i in order]
+        clone.linear = self.linear[order]
+        clone._build_csr(
+            self.num_variables,
+            position[self.rows],
+            position[self.indices],
+            self.data / 2.0,
+        )
+        return clone
+
+    def is_dense(self) -> bool:
+        """True when the average degree makes colouring pointless"""
+        n = self.num_variables
+        return n > 0 and len(self.data) / n > _DENSE_DEGREE_FRACTION * n
+
+    def colour_classes(self) -> List[np.ndarray]:
+        """Greedy colouring: variables in one class share no couplings"""
+        n = self.num_variables
+        if n == 0:
+            return []
+        if self.is_dense():
+            return [np.array([i]) for i in range(n)]
+
+        colours = np.full(n, -1, dtype=np.int64)
+        degrees = np.diff(self.indptr)
+        for i in np.argsort(-degrees, kind="stable"):
+            used = set(colours[self.neighbours(i)].tolist())
+            colour = 0
+            while colour in used:
+                colour += 1
+            colours[i] = colour
+
+        return [np.flatnonzero(colours == c) for c in range(int(colours.max()) + 1)]
+
+
+class _ReplicaExchange:
+    """
+    Temperature ladder for parallel tempering.
+
+    Column ``c`` of the replica batch belongs to chain ``c // T`` for a
+    ladder of ``T`` betas. Exchanges swap the temperatures of two columns
+    rather than copying their states. The lowest-energy state each chain
+    has visited is kept.
+    """
+
+    def __init__(
+        self,
+        ladder: np.ndarray,
+        num_chains: int,
+        num_sweeps: int,
+        rng: np.random.Generator,
+    ):
+        self.ladder = ladder
+        self.num_chains = num_chains
+        self.num_sweeps = num_sweeps
+        self.rng = rng
+        # slot_columns[k, t]: column of chain k currently at temperature t
+        self.slot_columns = np.arange(num_chains * len(ladder)).reshape(
+            num_chains, len(ladder)
+        )
+        self.column_betas = np.tile(ladder, num_chains)
+        self.attempts = np.zeros(max(len(ladder) - 1, 0), dtype=np.int64)
+        self.accepted = np.zeros_like(self.attempts)
+        self._parity = 0
+
+    @property
+    def num_columns(self) -> int:
+        return len(self.column_betas)
+
+    def __iter__(self):
+        for _ in range(self.num_sweeps):
+            yield self.column_betas
+
+    def start(self, problem: "_SparseQUBO", x: np.ndarray, field_: np.ndarray):
+        """Record the initial energies; ``field_`` includes the linear biases"""
+        # x.J.x counted twice in x.field_, once in x.linear
+        self.energies = 0.5 * np.einsum("ij,ij->j", x, field_ + problem.linear[:, None])
+        self.best_energies = np.full(self.num_chains, np.inf)
+        self.best_states = np.zeros(
+            (problem.num_variables, self.num_chains), dtype=np.int8
+        )
+        self._record_best(x)
+
+    def observe(self, x: np.ndarray, delta: np.ndarray):
+        """Apply a sweep's energy changes, then attempt exchanges"""
+        self.energies += delta
+        self._record_best(x)
+        self._exchange()
+
+    def _record_best(self, x: np.ndarray):
+        per_chain = self.energies.reshape(self.num_chains, -1)
+        slots = per_chain.argmin(axis=1)
+        lowest = per_chain[np.arange(self.num_chains), slots]
+        improved = np.flatnonzero(lowest < self.best_energies)
+        if len(improved):
+            columns = improved * len(self.ladder) + slots[improved]
+            self.best_states[:, improved] = x[:, columns]
+            self.best_energies[improved] = lowest[improved]
+
+    def _exchange(self):
+        """Metropolis swaps of neighbouring temperatures, alternating even/odd pairs"""
+        pairs = np.arange(self._parity, len(self.ladder) - 1, 2)
+        self._parity ^= 1
+        if not len(pairs):
+            return
+        hot = self.slot_columns[:, pairs]
+        cold = self.slot_columns[:, pairs + 1]
+        # Accept with probability min(1, exp(d_beta * d_energy))
+        log_ratio = (self.ladder[pairs + 1] - self.ladder[pairs]) * (
+            self.energies[cold] - self.energies[hot]
+        )
+        accept = np.log1p(-self.rng.random(hot.shape)) < log_ratio
+        self.attempts[pairs] += self.num_chains
+        self.accepted[pairs] += accept.sum(axis=0)
+        self.slot_columns[:, pairs] = np.where(accept, cold, hot)
+        self.slot_columns[:, pairs + 1] = np.where(accept, hot, cold)
+        self.column_betas[self.slot_columns] = self.ladder
+
+    @property
+    def acceptance_rates(self) -> List[float]:
+        return (self.accepted / np.maximum(self.attempts, 1)).tolist()
+
+
+class NumpySimulatedAnnealer:
+    """
+    Batched simulated annealing sampler for QUBO problems.
+
+    Every replica keeps a local field ``h_i + sum_j J_ij x_j``; a flip of
+    variable ``i`` changes energy by ``(1 - 2 x_i) * field_i`` and only
+    updates the fields of ``i``'s neighbours.
+    """
+
+    def __init__(
+        self,
+        num_reads: int = 16,
+        num_sweeps: int = 250,
+        beta_range: Optional[Tuple[float, float]] = None,
+        beta_schedule_type: str = "geometric",
+        seed: Optional[int] = None,
+        max_dense_variables: int = 4096,
+    ):
+        self.num_reads = num_reads
+        self.num_sweeps = num_sweeps
+        self.beta_range = beta_range
+        self.beta_schedule_type = beta_schedule_type
+        self.seed = seed
+        self.max_dense_variables = max_dense_variables
+
+    def sample_qubo(
+        self,
+        qubo: QUBOInput,
+        offset: float = 0.0,
+        timeout: Optional[float] = None,
+        variables: Optional[Sequence[Hashable]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+        **overrides: Any,
+    ) -> AnnealResult:
+        """
+        Anneal a QUBO given as a SparseQUBO, ``{(u, v): bias}`` or a dense
+        matrix. ``should_stop`` is polled after every sweep and ends the run
+        early, like ``timeout``.
+        """
+        num_reads = int(overrides.get("num_reads", self.num_reads))
+        num_sweeps = int(overrides.get("num_sweeps", self.num_sweeps))
+        schedule_type = overrides.get("beta_schedule_type", self.beta_schedule_type)
+        seed = overrides.get("seed", self.seed)
+        rng = np.random.default_rng(seed)
+
+        problem = _SparseQUBO(qubo, variables)
+        if isinstance(qubo, SparseQUBO):
+            offset += qubo.offset
+        n = problem.num_variables
+        if n == 0:
+            return AnnealResult(
+                samples=np.zeros((1, 0), dtype=np.int8),
+                energies=np.array([float(offset)]),
+                variables=[],
+                num_sweeps=0,
+            )
+
+        beta_range = overrides.get("beta_range", self.beta_range) or (
+            self.default_beta_range(problem)
+        )
+        betas = self.beta_schedule(beta_range, num_sweeps, schedule_type)
+
+        stop = self._stop_check(timeout, should_stop)
+        problem, x, sweeps_run, timed_out, num_classes = self._anneal(
+            problem, betas, num_reads, rng, stop
+        )
+
+        return AnnealResult(
+            samples=np.ascontiguousarray(x.T),
+            energies=problem.energies(x.T, offset),
+            variables=problem.variables,
+            num_sweeps=sweeps_run,
+            timed_out=timed_out,
+            beta_range=tuple(beta_range),
+            info={
+                "num_reads": num_reads,
+                "num_variables": n,
+                "num_interactions": problem.num_interactions,
+                "num_colour_classes": num_classes,
+                "beta_schedule_type": schedule_type,
+            },
+        )
+
+    def parallel_tempering(
+        self,
+        qubo: QUBOInput,
+        offset: float = 0.0,
+        timeout: Optional[float] = None,
+        variables: Optional[Sequence[Hashable]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+        num_temperatures: int = 8,
+        **overrides: Any,
+    ) -> AnnealResult:
+        """
+        Sample a QUBO by parallel tempering (replica exchange Monte Carlo).
+
+        Each of ``num_reads`` chains runs ``num_temperatures`` replicas on a
+        geometric ladder spanning ``beta_range``; after every sweep,
+        neighbouring replicas of a chain may swap temperatures. Returns the
+        best state each chain visited, one sample per chain.
+        """
+        num_reads = int(overrides.get("num_reads", self.num_reads))
+        num_sweeps = int(overrides.get("num_sweeps", self.num_sweeps))
+        rng = np.random.default_rng(overrides.get("seed", self.seed))
+
+        problem = _SparseQUBO(qubo, variables)
+        if isinstance(qubo, SparseQUBO):
+            offset += qubo.offset
+        n = problem.num_variables
+        if n == 0:
+            return AnnealResult(
+                samples=np.zeros((1, 0), dtype=np.int8),
+                energies=np.array([float(offset)]),
+                variables=[],
+                num_sweeps=0,
+            )
+
+        beta_range = overrides.get("beta_range", self.beta_range) or (
+            self.default_beta_range(problem)
+        )
+        ladder = self.beta_schedule(beta_range, num_temperatures, "geometric")
+        exchange = _ReplicaExchange(ladder, num_reads, num_sweeps, rng)
+
+        stop = self._stop_check(timeout, should_stop)
+        problem, _, sweeps_run, timed_out, num_classes = self._anneal(
+            problem, exchange, exchange.num_columns, rng, stop, exchange
+        )
+
+        samples = np.ascontiguousarray(exchange.best_states.T)
+        return AnnealResult(
+            samples=samples,
+            energies=problem.energies(samples, offset),
+            variables=problem.variables,
+            num_sweeps=sweeps_run,
+            timed_out=timed_out,
+            beta_range=tuple(beta_range),
+            info={
+                "num_reads": num_reads,
+                "num_variables": n,
+                "num_interactions": problem.num_interactions,
+                "num_colour_classes": num_classes,
+                "num_temperatures": len(ladder),
+                "exchange_acceptance": exchange.acceptance_rates,
+            },
+        )
+
+    def sample_many(
+        self,
+        qubos: Sequence[QUBOInput],
+        offsets: Optional[Sequence[float]] = None,
+        timeout: Optional[float] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+        **overrides: Any,
+    ) -> List[AnnealResult]:
+        """
+        Anneal several independent QUBOs in a single pass.
+
+        The problems are stacked into one block-diagonal QUBO, so their
+        variables share colour classes and every sweep updates all of
+        them together; results are split back out per problem.
+        """
+        blocks = [as_sparse_qubo(qubo) for qubo in qubos]
+        if offsets is None:
+            offsets = [0.0] * len(blocks)
+        if not blocks:
+            return []
+
+        starts = np.concatenate(([0], np.cumsum([b.num_variables for b in blocks])))
+        combined = SparseQUBO(
+            np.concatenate([b.linear for b in blocks]),
+            np.concatenate([b.rows + start for b, start in zip(blocks, starts)]),
+            np.concatenate([b.cols + start for b, start in zip(blocks, starts)]),
+            np.concatenate([b.data for b in blocks]),
+        )
+        result = self.sample_qubo(
+            combined, timeout=timeout, should_stop=should_stop, **overrides
+        )
+
+        # Undo the annealer's variable renumbering, then cut per problem
+        samples = result.samples[:, np.argsort(np.asarray(result.variables))]
+        results = []
+        for block, offset, start, stop in zip(blocks, offsets, starts, starts[1:]):
+            block_samples = np.ascontiguousarray(samples[:, start:stop])
+            results.append(
+                AnnealResult(
+                    samples=block_samples,
+                    energies=block.energies(block_samples) + offset,
+                    variables=block.labels,
+                    num_sweeps=result.num_sweeps,
+                    timed_out=result.timed_out,
+                    beta_range=result.beta_range,
+                    info={
+                        **result.info,
+                        "num_variables": block.num_variables,
+                        "num_interactions": block.num_interactions,
+                        "batch_size": len(blocks),
+                    },
+                )
+            )
+        return results
+
+    def _anneal(
+        self,
+        problem: "_SparseQUBO",
+        betas: Iterable,
+        num_reads: int,
+        rng: np.random.Generator,
+        stop: Optional[Callable[[], bool]],
+        exchange: Optional[_ReplicaExchange] = None,
+    ):
+        """
+        Run one sweep per entry of ``betas``, each a scalar or one beta per
+        replica. With ``exchange``, energy changes are reported after every
+        sweep.
+        """
+        if problem.is_dense() and problem.num_variables <= self.max_dense_variables:
+            return self._anneal_dense(problem, betas, num_reads, rng, stop, exchange)
+        return self._anneal_coloured(problem, betas, num_reads, rng, stop, exchange)
+
+    def _anneal_coloured(
+        self,
+        problem: "_SparseQUBO",
+        betas: Iterable,
+        num_reads: int,
+        rng: np.random.Generator,
+        stop: Optional[Callable[[], bool]],
+        exchange: Optional[_ReplicaExchange] = None,
+    ):
+        """Sweep colour classes; each class is updated in one vectorized step"""
+        # Renumber variables so every colour class is a contiguous slice
+        colour_classes = problem.colour_classes()
+        problem = problem.permuted(np.concatenate(colour_classes))
+        bounds = np.cumsum([0] + [len(members) for members in colour_classes])
+        slices = [(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:])]
+        class_plans = [self._class_plan(problem, a, b) for a, b in slices]
+        degrees = np.diff(problem.indptr)
+
+        # Variables on axis 0, replicas on axis 1
+        n = problem.num_variables
+        x = rng.integers(0, 2, size=(n, num_reads)).astype(np.int8)
+        field_ = problem.coupling_field(x) + problem.linear[:, None]
+        sweeps_run = 0
+        if exchange is not None:
+            exchange.start(problem, x, field_)
+
+        for beta in betas:
+            # Metropolis: accept when delta < -ln(u) / beta (always if delta <= 0)
+            thresholds = -np.log1p(-rng.random((n, num_reads))) / beta
+            delta = np.zeros(num_reads)
+            for (a, b), plan in zip(slices, class_plans):
+                xc = x[a:b]
+                step = 1 - 2 * xc  # +1 for a 0 -> 1 flip, -1 for 1 -> 0
+                change = step * (step * field_[a:b] < thresholds[a:b])
+                xc += change.astype(np.int8)
+                if exchange is not None:
+                    # Class members share no couplings, so their fields are current
+                    delta += np.einsum("ij,ij->j", change, field_[a:b])
+
+                # Few flips (cold phase): update only the flipped neighbourhoods
+                flipped_vars, flipped_reads = np.nonzero(change)
+                if not len(flipped_vars):
+                    continue
+                work = degrees[a + flipped_vars].sum()
+                if work * 4 < len(plan.rows) * num_reads:
+                    self._sparse_update(
+                        problem,
+                        field_,
+                        a + flipped_vars,
+                        flipped_reads,
+                        change[flipped_vars, flipped_reads],
+                    )
+                else:
+                    plan.apply(change, field_)
+
+            sweeps_run += 1
+            if exchange is not None:
+                exchange.observe(x, delta)
+            if stop is not None and stop():
+                return problem, x, sweeps_run, True, len(slices)
+
+        return problem, x, sweeps_run, False, len(slices)
+
+    def _anneal_dense(
+        self,
+        problem: "_SparseQUBO",
+        betas: Iterable,
+        num_reads: int,
+        rng: np.random.Generator,
+        stop: Optional[Callable[[], bool]],
+        exchange: Optional[_ReplicaExchange] = None,
+    ):
+        """Sequential sweeps against a dense coupling matrix"""
+        n = problem.num_variables
+        couplings = np.zeros((n, n))
+        couplings[problem.rows, problem.indices] = problem.data
+
+        x = rng.integers(0, 2, size=(n, num_reads)).astype(np.int8)
+        field_ = couplings @ x + problem.linear[:, None]
+        sweeps_run = 0
+        if exchange is not None:
+            exchange.start(problem, x, field_)
+
+        for beta in betas:
+            thresholds = -np.log1p(-rng.random((n, num_reads))) / beta
+            delta = np.zeros(num_reads)
+            for i in range(n):
+                step = 1 - 2 * x[i]
+                change = step * (step * field_[i] < thresholds[i])
+                if change.any():
+                    x[i] += change.astype(np.int8)
+                    delta += change * field_[i]
+                    field_ += np.outer(couplings[i], change)
+
+            sweeps_run += 1
+            if exchange is not None:
+                exchange.observe(x, delta)
+            if stop is not None and stop():
+                return problem, x, sweeps_run, True, n
+
+        return problem, x, sweeps_run, False, n
+
+    @staticmethod
+    def _stop_check(
+        timeout: Optional[float], should_stop: Optional[Callable[[], bool]]
+    ) -> Optional[Callable[[], bool]]:
+        """Combine a deadline ``timeout`` seconds from now and the caller's callback"""
+        deadline = (time.monotonic() + timeout) if timeout else None
+        if deadline is None:
+            return should_stop
+        if should_stop is None:
+            return lambda: time.monotonic() > deadline
+        return lambda: time.monotonic() > deadline or should_stop()
+
+    @staticmethod
+    def _entry_ranges(problem: "_SparseQUBO", rows: np.ndarray) -> np.ndarray:
+        """CSR entry indices of every coupling in the given rows"""
+        starts = problem.indptr[rows]
+        counts = problem.indptr[rows + 1] - starts
+        offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        return offsets + np.arange(counts.sum())
+
+    @classmethod
+    def _sparse_update(
+        cls,
+        problem: "_SparseQUBO",
+        field_: np.ndarray,
+        rows: np.ndarray,
+        reads: np.ndarray,
+        change: np.ndarray,
+    ):
+        """Apply individual flips (variable, replica, +/-1) to the local fields"""
+        counts = problem.indptr[rows + 1] - problem.indptr[rows]
+        entries = cls._entry_ranges(problem, rows)
+        np.add.at(
+            field_,
+            (problem.indices[entries], np.repeat(reads, counts)),
+            problem.data[entries] * np.repeat(change, counts),
+        )
+
+    @classmethod
+    def _class_plan(cls, problem: "_SparseQUBO", a: int, b: int) -> _ScatterPlan:
+        """Field-update plan for flips of the colour class ``a:b``"""
+        members = np.arange(a, b)
+        counts = problem.indptr[members + 1] - problem.indptr[members]
+        entries = cls._entry_ranges(problem, members)
+        return _ScatterPlan(
+            np.repeat(np.arange(b - a), counts),
+            problem.indices[entries],
+            problem.data[entries],
+        )
+
+    @staticmethod
+    def default_beta_range(problem: _SparseQUBO) -> Tuple[float, float]:
+        """
+        Hot beta accepts the largest possible uphill move with ~50%
+        probability; cold beta accepts the smallest with ~1%.
+        """
+        abs_couplings = np.zeros(problem.num_variables)
+        np.add.at(abs_couplings, problem.rows, np.abs(problem.data))
+        max_delta = float(np.max(np.abs(problem.linear) + abs_couplings, initial=0.0))
+
+        magnitudes = np.concatenate([np.abs(problem.linear), np.abs(problem.data)])
+        magnitudes = magnitudes[magnitudes > 0]
+        min_delta = float(magnitudes.min()) if len(magnitudes) else 1.0
+        if max_delta <= 0:
+            max_delta = 1.0
+
+        hot = math.log(2) / max_delta
+        cold = math.log(100) / min_delta
+        return (hot, max(cold, hot))
+
+    @staticmethod
+    def beta_schedule(
+        beta_range: Tuple[float, float], num_sweeps: int, schedule_type: str
+    ) -> np.ndarray:
+        """Inverse temperatures for each sweep"""
+        hot, cold = beta_range
+        num_sweeps = max(1, num_sweeps)
+        if schedule_type == "geometric":
+            return np.geomspace(max(hot, 1e-12), max(cold, 1e-12), num_sweeps)
+        if schedule_type == "linear":
+            return np.linspace(hot, cold, num_sweeps)
+        raise ValueError(f"Unsupported beta schedule: {schedule_type}")
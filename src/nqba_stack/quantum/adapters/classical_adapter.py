@@ -3,19 +3,83 @@ Classical Adapter - Fallback Optimization Solvers
 
 This module provides classical optimization solvers as fallbacks when
 quantum solvers are unavailable, ensuring 24/7 optimization capabilities.
+Blocking solves run in a process or thread pool so the event loop stays
+responsive, with timeouts and cancellation by job id.
 """
 
+import asyncio
 import logging
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Union
 from abc import ABC, abstractmethod
 
+from ..sparse_qubo import SparseQUBO
+from .annealer import NumpySimulatedAnnealer
+from .solver_pool import SolverCancelledError, cancel_requested, get_solver_pool
+
 logger = logging.getLogger(__name__)
 
+# Inputs forwarded to the native annealer when present
+ANNEALER_PARAMETERS = (
+    "num_reads",
+    "num_sweeps",
+    "beta_range",
+    "beta_schedule_type",
+    "seed",
+)
+
+# Extra time a pooled solve gets beyond its own timeout before it is abandoned
+TIMEOUT_GRACE_SECONDS = 5.0
+
+
+def _sample_qubo_task(
+    annealer: NumpySimulatedAnnealer,
+    qubo: Dict,
+    offset: float,
+    timeout: Optional[float],
+    variables: List,
+    overrides: Dict[str, Any],
+):
+    """Pool task: anneal one QUBO, stopping early if cancelled"""
+    return annealer.sample_qubo(
+        qubo,
+        offset=offset,
+        timeout=timeout,
+        variables=variables,
+        should_stop=cancel_requested,
+        **overrides,
+    )
+
+
+def _sample_many_task(
+    annealer: NumpySimulatedAnnealer,
+    qubos: List[Dict],
+    offsets: List[float],
+    timeout: Optional[float],
+    overrides: Dict[str, Any],
+):
+    """Pool task: anneal several QUBOs in one block-diagonal pass"""
+    return annealer.sample_many(
+        qubos, offsets, timeout=timeout, should_stop=cancel_requested, **overrides
+    )
+
+
+def _exact_sample_task(bqm: Any):
+    """Pool task: exhaustive solve, returning only the best sample"""
+    import dimod
+
+    first = dimod.ExactSolver().sample(bqm).first
+    return dict(first.sample), float(first.energy)
+
 
 class ClassicalSolver(ABC):
     """Abstract base class for classical solvers"""
 
+    # "process", "thread" or "inline" (run on the event loop)
+    executor = "process"
+    # Problems up to this many variables are cheap enough to run inline
+    inline_max_variables = 0
+
     @abstractmethod
     async def solve(
         self, problem_data: Dict[str, Any], timeout: int = 300
@@ -28,14 +92,47 @@ class ClassicalSolver(ABC):
         """Get information about the solver"""
         pass
 
+    async def cancel(self, job_id: str) -> bool:
+        """Cancel a running solve started for ``job_id``"""
+        if self.executor == "inline":
+            return False
+        return await get_solver_pool(self.executor).cancel(job_id)
+
+    async def _run_blocking(
+        self,
+        fn: Any,
+        *args: Any,
+        timeout: Optional[float] = None,
+        job_id: Optional[str] = None,
+        num_variables: Optional[int] = None,
+    ) -> Any:
+        """
+        Run a blocking solver call off the event loop. The call gets
+        ``timeout`` plus a grace period to return before it is abandoned.
+        """
+        if self.executor == "inline" or (
+            num_variables is not None and num_variables <= self.inline_max_variables
+        ):
+            return fn(*args)
+
+        pool = get_solver_pool(self.executor)
+        hard_timeout = timeout + TIMEOUT_GRACE_SECONDS if timeout else None
+        try:
+            return await pool.run(fn, *args, timeout=hard_timeout, task_id=job_id)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"{self.name} solve exceeded {timeout}s timeout")
+
 
 class DimodSolver(ClassicalSolver):
     """Dimod-based classical solver for QUBO problems"""
 
-    def __init__(self):
+    def __init__(self, executor: str = "process", inline_max_variables: int = 12):
         self.name = "dimod"
         self.version = "0.12.0"
         self.supported_problems = ["qubo", "bqm", "ising"]
+        self.annealer = NumpySimulatedAnnealer()
+        self.executor = executor
+        self.inline_max_variables = inline_max_variables
 
         # Try to import dimod
         try:
@@ -58,56 +155,65 @@ class DimodSolver(ClassicalSolver):
         try:
             operation = problem_data.get("operation", "qubo")
             inputs = problem_data.get("inputs", {})
+            job_id = problem_data.get("job_id")
 
             if operation == "qubo":
-                return await self._solve_qubo(inputs, timeout)
+                return await self._solve_qubo(inputs, timeout, job_id)
             elif operation == "bqm":
-                return await self._solve_bqm(inputs, timeout)
+                return await self._solve_bqm(inputs, timeout, job_id)
             elif operation == "ising":
-                return await self._solve_ising(inputs, timeout)
+                return await self._solve_ising(inputs, timeout, job_id)
             else:
                 raise ValueError(f"Unsupported operation: {operation}")
 
+        except SolverCancelledError:
+            raise
         except Exception as e:
             logger.error(f"Dimod solver error: {e}")
             raise
 
-    async def _solve_qubo(self, inputs: Dict[str, Any], timeout: int) -> Dict[str, Any]:
+    async def _solve_qubo(
+        self, inputs: Dict[str, Any], timeout: int, job_id: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Solve QUBO problem"""
         # Extract QUBO matrix and offset
         qubo_matrix = inputs.get("qubo_matrix", {})
         offset = inputs.get("offset", 0.0)
 
         # Convert to dimod format
-        bqm = self.dimod.BinaryQuadraticModel.from_qubo(qubo_matrix, offset)
-
-        # Solve using exact solver for small problems, heuristic for larger ones
-        if len(bqm.variables) <= 20:
-            solver = self.dimod.ExactSolver()
+        if isinstance(qubo_matrix, SparseQUBO):
+            bqm = qubo_matrix.to_bqm()
+            bqm.offset += offset
         else:
-            solver = self.dimod.SimulatedAnnealingSampler()
+            bqm = self.dimod.BinaryQuadraticModel.from_qubo(qubo_matrix, offset)
+
+        # Solve using exact solver for small problems, native annealer otherwise
+        if len(bqm.variables) > 20:
+            return await self._anneal_bqm(bqm, inputs, timeout, job_id)
 
         start_time = time.time()
-        sampleset = solver.sample(bqm)
+        sample, energy = await self._run_blocking(
+            _exact_sample_task,
+            bqm,
+            timeout=timeout,
+            job_id=job_id,
+            num_variables=len(bqm.variables),
+        )
         execution_time = time.time() - start_time
 
-        # Get best solution
-        best_sample = sampleset.first.sample
-        best_energy = sampleset.first.energy
-
         return {
-            "solution": best_sample,
-            "objective_value": best_energy,
+            "solution": sample,
+            "objective_value": energy,
             "execution_time": execution_time,
             "solver": "dimod",
-            "solver_method": (
-                "exact" if len(bqm.variables) <= 20 else "simulated_annealing"
-            ),
+            "solver_method": "exact",
             "num_variables": len(bqm.variables),
             "num_quadratic_terms": len(bqm.quadratic),
         }
 
-    async def _solve_bqm(self, inputs: Dict[str, Any], timeout: int) -> Dict[str, Any]:
+    async def _solve_bqm(
+        self, inputs: Dict[str, Any], timeout: int, job_id: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Solve Binary Quadratic Model"""
         # Extract BQM components
         linear = inputs.get("linear", {})
@@ -117,27 +223,10 @@ class DimodSolver(ClassicalSolver):
         # Create BQM
         bqm = self.dimod.BinaryQuadraticModel(linear, quadratic, vartype)
 
-        # Solve
-        solver = self.dimod.SimulatedAnnealingSampler()
-        start_time = time.time()
-        sampleset = solver.sample(bqm)
-        execution_time = time.time() - start_time
-
-        best_sample = sampleset.first.sample
-        best_energy = sampleset.first.energy
-
-        return {
-            "solution": best_sample,
-            "objective_value": best_energy,
-            "execution_time": execution_time,
-            "solver": "dimod",
-            "solver_method": "simulated_annealing",
-            "num_variables": len(bqm.variables),
-            "num_quadratic_terms": len(bqm.quadratic),
-        }
+        return await self._anneal_bqm(bqm, inputs, timeout, job_id)
 
     async def _solve_ising(
-        self, inputs: Dict[str, Any], timeout: int
+        self, inputs: Dict[str, Any], timeout: int, job_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """Solve Ising model"""
         # Extract Ising components
@@ -147,23 +236,148 @@ class DimodSolver(ClassicalSolver):
         # Create BQM from Ising
         bqm = self.dimod.BinaryQuadraticModel.from_ising(linear, quadratic)
 
-        # Solve
-        solver = self.dimod.SimulatedAnnealingSampler()
+        return await self._anneal_bqm(bqm, inputs, timeout, job_id)
+
+    async def solve_batch(
+        self, problems: List[Dict[str, Any]], timeout: int = 300
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Solve several problems, annealing compatible ones in a single pass.
+
+        Small QUBOs are still solved exactly; everything that would be
+        annealed is grouped by its annealer parameters and each group goes
+        through one block-diagonal ``sample_many`` call. Returns one result
+        dict, or the exception raised, per problem.
+        """
+        if not self.available:
+            raise RuntimeError("Dimod solver not available")
+
+        results: List[Union[Dict[str, Any], Exception]] = [None] * len(problems)
+        groups: Dict[tuple, List[tuple]] = {}
+
+        for index, problem_data in enumerate(problems):
+            operation = problem_data.get("operation", "qubo")
+            inputs = problem_data.get("inputs", {})
+            try:
+                bqm = self._build_bqm(operation, inputs)
+                if operation == "qubo" and len(bqm.variables) <= 20:
+                    results[index] = await self.solve(problem_data, timeout)
+                    continue
+            except Exception as e:
+                results[index] = e
+                continue
+
+            overrides = {
+                key: inputs[key] for key in ANNEALER_PARAMETERS if key in inputs
+            }
+            group_key = tuple(sorted((k, repr(v)) for k, v in overrides.items()))
+            groups.setdefault(group_key, []).append((index, bqm, overrides))
+
+        for members in groups.values():
+            overrides = members[0][2]
+            qubos, offsets = [], []
+            for _, bqm, _ in members:
+                qubo, qubo_offset = bqm.change_vartype(
+                    "BINARY", inplace=False
+                ).to_qubo()
+                # Keep isolated variables that have no bias in the sample
+                qubo.update({(v, v): qubo.get((v, v), 0.0) for v in bqm.variables})
+                qubos.append(qubo)
+                offsets.append(qubo_offset)
+
+            start_time = time.time()
+            try:
+                anneals = await self._run_blocking(
+                    _sample_many_task,
+                    self.annealer,
+                    qubos,
+                    offsets,
+                    timeout,
+                    overrides,
+                    timeout=timeout,
+                )
+            except Exception as e:
+                for index, _, _ in members:
+                    results[index] = e
+                continue
+            execution_time = time.time() - start_time
+
+            for (index, bqm, _), anneal in zip(members, anneals):
+                result = self._anneal_result(bqm, anneal, execution_time)
+                result["batch_size"] = len(members)
+                results[index] = result
+
+        return results
+
+    def _build_bqm(self, operation: str, inputs: Dict[str, Any]) -> Any:
+        """Build the dimod BQM for a qubo/bqm/ising problem"""
+        if operation == "qubo":
+            qubo_matrix = inputs.get("qubo_matrix", {})
+            offset = inputs.get("offset", 0.0)
+            if isinstance(qubo_matrix, SparseQUBO):
+                bqm = qubo_matrix.to_bqm()
+                bqm.offset += offset
+                return bqm
+            return self.dimod.BinaryQuadraticModel.from_qubo(qubo_matrix, offset)
+        if operation == "bqm":
+            return self.dimod.BinaryQuadraticModel(
+                inputs.get("linear", {}),
+                inputs.get("quadratic", {}),
+                inputs.get("vartype", "BINARY"),
+            )
+        if operation == "ising":
+            return self.dimod.BinaryQuadraticModel.from_ising(
+                inputs.get("linear", {}), inputs.get("quadratic", {})
+            )
+        raise ValueError(f"Unsupported operation: {operation}")
+
+    async def _anneal_bqm(
+        self,
+        bqm: Any,
+        inputs: Dict[str, Any],
+        timeout: int,
+        job_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Sample a BQM of either vartype with the native NumPy annealer"""
+        qubo, qubo_offset = bqm.change_vartype("BINARY", inplace=False).to_qubo()
+        overrides = {key: inputs[key] for key in ANNEALER_PARAMETERS if key in inputs}
+
         start_time = time.time()
-        sampleset = solver.sample(bqm)
+        anneal = await self._run_blocking(
+            _sample_qubo_task,
+            self.annealer,
+            qubo,
+            qubo_offset,
+            timeout,
+            list(bqm.variables),
+            overrides,
+            timeout=timeout,
+            job_id=job_id,
+            num_variables=len(bqm.variables),
+        )
         execution_time = time.time() - start_time
 
-        best_sample = sampleset.first.sample
-        best_energy = sampleset.first.energy
+        return self._anneal_result(bqm, anneal, execution_time)
+
+    def _anneal_result(
+        self, bqm: Any, anneal: Any, execution_time: float
+    ) -> Dict[str, Any]:
+        """Solver result dict for the best sample of an anneal"""
+        best_sample = anneal.best_sample
+        if bqm.vartype is self.dimod.SPIN:
+            best_sample = {var: 2 * value - 1 for var, value in best_sample.items()}
 
         return {
             "solution": best_sample,
-            "objective_value": best_energy,
+            "objective_value": float(bqm.energy(best_sample)),
             "execution_time": execution_time,
             "solver": "dimod",
             "solver_method": "simulated_annealing",
             "num_variables": len(bqm.variables),
             "num_quadratic_terms": len(bqm.quadratic),
+            "num_reads": int(anneal.samples.shape[0]),
+            "num_sweeps": anneal.num_sweeps,
+            "timed_out": anneal.timed_out,
         }
 
     def get_solver_info(self) -> Dict[str, Any]:
@@ -180,6 +394,9 @@ class DimodSolver(ClassicalSolver):
 class ORToolsSolver(ClassicalSolver):
     """OR-Tools-based classical solver for various optimization problems"""
 
+    # OR-Tools releases the GIL while searching
+    executor = "thread"
+
     def __init__(self):
         self.name = "ortools"
         self.version = "9.5.0"
@@ -215,24 +432,27 @@ class ORToolsSolver(ClassicalSolver):
         try:
             operation = problem_data.get("operation", "linear_programming")
             inputs = problem_data.get("inputs", {})
+            job_id = problem_data.get("job_id")
 
             if operation == "linear_programming":
-                return await self._solve_linear_programming(inputs, timeout)
+                return await self._solve_linear_programming(inputs, timeout, job_id)
             elif operation == "integer_programming":
-                return await self._solve_integer_programming(inputs, timeout)
+                return await self._solve_integer_programming(inputs, timeout, job_id)
             elif operation == "constraint_programming":
-                return await self._solve_constraint_programming(inputs, timeout)
+                return await self._solve_constraint_programming(inputs, timeout, job_id)
             elif operation == "routing":
-                return await self._solve_routing(inputs, timeout)
+                return await self._solve_routing(inputs, timeout, job_id)
             else:
                 raise ValueError(f"Unsupported operation: {operation}")
 
+        except SolverCancelledError:
+            raise
         except Exception as e:
             logger.error(f"OR-Tools solver error: {e}")
             raise
 
     async def _solve_linear_programming(
-        self, inputs: Dict[str, Any], timeout: int
+        self, inputs: Dict[str, Any], timeout: int, job_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """Solve linear programming problem"""
         # Extract LP components
@@ -274,9 +494,15 @@ class ORToolsSolver(ClassicalSolver):
                     if j < len(variables):
                         constraint.SetCoefficient(variables[j], coeff)
 
-        # Solve
+        # Solve; interrupt the native search if we give up on it
         start_time = time.time()
-        status = solver.Solve()
+        try:
+            status = await self._run_blocking(
+                solver.Solve, timeout=timeout, job_id=job_id
+            )
+        except (SolverCancelledError, TimeoutError):
+            solver.InterruptSolve()
+            raise
         execution_time = time.time() - start_time
 
         if status == self.pywraplp.Solver.OPTIMAL:
@@ -297,15 +523,15 @@ class ORToolsSolver(ClassicalSolver):
         }
 
     async def _solve_integer_programming(
-        self, inputs: Dict[str, Any], timeout: int
+        self, inputs: Dict[str, Any], timeout: int, job_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """Solve integer programming problem"""
         # Similar to LP but with integer variables
         # For brevity, implementing a simplified version
-        return await self._solve_linear_programming(inputs, timeout)
+        return await self._solve_linear_programming(inputs, timeout, job_id)
 
     async def _solve_constraint_programming(
-        self, inputs: Dict[str, Any], timeout: int
+        self, inputs: Dict[str, Any], timeout: int, job_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """Solve constraint programming problem"""
         # Extract CP components
@@ -339,12 +565,14 @@ class ORToolsSolver(ClassicalSolver):
         )
 
         # Solve
+        def search():
+            solver.NewSearch(db)
+            if solver.NextSolution():
+                return [var.Value() for var in cp_vars]
+            return []
+
         start_time = time.time()
-        solver.NewSearch(db)
-        if solver.NextSolution():
-            solution = [var.Value() for var in cp_vars]
-        else:
-            solution = []
+        solution = await self._run_blocking(search, timeout=timeout, job_id=job_id)
         execution_time = time.time() - start_time
 
         return {
@@ -358,7 +586,7 @@ class ORToolsSolver(ClassicalSolver):
         }
 
     async def _solve_routing(
-        self, inputs: Dict[str, Any], timeout: int
+        self, inputs: Dict[str, Any], timeout: int, job_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """Solve vehicle routing problem"""
         # Extract routing components
@@ -388,7 +616,12 @@ class ORToolsSolver(ClassicalSolver):
 
         # Solve
         start_time = time.time()
-        solution = routing.SolveWithParameters(search_parameters)
+        solution = await self._run_blocking(
+            routing.SolveWithParameters,
+            search_parameters,
+            timeout=timeout,
+            job_id=job_id,
+        )
         execution_time = time.time() - start_time
 
         if solution:
@@ -494,6 +727,8 @@ class ClassicalAdapter:
             try:
                 solver = self.solvers[self.primary_solver]
                 return await solver.solve(problem_data, timeout)
+            except SolverCancelledError:
+                raise
             except Exception as e:
                 logger.warning(f"Primary solver {self.primary_solver} failed: {e}")
                 # Fall through to other solvers
@@ -503,6 +738,8 @@ class ClassicalAdapter:
             if solver_name != self.primary_solver:
                 try:
                     return await solver.solve(problem_data, timeout)
+                except SolverCancelledError:
+                    raise
                 except Exception as e:
                     logger.warning(f"Solver {solver_name} failed: {e}")
                     continue
@@ -510,6 +747,39 @@ class ClassicalAdapter:
         # All solvers failed
         raise RuntimeError("All classical solvers failed to solve the problem")
 
+    async def solve_batch(
+        self, problems: List[Dict[str, Any]], timeout: int = 300
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Solve several problems, in one pass when the primary solver supports
+        it; problems that fail there are retried one by one via ``solve``.
+        """
+        if not self.solvers:
+            raise RuntimeError("No classical solvers available")
+
+        results: List[Union[Dict[str, Any], Exception]] = [None] * len(problems)
+        solver = self.solvers.get(self.primary_solver)
+        if solver is not None and hasattr(solver, "solve_batch"):
+            try:
+                results = list(await solver.solve_batch(problems, timeout))
+            except Exception as e:
+                logger.warning(f"Batch solve on {self.primary_solver} failed: {e}")
+
+        for index, result in enumerate(results):
+            if result is None or isinstance(result, Exception):
+                try:
+                    results[index] = await self.solve(problems[index], timeout)
+                except Exception as e:
+                    results[index] = e
+        return results
+
+    async def cancel(self, job_id: str) -> bool:
+        """Cancel a running solve for ``job_id`` on whichever solver has it"""
+        cancelled = False
+        for solver in self.solvers.values():
+            cancelled = await solver.cancel(job_id) or cancelled
+        return cancelled
+
     def get_available_solvers(self) -> Dict[str, Dict[str, Any]]:
         """Get information about available solvers"""
         return {name: solver.get_solver_info() for name, solver in self.solvers.items()}
@@ -0,0 +1,231 @@
+"""
+Solver Pool - Off-Loop Execution for Blocking Solvers
+
+Runs blocking solver calls without stalling the asyncio event loop:
+- Process pool for CPU-bound Python/NumPy solvers, thread pool for
+  backends that release the GIL (e.g. OR-Tools)
+- Timeouts enforced on the awaiting side
+- Cooperative cancellation: a running task can poll ``cancel_requested()``
+  (a shared-memory flag in process workers, an Event in thread workers)
+- One lazily created pool per kind, shared by all solvers
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Number of concurrently cancellable process tasks
+_CANCEL_SLOTS = 256
+
+# Worker-side state
+_cancel_flags: Optional[Any] = None
+_current_slot: Optional[int] = None
+_thread_state = threading.local()
+
+
+class SolverCancelledError(RuntimeError):
+    """Raised when a pooled solve is cancelled"""
+
+
+def cancel_requested() -> bool:
+    """True if the task running in this worker has been cancelled"""
+    event = getattr(_thread_state, "cancel_event", None)
+    if event is not None:
+        return event.is_set()
+    if _cancel_flags is not None and _current_slot is not None:
+        return bool(_cancel_flags[_current_slot])
+    return False
+
+
+def _init_process_worker(flags: Any):
+    global _cancel_flags
+    _cancel_flags = flags
+
+
+def _run_in_process(slot: Optional[int], fn: Callable, args: tuple) -> Any:
+    global _current_slot
+    _current_slot = slot
+    try:
+        return fn(*args)
+    finally:
+        _current_slot = None
+
+
+def _run_in_thread(event: threading.Event, fn: Callable, args: tuple) -> Any:
+    _thread_state.cancel_event = event
+    try:
+        return fn(*args)
+    finally:
+        _thread_state.cancel_event = None
+
+
+class _Task:
+    """Bookkeeping for one submitted call"""
+
+    def __init__(self, slot: Optional[int], event: Optional[threading.Event]):
+        self.slot = slot
+        self.event = event
+        self.future: Optional[asyncio.Future] = None
+
+
+class SolverPool:
+    """
+    Executes blocking callables in a process or thread pool.
+
+    ``run`` awaits the call; ``cancel`` flags a running call (which stops at
+    its next ``cancel_requested()`` check) and makes ``run`` raise
+    SolverCancelledError immediately. Callables for a process pool must be
+    picklable module-level functions.
+    """
+
+    def __init__(self, kind: str = "process", max_workers: Optional[int] = None):
+        if kind not in ("process", "thread"):
+            raise ValueError(f"Unsupported pool kind: {kind}")
+        self.kind = kind
+        self.max_workers = max_workers or (os.cpu_count() or 1)
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._tasks: Dict[str, _Task] = {}
+        self._free_slots: List[int] = list(range(_CANCEL_SLOTS))
+        self._flags: Optional[Any] = None
+
+        self.submitted = 0
+        self.cancelled = 0
+        self.timed_out = 0
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.kind == "process":
+                    context = multiprocessing.get_context("spawn")
+                    self._flags = context.RawArray("b", _CANCEL_SLOTS)
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=context,
+                        initializer=_init_process_worker,
+                        initargs=(self._flags,),
+                    )
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="solver"
+                    )
+                logger.info(
+                    f"Started {self.kind} solver pool with {self.max_workers} workers"
+                )
+            return self._executor
+
+    async def run(
+        self,
+        fn: Callable,
+        *args: Any,
+        timeout: Optional[float] = None,
+        task_id: Optional[str] = None,
+    ) -> Any:
+        """Run ``fn(*args)`` in the pool and await its result"""
+        executor = self._get_executor()
+        task = self._start_task(task_id)
+        self.submitted += 1
+
+        if self.kind == "process":
+            future = executor.submit(_run_in_process, task.slot, fn, args)
+        else:
+            future = executor.submit(_run_in_thread, task.event, fn, args)
+        # The cancel slot is only reusable once the worker is done with it
+        future.add_done_callback(lambda _: self._release_slot(task))
+        task.future = asyncio.wrap_future(future)
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(task.future), timeout)
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            self._signal(task)
+            raise
+        except asyncio.CancelledError:
+            self._signal(task)
+            if task_id is not None and task_id not in self._tasks:
+                raise SolverCancelledError(f"Solve {task_id} was cancelled")
+            raise
+        except BrokenProcessPool:
+            # A worker died; start a fresh pool on the next call
+            self.shutdown()
+            raise
+        finally:
+            self._finish_task(task_id, task)
+
+    async def cancel(self, task_id: str) -> bool:
+        """Cancel a running or pending call; returns False if none is known"""
+        task = self._tasks.pop(task_id, None)
+        if task is None:
+            return False
+        self.cancelled += 1
+        self._signal(task)
+        return True
+
+    def shutdown(self, wait: bool = False):
+        """Stop the pool; pending calls are cancelled"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "max_workers": self.max_workers,
+            "running": len(self._tasks),
+            "submitted": self.submitted,
+            "cancelled": self.cancelled,
+            "timed_out": self.timed_out,
+        }
+
+    def _start_task(self, task_id: Optional[str]) -> _Task:
+        slot, event = None, None
+        if self.kind == "process":
+            with self._lock:
+                slot = self._free_slots.pop() if self._free_slots else None
+            if slot is not None:
+                self._flags[slot] = 0
+        else:
+            event = threading.Event()
+        task = _Task(slot, event)
+        if task_id is not None:
+            self._tasks[task_id] = task
+        return task
+
+    def _finish_task(self, task_id: Optional[str], task: _Task):
+        if task_id is not None and self._tasks.get(task_id) is task:
+            del self._tasks[task_id]
+
+    def _release_slot(self, task: _Task):
+        with self._lock:
+            if task.slot is not None:
+                self._free_slots.append(task.slot)
+                task.slot = None
+
+    def _signal(self, task: _Task):
+        """Ask the worker to stop and release the awaiting coroutine"""
+        with self._lock:
+            if task.slot is not None:
+                self._flags[task.slot] = 1
+        if task.event is not None:
+            task.event.set()
+        if task.future is not None and not task.future.done():
+            task.future.cancel()
+
+
+_pools: Dict[str, SolverPool] = {}
+
+
+def get_solver_pool(kind: str = "process") -> SolverPool:
+    """Shared pool of the given kind, created on first use"""
+    pool = _pools.get(kind)
+    if pool is None:
+        pool = _pools.setdefault(kind, SolverPool(kind))
+    return pool
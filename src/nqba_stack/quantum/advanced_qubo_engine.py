@@ -15,6 +15,7 @@ from pathlib import Path
 from ..core.ltc_logger import LTCLogger
 from ..quantum_adapter import QuantumAdapter
 from ..constraints.constraint_evolution_engine import ConstraintEvolutionEngine
+from .sparse_qubo import SparseQUBO, SparseQUBOBuilder
 
 logger = logging.getLogger(__name__)
 
@@ -227,19 +228,17 @@ class AdvancedQUBOEngine:
 
             start_time = datetime.now()
 
-            # Build QUBO matrix with constraints
-            qubo_matrix = await self._build_qubo_matrix(problem, initial_values)
+            # Build sparse QUBO with constraints
+            qubo = await self._build_qubo_matrix(problem, initial_values)
 
             # Apply optimization strategy
             if problem.strategy == OptimizationStrategy.ADAPTIVE:
-                qubo_matrix = await self._apply_adaptive_strategy(qubo_matrix, problem)
+                qubo = await self._apply_adaptive_strategy(qubo, problem)
 
-            # Optimize using quantum adapter
+            # Optimize using quantum adapter (consumes the sparse QUBO directly)
             try:
                 optimization_result = await self.quantum_adapter.optimize_qubo(
-                    qubo_matrix=qubo_matrix,
-                    num_reads=1000,
-                    backend="dynex",  # Use Dynex for best performance
+                    qubo, parameters={"num_reads": 1000}
                 )
                 logger.info(f"Quantum optimization completed successfully")
             except Exception as e:
@@ -337,69 +336,66 @@ class AdvancedQUBOEngine:
 
     async def _build_qubo_matrix(
         self, problem: OptimizationProblem, initial_values: Optional[Dict[str, float]]
-    ) -> np.ndarray:
-        """Build QUBO matrix from problem definition"""
+    ) -> SparseQUBO:
+        """Build the sparse QUBO from the problem definition"""
         n_vars = len(problem.variables)
-        matrix = np.zeros((n_vars, n_vars))
+        builder = SparseQUBOBuilder(n_vars, variables=problem.variables)
 
         # Add objective function terms
         # This is a simplified implementation - in practice, you'd parse the expression
-        # and build the matrix accordingly
-        for i in range(n_vars):
-            for j in range(n_vars):
-                if i == j:
-                    matrix[i, j] = 1.0  # Linear terms
-                else:
-                    matrix[i, j] = 0.1  # Quadratic terms
+        # and build the terms accordingly
+        builder.add_linear(np.arange(n_vars), 1.0)  # Linear terms
+        rows, cols = np.triu_indices(n_vars, k=1)
+        builder.add_quadratic(rows, cols, 0.2)  # 0.1 on each side of the diagonal
 
         # Add constraint terms
         for constraint in problem.constraints:
             if constraint.is_active:
-                constraint_matrix = self._build_constraint_matrix(
+                constraint_terms = self._build_constraint_terms(
                     constraint, problem.variables
                 )
-                matrix += constraint.weight * constraint_matrix
+                builder.add_linear(
+                    np.arange(n_vars), constraint.weight * constraint_terms
+                )
 
-        return matrix
+        return builder.build()
 
-    def _build_constraint_matrix(
+    def _build_constraint_terms(
         self, constraint: OptimizationConstraint, variables: List[str]
     ) -> np.ndarray:
-        """Build constraint contribution to QUBO matrix"""
+        """Build constraint contribution to the QUBO linear biases"""
         n_vars = len(variables)
-        matrix = np.zeros((n_vars, n_vars))
+        linear = np.zeros(n_vars)
 
         # Simplified constraint implementation
         # In practice, you'd parse the constraint expression and build accordingly
         if constraint.constraint_type == ConstraintType.EQUALITY:
             # Equality constraint: (sum - target)^2
-            for i in range(n_vars):
-                matrix[i, i] = 1.0
+            linear[:] = 1.0
         elif constraint.constraint_type == ConstraintType.INEQUALITY:
             # Inequality constraint: max(0, sum - limit)^2
-            for i in range(n_vars):
-                matrix[i, i] = 0.5
+            linear[:] = 0.5
 
-        return matrix
+        return linear
 
     async def _apply_adaptive_strategy(
-        self, qubo_matrix: np.ndarray, problem: OptimizationProblem
-    ) -> np.ndarray:
+        self, qubo: SparseQUBO, problem: OptimizationProblem
+    ) -> SparseQUBO:
         """Apply adaptive optimization strategy based on performance history"""
         if not problem.performance_metrics:
-            return qubo_matrix
+            return qubo
 
         # Adjust based on previous performance
         last_advantage = problem.performance_metrics.get("last_quantum_advantage", 1.0)
 
         if last_advantage < 10:  # Poor performance
             # Increase exploration
-            qubo_matrix *= 1.2
+            qubo = qubo.scaled(1.2)
         elif last_advantage > 100:  # Excellent performance
             # Fine-tune
-            qubo_matrix *= 0.9
+            qubo = qubo.scaled(0.9)
 
-        return qubo_matrix
+        return qubo
 
     def _extract_solution(
         self, optimization_result: Dict[str, Any], variables: List[str]
@@ -0,0 +1,489 @@
+"""
+QIH Job Store - Persistent Job State for the Quantum Integration Hub
+
+Pluggable storage behind QuantumIntegrationHub:
+- SQLite in WAL mode (default) or in-memory backends
+- State transitions are coalesced per job and written in batches by a
+  background flusher with ``executemany``
+- Requests and results are stored as separate blobs; results are written
+  once and loaded lazily
+- Unfinished (queued/running) jobs can be reloaded after a restart
+- Each SQLite store leases the jobs it writes; only unowned jobs or jobs
+  whose lease has expired are reclaimed by another process
+"""
+
+import atexit
+import logging
+import os
+import pickle
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Scalar job columns; QuantumJob.to_record() produces exactly these keys
+JOB_COLUMNS = (
+    "job_id",
+    "user_id",
+    "status",
+    "priority",
+    "created_at",
+    "started_at",
+    "completed_at",
+    "error",
+    "metrics",
+    "retry_count",
+    "max_retries",
+    "idempotency_key",
+    "ttl_days",
+    "batch_id",
+)
+
+# Job statuses that must be re-queued after a restart
+UNFINISHED_STATUSES = ("queued", "running")
+
+# Ownership columns maintained by the SQLite store itself
+LEASE_COLUMNS = ("owner", "lease_expires_at")
+
+JobRecord = Dict[str, Any]
+
+
+class JobStore(ABC):
+    """
+    Storage backend for QIH jobs.
+
+    ``save`` only marks a job dirty; its record is taken from the live job
+    object when the store flushes, so several transitions of one job in
+    quick succession cost a single write.
+    """
+
+    @abstractmethod
+    def save(self, job: Any, new: bool = False):
+        """Mark a job for writing; ``new`` also stores its request"""
+        pass
+
+    @abstractmethod
+    def save_result(self, job_id: str, result: Any):
+        """Store the result of a finished job"""
+        pass
+
+    @abstractmethod
+    def delete(self, job_id: str):
+        """Remove a job and its result"""
+        pass
+
+    @abstractmethod
+    def load(self, job_id: str) -> Optional[Tuple[JobRecord, Any]]:
+        """Return (record, request) for a job, or None"""
+        pass
+
+    @abstractmethod
+    def load_result(self, job_id: str) -> Optional[Any]:
+        """Return a stored result, or None"""
+        pass
+
+    @abstractmethod
+    def find_by_idempotency_key(self, key: str) -> Optional[str]:
+        """Return the id of the job stored under an idempotency key"""
+        pass
+
+    @abstractmethod
+    def claim_unfinished(self) -> List[Tuple[JobRecord, Any]]:
+        """
+        Take ownership of queued or running jobs that no live store holds
+        and return (record, request) for each of them
+        """
+        pass
+
+    def flush(self):
+        """Write any pending changes"""
+        pass
+
+    def close(self):
+        """Flush and release resources"""
+        self.flush()
+
+
+class InMemoryJobStore(JobStore):
+    """Job store kept in process memory (no persistence across restarts)"""
+
+    def __init__(self):
+        self._records: Dict[str, JobRecord] = {}
+        self._requests: Dict[str, Any] = {}
+        self._results: Dict[str, Any] = {}
+        self._jobs: Dict[str, Any] = {}
+        self._keys: Dict[str, str] = {}
+
+    def save(self, job: Any, new: bool = False):
+        self._jobs[job.job_id] = job
+        if new:
+            self._requests[job.job_id] = job.request
+            if job.idempotency_key:
+                self._keys[job.idempotency_key] = job.job_id
+
+    def save_result(self, job_id: str, result: Any):
+        self._results[job_id] = result
+
+    def delete(self, job_id: str):
+        job = self._jobs.get(job_id)
+        record = self._records.get(job_id)
+        key = job.idempotency_key if job else record and record["idempotency_key"]
+        if key and self._keys.get(key) == job_id:
+            del self._keys[key]
+        for table in (self._records, self._requests, self._results, self._jobs):
+            table.pop(job_id, None)
+
+    def load(self, job_id: str) -> Optional[Tuple[JobRecord, Any]]:
+        self.flush()
+        if job_id not in self._records:
+            return None
+        return dict(self._records[job_id]), self._requests.get(job_id)
+
+    def load_result(self, job_id: str) -> Optional[Any]:
+        return self._results.get(job_id)
+
+    def find_by_idempotency_key(self, key: str) -> Optional[str]:
+        return self._keys.get(key)
+
+    def claim_unfinished(self) -> List[Tuple[JobRecord, Any]]:
+        self.flush()
+        return [
+            (dict(record), self._requests.get(job_id))
+            for job_id, record in self._records.items()
+            if record["status"] in UNFINISHED_STATUSES
+        ]
+
+    def flush(self):
+        for job_id, job in self._jobs.items():
+            self._records[job_id] = job.to_record()
+        self._jobs.clear()
+
+
+class SQLiteJobStore(JobStore):
+    """
+    SQLite job store in WAL mode with batched, coalesced writes.
+
+    Pending changes are flushed every ``flush_interval`` seconds by a
+    daemon thread, or as soon as ``batch_size`` jobs are dirty.
+
+    Several processes may share one database. Every job row written by a
+    store carries that store's ``owner_id`` and a lease that the flusher
+    renews while the store is open; ``close`` releases the leases.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        flush_interval: float = 0.1,
+        batch_size: int = 500,
+        lease_seconds: float = 60.0,
+    ):
+        self.path = Path(path)
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.lease_seconds = lease_seconds
+        self.owner_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self._lock = threading.RLock()
+        self._dirty: Dict[str, Any] = {}
+        self._new: Dict[str, Any] = {}
+        self._results: Dict[str, bytes] = {}
+        self._deleted: Dict[str, None] = {}
+        # Idempotency keys of new jobs that are not written yet
+        self._new_keys: Dict[str, str] = {}
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._flusher: Optional[threading.Thread] = None
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._initialize_store()
+        atexit.register(self.close)
+
+    def _initialize_store(self):
+        """Create the schema"""
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS qih_jobs (
+                job_id TEXT PRIMARY KEY,
+                user_id TEXT NOT NULL,
+                status TEXT NOT NULL,
+                priority TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                started_at TEXT,
+                completed_at TEXT,
+                error TEXT,
+                metrics TEXT,
+                retry_count INTEGER NOT NULL DEFAULT 0,
+                max_retries INTEGER NOT NULL DEFAULT 3,
+                idempotency_key TEXT,
+                ttl_days INTEGER NOT NULL DEFAULT 30,
+                batch_id TEXT,
+                request BLOB,
+                result BLOB,
+                owner TEXT,
+                lease_expires_at REAL
+            )
+            """)
+        # Databases created before leases were added lack the lease columns
+        existing = {row[1] for row in self._conn.execute("PRAGMA table_info(qih_jobs)")}
+        if "owner" not in existing:
+            self._conn.execute("ALTER TABLE qih_jobs ADD COLUMN owner TEXT")
+        if "lease_expires_at" not in existing:
+            self._conn.execute("ALTER TABLE qih_jobs ADD COLUMN lease_expires_at REAL")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_qih_jobs_status ON qih_jobs(status)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_qih_jobs_idempotency_key "
+            "ON qih_jobs(idempotency_key)"
+        )
+        self._conn.commit()
+
+    def save(self, job: Any, new: bool = False):
+        with self._lock:
+            self._deleted.pop(job.job_id, None)
+            self._dirty[job.job_id] = job
+            if new:
+                self._new[job.job_id] = job
+                if job.idempotency_key:
+                    self._new_keys[job.idempotency_key] = job.job_id
+            pending = len(self._dirty)
+        self._schedule_flush(pending >= self.batch_size)
+
+    def save_result(self, job_id: str, result: Any):
+        blob = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._results[job_id] = blob
+        self._schedule_flush(False)
+
+    def delete(self, job_id: str):
+        with self._lock:
+            job = self._new.get(job_id)
+            if job is not None and job.idempotency_key:
+                self._new_keys.pop(job.idempotency_key, None)
+            for pending in (self._dirty, self._new, self._results):
+                pending.pop(job_id, None)
+            self._deleted[job_id] = None
+        self._schedule_flush(False)
+
+    def load(self, job_id: str) -> Optional[Tuple[JobRecord, Any]]:
+        self.flush()
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(JOB_COLUMNS)}, request FROM qih_jobs "
+                "WHERE job_id = ?",
+                (job_id,),
+            ).fetchone()
+        return self._decode_row(row) if row else None
+
+    def load_result(self, job_id: str) -> Optional[Any]:
+        with self._lock:
+            blob = self._results.get(job_id)
+            if blob is None:
+                row = self._conn.execute(
+                    "SELECT result FROM qih_jobs WHERE job_id = ?", (job_id,)
+                ).fetchone()
+                blob = row[0] if row else None
+        if blob is None:
+            return None
+        return pickle.loads(blob)  # nosec B301 - written by this store
+
+    def find_by_idempotency_key(self, key: str) -> Optional[str]:
+        """Look up pending jobs first, then the indexed column; never flushes"""
+        with self._lock:
+            job_id = self._new_keys.get(key)
+            if job_id is not None:
+                return job_id
+            row = self._conn.execute(
+                "SELECT job_id FROM qih_jobs WHERE idempotency_key = ? "
+                "ORDER BY created_at DESC LIMIT 1",
+                (key,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def claim_unfinished(self) -> List[Tuple[JobRecord, Any]]:
+        """
+        Claim unfinished jobs that are unowned or whose lease has expired.
+
+        The select and the ownership update run in one immediate transaction,
+        so two processes recovering at once never claim the same job.
+        """
+        self.flush()
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute(
+                    f"SELECT {', '.join(JOB_COLUMNS)}, request FROM qih_jobs "
+                    f"WHERE status IN ({', '.join('?' * len(UNFINISHED_STATUSES))}) "
+                    "AND (owner IS NULL OR owner = ? "
+                    "OR lease_expires_at IS NULL OR lease_expires_at < ?) "
+                    "ORDER BY created_at",
+                    (*UNFINISHED_STATUSES, self.owner_id, now),
+                ).fetchall()
+                self._conn.executemany(
+                    "UPDATE qih_jobs SET owner = ?, lease_expires_at = ? "
+                    "WHERE job_id = ?",
+                    [(self.owner_id, now + self.lease_seconds, row[0]) for row in rows],
+                )
+                self._conn.commit()
+            except sqlite3.Error:
+                self._conn.rollback()
+                raise
+        return [self._decode_row(row) for row in rows]
+
+    def renew_leases(self):
+        """Extend the lease on every unfinished job this store owns"""
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                with self._conn:
+                    self._conn.execute(
+                        "UPDATE qih_jobs SET lease_expires_at = ? WHERE owner = ? "
+                        f"AND status IN ({', '.join('?' * len(UNFINISHED_STATUSES))})",
+                        (time.time() + self.lease_seconds, self.owner_id, *UNFINISHED_STATUSES),
+                    )
+            except sqlite3.Error as e:
+                logger.error(f"Failed to renew QIH job leases: {e}")
+
+    def flush(self):
+        """Write every pending change in one transaction, keeping it on failure"""
+        with self._lock:
+            if self._conn is None:
+                return
+            if not (self._dirty or self._results or self._deleted):
+                return
+
+            new_rows = [
+                (job.job_id, pickle.dumps(job.request, pickle.HIGHEST_PROTOCOL))
+                for job in self._new.values()
+            ]
+            records = [job.to_record() for job in self._dirty.values()]
+            results = list(self._results.items())
+            deleted = [(job_id,) for job_id in self._deleted]
+
+            try:
+                with self._conn:
+                    self._write(new_rows, records, results, deleted)
+            except sqlite3.Error as e:
+                # Keep everything pending so the next flush retries it
+                logger.error(f"Failed to flush QIH job store: {e}")
+                return
+
+            self._dirty.clear()
+            self._new.clear()
+            self._new_keys.clear()
+            self._results.clear()
+            self._deleted.clear()
+
+    def _write(
+        self,
+        new_rows: List[Tuple[str, bytes]],
+        records: List[JobRecord],
+        results: List[Tuple[str, bytes]],
+        deleted: List[Tuple[str]],
+    ):
+        """Apply one batch of changes; must run inside a transaction"""
+        all_columns = JOB_COLUMNS + LEASE_COLUMNS
+        columns = ", ".join(all_columns)
+        placeholders = ", ".join("?" * len(all_columns))
+        updates = ", ".join(f"{c} = excluded.{c}" for c in all_columns[1:])
+        lease = (self.owner_id, time.time() + self.lease_seconds)
+
+        self._conn.executemany(
+            f"INSERT INTO qih_jobs ({columns}) VALUES ({placeholders}) "
+            f"ON CONFLICT(job_id) DO UPDATE SET {updates}",
+            [tuple(record[c] for c in JOB_COLUMNS) + lease for record in records],
+        )
+        self._conn.executemany(
+            "UPDATE qih_jobs SET request = ? WHERE job_id = ?",
+            [(blob, job_id) for job_id, blob in new_rows],
+        )
+        self._conn.executemany(
+            "UPDATE qih_jobs SET result = ? WHERE job_id = ?",
+            [(blob, job_id) for job_id, blob in results],
+        )
+        self._conn.executemany("DELETE FROM qih_jobs WHERE job_id = ?", deleted)
+
+    def close(self):
+        """
+        Stop the flusher, write pending changes, release this store's
+        leases so its unfinished jobs can be reclaimed at once, and close
+        the database
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._wakeup.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=5)
+        self.flush()
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.execute(
+                        "UPDATE qih_jobs SET owner = NULL, lease_expires_at = NULL "
+                        "WHERE owner = ?",
+                        (self.owner_id,),
+                    )
+            except sqlite3.Error as e:
+                logger.error(f"Failed to release QIH job leases: {e}")
+            self._conn.close()
+            self._conn = None
+
+    def _schedule_flush(self, immediately: bool):
+        """Start the background flusher if needed and optionally wake it"""
+        if self._flusher is None and not self._closed:
+            with self._lock:
+                if self._flusher is None:
+                    self._flusher = threading.Thread(
+                        target=self._flush_loop, name="qih-job-store", daemon=True
+                    )
+                    self._flusher.start()
+        if immediately:
+            self._wakeup.set()
+
+    def _flush_loop(self):
+        renew_at = time.monotonic() + self.lease_seconds / 3
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            if self._closed:
+                break
+            self.flush()
+            if time.monotonic() >= renew_at:
+                self.renew_leases()
+                renew_at = time.monotonic() + self.lease_seconds / 3
+
+    @staticmethod
+    def _decode_row(row: Tuple) -> Tuple[JobRecord, Any]:
+        record = dict(zip(JOB_COLUMNS, row[: len(JOB_COLUMNS)]))
+        blob = row[len(JOB_COLUMNS)]
+        request = pickle.loads(blob) if blob else None  # nosec B301
+        return record, request
+
+
+def create_job_store(location: Optional[Union[str, Path]] = None) -> JobStore:
+    """
+    Build the configured job store.
+
+    ``location`` (or the ``NQBA_QIH_JOB_STORE`` environment variable) is a
+    SQLite path, or ``:memory:`` for the in-memory store. Defaults to
+    ``qih_jobs.db`` under ``NQBA_DATA_DIR``.
+    """
+    location = location or os.getenv("NQBA_QIH_JOB_STORE")
+    if str(location) == ":memory:":
+        return InMemoryJobStore()
+    if not location:
+        location = Path(os.getenv("NQBA_DATA_DIR", "data")) / "qih_jobs.db"
+    return SQLiteJobStore(location)
@@ -7,7 +7,5 @@ canonical quantum forms (QUBO, Ising, etc.) for quantum optimization.
 
 from .base_mapper import ProblemMapper
 from .sigma_lead_mapper import SigmaLeadMapper
-from .energy_mapper import EnergyMapper
-from .portfolio_mapper import PortfolioMapper
 
-__all__ = ["ProblemMapper", "SigmaLeadMapper", "EnergyMapper", "PortfolioMapper"]
+__all__ = ["ProblemMapper", "SigmaLeadMapper"]
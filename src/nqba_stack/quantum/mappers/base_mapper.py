@@ -9,6 +9,7 @@ from typing import Dict, Any, Optional, List
 import numpy as np
 
 from ..schemas.core_models import ProblemType
+from ..sparse_qubo import SparseQUBO
 
 
 class ProblemMapper(ABC):
@@ -35,46 +36,63 @@ class ProblemMapper(ABC):
         pass
 
     async def map_to_ising(self, problem_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Map business problem to Ising format (default implementation)."""
+        """
+        Map business problem to Ising format (default implementation).
+
+        Returns ``"ising_terms"`` (h), sparse ``"ising_couplings"``
+        (``{(u, v): J}``) and ``"offset"`` for either kind of QUBO result; a
+        dense upper-triangular ``"ising_matrix"`` is only added when
+        ``dense_output`` is set.
+        """
         # Convert QUBO to Ising: x_i = (1 - s_i) / 2
         qubo_result = await self.map_to_qubo(problem_data)
 
-        # Extract QUBO matrix and linear terms
-        qubo_matrix = qubo_result.get("qubo_matrix", [])
-        linear_terms = qubo_result.get("linear_terms", [])
-
-        if not qubo_matrix:
-            return {"ising_matrix": [], "ising_terms": []}
-
-        # Convert to Ising format
-        n = len(qubo_matrix)
-        ising_matrix = np.zeros((n, n))
-        ising_terms = np.zeros(n)
-
-        # Convert QUBO to Ising
-        for i in range(n):
-            for j in range(n):
-                if i == j:
-                    # Diagonal terms: h_i = -0.5 * (linear_terms[i] + sum of QUBO diagonal)
-                    ising_terms[i] = -0.5 * (
-                        linear_terms[i] if i < len(linear_terms) else 0
-                    )
-                    for k in range(n):
-                        if k != i:
-                            ising_terms[i] -= 0.5 * qubo_matrix[i][k]
-                else:
-                    # Off-diagonal terms: J_ij = 0.25 * QUBO[i][j]
-                    ising_matrix[i][j] = 0.25 * qubo_matrix[i][j]
-
-        return {
-            "ising_matrix": ising_matrix.tolist(),
-            "ising_terms": ising_terms.tolist(),
+        # Dense results go through the same sparse conversion
+        qubo = qubo_result.get("qubo")
+        if not isinstance(qubo, SparseQUBO):
+            matrix = np.asarray(qubo_result.get("qubo_matrix", []), dtype=float)
+            n = len(matrix)
+            matrix = matrix.reshape(n, n)
+            linear = np.zeros(n)
+            linear_terms = np.asarray(
+                qubo_result.get("linear_terms", [])[:n], dtype=float
+            )
+            linear[: len(linear_terms)] = linear_terms
+            rows, cols = np.nonzero(matrix)
+            qubo = SparseQUBO(
+                linear,
+                rows,
+                cols,
+                matrix[rows, cols],
+                offset=qubo_result.get("constant_term", 0.0),
+            )
+
+        # to_ising() substitutes x = (1 + s) / 2; flipping every spin only
+        # changes the sign of h
+        h, rows, cols, couplings, offset = qubo.to_ising()
+        h = -h
+        labels = qubo.labels
+
+        result = {
+            "ising_terms": h.tolist(),
+            "ising_couplings": {
+                (labels[i], labels[j]): value
+                for i, j, value in zip(rows.tolist(), cols.tolist(), couplings.tolist())
+            },
+            "offset": offset,
             "metadata": {
                 "converted_from": "qubo",
                 "mapper": self.name,
                 "problem_type": "ising",
+                "spin_convention": "x = (1 - s) / 2",
             },
         }
+        if problem_data.get("dense_output", False):
+            ising_matrix = np.zeros(qubo.shape)
+            ising_matrix[rows, cols] = couplings
+            result["ising_matrix"] = ising_matrix.tolist()
+
+        return result
 
     async def get_mapping_info(self) -> Dict[str, Any]:
         """Get information about the mapper."""
@@ -10,6 +10,7 @@ from typing import Dict, Any, List, Optional
 import logging
 
 from .base_mapper import ProblemMapper
+from ..sparse_qubo import SparseQUBOBuilder
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +46,12 @@ class SigmaLeadMapper(ProblemMapper):
         }
 
     async def map_to_qubo(self, problem_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Map lead scoring problem to QUBO format."""
+        """
+        Map lead scoring problem to QUBO format.
+
+        Returns the problem as a ``SparseQUBO`` under ``"qubo"``; a dense
+        ``"qubo_matrix"`` list is only added when ``dense_output`` is set.
+        """
         try:
             # Validate input
             if not await self.validate_input(problem_data):
@@ -60,78 +66,65 @@ class SigmaLeadMapper(ProblemMapper):
             n_channels = len(channels)
             total_vars = n_leads + n_leads * n_channels  # x_i + y_ij variables
 
-            # Initialize QUBO matrix
-            qubo_matrix = np.zeros((total_vars, total_vars))
-            linear_terms = np.zeros(total_vars)
+            # QUBO terms are accumulated sparsely and merged on build
+            builder = SparseQUBOBuilder(total_vars)
 
             # Variable mapping:
             # x_i: Whether to contact lead i (0 to n_leads-1)
-            # y_ij: Whether to use channel j for lead i (n_leads to total_vars-1)
+            # y_ij: Whether to use channel j for lead i (n_leads + i*n_channels + j)
+            x_idx = np.arange(n_leads)
+            y_idx = n_leads + np.arange(n_leads * n_channels)
+            costs = np.array(
+                [self.channel_costs.get(channel, 1.0) for channel in channels]
+            )
+            y_cost = np.tile(costs, n_leads)  # cost of y_ij, ordered like y_idx
 
             # Objective: Maximize expected revenue - contact costs
-            for i, lead in enumerate(leads):
-                # Lead selection variable x_i
-                expected_revenue = self._calculate_expected_revenue(lead)
-                linear_terms[i] = -expected_revenue  # Negative because we minimize
-
-                # Channel selection variables y_ij
-                for j, channel in enumerate(channels):
-                    y_idx = n_leads + i * n_channels + j
-                    channel_cost = self.channel_costs.get(channel, 1.0)
-                    linear_terms[y_idx] = channel_cost
+            revenue = np.array(
+                [self._calculate_expected_revenue(lead) for lead in leads]
+            )
+            builder.add_linear(x_idx, -revenue)  # Negative because we minimize
+            builder.add_linear(y_idx, y_cost)
 
             # Constraints
 
             # 1. Budget constraint: sum of channel costs <= budget
+            # Penalty * (sum_k c_k y_k)^2 over the upper triangle (y_k^2 = y_k)
             budget_penalty = 1000  # Large penalty for budget violation
-            for i in range(n_leads):
-                for j, channel in enumerate(channels):
-                    y_idx = n_leads + i * n_channels + j
-                    channel_cost = self.channel_costs.get(channel, 1.0)
-
-                    # Add quadratic terms for budget constraint
-                    for i2 in range(n_leads):
-                        for j2, channel2 in enumerate(channels):
-                            y2_idx = n_leads + i2 * n_channels + j2
-                            channel_cost2 = self.channel_costs.get(channel2, 1.0)
-
-                            if y_idx <= y2_idx:  # Avoid double counting
-                                qubo_matrix[y_idx][y2_idx] += (
-                                    budget_penalty * channel_cost * channel_cost2
-                                )
+            builder.add_linear(y_idx, budget_penalty * y_cost**2)
+            a, b = np.triu_indices(len(y_idx), k=1)
+            builder.add_quadratic(
+                y_idx[a], y_idx[b], budget_penalty * y_cost[a] * y_cost[b]
+            )
 
             # 2. Lead-channel coupling: y_ij <= x_i
+            # y_ij - x_i <= 0 becomes y_ij^2 - y_ij*x_i
             coupling_penalty = 500
-            for i in range(n_leads):
-                for j in range(n_channels):
-                    y_idx = n_leads + i * n_channels + j
-                    # y_ij - x_i <= 0 becomes y_ij^2 - y_ij*x_i
-                    qubo_matrix[y_idx][y_idx] += coupling_penalty  # y_ij^2 term
-                    qubo_matrix[i][y_idx] -= coupling_penalty  # -y_ij*x_i term
+            builder.add_linear(y_idx, coupling_penalty)
+            builder.add_quadratic(
+                np.repeat(x_idx, n_channels), y_idx, -coupling_penalty
+            )
 
             # 3. Maximum leads constraint
             if max_leads < n_leads:
                 max_leads_penalty = 800
-                for i in range(n_leads):
-                    for j in range(n_leads):
-                        if i <= j:
-                            qubo_matrix[i][j] += max_leads_penalty
+                builder.add_linear(x_idx, max_leads_penalty)
+                i, j = np.triu_indices(n_leads, k=1)
+                builder.add_quadratic(i, j, max_leads_penalty)
 
             # 4. Channel exclusivity: at most one channel per lead
             exclusivity_penalty = 300
-            for i in range(n_leads):
-                for j1 in range(n_channels):
-                    for j2 in range(j1 + 1, n_channels):
-                        y1_idx = n_leads + i * n_channels + j1
-                        y2_idx = n_leads + i * n_channels + j2
-                        qubo_matrix[y1_idx][y2_idx] += exclusivity_penalty
+            j1, j2 = np.triu_indices(n_channels, k=1)
+            lead_base = (n_leads + x_idx * n_channels)[:, None]
+            builder.add_quadratic(lead_base + j1, lead_base + j2, exclusivity_penalty)
 
             # Add constant term for budget constraint
             constant_term = budget_penalty * budget * budget
+            builder.add_offset(constant_term)
+            qubo = builder.build()
 
             result = {
-                "qubo_matrix": qubo_matrix.tolist(),
-                "linear_terms": linear_terms.tolist(),
+                "qubo": qubo,
                 "constant_term": constant_term,
                 "metadata": {
                     "mapper": self.name,
@@ -144,6 +137,9 @@ class SigmaLeadMapper(ProblemMapper):
                     "branding": "Sigma Select - FLYFOX AI Quantum",
                 },
             }
+            if problem_data.get("dense_output", False):
+                # Linear biases are folded onto the diagonal
+                result["qubo_matrix"] = qubo.to_dense_list()
 
             logger.info(
                 f"Sigma Lead Mapper: Mapped {n_leads} leads to {total_vars} QUBO variables"
@@ -7,6 +7,10 @@ This module provides the core quantum integration system with:
 - Usage metering (qpu_time_ms, reads, problems_solved, bytes_in/out)
 - Versioned protocol (v1alpha, schema-first JSON)
 - Fallback to classical solvers when quantum is unavailable
+- Fair priority scheduling with a pool of concurrent workers
+- Content-addressed caching of QUBO results
+- Batch submission with results streamed back as jobs finish
+- Persistent job store with crash recovery and lazily loaded results
 """
 
 import asyncio
@@ -16,12 +20,16 @@ import time
 import uuid
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Any, Union
+from typing import AsyncIterator, Dict, List, Optional, Any, Set, Union
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
 import hashlib
 import hmac
 
+from .job_store import JobRecord, JobStore, InMemoryJobStore, create_job_store
+from .result_cache import QUBOResultCache, qubo_cache_key
+from .scheduler import JobScheduler
+
 # Quantum and classical solver imports
 try:
     from .adapters.dynex_adapter import DynexAdapter
@@ -120,6 +128,19 @@ class QuantumJob:
     max_retries: int = 3
     idempotency_key: Optional[str] = None
     ttl_days: int = 30
+    batch_id: Optional[str] = None
+
+    def __setattr__(self, name: str, value: Any):
+        """Notify the owning hub of status transitions so its indexes stay current"""
+        if name != "status":
+            object.__setattr__(self, name, value)
+            return
+
+        old_status = self.__dict__.get("status")
+        object.__setattr__(self, name, value)
+        listener = self.__dict__.get("_status_listener")
+        if listener is not None and old_status is not value:
+            listener(self, old_status, value)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert job to dictionary for storage/transmission"""
@@ -141,8 +162,90 @@ class QuantumJob:
             "max_retries": self.max_retries,
             "idempotency_key": self.idempotency_key,
             "ttl_days": self.ttl_days,
+            "batch_id": self.batch_id,
+        }
+
+    def to_record(self) -> JobRecord:
+        """Scalar job state for the job store (request and result excluded)"""
+        return {
+            "job_id": self.job_id,
+            "user_id": self.user_id,
+            "status": self.status.value,
+            "priority": self.priority.value,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "completed_at": (
+                self.completed_at.isoformat() if self.completed_at else None
+            ),
+            "error": self.error,
+            "metrics": json.dumps(asdict(self.metrics)),
+            "retry_count": self.retry_count,
+            "max_retries": self.max_retries,
+            "idempotency_key": self.idempotency_key,
+            "ttl_days": self.ttl_days,
+            "batch_id": self.batch_id,
         }
 
+    @classmethod
+    def from_record(
+        cls, record: JobRecord, request: OptimizationRequest
+    ) -> "QuantumJob":
+        """Rebuild a job from a job store record (without its result)"""
+
+        def parse_time(value: Optional[str]) -> Optional[datetime]:
+            return datetime.fromisoformat(value) if value else None
+
+        return cls(
+            job_id=record["job_id"],
+            user_id=record["user_id"],
+            request=request,
+            status=JobStatus(record["status"]),
+            priority=JobPriority(record["priority"]),
+            created_at=parse_time(record["created_at"]),
+            started_at=parse_time(record["started_at"]),
+            completed_at=parse_time(record["completed_at"]),
+            error=record["error"],
+            metrics=JobMetrics(**json.loads(record["metrics"] or "{}")),
+            retry_count=record["retry_count"],
+            max_retries=record["max_retries"],
+            idempotency_key=record["idempotency_key"],
+            ttl_days=record["ttl_days"],
+            batch_id=record["batch_id"],
+        )
+
+
+@dataclass
+class QuantumBatch:
+    """A group of jobs submitted together and polled/streamed as one"""
+
+    batch_id: str
+    user_id: str
+    job_ids: List[str]
+    idempotency_key: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    # Finished job ids in completion order
+    finished: Dict[str, None] = field(default_factory=dict)
+    _changed: Optional[asyncio.Event] = field(default=None, repr=False)
+
+    @property
+    def is_finished(self) -> bool:
+        return len(self.finished) == len(set(self.job_ids))
+
+    def mark_finished(self, job_id: str):
+        """Record a finished member and wake any result streams"""
+        if job_id in self.finished:
+            return
+        self.finished[job_id] = None
+        if self._changed is not None:
+            self._changed.set()
+            self._changed = None
+
+    async def wait_for_change(self, timeout: Optional[float] = None):
+        """Wait until another member finishes"""
+        if self._changed is None:
+            self._changed = asyncio.Event()
+        await asyncio.wait_for(self._changed.wait(), timeout)
+
 
 class CircuitBreaker:
     """Circuit breaker pattern for quantum solver availability"""
@@ -214,15 +317,46 @@ class QuantumIntegrationHub:
     policies, fallbacks, and comprehensive usage tracking.
     """
 
-    def __init__(self):
+    # Operations whose inputs describe a QUBO/BQM and can be result-cached
+    CACHEABLE_OPERATIONS = ("qubo", "bqm", "ising")
+    # Statuses after which a batch member is reported as finished
+    BATCH_FINISHED_STATUSES = (JobStatus.COMPLETED, JobStatus.FAILED)
+    # Days an archived job stays queryable before it is purged
+    ARCHIVE_RETENTION_DAYS = 30
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        aging_interval_seconds: float = 60.0,
+        result_cache: Optional[QUBOResultCache] = None,
+        enable_result_cache: bool = True,
+        job_store: Optional[JobStore] = None,
+    ):
         self.jobs: Dict[str, QuantumJob] = {}
-        self.job_queue: List[str] = []
+        self.job_store = job_store or InMemoryJobStore()
+        # Secondary indexes over self.jobs
+        self._jobs_by_idempotency_key: Dict[str, str] = {}
+        self._jobs_by_user: Dict[str, Dict[str, None]] = {}
+        self._jobs_by_status: Dict[JobStatus, Set[str]] = {
+            status: set() for status in JobStatus
+        }
+        self._job_batches: Dict[str, Set[str]] = {}
+        self.batches: Dict[str, QuantumBatch] = {}
+        self._batches_by_idempotency_key: Dict[str, str] = {}
+        self.job_queue = JobScheduler(aging_interval_seconds=aging_interval_seconds)
+        self.max_workers = max_workers
+        self.active_workers = 0
+        self._queue_event: Optional[asyncio.Event] = None
         self.circuit_breaker = CircuitBreaker()
         self.retry_policy = RetryPolicy()
         self.solvers: Dict[SolverType, Any] = {}
         self.usage_tracker = UsageTracker()
+        self.result_cache = (
+            (result_cache or QUBOResultCache()) if enable_result_cache else None
+        )
 
         self._initialize_solvers()
+        self._recover_jobs()
         self._start_cleanup_task()
 
     def _initialize_solvers(self):
@@ -257,6 +391,31 @@ class QuantumIntegrationHub:
         except Exception as e:
             logger.warning(f"Failed to initialize OR-Tools solver: {e}")
 
+    def _recover_jobs(self):
+        """
+        Re-queue unfinished jobs that no live hub owns, e.g. jobs left
+        queued or running by a process that stopped or crashed
+        """
+        recovered = 0
+        for record, request in self.job_store.claim_unfinished():
+            if record["job_id"] in self.jobs or request is None:
+                continue
+            job = QuantumJob.from_record(record, request)
+            job.status = JobStatus.QUEUED
+            job.started_at = None
+            self._register_job(job, persist=False)
+            self.job_store.save(job)
+            self._add_to_queue(job.job_id)
+            recovered += 1
+
+        if recovered:
+            logger.info(f"Recovered {recovered} unfinished jobs from the job store")
+
+    def persist_job(self, job: QuantumJob):
+        """Write a job's current state to the job store"""
+        if job.job_id in self.jobs:
+            self.job_store.save(job)
+
     def submit_job(
         self,
         user_id: str,
@@ -283,90 +442,484 @@ class QuantumIntegrationHub:
             idempotency_key=idempotency_key,
         )
 
-        self.jobs[job_id] = job
+        self._register_job(job)
         self._add_to_queue(job_id)
 
         logger.info(f"Submitted job {job_id} for user {user_id}")
         return job_id
 
+    def submit_batch(
+        self,
+        user_id: str,
+        requests: List[OptimizationRequest],
+        idempotency_key: Optional[str] = None,
+        item_keys: Optional[List[Optional[str]]] = None,
+    ) -> str:
+        """
+        Submit several optimization jobs as one batch.
+
+        Item keys share the job idempotency namespace, so an item that was
+        already submitted (alone or in another batch) reuses that job, and
+        duplicates within the batch collapse to one job. A batch-level key
+        returns the existing batch unchanged.
+        """
+        if item_keys is not None and len(item_keys) != len(requests):
+            raise ValueError("item_keys must match the number of requests")
+
+        if idempotency_key:
+            existing_batch = self._batches_by_idempotency_key.get(idempotency_key)
+            if existing_batch in self.batches:
+                logger.info(
+                    f"Batch with idempotency key {idempotency_key} already exists: {existing_batch}"
+                )
+                return existing_batch
+
+        batch = QuantumBatch(
+            batch_id=str(uuid.uuid4()),
+            user_id=user_id,
+            job_ids=[],
+            idempotency_key=idempotency_key,
+        )
+        new_jobs: List[str] = []
+        for index, request in enumerate(requests):
+            key = item_keys[index] if item_keys else None
+            existing_job = self._find_job_by_idempotency_key(key) if key else None
+            if existing_job:
+                batch.job_ids.append(existing_job.job_id)
+                if existing_job.status in self.BATCH_FINISHED_STATUSES:
+                    batch.mark_finished(existing_job.job_id)
+                continue
+
+            job = QuantumJob(
+                job_id=str(uuid.uuid4()),
+                user_id=user_id,
+                request=request,
+                priority=request.priority,
+                idempotency_key=key,
+                batch_id=batch.batch_id,
+            )
+            self._register_job(job)
+            batch.job_ids.append(job.job_id)
+            new_jobs.append(job.job_id)
+
+        self.batches[batch.batch_id] = batch
+        if idempotency_key:
+            self._batches_by_idempotency_key[idempotency_key] = batch.batch_id
+        for job_id in batch.job_ids:
+            self._job_batches.setdefault(job_id, set()).add(batch.batch_id)
+        for job_id in new_jobs:
+            self._add_to_queue(job_id)
+
+        logger.info(
+            f"Submitted batch {batch.batch_id} with {len(new_jobs)} new jobs for user {user_id}"
+        )
+        return batch.batch_id
+
+    def get_batch_status(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """Get per-status counts and per-job status for a batch"""
+        batch = self.batches.get(batch_id)
+        if not batch:
+            return None
+
+        counts = {status.value: 0 for status in JobStatus}
+        jobs = []
+        for job_id in batch.job_ids:
+            job = self.jobs.get(job_id)
+            status = job.status.value if job else JobStatus.ARCHIVED.value
+            counts[status] += 1
+            jobs.append({"job_id": job_id, "status": status})
+
+        return {
+            "batch_id": batch.batch_id,
+            "user_id": batch.user_id,
+            "created_at": batch.created_at.isoformat(),
+            "total_jobs": len(batch.job_ids),
+            "finished_jobs": len(batch.finished),
+            "is_finished": batch.is_finished,
+            "status_counts": counts,
+            "jobs": jobs,
+        }
+
+    async def iter_batch_results(
+        self, batch_id: str, timeout: Optional[float] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield each finished job of a batch as soon as it completes or fails,
+        in completion order. Raises asyncio.TimeoutError if nothing finishes
+        within ``timeout`` seconds.
+        """
+        batch = self.batches.get(batch_id)
+        if batch is None:
+            raise KeyError(f"Batch {batch_id} not found")
+
+        sent = 0
+        while True:
+            finished = list(batch.finished)
+            for job_id in finished[sent:]:
+                job = self.jobs.get(job_id)
+                if job is not None:
+                    yield self._job_to_dict(job)
+            sent = len(finished)
+            if batch.is_finished:
+                return
+            await batch.wait_for_change(timeout)
+
     def _find_job_by_idempotency_key(self, key: str) -> Optional[QuantumJob]:
-        """Find existing job by idempotency key"""
-        for job in self.jobs.values():
-            if job.idempotency_key == key:
-                return job
-        return None
+        """Find existing job by idempotency key, falling back to the job store"""
+        job_id = self._jobs_by_idempotency_key.get(key)
+        if job_id:
+            return self.jobs.get(job_id)
+
+        job_id = self.job_store.find_by_idempotency_key(key)
+        return self._load_stored_job(job_id) if job_id else None
+
+    def _load_stored_job(self, job_id: str) -> Optional[QuantumJob]:
+        """Bring a job that is only in the job store back into memory"""
+        stored = self.job_store.load(job_id)
+        if stored is None or stored[1] is None:
+            return None
+        job = QuantumJob.from_record(*stored)
+        self._register_job(job, persist=False)
+        return job
+
+    def _register_job(self, job: QuantumJob, persist: bool = True):
+        """Add a job to the job table and all secondary indexes"""
+        self.jobs[job.job_id] = job
+        if job.idempotency_key:
+            self._jobs_by_idempotency_key[job.idempotency_key] = job.job_id
+        self._jobs_by_user.setdefault(job.user_id, {})[job.job_id] = None
+        self._jobs_by_status[job.status].add(job.job_id)
+        job._status_listener = self._on_job_status_change
+        if persist:
+            self.job_store.save(job, new=True)
+
+    def _remove_job(self, job_id: str) -> Optional[QuantumJob]:
+        """Drop a job from the job table and all secondary indexes"""
+        job = self.jobs.pop(job_id, None)
+        if job is None:
+            return None
+
+        if (
+            job.idempotency_key
+            and self._jobs_by_idempotency_key.get(job.idempotency_key) == job_id
+        ):
+            del self._jobs_by_idempotency_key[job.idempotency_key]
+
+        user_jobs = self._jobs_by_user.get(job.user_id)
+        if user_jobs is not None:
+            user_jobs.pop(job_id, None)
+            if not user_jobs:
+                del self._jobs_by_user[job.user_id]
+
+        self._jobs_by_status[job.status].discard(job_id)
+        self.job_queue.discard(job_id)
+        self._job_batches.pop(job_id, None)
+        self.job_store.delete(job_id)
+        job._status_listener = None
+        return job
+
+    def _on_job_status_change(
+        self, job: QuantumJob, old_status: Optional[JobStatus], new_status: JobStatus
+    ):
+        """Keep the status index in sync with job.status"""
+        if job.job_id not in self.jobs:
+            return
+        if old_status is not None:
+            self._jobs_by_status[old_status].discard(job.job_id)
+        self._jobs_by_status[new_status].add(job.job_id)
+        self.job_store.save(job)
+
+        if new_status in self.BATCH_FINISHED_STATUSES:
+            for batch_id in self._job_batches.get(job.job_id, ()):
+                batch = self.batches.get(batch_id)
+                if batch is not None:
+                    batch.mark_finished(job.job_id)
+
+    def count_jobs(self, status: Optional[JobStatus] = None) -> int:
+        """Count jobs, optionally only those in a given status"""
+        if status is None:
+            return len(self.jobs)
+        return len(self._jobs_by_status[status])
 
     def _add_to_queue(self, job_id: str):
         """Add job to priority queue"""
         job = self.jobs[job_id]
+        self.job_queue.push(job_id, job.user_id, job.priority.value)
 
-        # Insert based on priority
-        priority_values = {
-            JobPriority.LOW: 0,
-            JobPriority.NORMAL: 1,
-            JobPriority.HIGH: 2,
-            JobPriority.URGENT: 3,
-        }
-
-        job_priority = priority_values.get(job.priority, 1)
+        # Wake an idle worker
+        if self._queue_event is not None:
+            self._queue_event.set()
 
-        # Find insertion point
-        insert_index = 0
-        for i, queued_job_id in enumerate(self.job_queue):
-            queued_job = self.jobs[queued_job_id]
-            queued_priority = priority_values.get(queued_job.priority, 1)
+    async def process_job_queue(self, max_workers: Optional[int] = None):
+        """Process jobs in the queue with a pool of concurrent workers"""
+        worker_count = max(1, max_workers or self.max_workers)
+        self._queue_event = asyncio.Event()
+        if self.job_queue:
+            self._queue_event.set()
 
-            if job_priority > queued_priority:
-                insert_index = i
-                break
-            elif job_priority == queued_priority:
-                # Same priority, FIFO
-                insert_index = i + 1
+        workers = [
+            asyncio.create_task(self._queue_worker(i)) for i in range(worker_count)
+        ]
+        logger.info(f"Started {worker_count} QIH queue workers")
 
-        self.job_queue.insert(insert_index, job_id)
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
 
-    async def process_job_queue(self):
-        """Process jobs in the queue"""
+    async def _queue_worker(self, worker_id: int):
+        """Single queue worker: pull the next job and execute it"""
         while True:
             try:
-                if self.job_queue:
-                    job_id = self.job_queue.pop(0)
+                job_id = self.job_queue.pop()
+                if job_id is None:
+                    self._queue_event.clear()
+                    try:
+                        await asyncio.wait_for(self._queue_event.wait(), timeout=1)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                self.active_workers += 1
+                try:
                     await self._execute_job(job_id)
-                else:
-                    await asyncio.sleep(1)  # Wait for new jobs
+                finally:
+                    self.active_workers -= 1
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                logger.error(f"Error processing job queue: {e}")
+                logger.error(f"Error in QIH queue worker {worker_id}: {e}")
                 await asyncio.sleep(5)
 
+    def get_queue_metrics(self) -> Dict[str, Any]:
+        """Get queue depth, wait-time and worker utilisation metrics"""
+        metrics = self.job_queue.get_metrics()
+        metrics["max_workers"] = self.max_workers
+        metrics["active_workers"] = self.active_workers
+        return metrics
+
     async def _execute_job(self, job_id: str):
         """Execute a single job"""
         job = self.jobs[job_id]
+        if job.batch_id is not None:
+            await self._execute_batch(job)
+            return
+
+        await self._execute_single_job(job)
 
+    async def _execute_single_job(self, job: QuantumJob):
+        """Run one job through the cache and solver chain"""
         try:
             # Update job status
-            job.status = JobStatus.RUNNING
             job.started_at = datetime.utcnow()
+            job.status = JobStatus.RUNNING
 
             # Execute optimization
             result = await self._run_optimization(job)
 
-            # Update job with result
-            job.result = result
-            job.status = JobStatus.COMPLETED
-            job.completed_at = datetime.utcnow()
+            # Update job with result and usage metrics, unless it was cancelled
+            if job.status == JobStatus.RUNNING:
+                self._complete_job(job, result)
 
-            # Update usage metrics
-            self.usage_tracker.record_job_completion(job)
+        except Exception as e:
+            # Handle job failure
+            if job.status == JobStatus.RUNNING:
+                await self._handle_job_failure(job, str(e))
+
+    async def cancel_job(self, job_id: str) -> bool:
+        """
+        Cancel a queued or running job. A running job's solver is asked to
+        stop; whatever it returns afterwards is discarded.
+        """
+        job = self.jobs.get(job_id)
+        if job is None or job.status not in (JobStatus.QUEUED, JobStatus.RUNNING):
+            return False
+
+        was_running = job.status == JobStatus.RUNNING
+        self.job_queue.discard(job_id)
+        job.error = "Cancelled by user"
+        job.completed_at = datetime.utcnow()
+        job.status = JobStatus.FAILED
+
+        if was_running:
+            for solver in self.solvers.values():
+                cancel = getattr(solver, "cancel", None)
+                if cancel is None:
+                    continue
+                try:
+                    await cancel(job_id)
+                except Exception as e:
+                    logger.warning(f"Failed to cancel job {job_id} on solver: {e}")
+
+        logger.info(f"Job {job_id} cancelled")
+        return True
+
+    async def _execute_batch(self, job: QuantumJob):
+        """
+        Execute a batch job together with its still-queued siblings.
+
+        Only siblings that would also run on the classical dimod path are
+        taken off the queue and solved in one ``solve_batch`` pass; the rest
+        stay queued so the other workers can run them concurrently.
+        """
+        if not self._is_batch_solvable(job):
+            await self._execute_single_job(job)
+            return
+
+        batch = self.batches.get(job.batch_id)
+        members = [job]
+        if batch is not None:
+            for job_id in dict.fromkeys(batch.job_ids):
+                sibling = self.jobs.get(job_id)
+                if (
+                    sibling is not None
+                    and sibling is not job
+                    and sibling.batch_id == job.batch_id
+                    and sibling.status == JobStatus.QUEUED
+                    and self._is_batch_solvable(sibling)
+                    and self.job_queue.discard(job_id)
+                ):
+                    members.append(sibling)
+
+        pending = []
+        for member in members:
+            member.started_at = datetime.utcnow()
+            member.status = JobStatus.RUNNING
+            cache_key = self._result_cache_key(member.request)
+            cached = self.result_cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                cached.metadata = {**cached.metadata, "cache_hit": True}
+                self._complete_job(member, cached)
+            else:
+                pending.append((member, cache_key))
+
+        if len(pending) == 1:
+            await self._execute_single_job(pending[0][0])
+        elif pending:
+            await self._solve_batch_group(pending)
+
+    def _is_batch_solvable(self, job: QuantumJob) -> bool:
+        """True if the job would run on the dimod solver, which can batch"""
+        request = job.request
+        if request.operation not in self.CACHEABLE_OPERATIONS:
+            return False
+        if SolverType.CLASSICAL_DIMOD not in self.solvers:
+            return False
+        wants_quantum = request.solver_preference in (None, SolverType.QUANTUM_DYNEX)
+        return not (
+            wants_quantum
+            and SolverType.QUANTUM_DYNEX in self.solvers
+            and self.circuit_breaker.can_execute()
+        )
 
-            logger.info(f"Job {job_id} completed successfully")
+    async def _solve_batch_group(self, pending: List[tuple]):
+        """Solve a group of batch jobs in a single classical pass"""
+        solver = self.solvers[SolverType.CLASSICAL_DIMOD]
+        problems = [self._prepare_classical_problem(job.request) for job, _ in pending]
+        timeout = max(job.request.timeout_seconds for job, _ in pending)
 
+        start_time = time.time()
+        try:
+            solutions = await solver.solve_batch(problems, timeout=timeout)
         except Exception as e:
-            # Handle job failure
-            await self._handle_job_failure(job, str(e))
+            solutions = [e] * len(pending)
+        execution_time = (time.time() - start_time) * 1000
+
+        for (job, cache_key), solution in zip(pending, solutions):
+            if job.status != JobStatus.RUNNING:
+                continue
+            if isinstance(solution, Exception):
+                await self._handle_job_failure(job, str(solution))
+                continue
+
+            result = OptimizationResult(
+                solution=solution,
+                objective_value=solution.get("objective_value", 0.0),
+                solver_used=SolverType.CLASSICAL_DIMOD,
+                execution_time_ms=int(execution_time),
+                quantum_advantage=None,
+                metadata={
+                    "solver_version": "dimod",
+                    "fallback": True,
+                    "batched": True,
+                    "batch_size": len(pending),
+                },
+            )
+            if cache_key:
+                self.result_cache.put(cache_key, result)
+            self._complete_job(job, result)
+
+    def _complete_job(self, job: QuantumJob, result: OptimizationResult):
+        """
+        Finish a running job. The result goes to the job store and is not
+        kept on the in-memory job; ``get_job_status`` loads it on demand.
+        """
+        job.result = result
+        job.completed_at = datetime.utcnow()
+        job.status = JobStatus.COMPLETED
+        self.usage_tracker.record_job_completion(job)
+
+        self.job_store.save_result(job.job_id, result)
+        self.job_store.save(job)
+        job.result = None
+        logger.info(f"Job {job.job_id} completed successfully")
 
     async def _run_optimization(self, job: QuantumJob) -> OptimizationResult:
-        """Run the actual optimization"""
-        start_time = time.time()
+        """Run the actual optimization, serving repeated QUBOs from the cache"""
+        cache_key = self._result_cache_key(job.request)
+        if cache_key:
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                cached.metadata = {**cached.metadata, "cache_hit": True}
+                logger.info(f"Job {job.job_id} served from result cache")
+                return cached
+
+        result = await self._solve_optimization(job)
+
+        if cache_key:
+            self.result_cache.put(cache_key, result)
+        return result
+
+    def _result_cache_key(self, request: OptimizationRequest) -> Optional[str]:
+        """Canonical cache key for a request, or None if it is not cacheable"""
+        if self.result_cache is None or request.metadata.get("use_cache") is False:
+            return None
+        if request.operation not in self.CACHEABLE_OPERATIONS:
+            return None
+
+        inputs = request.inputs
+        if request.operation == "qubo":
+            qubo, linear = inputs.get("qubo_matrix"), None
+        else:
+            qubo, linear = inputs.get("quadratic", {}), inputs.get("linear", {})
+        if not qubo and not linear:
+            return None
+
+        params = {
+            key: value
+            for key, value in inputs.items()
+            if key not in ("qubo_matrix", "linear", "quadratic", "offset")
+        }
+        params["operation"] = request.operation
+        params["solver_preference"] = (
+            request.solver_preference.value if request.solver_preference else None
+        )
+
+        try:
+            return qubo_cache_key(qubo, inputs.get("offset", 0.0), params, linear)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Request not cacheable: {e}")
+            return None
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get result cache hit/miss counters and occupancy"""
+        if self.result_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.result_cache.get_stats()}
+
+    async def _solve_optimization(self, job: QuantumJob) -> OptimizationResult:
+        """Run the optimization on the best available solver"""
 
         # Try quantum solver first if available and circuit breaker allows
         if (
@@ -432,8 +985,9 @@ class QuantumIntegrationHub:
         else:
             raise RuntimeError("No classical solvers available")
 
-        # Prepare problem for classical solver
+        # Prepare problem for classical solver; the job id lets it be cancelled
         problem_data = self._prepare_classical_problem(job.request)
+        problem_data["job_id"] = job.job_id
 
         # Execute classical optimization
         start_time = time.time()
@@ -494,29 +1048,47 @@ class QuantumIntegrationHub:
             )
 
             # Reset job status for retry
-            job.status = JobStatus.QUEUED
             job.started_at = None
             job.completed_at = None
             job.error = None
+            job.status = JobStatus.QUEUED
 
-            # Re-add to queue with delay
-            await asyncio.sleep(delay)
-            self._add_to_queue(job.job_id)
+            # Re-add to queue after the backoff without holding a worker
+            asyncio.get_running_loop().call_later(
+                delay, self._requeue_if_queued, job.job_id
+            )
         else:
             # Max retries exceeded
-            job.status = JobStatus.FAILED
             job.completed_at = datetime.utcnow()
+            job.status = JobStatus.FAILED
             logger.error(
                 f"Job {job.job_id} failed after {job.max_retries} retries: {error}"
             )
 
-    def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
-        """Get current status of a job"""
+    def _requeue_if_queued(self, job_id: str):
+        """Re-add a retried job unless it was cancelled during the backoff"""
         job = self.jobs.get(job_id)
+        if job and job.status == JobStatus.QUEUED:
+            self._add_to_queue(job_id)
+
+    def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get current status of a job, loading its result from the job store"""
+        job = self.jobs.get(job_id) or self._load_stored_job(job_id)
         if not job:
             return None
 
-        return job.to_dict()
+        return self._job_to_dict(job)
+
+    def _job_to_dict(self, job: QuantumJob) -> Dict[str, Any]:
+        """job.to_dict() with the stored result filled in for completed jobs"""
+        job_data = job.to_dict()
+        if job.result is None and job.status in (
+            JobStatus.COMPLETED,
+            JobStatus.ARCHIVED,
+        ):
+            result = self.job_store.load_result(job.job_id)
+            job_data["result"] = asdict(result) if result else None
+        return job_data
 
     def get_user_jobs(
         self, user_id: str, status: Optional[JobStatus] = None
@@ -524,9 +1096,10 @@ class QuantumIntegrationHub:
         """Get all jobs for a user, optionally filtered by status"""
         user_jobs = []
 
-        for job in self.jobs.values():
-            if job.user_id == user_id and (status is None or job.status == status):
-                user_jobs.append(job.to_dict())
+        for job_id in self._jobs_by_user.get(user_id, ()):
+            job = self.jobs[job_id]
+            if status is None or job.status == status:
+                user_jobs.append(self._job_to_dict(job))
 
         return user_jobs
 
@@ -545,34 +1118,56 @@ class QuantumIntegrationHub:
         """Clean up old completed/failed jobs"""
         while True:
             try:
-                current_time = datetime.utcnow()
-                jobs_to_archive = []
-
-                for job in self.jobs.values():
-                    if job.status in [JobStatus.COMPLETED, JobStatus.FAILED]:
-                        # Check if job has exceeded TTL
-                        if (
-                            job.completed_at
-                            and current_time - job.completed_at
-                            > timedelta(days=job.ttl_days)
-                        ):
-                            jobs_to_archive.append(job.job_id)
-
-                # Archive old jobs
-                for job_id in jobs_to_archive:
-                    job = self.jobs[job_id]
-                    job.status = JobStatus.ARCHIVED
-                    logger.info(f"Archived old job {job_id}")
-
-                # Remove archived jobs from memory (they would be moved to persistent storage)
-                # For now, just mark them as archived
-
+                self._archive_expired_jobs()
+                self._purge_archived_jobs()
+                # Pick up jobs whose owning process has gone away
+                self._recover_jobs()
                 await asyncio.sleep(3600)  # Run cleanup every hour
 
             except Exception as e:
                 logger.error(f"Error in cleanup task: {e}")
                 await asyncio.sleep(3600)
 
+    def _archive_expired_jobs(self) -> List[str]:
+        """Archive completed/failed jobs that have exceeded their TTL"""
+        current_time = datetime.utcnow()
+        jobs_to_archive = []
+
+        # Only finished jobs are candidates, so walk the status index
+        for status in (JobStatus.COMPLETED, JobStatus.FAILED):
+            for job_id in self._jobs_by_status[status]:
+                job = self.jobs[job_id]
+                # Check if job has exceeded TTL
+                if job.completed_at and current_time - job.completed_at > timedelta(
+                    days=job.ttl_days
+                ):
+                    jobs_to_archive.append(job_id)
+
+        # Archive old jobs (the status index is updated by the job itself)
+        for job_id in jobs_to_archive:
+            self.jobs[job_id].status = JobStatus.ARCHIVED
+            logger.info(f"Archived old job {job_id}")
+
+        return jobs_to_archive
+
+    def _purge_archived_jobs(self) -> List[str]:
+        """Remove archived jobs past their retention from memory, indexes and store"""
+        current_time = datetime.utcnow()
+        jobs_to_purge = []
+
+        for job_id in self._jobs_by_status[JobStatus.ARCHIVED]:
+            job = self.jobs[job_id]
+            retention = timedelta(days=job.ttl_days + self.ARCHIVE_RETENTION_DAYS)
+            if job.completed_at and current_time - job.completed_at > retention:
+                jobs_to_purge.append(job_id)
+
+        # Dropping the job also prunes the secondary indexes and the job store
+        for job_id in jobs_to_purge:
+            self._remove_job(job_id)
+            logger.info(f"Purged archived job {job_id}")
+
+        return jobs_to_purge
+
 
 class UsageTracker:
     """Track usage metrics for billing and analytics"""
@@ -639,29 +1234,48 @@ class UsageTracker:
         }
 
 
-# Global QIH instance
-qih = QuantumIntegrationHub()
+# Global QIH instance, created on first use so that importing this module
+# neither opens the job store nor recovers jobs
+_qih: Optional[QuantumIntegrationHub] = None
 
 
 def get_qih() -> QuantumIntegrationHub:
     """Get the global quantum integration hub instance"""
-    return qih
+    global _qih
+    if _qih is None:
+        _qih = QuantumIntegrationHub(job_store=create_job_store())
+    return _qih
 
 
 def submit_optimization_job(
     user_id: str, request: OptimizationRequest, idempotency_key: Optional[str] = None
 ) -> str:
     """Submit an optimization job to the QIH"""
-    return qih.submit_job(user_id, request, idempotency_key)
+    return get_qih().submit_job(user_id, request, idempotency_key)
+
+
+def submit_optimization_batch(
+    user_id: str,
+    requests: List[OptimizationRequest],
+    idempotency_key: Optional[str] = None,
+    item_keys: Optional[List[Optional[str]]] = None,
+) -> str:
+    """Submit a batch of optimization jobs to the QIH"""
+    return get_qih().submit_batch(user_id, requests, idempotency_key, item_keys)
 
 
 def get_job_status(job_id: str) -> Optional[Dict[str, Any]]:
     """Get the status of a specific job"""
-    return qih.get_job_status(job_id)
+    return get_qih().get_job_status(job_id)
+
+
+def get_batch_status(batch_id: str) -> Optional[Dict[str, Any]]:
+    """Get the status of a batch of jobs"""
+    return get_qih().get_batch_status(batch_id)
 
 
 def get_user_jobs(
     user_id: str, status: Optional[JobStatus] = None
 ) -> List[Dict[str, Any]]:
     """Get all jobs for a specific user"""
-    return qih.get_user_jobs(user_id, status)
+    return get_qih().get_user_jobs(user_id, status)
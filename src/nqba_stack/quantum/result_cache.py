@@ -0,0 +1,371 @@
+"""
+QUBO Result Cache - Content-Addressed Solver Results
+
+Caches optimization results keyed by a canonical hash of the QUBO:
+- Canonical form: symmetric entries folded to the upper triangle, zeros
+  dropped, terms sorted, hashed as NumPy COO arrays plus offset and
+  solver parameters
+- LRU eviction under an entry-count and byte budget
+- Per-entry TTL
+- Optional on-disk persistence (SQLite)
+- Hit/miss/eviction counters
+"""
+
+import hashlib
+import json
+import logging
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .sparse_qubo import SparseQUBO
+
+logger = logging.getLogger(__name__)
+
+QUBOTerms = List[Tuple[Any, Any, float]]
+
+
+def _label_sort_key(label: Any) -> Tuple[int, Any]:
+    """Sort integer labels numerically and everything else by string form"""
+    if isinstance(label, (int, np.integer)) and not isinstance(label, bool):
+        return (0, int(label))
+    return (1, str(label))
+
+
+def _normalize_label(label: Any) -> Any:
+    if isinstance(label, np.integer):
+        return int(label)
+    return label
+
+
+def canonical_qubo_arrays(
+    qubo: Union[SparseQUBO, Dict[Any, float], np.ndarray, List[List[float]]],
+    linear: Optional[Dict[Any, float]] = None,
+) -> Tuple[List[Any], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert a QUBO to canonical COO arrays ``(labels, rows, cols, values)``.
+
+    Accepts a SparseQUBO, a ``{(i, j): value}`` dict, a dense matrix (list
+    or ndarray), and optional separate linear biases. ``labels`` holds the
+    variables that appear in a non-zero term, in sorted order; ``rows`` and
+    ``cols`` index into it with ``rows <= cols``. ``(i, j)`` and ``(j, i)``
+    are folded together so equivalent upper/lower/symmetric encodings give
+    the same arrays; terms are sorted by ``(row, col)`` and zeros dropped.
+    """
+    if isinstance(qubo, SparseQUBO):
+        n = qubo.num_variables
+        labels = [_normalize_label(label) for label in qubo.labels]
+        diagonal = np.arange(n, dtype=np.int64)
+        rows = np.concatenate([diagonal, qubo.rows])
+        cols = np.concatenate([diagonal, qubo.cols])
+        values = np.concatenate([qubo.linear, qubo.data])
+    elif isinstance(qubo, dict):
+        labels, index = [], {}
+        rows = np.empty(len(qubo), dtype=np.int64)
+        cols = np.empty(len(qubo), dtype=np.int64)
+        for k, key in enumerate(qubo):
+            if not isinstance(key, (tuple, list)) or len(key) != 2:
+                raise ValueError(f"QUBO keys must be (i, j) pairs, got {key!r}")
+            for target, label in ((rows, key[0]), (cols, key[1])):
+                label = _normalize_label(label)
+                position = index.get(label)
+                if position is None:
+                    position = index[label] = len(labels)
+                    labels.append(label)
+                target[k] = position
+        values = np.fromiter(qubo.values(), dtype=float, count=len(qubo))
+    elif qubo is not None:
+        matrix = np.asarray(qubo, dtype=float)
+        if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+            raise ValueError("Dense QUBO must be a square 2-D matrix")
+        # Folded up front, so nonzero() yields unique pairs in (row, col) order
+        upper = np.triu(matrix) + np.triu(matrix.T, k=1)
+        labels = list(range(matrix.shape[0]))
+        rows, cols = np.nonzero(upper)
+        values = upper[rows, cols]
+        if not linear:
+            return _compact_labels(labels, rows, cols, values)
+    else:
+        labels = []
+        rows = cols = np.zeros(0, dtype=np.int64)
+        values = np.zeros(0)
+
+    if linear:
+        index = {label: k for k, label in enumerate(labels)}
+        extra = np.empty(len(linear), dtype=np.int64)
+        for k, label in enumerate(linear):
+            label = _normalize_label(label)
+            position = index.get(label)
+            if position is None:
+                position = index[label] = len(labels)
+                labels.append(label)
+            extra[k] = position
+        rows = np.concatenate([rows, extra])
+        cols = np.concatenate([cols, extra])
+        values = np.concatenate(
+            [values, np.fromiter(linear.values(), dtype=float, count=len(linear))]
+        )
+
+    # Renumber variables in label order, then fold each pair to row <= col
+    order = sorted(range(len(labels)), key=lambda k: _label_sort_key(labels[k]))
+    if order != list(range(len(labels))):
+        rank = np.empty(len(labels), dtype=np.int64)
+        rank[order] = np.arange(len(labels))
+        rows, cols = rank[rows], rank[cols]
+        labels = [labels[k] for k in order]
+    low, high = np.minimum(rows, cols), np.maximum(rows, cols)
+
+    # Merge duplicate pairs; np.unique also sorts them by (row, col)
+    width = max(len(labels), 1)
+    keys, inverse = np.unique(low * width + high, return_inverse=True)
+    merged = np.bincount(inverse.ravel(), weights=values, minlength=len(keys))
+    keep = merged != 0.0
+    keys = keys[keep]
+    return _compact_labels(labels, keys // width, keys % width, merged[keep])
+
+
+def _compact_labels(
+    labels: List[Any], rows: np.ndarray, cols: np.ndarray, values: np.ndarray
+) -> Tuple[List[Any], np.ndarray, np.ndarray, np.ndarray]:
+    """Drop labels no term refers to and renumber ``rows``/``cols`` to match"""
+    present = np.zeros(len(labels), dtype=bool)
+    present[rows] = True
+    present[cols] = True
+    if present.all():
+        return labels, rows, cols, values
+    position = np.cumsum(present) - 1
+    labels = [labels[k] for k in np.flatnonzero(present).tolist()]
+    return labels, position[rows], position[cols], values
+
+def canonical_qubo_terms(
+    qubo: Union[SparseQUBO, Dict[Any, float], np.ndarray, List[List[float]]],
+    linear: Optional[Dict[Any, float]] = None,
+) -> QUBOTerms:
+    """``canonical_qubo_arrays`` as a sorted list of ``(i, j, value)`` terms"""
+    labels, rows, cols, values = canonical_qubo_arrays(qubo, linear)
+    return [
+        (labels[i], labels[j], value)
+        for i, j, value in zip(rows.tolist(), cols.tolist(), values.tolist())
+    ]
+
+
+def qubo_cache_key(
+    qubo: Union[SparseQUBO, Dict[Any, float], np.ndarray, List[List[float]], None],
+    offset: float = 0.0,
+    params: Optional[Dict[str, Any]] = None,
+    linear: Optional[Dict[Any, float]] = None,
+) -> str:
+    """Content hash of a QUBO, its offset and the solver parameters"""
+    if isinstance(qubo, SparseQUBO):
+        offset = float(offset) + qubo.offset
+    labels, rows, cols, values = canonical_qubo_arrays(qubo, linear)
+    digest = hashlib.sha256()
+    digest.update(f"{labels!r};{len(values)};".encode())
+    digest.update(rows.astype("<i8").tobytes())
+    digest.update(cols.astype("<i8").tobytes())
+    digest.update(values.astype("<f8").tobytes())
+    digest.update(f"offset:{float(offset)!r};".encode())
+    digest.update(json.dumps(params or {}, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+@dataclass
+class _CacheEntry:
+    """Serialized cache value with bookkeeping"""
+
+    blob: bytes
+    expires_at: Optional[float]
+
+    @property
+    def size(self) -> int:
+        return len(self.blob)
+
+
+class QUBOResultCache:
+    """
+    LRU/TTL cache for solver results with a byte budget.
+
+    Values are stored pickled, so every ``get`` returns an independent
+    copy and the byte budget reflects the real payload size. When
+    ``persist_path`` is set, entries are written through to a SQLite file
+    and misses in memory fall back to disk.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl_seconds: Optional[float] = 3600.0,
+        persist_path: Optional[Union[str, Path]] = None,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.persist_path = Path(persist_path) if persist_path else None
+
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        if self.persist_path:
+            self._initialize_store()
+
+    def _initialize_store(self):
+        """Open the on-disk store"""
+        self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.persist_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS qubo_result_cache (
+                cache_key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                expires_at REAL
+            )
+            """)
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a cached value, or None on miss/expiry"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_expired(entry):
+                self._drop(key)
+                self.expirations += 1
+                entry = None
+
+            if entry is None and self._conn is not None:
+                entry = self._load_from_disk(key)
+                if entry is not None:
+                    self.disk_hits += 1
+                    self._insert(key, entry)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return pickle.loads(entry.blob)  # nosec B301 - written by this cache
+
+    def put(self, key: str, value: Any, ttl_seconds: Optional[float] = None):
+        """Store a value; values larger than the byte budget are skipped"""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(blob) > self.max_bytes:
+            logger.debug(f"Result for {key[:12]} exceeds cache byte budget")
+            return
+
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        entry = _CacheEntry(blob=blob, expires_at=(time.time() + ttl) if ttl else None)
+
+        with self._lock:
+            self._insert(key, entry)
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO qubo_result_cache VALUES (?, ?, ?)",
+                    (key, entry.blob, entry.expires_at),
+                )
+                self._conn.commit()
+
+    def invalidate(self, key: str):
+        """Remove a key from memory and disk"""
+        with self._lock:
+            self._drop(key)
+            if self._conn is not None:
+                self._conn.execute(
+                    "DELETE FROM qubo_result_cache WHERE cache_key = ?", (key,)
+                )
+                self._conn.commit()
+
+    def clear(self):
+        """Remove every entry from memory and disk"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM qubo_result_cache")
+                self._conn.commit()
+
+    def close(self):
+        """Close the on-disk store"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._is_expired(entry)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache counters and occupancy"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            "persistent": self._conn is not None,
+        }
+
+    def _is_expired(self, entry: _CacheEntry) -> bool:
+        return entry.expires_at is not None and entry.expires_at <= time.time()
+
+    def _insert(self, key: str, entry: _CacheEntry):
+        """Insert into memory and evict least-recently-used entries over budget"""
+        self._drop(key)
+        self._entries[key] = entry
+        self._bytes += entry.size
+
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            oldest_key = next(iter(self._entries))
+            self._drop(oldest_key)
+            self.evictions += 1
+
+    def _drop(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _load_from_disk(self, key: str) -> Optional[_CacheEntry]:
+        row = self._conn.execute(
+            "SELECT value, expires_at FROM qubo_result_cache WHERE cache_key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        entry = _CacheEntry(blob=row[0], expires_at=row[1])
+        if self._is_expired(entry):
+            self._conn.execute(
+                "DELETE FROM qubo_result_cache WHERE cache_key = ?", (key,)
+            )
+            self._conn.commit()
+            self.expirations += 1
+            return None
+        return entry
@@ -0,0 +1,245 @@
+"""
+Job Scheduler for the Quantum Integration Hub
+
+Priority scheduler used by the QIH job queue:
+- One bucket per priority level, each holding a FIFO deque per user
+- Round-robin across users inside a bucket (per-user fairness)
+- Aging so long-waiting LOW/NORMAL jobs are eventually promoted
+- O(1) enqueue, O(levels) dequeue, O(1) cancellation (lazy deletion)
+- Queue-depth and wait-time metrics
+"""
+
+import logging
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Numeric rank of each priority value (higher runs first)
+PRIORITY_RANKS: Dict[str, int] = {
+    "low": 0,
+    "normal": 1,
+    "high": 2,
+    "urgent": 3,
+}
+
+
+@dataclass
+class _QueueEntry:
+    """Bookkeeping for a queued job"""
+
+    job_id: str
+    user_id: str
+    rank: int
+    seq: int
+    enqueued_at: float
+
+
+class JobScheduler:
+    """
+    Priority scheduler with per-user fairness and aging.
+
+    Keeps the list-like surface the hub and API already rely on
+    (``len()``, ``in``, ``remove()``, indexing and iteration in
+    dispatch order) while avoiding the O(n) insert/pop of a plain list.
+    """
+
+    def __init__(self, aging_interval_seconds: float = 60.0, wait_window: int = 1000):
+        self.aging_interval_seconds = aging_interval_seconds
+        self._levels = sorted(set(PRIORITY_RANKS.values()))
+        # rank -> user_id -> deque of entries (round-robin order of users)
+        self._buckets: Dict[int, "OrderedDict[str, Deque[_QueueEntry]]"] = {
+            rank: OrderedDict() for rank in self._levels
+        }
+        # job_id -> live entry; anything not in here is stale
+        self._entries: Dict[str, _QueueEntry] = {}
+        self._depth_by_rank: Dict[int, int] = {rank: 0 for rank in self._levels}
+        self._seq = 0
+
+        # Metrics
+        self._wait_times: Deque[float] = deque(maxlen=wait_window)
+        self._total_enqueued = 0
+        self._total_dispatched = 0
+        self._total_removed = 0
+        self._aged_dispatches = 0
+        self._max_wait_seconds = 0.0
+
+    # ------------------------------------------------------------------
+    # List-like interface
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, job_id: object) -> bool:
+        return job_id in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.snapshot())
+
+    def __getitem__(self, index):
+        return self.snapshot()[index]
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+
+    def remove(self, job_id: str):
+        """Remove a queued job (raises ValueError if absent, like list.remove)"""
+        entry = self._entries.pop(job_id, None)
+        if entry is None:
+            raise ValueError(f"Job {job_id} is not queued")
+        self._depth_by_rank[entry.rank] -= 1
+        self._total_removed += 1
+
+    def discard(self, job_id: str) -> bool:
+        """Remove a queued job if present"""
+        try:
+            self.remove(job_id)
+            return True
+        except ValueError:
+            return False
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    def push(self, job_id: str, user_id: str, priority: str = "normal"):
+        """Enqueue a job; re-pushing a queued job is a no-op"""
+        if job_id in self._entries:
+            return
+
+        rank = PRIORITY_RANKS.get(priority, PRIORITY_RANKS["normal"])
+        self._seq += 1
+        entry = _QueueEntry(
+            job_id=job_id,
+            user_id=user_id,
+            rank=rank,
+            seq=self._seq,
+            enqueued_at=time.monotonic(),
+        )
+        self._entries[job_id] = entry
+        self._depth_by_rank[rank] += 1
+        self._total_enqueued += 1
+
+        bucket = self._buckets[rank]
+        user_queue = bucket.get(user_id)
+        if user_queue is None:
+            user_queue = deque()
+            bucket[user_id] = user_queue
+        user_queue.append(entry)
+
+    def pop(self) -> Optional[str]:
+        """Dequeue the next job to run, or None if the queue is empty"""
+        now = time.monotonic()
+        best_rank = None
+        best_key: Optional[Tuple[float, int, int]] = None
+
+        for rank in self._levels:
+            head = self._peek_bucket(rank)
+            if head is None:
+                continue
+            key = (self._effective_priority(head, now), rank, -head.seq)
+            if best_key is None or key > best_key:
+                best_key = key
+                best_rank = rank
+
+        if best_rank is None:
+            return None
+
+        entry = self._pop_bucket(best_rank)
+        del self._entries[entry.job_id]
+        self._depth_by_rank[entry.rank] -= 1
+
+        wait = now - entry.enqueued_at
+        self._wait_times.append(wait)
+        self._max_wait_seconds = max(self._max_wait_seconds, wait)
+        self._total_dispatched += 1
+        if best_key[0] > entry.rank:
+            self._aged_dispatches += 1
+
+        return entry.job_id
+
+    def snapshot(self) -> List[str]:
+        """Queued job ids in the order they would currently be dispatched"""
+        now = time.monotonic()
+        live = sorted(
+            self._entries.values(),
+            key=lambda e: (
+                -min(self._effective_priority(e, now), self._levels[-1]),
+                e.seq,
+            ),
+        )
+        return [entry.job_id for entry in live]
+
+    def _effective_priority(self, entry: _QueueEntry, now: float) -> float:
+        """Base rank plus one level per aging interval waited"""
+        if self.aging_interval_seconds <= 0:
+            return float(entry.rank)
+        waited = now - entry.enqueued_at
+        return entry.rank + int(waited // self.aging_interval_seconds)
+
+    def _is_live(self, entry: _QueueEntry) -> bool:
+        return self._entries.get(entry.job_id) is entry
+
+    def _peek_bucket(self, rank: int) -> Optional[_QueueEntry]:
+        """Return the next entry for a bucket, dropping stale entries"""
+        bucket = self._buckets[rank]
+        while bucket:
+            user_id, user_queue = next(iter(bucket.items()))
+            while user_queue and not self._is_live(user_queue[0]):
+                user_queue.popleft()
+            if user_queue:
+                return user_queue[0]
+            del bucket[user_id]
+        return None
+
+    def _pop_bucket(self, rank: int) -> _QueueEntry:
+        """Pop the head of the next user in line and rotate that user to the back"""
+        bucket = self._buckets[rank]
+        user_id, user_queue = next(iter(bucket.items()))
+        entry = user_queue.popleft()
+        if user_queue:
+            bucket.move_to_end(user_id)
+        else:
+            del bucket[user_id]
+        return entry
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Queue depth and wait-time metrics"""
+        rank_names = {rank: name for name, rank in PRIORITY_RANKS.items()}
+        waits = sorted(self._wait_times)
+        now = time.monotonic()
+        oldest = min((e.enqueued_at for e in self._entries.values()), default=None)
+
+        def percentile(p: float) -> float:
+            if not waits:
+                return 0.0
+            index = min(len(waits) - 1, int(round(p * (len(waits) - 1))))
+            return waits[index]
+
+        return {
+            "queue_depth": len(self._entries),
+            "depth_by_priority": {
+                rank_names[rank]: depth for rank, depth in self._depth_by_rank.items()
+            },
+            "queued_users": len({e.user_id for e in self._entries.values()}),
+            "oldest_wait_seconds": (now - oldest) if oldest is not None else 0.0,
+            "total_enqueued": self._total_enqueued,
+            "total_dispatched": self._total_dispatched,
+            "total_removed": self._total_removed,
+            "aged_dispatches": self._aged_dispatches,
+            "wait_time_seconds": {
+                "samples": len(waits),
+                "avg": (sum(waits) / len(waits)) if waits else 0.0,
+                "p50": percentile(0.50),
+                "p95": percentile(0.95),
+                "p99": percentile(0.99),
+                "max": self._max_wait_seconds,
+            },
+        }
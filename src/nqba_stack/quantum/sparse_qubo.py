@@ -0,0 +1,384 @@
+"""
+Sparse QUBO - Shared Problem Representation
+
+Coordinate-format QUBO passed between mappers, engines and adapters:
+- Linear biases as a vector, couplings as upper-triangular COO arrays
+  (``i < j``) with duplicates merged, plus a constant offset
+- Block-wise construction from NumPy arrays via ``SparseQUBOBuilder``
+- CSR view, batch energies and Ising conversion without densifying
+- Hand-off to dimod and Dynex straight from the underlying arrays
+- Dense matrices/lists are only built when a caller asks for them
+"""
+
+import logging
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+QUBOLike = Union[
+    "SparseQUBO",
+    Dict[Tuple[Hashable, Hashable], float],
+    np.ndarray,
+    List[List[float]],
+]
+
+
+def _canonical_coo(
+    n: int,
+    linear: np.ndarray,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    data: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Fold diagonal terms into ``linear``, orient pairs as i < j, merge duplicates"""
+    rows, cols, data = np.broadcast_arrays(
+        np.asarray(rows, dtype=np.int64),
+        np.asarray(cols, dtype=np.int64),
+        np.asarray(data, dtype=float),
+    )
+    rows, cols, data = rows.ravel(), cols.ravel(), data.ravel()
+    if len(rows) and (
+        min(rows.min(), cols.min()) < 0 or max(rows.max(), cols.max()) >= n
+    ):
+        raise ValueError(f"QUBO variable index out of range for {n} variables")
+
+    diagonal = rows == cols
+    if diagonal.any():
+        linear = linear + np.bincount(
+            rows[diagonal], weights=data[diagonal], minlength=n
+        )
+        off = ~diagonal
+        rows, cols, data = rows[off], cols[off], data[off]
+
+    low, high = np.minimum(rows, cols), np.maximum(rows, cols)
+    keys, inverse = np.unique(low * max(n, 1) + high, return_inverse=True)
+    merged = np.bincount(inverse.ravel(), weights=data, minlength=len(keys))
+    keep = merged != 0.0
+    keys = keys[keep]
+    return linear, keys // max(n, 1), keys % max(n, 1), merged[keep]
+
+
+class SparseQUBO:
+    """
+    QUBO ``E(x) = offset + sum_i linear_i x_i + sum_k data_k x_rows_k x_cols_k``.
+
+    ``rows``/``cols``/``data`` hold each coupling once with ``rows < cols``,
+    sorted by ``(row, col)``. ``variables`` optionally names the indices;
+    without it variables are labelled ``0..n-1``.
+    """
+
+    def __init__(
+        self,
+        linear: Union[np.ndarray, Sequence[float]],
+        rows: Optional[Union[np.ndarray, Sequence[int]]] = None,
+        cols: Optional[Union[np.ndarray, Sequence[int]]] = None,
+        data: Optional[Union[np.ndarray, Sequence[float]]] = None,
+        offset: float = 0.0,
+        variables: Optional[Sequence[Hashable]] = None,
+    ):
+        linear = np.array(linear, dtype=float).ravel()
+        n = len(linear)
+        empty = np.zeros(0)
+        self.linear, self.rows, self.cols, self.data = _canonical_coo(
+            n,
+            linear,
+            empty if rows is None else rows,
+            empty if cols is None else cols,
+            empty if data is None else data,
+        )
+        self.offset = float(offset)
+        self.variables = list(variables) if variables is not None else None
+        if self.variables is not None and len(self.variables) != n:
+            raise ValueError(
+                f"Got {len(self.variables)} variable labels for {n} variables"
+            )
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_dense(
+        cls,
+        matrix: Union[np.ndarray, List[List[float]]],
+        offset: float = 0.0,
+        variables: Optional[Sequence[Hashable]] = None,
+    ) -> "SparseQUBO":
+        """From a square matrix; both triangles are summed, the diagonal is linear"""
+        matrix = np.asarray(matrix, dtype=float)
+        if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+            raise ValueError("QUBO matrix must be a square 2-D matrix")
+        rows, cols = np.nonzero(matrix)
+        return cls(
+            np.zeros(matrix.shape[0]),
+            rows,
+            cols,
+            matrix[rows, cols],
+            offset=offset,
+            variables=variables,
+        )
+
+    @classmethod
+    def from_dict(
+        cls,
+        qubo: Dict[Tuple[Hashable, Hashable], float],
+        offset: float = 0.0,
+        variables: Optional[Sequence[Hashable]] = None,
+    ) -> "SparseQUBO":
+        """From ``{(u, v): bias}``; labels are kept in first-seen order"""
+        labels: List[Hashable] = list(variables) if variables is not None else []
+        index: Dict[Hashable, int] = {var: i for i, var in enumerate(labels)}
+        rows, cols, data = [], [], []
+        for key, bias in qubo.items():
+            if not isinstance(key, (tuple, list)) or len(key) != 2:
+                raise ValueError(f"QUBO keys must be (u, v) pairs, got {key!r}")
+            for var in key:
+                if var not in index:
+                    index[var] = len(labels)
+                    labels.append(var)
+            rows.append(index[key[0]])
+            cols.append(index[key[1]])
+            data.append(float(bias))
+
+        natural = all(
+            isinstance(var, (int, np.integer)) and var == i
+            for i, var in enumerate(labels)
+        )
+        return cls(
+            np.zeros(len(labels)),
+            rows,
+            cols,
+            data,
+            offset=offset,
+            variables=None if natural else labels,
+        )
+
+    @classmethod
+    def from_bqm(cls, bqm: Any) -> "SparseQUBO":
+        """From a dimod BinaryQuadraticModel of either vartype"""
+        binary = bqm.change_vartype("BINARY", inplace=False)
+        variables = list(binary.variables)
+        linear, (rows, cols, data), offset = binary.to_numpy_vectors(variables)
+        natural = variables == list(range(len(variables)))
+        return cls(
+            linear,
+            rows,
+            cols,
+            data,
+            offset=offset,
+            variables=None if natural else variables,
+        )
+
+    # ------------------------------------------------------------------
+    # Shape
+    # ------------------------------------------------------------------
+
+    @property
+    def num_variables(self) -> int:
+        return len(self.linear)
+
+    @property
+    def num_interactions(self) -> int:
+        return len(self.data)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (self.num_variables, self.num_variables)
+
+    @property
+    def labels(self) -> List[Hashable]:
+        if self.variables is not None:
+            return self.variables
+        return list(range(self.num_variables))
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            self.linear.nbytes + self.rows.nbytes + self.cols.nbytes + self.data.nbytes
+        )
+
+    @property
+    def density(self) -> float:
+        """Fraction of the possible couplings that are present"""
+        n = self.num_variables
+        return self.num_interactions / (n * (n - 1) / 2) if n > 1 else 0.0
+
+    def __len__(self) -> int:
+        return self.num_variables
+
+    def __repr__(self) -> str:
+        return (
+            f"SparseQUBO(num_variables={self.num_variables}, "
+            f"num_interactions={self.num_interactions}, offset={self.offset})"
+        )
+
+    # ------------------------------------------------------------------
+    # Evaluation
+    # ------------------------------------------------------------------
+
+    def energies(
+        self, samples: Union[np.ndarray, Sequence[Sequence[int]]]
+    ) -> np.ndarray:
+        """Energies of a batch of binary samples (samples x variables)"""
+        x = np.atleast_2d(np.asarray(samples, dtype=float))
+        if x.shape[1] != self.num_variables:
+            raise ValueError(
+                f"Samples have {x.shape[1]} variables, QUBO has {self.num_variables}"
+            )
+        quadratic = (x[:, self.rows] * x[:, self.cols]) @ self.data
+        return self.offset + x @ self.linear + quadratic
+
+    def energy(self, sample: Union[Dict[Hashable, int], Sequence[int]]) -> float:
+        """Energy of one sample given as a label dict or a vector"""
+        if isinstance(sample, dict):
+            sample = [sample[var] for var in self.labels]
+        return float(self.energies([sample])[0])
+
+    def scaled(self, factor: float) -> "SparseQUBO":
+        """Copy with every bias and the offset multiplied by ``factor``"""
+        clone = object.__new__(SparseQUBO)
+        clone.linear = self.linear * factor
+        clone.rows, clone.cols = self.rows, self.cols
+        clone.data = self.data * factor
+        clone.offset = self.offset * factor
+        clone.variables = self.variables
+        return clone
+
+    # ------------------------------------------------------------------
+    # Conversion
+    # ------------------------------------------------------------------
+
+    def to_csr(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Upper-triangular CSR ``(indptr, indices, data)`` sharing the COO arrays"""
+        indptr = np.zeros(self.num_variables + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.rows, minlength=self.num_variables), out=indptr[1:])
+        return indptr, self.cols, self.data
+
+    def to_ising(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, float]:
+        """``(h, rows, cols, J, offset)`` under the substitution x = (1 + s) / 2"""
+        quarter = self.data / 4.0
+        n = self.num_variables
+        h = (
+            self.linear / 2.0
+            + np.bincount(self.rows, weights=quarter, minlength=n)
+            + np.bincount(self.cols, weights=quarter, minlength=n)
+        )
+        offset = self.offset + self.linear.sum() / 2.0 + quarter.sum()
+        return h, self.rows, self.cols, quarter, float(offset)
+
+    def to_bqm(self) -> Any:
+        """dimod BinaryQuadraticModel built from the COO vectors"""
+        import dimod
+
+        return dimod.BinaryQuadraticModel.from_numpy_vectors(
+            self.linear,
+            (self.rows, self.cols, self.data),
+            self.offset,
+            dimod.BINARY,
+            variable_order=self.variables,
+        )
+
+    def to_dynex_format(self) -> Dict[str, Any]:
+        """Payload for the Dynex client; arrays are shared, not copied"""
+        return {
+            "type": "qubo",
+            "size": self.num_variables,
+            "linear": self.linear,
+            "quadratic": (self.rows, self.cols, self.data),
+            "offset": self.offset,
+            "variables": self.labels,
+        }
+
+    def to_dict(self) -> Dict[Tuple[Hashable, Hashable], float]:
+        """``{(u, v): bias}`` with linear biases on the diagonal"""
+        labels = self.labels
+        qubo = {
+            (labels[i], labels[i]): bias
+            for i, bias in enumerate(self.linear.tolist())
+            if bias
+        }
+        for i, j, bias in zip(
+            self.rows.tolist(), self.cols.tolist(), self.data.tolist()
+        ):
+            qubo[(labels[i], labels[j])] = bias
+        return qubo
+
+    def to_dense(self) -> np.ndarray:
+        """Upper-triangular dense matrix with linear biases on the diagonal"""
+        n = self.num_variables
+        matrix = np.zeros((n, n))
+        matrix[np.arange(n), np.arange(n)] = self.linear
+        matrix[self.rows, self.cols] = self.data
+        return matrix
+
+    def to_dense_list(self) -> List[List[float]]:
+        """``to_dense()`` as nested lists, for JSON payloads"""
+        return self.to_dense().tolist()
+
+
+class SparseQUBOBuilder:
+    """
+    Accumulates QUBO terms as NumPy blocks and builds a ``SparseQUBO``.
+
+    ``add_linear``/``add_quadratic`` broadcast their arguments, so a whole
+    penalty block is added with one call; duplicates are merged in ``build``.
+    """
+
+    def __init__(
+        self, num_variables: int, variables: Optional[Sequence[Hashable]] = None
+    ):
+        self.num_variables = num_variables
+        self.variables = variables
+        self._linear = np.zeros(num_variables)
+        self._rows: List[np.ndarray] = []
+        self._cols: List[np.ndarray] = []
+        self._data: List[np.ndarray] = []
+        self._offset = 0.0
+
+    def add_linear(self, index: Any, values: Any):
+        """``linear[index] += values`` (repeated indices accumulate)"""
+        index, values = np.broadcast_arrays(
+            np.asarray(index, dtype=np.int64), np.asarray(values, dtype=float)
+        )
+        np.add.at(self._linear, index.ravel(), values.ravel())
+
+    def add_quadratic(self, rows: Any, cols: Any, values: Any):
+        """Add couplings ``values * x_rows * x_cols``"""
+        rows, cols, values = np.broadcast_arrays(
+            np.asarray(rows, dtype=np.int64),
+            np.asarray(cols, dtype=np.int64),
+            np.asarray(values, dtype=float),
+        )
+        self._rows.append(rows.ravel())
+        self._cols.append(cols.ravel())
+        self._data.append(values.ravel())
+
+    def add_offset(self, value: float):
+        self._offset += float(value)
+
+    def build(self) -> SparseQUBO:
+        def joined(chunks: List[np.ndarray], dtype) -> np.ndarray:
+            return np.concatenate(chunks) if chunks else np.zeros(0, dtype=dtype)
+
+        return SparseQUBO(
+            self._linear,
+            joined(self._rows, np.int64),
+            joined(self._cols, np.int64),
+            joined(self._data, float),
+            offset=self._offset,
+            variables=self.variables,
+        )
+
+
+def as_sparse_qubo(qubo: QUBOLike, offset: float = 0.0) -> SparseQUBO:
+    """Coerce a SparseQUBO, ``{(u, v): bias}`` dict or dense matrix"""
+    if isinstance(qubo, SparseQUBO):
+        if offset:
+            qubo = qubo.scaled(1.0)
+            qubo.offset += float(offset)
+        return qubo
+    if isinstance(qubo, dict):
+        return SparseQUBO.from_dict(qubo, offset=offset)
+    return SparseQUBO.from_dense(qubo, offset=offset)
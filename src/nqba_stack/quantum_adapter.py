@@ -15,6 +15,9 @@ from dataclasses import dataclass
 from enum import Enum
 import json
 
+from .quantum.result_cache import QUBOResultCache, qubo_cache_key
+from .quantum.sparse_qubo import SparseQUBO, as_sparse_qubo
+
 logger = logging.getLogger(__name__)
 
 class BackendType(Enum):
@@ -53,18 +56,23 @@ class QuantumAdapter:
     def __init__(self, 
                  preferred_backend: str = "dynex",
                  max_qubits: int = 64,
-                 enable_fallback: bool = True):
+                 enable_fallback: bool = True,
+                 result_cache: Optional[QUBOResultCache] = None,
+                 enable_result_cache: bool = True):
         """Initialize quantum adapter
         
         Args:
             preferred_backend: Preferred quantum backend
             max_qubits: Maximum number of qubits supported
             enable_fallback: Enable fallback to heuristic methods
+            result_cache: Shared QUBO result cache (a private one is created if omitted)
+            enable_result_cache: Serve repeated QUBOs from the result cache
         """
         self.preferred_backend = BackendType(preferred_backend.lower())
         self.max_qubits = max_qubits
         self.enable_fallback = enable_fallback
         self.current_backend = self.preferred_backend
+        self.result_cache = (result_cache or QUBOResultCache()) if enable_result_cache else None
         
         # Initialize backend connections
         self._init_backends()
@@ -128,13 +136,13 @@ class QuantumAdapter:
         }
     
     async def optimize_qubo(self, 
-                           matrix: np.ndarray,
+                           matrix: Union[np.ndarray, SparseQUBO],
                            algorithm: str = "qaoa",
                            parameters: Optional[Dict[str, Any]] = None) -> OptimizationResult:
         """Optimize QUBO problem using quantum computing
         
         Args:
-            matrix: QUBO matrix (numpy array)
+            matrix: QUBO as a SparseQUBO or a dense numpy array
             algorithm: Optimization algorithm to use
             parameters: Additional parameters for the algorithm
             
@@ -144,19 +152,32 @@ class QuantumAdapter:
         start_time = time.time()
         
         try:
-            # Validate input
+            # Validate input and work on the sparse form from here on
             self._validate_qubo_matrix(matrix)
+            qubo = as_sparse_qubo(matrix)
+            
+            # Serve repeated problems from the result cache
+            cache_key = self._result_cache_key(qubo, algorithm, parameters)
+            if cache_key:
+                cached = self.result_cache.get(cache_key)
+                if cached is not None:
+                    cached.metadata = {**(cached.metadata or {}), "cache_hit": True}
+                    cached.execution_time = time.time() - start_time
+                    return cached
             
             # Try quantum backend first
             if self._is_backend_available(self.current_backend):
-                result = await self._execute_quantum_optimization(matrix, algorithm, parameters)
+                result = await self._execute_quantum_optimization(qubo, algorithm, parameters)
                 if result.success:
+                    self._cache_result(cache_key, result)
                     return result
             
             # Fallback to heuristic methods
             if self.enable_fallback:
                 logger.info(f"Falling back to heuristic optimization for algorithm: {algorithm}")
-                result = await self._execute_heuristic_optimization(matrix, algorithm, parameters)
+                result = await self._execute_heuristic_optimization(qubo, algorithm, parameters)
+                if result.success:
+                    self._cache_result(cache_key, result)
                 return result
             
             # If no fallback and quantum failed, return error
@@ -215,7 +236,7 @@ class QuantumAdapter:
             )
     
     async def _execute_quantum_optimization(self, 
-                                          matrix: np.ndarray,
+                                          matrix: SparseQUBO,
                                           algorithm: str,
                                           parameters: Optional[Dict[str, Any]]) -> OptimizationResult:
         """Execute quantum optimization on specified backend"""
@@ -232,7 +253,7 @@ class QuantumAdapter:
             raise ValueError(f"Unsupported quantum backend: {self.current_backend.value}")
     
     async def _execute_dynex_optimization(self, 
-                                        matrix: np.ndarray,
+                                        matrix: SparseQUBO,
                                         algorithm: str,
                                         parameters: Optional[Dict[str, Any]]) -> OptimizationResult:
         """Execute optimization using Dynex backend"""
@@ -250,8 +271,9 @@ class QuantumAdapter:
             await asyncio.sleep(0.1)
             
             # Mock result (replace with actual Dynex API call)
-            optimal_value = float(np.min(matrix))
-            solution_vector = [1 if i < len(matrix) // 2 else 0 for i in range(len(matrix))]
+            optimal_value = self._min_coefficient(matrix)
+            n = matrix.num_variables
+            solution_vector = [1 if i < n // 2 else 0 for i in range(n)]
             
             return OptimizationResult(
                 success=True,
@@ -278,18 +300,18 @@ class QuantumAdapter:
             )
     
     async def _execute_heuristic_optimization(self, 
-                                            matrix: np.ndarray,
+                                            matrix: SparseQUBO,
                                             algorithm: str,
                                             parameters: Optional[Dict[str, Any]]) -> OptimizationResult:
         """Execute optimization using heuristic methods"""
         start_time = time.time()
         
         try:
-            # Simple heuristic: find minimum value in matrix
-            optimal_value = float(np.min(matrix))
+            # Simple heuristic: find minimum coefficient
+            optimal_value = self._min_coefficient(matrix)
             
             # Simple solution vector (all zeros)
-            solution_vector = [0] * len(matrix)
+            solution_vector = [0] * matrix.num_variables
             
             return OptimizationResult(
                 success=True,
@@ -331,19 +353,57 @@ class QuantumAdapter:
             backend_used=backend.value
         )
     
-    def _qubo_to_dynex_format(self, matrix: np.ndarray) -> Dict[str, Any]:
-        """Convert QUBO matrix to Dynex format"""
-        return {
-            "type": "qubo",
-            "matrix": matrix.tolist(),
-            "size": len(matrix),
-            "timestamp": int(time.time())
-        }
+    def _result_cache_key(self,
+                          matrix: SparseQUBO,
+                          algorithm: str,
+                          parameters: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Canonical cache key for a QUBO solve, or None when caching is off"""
+        if self.result_cache is None or (parameters or {}).get("use_cache") is False:
+            return None
+        return qubo_cache_key(
+            matrix,
+            params={
+                "algorithm": algorithm,
+                "parameters": parameters or {},
+                "backend": self.current_backend.value,
+                "fallback": self.enable_fallback,
+            },
+        )
     
-    def _validate_qubo_matrix(self, matrix: np.ndarray):
+    def _cache_result(self, cache_key: Optional[str], result: OptimizationResult):
+        """Store a successful result in the cache"""
+        if cache_key:
+            self.result_cache.put(cache_key, result)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get result cache hit/miss counters and occupancy"""
+        if self.result_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.result_cache.get_stats()}
+    
+    def _qubo_to_dynex_format(self,
+                              matrix: SparseQUBO,
+                              include_matrix: bool = False) -> Dict[str, Any]:
+        """Convert QUBO to Dynex format (sparse; dense matrix only on request)"""
+        problem = {**matrix.to_dynex_format(), "timestamp": int(time.time())}
+        if include_matrix:
+            problem["matrix"] = matrix.to_dense_list()
+        return problem
+    
+    @staticmethod
+    def _min_coefficient(matrix: SparseQUBO) -> float:
+        """Smallest QUBO coefficient (zero counts for absent terms)"""
+        return float(min(matrix.linear.min(initial=0.0), matrix.data.min(initial=0.0)))
+    
+    def _validate_qubo_matrix(self, matrix: Union[np.ndarray, SparseQUBO]):
         """Validate QUBO matrix input"""
+        if isinstance(matrix, SparseQUBO):
+            if matrix.num_variables > self.max_qubits:
+                raise ValueError(f"Matrix size {matrix.num_variables} exceeds max qubits {self.max_qubits}")
+            return
+        
         if not isinstance(matrix, np.ndarray):
-            raise ValueError("Matrix must be a numpy array")
+            raise ValueError("Matrix must be a numpy array or SparseQUBO")
         
         if matrix.ndim != 2:
             raise ValueError("Matrix must be 2-dimensional")
@@ -8,7 +8,7 @@ import asyncio
 import logging
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass, field
 from pathlib import Path
 import json
@@ -23,6 +23,13 @@ from ..core.ltc_logger import LTCLogger
 from ..core.quantum_adapter import QuantumAdapter
 from ..database.models import TrainingDataset, DataSource, DataQualityMetrics
 from ..security.encryption import QuantumEncryption
+from .ingestion_scheduler import IngestionScheduler, read_json
+from .streaming_ingestion import (
+    ROW_GROUP_SUFFIX,
+    STREAM_READ_SIZE,
+    STREAMING_FORMATS,
+    stream_to_row_groups
+)
 
 logger = LTCLogger("DataIngestionPipeline")
 
@@ -44,6 +51,7 @@ class DataFormat(Enum):
     """Supported data formats"""
     
     JSON = "json"
+    JSONL = "jsonl"
     CSV = "csv"
     PARQUET = "parquet"
     AVRO = "avro"
@@ -83,6 +91,8 @@ class DataSourceConfig:
     retry_attempts: int = 3
     batch_size: int = 1000
     enabled: bool = True
+    streaming: bool = False  # parse and store chunk by chunk (jsonl, csv, xml)
+    record_tag: Optional[str] = None  # XML element holding one record
 
 
 @dataclass
@@ -125,7 +135,8 @@ class DataIngestionPipeline:
         quantum_adapter: QuantumAdapter,
         ltc_logger: LTCLogger,
         encryption: QuantumEncryption,
-        storage_path: Path = Path("/data/training")
+        storage_path: Path = Path("/data/training"),
+        scheduler: Optional[IngestionScheduler] = None
     ):
         self.db_session = db_session
         self.redis_client = redis_client
@@ -134,6 +145,9 @@ class DataIngestionPipeline:
         self.encryption = encryption
         self.storage_path = storage_path
         
+        # Shared per-host sessions, concurrency limit, rate limits and retries
+        self.scheduler = scheduler or IngestionScheduler()
+        
         # Data source configurations
         self.data_sources: Dict[str, DataSourceConfig] = {}
         
@@ -270,17 +284,25 @@ class DataIngestionPipeline:
         start_time = datetime.now()
         
         try:
-            # Fetch data from source
-            raw_data = await self._fetch_data(config, custom_params)
-            
-            # Validate data quality
-            validation_result = await self._validate_data(source_id, raw_data)
-            
-            # Process and transform data
-            processed_data = await self._process_data(config, raw_data)
-            
-            # Store data
-            storage_result = await self._store_data(config, processed_data)
+            if config.streaming:
+                # Validated, tagged and stored in batches as the body arrives
+                validation_result, storage_result = await self._stream_data(
+                    config, custom_params
+                )
+                records_processed = storage_result["stored_records"]
+            else:
+                # Fetch data from source
+                raw_data = await self._fetch_data(config, custom_params)
+                
+                # Validate data quality
+                validation_result = await self._validate_data(source_id, raw_data)
+                
+                # Process and transform data
+                processed_data = await self._process_data(config, raw_data)
+                
+                # Store data
+                storage_result = await self._store_data(config, processed_data)
+                records_processed = len(processed_data) if processed_data else 0
             
             # Update metrics
             await self._update_metrics(source_id, validation_result, storage_result)
@@ -290,7 +312,7 @@ class DataIngestionPipeline:
             result = DataIngestionResult(
                 source_id=source_id,
                 success=True,
-                records_processed=len(processed_data) if processed_data else 0,
+                records_processed=records_processed,
                 records_valid=validation_result.get("valid_records", 0),
                 records_invalid=validation_result.get("invalid_records", 0),
                 quality_score=validation_result.get("quality_score", 0.0),
@@ -335,6 +357,19 @@ class DataIngestionPipeline:
     ) -> Any:
         """Fetch data from external source"""
         
+        return await self.scheduler.fetch(
+            config.source_id,
+            config.endpoint_url,
+            read=self._response_reader(config.format),
+            headers=self._request_headers(config),
+            params=custom_params or {},
+            timeout=config.timeout,
+            rate_limit=config.rate_limit,
+            attempts=config.retry_attempts
+        )
+    
+    @staticmethod
+    def _request_headers(config: DataSourceConfig) -> Dict[str, str]:
         headers = {
             "User-Agent": "NQBA-Platform/1.0",
             **config.custom_headers
@@ -343,39 +378,150 @@ class DataIngestionPipeline:
         if config.api_key:
             headers["Authorization"] = f"Bearer {config.api_key}"
         
-        params = custom_params or {}
+        return headers
+    
+    @staticmethod
+    def _response_reader(data_format: DataFormat):
+        """Coroutine reading a response body in the source's format"""
+        if data_format == DataFormat.JSON:
+            return read_json
+        if data_format in (DataFormat.TEXT, DataFormat.XML):
+            return aiohttp.ClientResponse.text
+        return aiohttp.ClientResponse.read
+    
+    async def _stream_data(
+        self,
+        config: DataSourceConfig,
+        custom_params: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Stream a feed into a row-group file, one ``batch_size`` chunk at a time
         
-        timeout = aiohttp.ClientTimeout(total=config.timeout)
+        Only the current chunk is held in memory, so feeds of any size can be
+        ingested. Returns the validation and storage results.
+        """
         
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            for attempt in range(config.retry_attempts):
+        if config.format.value not in STREAMING_FORMATS:
+            raise ValueError(
+                f"Streaming ingestion does not support {config.format.value} data"
+            )
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"{config.source_id}_{timestamp}{ROW_GROUP_SUFFIX}"
+        file_path = self.storage_path / config.source_id / filename
+        
+        async def consume(response: aiohttp.ClientResponse):
+            # A retried request starts over with fresh counts and a fresh file
+            validation_result = {
+                "valid_records": 0,
+                "invalid_records": 0,
+                "quality_score": 0.0,
+                "rule_failures": {},
+                "validation_errors": [],
+                "validation_warnings": []
+            }
+            
+            async def prepare(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+                await self._validate_batch(config.source_id, batch, validation_result)
+                for record in batch:
+                    self._tag_record(config.source_id, record)
+                return batch
+            
+            storage = await stream_to_row_groups(
+                response.content.iter_chunked(STREAM_READ_SIZE),
+                config.format.value,
+                file_path,
+                config.batch_size,
+                prepare=prepare,
+                record_tag=config.record_tag,
+                encrypt=self.encryption.encrypt_data if config.encryption_required else None,
+                metadata={"source_id": config.source_id, "format": config.format.value}
+            )
+            return validation_result, storage
+        
+        validation_result, storage = await self.scheduler.fetch(
+            config.source_id,
+            config.endpoint_url,
+            read=consume,
+            headers=self._request_headers(config),
+            params=custom_params or {},
+            # Bound the wait for each read, not the whole (possibly huge) body
+            timeout=aiohttp.ClientTimeout(total=None, sock_read=config.timeout),
+            rate_limit=config.rate_limit,
+            attempts=config.retry_attempts
+        )
+        
+        self._summarize_validation(config.source_id, validation_result)
+        
+        file_size_mb = storage["size_bytes"] / (1024 * 1024)
+        await self._record_stored_file(
+            config, timestamp, filename, storage["rows"], file_size_mb
+        )
+        
+        logger.info(
+            f"Streamed {storage['rows']} records from {config.source_id} in "
+            f"{storage['row_groups']} row groups ({file_size_mb:.2f} MB)"
+        )
+        
+        storage_result = {
+            "stored_records": storage["rows"],
+            "row_groups": storage["row_groups"],
+            "size_mb": file_size_mb,
+            "file_path": storage["file_path"],
+            "encrypted": config.encryption_required
+        }
+        return validation_result, storage_result
+    
+    async def _validate_batch(
+        self,
+        source_id: str,
+        batch: List[Dict[str, Any]],
+        validation_result: Dict[str, Any]
+    ):
+        """Apply the source's rules to every record of a batch
+        
+        A record is invalid if an error-severity rule fails for it. Failures
+        are counted per rule rather than listed, to stay bounded on long feeds.
+        """
+        
+        rules = self.validation_rules.get(source_id, [])
+        failures = validation_result["rule_failures"]
+        
+        for record in batch:
+            valid = True
+            for rule in rules:
                 try:
-                    async with session.get(
-                        config.endpoint_url,
-                        headers=headers,
-                        params=params
-                    ) as response:
-                        response.raise_for_status()
-                        
-                        if config.format == DataFormat.JSON:
-                            return await response.json()
-                        elif config.format == DataFormat.TEXT:
-                            return await response.text()
-                        elif config.format == DataFormat.XML:
-                            return await response.text()
-                        else:
-                            return await response.read()
-                            
-                except Exception as e:
-                    if attempt == config.retry_attempts - 1:
-                        raise
-                    
-                    wait_time = 2 ** attempt  # Exponential backoff
-                    logger.warning(
-                        f"Fetch attempt {attempt + 1} failed for {config.source_id}, "
-                        f"retrying in {wait_time}s: {e}"
-                    )
-                    await asyncio.sleep(wait_time)
+                    rule_result = await self._apply_validation_rule(record, rule)
+                    passed = rule_result["passed"]
+                except Exception:
+                    passed = False
+                
+                if not passed:
+                    failures[rule.rule_id] = failures.get(rule.rule_id, 0) + 1
+                    if rule.severity == "error":
+                        valid = False
+            
+            if valid:
+                validation_result["valid_records"] += 1
+            else:
+                validation_result["invalid_records"] += 1
+    
+    def _summarize_validation(self, source_id: str, validation_result: Dict[str, Any]):
+        """Turn streamed per-rule failure counts into errors and a quality score"""
+        
+        total_records = validation_result["valid_records"] + validation_result["invalid_records"]
+        if total_records == 0:
+            validation_result["validation_errors"].append("No data received")
+            return
+        
+        validation_result["quality_score"] = validation_result["valid_records"] / total_records
+        
+        rules = {rule.rule_id: rule for rule in self.validation_rules.get(source_id, [])}
+        for rule_id, count in validation_result["rule_failures"].items():
+            message = f"Rule {rule_id}: failed for {count} of {total_records} records"
+            if rules[rule_id].severity == "error":
+                validation_result["validation_errors"].append(message)
+            else:
+                validation_result["validation_warnings"].append(message)
     
     async def _validate_data(self, source_id: str, data: Any) -> Dict[str, Any]:
         """Validate data quality and compliance"""
@@ -508,13 +654,7 @@ class DataIngestionPipeline:
             # Add metadata to each record
             for record in processed_data:
                 if isinstance(record, dict):
-                    record["_metadata"] = {
-                        "source_id": config.source_id,
-                        "ingestion_timestamp": datetime.now().isoformat(),
-                        "data_hash": hashlib.md5(
-                            json.dumps(record, sort_keys=True).encode()
-                        ).hexdigest()
-                    }
+                    self._tag_record(config.source_id, record)
             
             logger.info(f"Processed {len(processed_data)} records from {config.source_id}")
             
@@ -524,6 +664,17 @@ class DataIngestionPipeline:
         
         return processed_data
     
+    @staticmethod
+    def _tag_record(source_id: str, record: Dict[str, Any]):
+        """Attach source, ingestion time and content hash to a record"""
+        record["_metadata"] = {
+            "source_id": source_id,
+            "ingestion_timestamp": datetime.now().isoformat(),
+            "data_hash": hashlib.md5(
+                json.dumps(record, sort_keys=True, default=str).encode()
+            ).hexdigest()
+        }
+    
     async def _store_data(self, config: DataSourceConfig, data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Store processed data"""
         
@@ -552,25 +703,8 @@ class DataIngestionPipeline:
             # Calculate file size
             file_size_mb = file_path.stat().st_size / (1024 * 1024)
             
-            # Store metadata in Redis
-            metadata = {
-                "source_id": config.source_id,
-                "filename": filename,
-                "record_count": len(data),
-                "file_size_mb": file_size_mb,
-                "encrypted": config.encryption_required,
-                "timestamp": datetime.now().isoformat()
-            }
-            
-            await self.redis_client.hset(
-                f"training_data:{config.source_id}:{timestamp}",
-                mapping=metadata
-            )
-            
-            # Set expiration (30 days)
-            await self.redis_client.expire(
-                f"training_data:{config.source_id}:{timestamp}",
-                30 * 24 * 3600
+            await self._record_stored_file(
+                config, timestamp, filename, len(data), file_size_mb
             )
             
             logger.info(
@@ -589,6 +723,36 @@ class DataIngestionPipeline:
             logger.error(f"Data storage failed for {config.source_id}: {e}")
             raise
     
+    async def _record_stored_file(
+        self,
+        config: DataSourceConfig,
+        timestamp: str,
+        filename: str,
+        record_count: int,
+        file_size_mb: float
+    ):
+        """Store metadata about a written data file in Redis"""
+        
+        metadata = {
+            "source_id": config.source_id,
+            "filename": filename,
+            "record_count": record_count,
+            "file_size_mb": file_size_mb,
+            "encrypted": config.encryption_required,
+            "timestamp": datetime.now().isoformat()
+        }
+        
+        await self.redis_client.hset(
+            f"training_data:{config.source_id}:{timestamp}",
+            mapping=metadata
+        )
+        
+        # Set expiration (30 days)
+        await self.redis_client.expire(
+            f"training_data:{config.source_id}:{timestamp}",
+            30 * 24 * 3600
+        )
+    
     async def _update_metrics(self, source_id: str, validation_result: Dict, storage_result: Dict):
         """Update ingestion metrics"""
         
@@ -621,32 +785,45 @@ class DataIngestionPipeline:
         )
     
     async def ingest_all_sources(self) -> List[DataIngestionResult]:
-        """Ingest data from all enabled sources"""
+        """Ingest data from all enabled sources concurrently, in source order"""
         
-        results = []
+        source_ids = [
+            source_id for source_id, config in self.data_sources.items()
+            if config.enabled
+        ]
         
-        for source_id, config in self.data_sources.items():
-            if config.enabled:
-                try:
-                    result = await self.ingest_data(source_id)
-                    results.append(result)
-                except Exception as e:
-                    logger.error(f"Failed to ingest from {source_id}: {e}")
-                    results.append(DataIngestionResult(
-                        source_id=source_id,
-                        success=False,
-                        records_processed=0,
-                        records_valid=0,
-                        records_invalid=0,
-                        quality_score=0.0,
-                        processing_time=0.0,
-                        data_size_mb=0.0,
-                        error_message=str(e)
-                    ))
+        # Sources run side by side; the scheduler bounds requests in flight
+        outcomes = await asyncio.gather(
+            *(self.ingest_data(source_id) for source_id in source_ids),
+            return_exceptions=True
+        )
+        
+        results = []
+        for source_id, outcome in zip(source_ids, outcomes):
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, Exception):
+                    raise outcome
+                logger.error(f"Failed to ingest from {source_id}: {outcome}")
+                outcome = DataIngestionResult(
+                    source_id=source_id,
+                    success=False,
+                    records_processed=0,
+                    records_valid=0,
+                    records_invalid=0,
+                    quality_score=0.0,
+                    processing_time=0.0,
+                    data_size_mb=0.0,
+                    error_message=str(outcome)
+                )
+            results.append(outcome)
         
         logger.info(f"Completed ingestion from {len(results)} sources")
         return results
     
+    async def close(self):
+        """Close the pooled HTTP sessions"""
+        await self.scheduler.close()
+    
     async def get_ingestion_stats(self) -> Dict[str, Any]:
         """Get current ingestion statistics"""
         
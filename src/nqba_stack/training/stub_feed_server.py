@@ -0,0 +1,218 @@
+"""
+Stub Feed Server - Local HTTP Data Feeds for Offline Benchmarks
+
+Serves synthetic JSON, JSON-lines, CSV and XML feeds on localhost so
+ingestion can be exercised and benchmarked without network access:
+- ``GET /feeds/{name}.{json,jsonl,csv,xml}?records=N`` returns N market
+  records, generated and written in batches so feeds of any size are cheap
+- ``latency`` delays every response, ``failures_per_feed`` answers the first
+  requests for each feed with 503 to exercise retries
+- request counts, peak concurrency and client connections are recorded
+
+Run as a module to compare one session per request fetched sequentially
+against the concurrent ``IngestionScheduler``:
+
+    python -m src.nqba_stack.training.stub_feed_server --sources 32
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import Counter
+from typing import Dict, Iterator, Optional
+
+import aiohttp
+from aiohttp import web
+
+from .ingestion_scheduler import IngestionScheduler, RetryPolicy
+
+DEFAULT_RECORDS = 100
+
+# Records rendered per write to the response
+WRITE_BATCH = 1000
+
+FIELDS = ("id", "symbol", "price", "volume")
+
+CONTENT_TYPES = {
+    "json": "application/json",
+    "jsonl": "application/x-ndjson",
+    "csv": "text/csv",
+    "xml": "application/xml",
+}
+
+# Text written before and after the records of each format
+FRAMES = {
+    "json": ('{"data":[', "]}"),
+    "jsonl": ("", ""),
+    "csv": (",".join(FIELDS) + "\n", ""),
+    "xml": ("<feed>", "</feed>"),
+}
+
+
+def generate_records(name: str, count: int, seed: int = 0) -> Iterator[dict]:
+    """Deterministic synthetic market records for a feed"""
+    rng = random.Random(f"{name}:{seed}")
+    for i in range(count):
+        yield {
+            "id": i,
+            "symbol": f"{name.upper()[:4]}{i % 50}",
+            "price": round(rng.uniform(1, 500), 2),
+            "volume": rng.randint(100, 100_000),
+        }
+
+
+def render(records: list, fmt: str, first: bool) -> str:
+    """One batch of records as a piece of the feed body"""
+    if fmt == "json":
+        body = ",".join(json.dumps(r) for r in records)
+        return body if first or not body else "," + body
+    if fmt == "jsonl":
+        return "".join(json.dumps(r) + "\n" for r in records)
+    if fmt == "csv":
+        return "".join(",".join(str(r[f]) for f in FIELDS) + "\n" for r in records)
+    return "".join(
+        "<record>" + "".join(f"<{k}>{v}</{k}>" for k, v in r.items()) + "</record>"
+        for r in records
+    )
+
+
+class StubFeedServer:
+    """aiohttp server on an ephemeral localhost port"""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        failures_per_feed: int = 0,
+        records: int = DEFAULT_RECORDS,
+        host: str = "127.0.0.1",
+    ):
+        self.latency = latency
+        self.failures_per_feed = failures_per_feed
+        self.records = records
+        self.host = host
+        self.port: Optional[int] = None
+        self.requests: Counter = Counter()
+        self.active = 0
+        self.peak = 0
+        self.connections = set()
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def feed_url(self, name: str, fmt: str = "json") -> str:
+        return f"{self.url}/feeds/{name}.{fmt}"
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        name, fmt = request.match_info["name"], request.match_info["fmt"]
+        self.requests[name] += 1
+        self.connections.add(request.transport.get_extra_info("peername"))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            if self.requests[name] <= self.failures_per_feed:
+                raise web.HTTPServiceUnavailable(text="Injected failure")
+            count = int(request.query.get("records", self.records))
+            return await self._stream(request, generate_records(name, count), fmt)
+        finally:
+            self.active -= 1
+
+    @staticmethod
+    async def _stream(
+        request: web.Request, records: Iterator[dict], fmt: str
+    ) -> web.StreamResponse:
+        response = web.StreamResponse(headers={"Content-Type": CONTENT_TYPES[fmt]})
+        await response.prepare(request)
+        head, tail = FRAMES[fmt]
+        await response.write(head.encode())
+        first = True
+        while True:
+            batch = [record for _, record in zip(range(WRITE_BATCH), records)]
+            if not batch:
+                break
+            await response.write(render(batch, fmt, first).encode())
+            first = False
+        await response.write(tail.encode())
+        await response.write_eof()
+        return response
+
+    async def start(self) -> "StubFeedServer":
+        app = web.Application()
+        app.router.add_get(r"/feeds/{name}.{fmt:jsonl|json|csv|xml}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, 0).start()
+        self.port = self._runner.addresses[0][1]
+        return self
+
+    async def close(self):
+        runner, self._runner = self._runner, None
+        if runner is not None:
+            await runner.cleanup()
+
+    async def __aenter__(self) -> "StubFeedServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+
+async def _fetch_sequential(urls: list) -> None:
+    # The pre-scheduler pattern: a fresh session per fetch, one at a time
+    for url in urls:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url) as response:
+                response.raise_for_status()
+                await response.json()
+
+
+async def benchmark(
+    sources: int = 32,
+    latency: float = 0.05,
+    max_concurrency: int = 8,
+    records: int = DEFAULT_RECORDS,
+) -> Dict[str, float]:
+    """Feeds per second, sequential versus scheduled, against a stub server"""
+    async with StubFeedServer(latency=latency, records=records) as server:
+        urls = [server.feed_url(f"source{i}") for i in range(sources)]
+
+        start = time.perf_counter()
+        await _fetch_sequential(urls)
+        sequential = time.perf_counter() - start
+
+        async with IngestionScheduler(
+            max_concurrency=max_concurrency, retry=RetryPolicy(base_delay=0.01)
+        ) as scheduler:
+            start = time.perf_counter()
+            await asyncio.gather(
+                *(scheduler.fetch(f"source{i}", url) for i, url in enumerate(urls))
+            )
+            scheduled = time.perf_counter() - start
+
+    return {
+        "sources": sources,
+        "sequential_seconds": sequential,
+        "scheduled_seconds": scheduled,
+        "sequential_feeds_per_second": sources / sequential,
+        "scheduled_feeds_per_second": sources / scheduled,
+        "speedup": sequential / scheduled,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sources", type=int, default=32)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--max-concurrency", type=int, default=8)
+    parser.add_argument("--records", type=int, default=DEFAULT_RECORDS)
+    args = parser.parse_args()
+
+    report = asyncio.run(
+        benchmark(args.sources, args.latency, args.max_concurrency, args.records)
+    )
+    print(json.dumps(report, indent=2))
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests for the parallel, resumable benchmark harness
+"""
+
+import json
+
+import pytest
+
+from src.nqba_stack.benchmarks import (
+    BenchmarkCheckpoint,
+    BenchmarkConfig,
+    BenchmarkHarness,
+    BenchmarkRunner,
+)
+from src.nqba_stack.benchmarks import harness as harness_module
+
+PROBLEMS = ["Portfolio_Optimization", "Knapsack_Problem"]
+
+
+def make_harness(tmp_path, iterations=1, max_workers=0):
+    return BenchmarkHarness(
+        PROBLEMS,
+        problem_size=8,
+        iterations=iterations,
+        timeout_seconds=60,
+        checkpoint_path=tmp_path / "checkpoint.jsonl",
+        max_workers=max_workers,
+    )
+
+
+@pytest.mark.asyncio
+async def test_cells_record_timing_memory_and_quality(tmp_path):
+    harness = make_harness(tmp_path)
+    records = await harness.run()
+
+    assert len(records) == len(PROBLEMS) * 2
+    for record in records:
+        metadata = record["metadata"]
+        assert "error" not in metadata
+        assert record["execution_time"] > 0
+        assert metadata["cpu_time"] >= 0
+        assert record["memory_usage"] > 0
+        assert metadata["tracemalloc_peak_mb"] >= 0
+
+    # Both solvers of one instance share its seed
+    seeds = {(r["problem_name"], r["metadata"]["seed"]) for r in records}
+    assert len(seeds) == len(PROBLEMS)
+
+
+@pytest.mark.asyncio
+async def test_resume_skips_checkpointed_cells(tmp_path):
+    first = await make_harness(tmp_path, iterations=1).run()
+    checkpoint = tmp_path / "checkpoint.jsonl"
+    assert len(checkpoint.read_text().splitlines()) == len(first)
+
+    resumed = make_harness(tmp_path, iterations=2)
+    records = await resumed.run()
+
+    assert resumed.skipped == len(first)
+    assert resumed.executed == len(first)
+    by_id = {r["metadata"]["cell_id"]: r for r in records}
+    for record in first:
+        assert by_id[record["metadata"]["cell_id"]] == record
+
+    # A torn trailing line from an interrupted write is ignored
+    with open(checkpoint, "a") as f:
+        f.write('{"problem_name": "Knap')
+    assert len(BenchmarkCheckpoint(checkpoint).load()) == len(records)
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_overrunning_cells_time_out_and_rerun_on_resume(tmp_path, monkeypatch):
+    # Worker start-up alone outlasts this deadline, so every cell overruns
+    monkeypatch.setattr(harness_module, "WORKER_GRACE_SECONDS", 0.01)
+    harness = make_harness(tmp_path, max_workers=2)
+    harness.timeout_seconds = 0
+    records = await harness.run()
+    assert [r["metadata"]["error"] for r in records] == ["timeout"] * len(records)
+    monkeypatch.undo()
+
+    kept = make_harness(tmp_path)
+    await kept.run(retry_failed=False)
+    assert kept.skipped == len(records)
+    assert kept.executed == 0
+
+    retried = make_harness(tmp_path)
+    rerun = await retried.run()
+    assert retried.executed == len(records)
+    assert all("error" not in r["metadata"] for r in rerun)
+    assert len(BenchmarkCheckpoint(tmp_path / "checkpoint.jsonl").load()) == len(rerun)
+
+
+@pytest.mark.asyncio
+async def test_seeded_cells_are_reproducible(tmp_path):
+    first = await make_harness(tmp_path / "a").run()
+    second = await make_harness(tmp_path / "b").run()
+
+    assert [r["solution_quality"] for r in first] == [
+        r["solution_quality"] for r in second
+    ]
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_runner_parallel_benchmark_uses_process_pool(tmp_path):
+    config = BenchmarkConfig(
+        problem_size=8,
+        iterations=2,
+        timeout_seconds=60,
+        output_dir=str(tmp_path),
+        max_workers=2,
+    )
+    runner = BenchmarkRunner(config)
+    report = await runner.run_parallel_benchmark(PROBLEMS)
+
+    assert report.total_problems == len(PROBLEMS)
+    assert report.successful_classical_runs == len(PROBLEMS) * 2
+    assert report.successful_quantum_runs == len(PROBLEMS) * 2
+    assert all(r.energy_consumption is not None for r in runner.results)
+
+    lines = (tmp_path / config.checkpoint_file).read_text().splitlines()
+    assert len(lines) == len(PROBLEMS) * 2 * 2
+    assert {json.loads(line)["metadata"]["iteration"] for line in lines} == {0, 1}
+
+    # Nothing left to do on a second run
+    rerun = BenchmarkRunner(config)
+    await rerun.run_parallel_benchmark(PROBLEMS)
+    assert len((tmp_path / config.checkpoint_file).read_text().splitlines()) == len(
+        lines
+    )
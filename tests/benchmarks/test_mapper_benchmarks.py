@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark: SigmaLeadMapper mapping time vs lead count
+
+Measures how long SigmaLeadMapper.map_to_qubo takes as the number of
+leads grows, together with the size of the resulting sparse QUBO.
+Run directly for a table:
+
+    python -m tests.benchmarks.test_mapper_benchmarks
+"""
+
+import asyncio
+import statistics
+import time
+from typing import Any, Dict, List, Sequence
+
+import pytest
+
+from src.nqba_stack.quantum.mappers import SigmaLeadMapper
+
+DEFAULT_CHANNELS = ["email", "phone", "linkedin"]
+
+
+def generate_leads(count: int) -> List[Dict[str, Any]]:
+    """Deterministic synthetic leads"""
+    return [
+        {
+            "id": f"lead_{i}",
+            "engagement_score": (i % 10) / 10,
+            "budget_score": (i % 7) / 7,
+            "authority_score": (i % 5) / 5,
+            "base_revenue": 5000 + 100 * (i % 50),
+        }
+        for i in range(count)
+    ]
+
+
+def benchmark_mapping(
+    lead_counts: Sequence[int] = (50, 100, 250, 500, 1000),
+    channels: Sequence[str] = DEFAULT_CHANNELS,
+    repeats: int = 3,
+) -> List[Dict[str, Any]]:
+    """Median mapping time and QUBO size for each lead count"""
+    mapper = SigmaLeadMapper()
+    results = []
+
+    for count in lead_counts:
+        problem = {
+            "leads": generate_leads(count),
+            "channels": list(channels),
+            "max_leads": max(1, count // 10),
+        }
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            mapped = asyncio.run(mapper.map_to_qubo(problem))
+            timings.append(time.perf_counter() - start)
+
+        qubo = mapped["qubo"]
+        results.append(
+            {
+                "leads": count,
+                "variables": qubo.num_variables,
+                "interactions": qubo.num_interactions,
+                "qubo_mb": qubo.nbytes / 1e6,
+                "map_seconds": statistics.median(timings),
+            }
+        )
+
+    return results
+
+
+@pytest.mark.slow
+def test_mapping_time_by_lead_count():
+    """Mapping stays well under a second for a few hundred leads"""
+    results = benchmark_mapping(lead_counts=(50, 100, 200), repeats=1)
+
+    for row in results:
+        n = row["leads"]
+        m = n * len(DEFAULT_CHANNELS)
+        assert row["variables"] == n + m
+        # budget block (all y pairs) + max-leads block (all x pairs) + x-y coupling
+        assert row["interactions"] == m * (m - 1) // 2 + n * (n - 1) // 2 + m
+
+    assert results[-1]["map_seconds"] < 1.0
+
+
+if __name__ == "__main__":
+    print(
+        f"{'leads':>7} {'variables':>10} {'interactions':>13} {'MB':>8} {'seconds':>9}"
+    )
+    for row in benchmark_mapping():
+        print(
+            f"{row['leads']:>7} {row['variables']:>10} {row['interactions']:>13} "
+            f"{row['qubo_mb']:>8.1f} {row['map_seconds']:>9.4f}"
+        )
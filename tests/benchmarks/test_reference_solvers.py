@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Tests for the reference TSP and knapsack heuristics
+"""
+
+import itertools
+import time
+
+import numpy as np
+import pytest
+
+from src.nqba_stack.benchmarks import (
+    KnapsackProblem,
+    ReferenceSolver,
+    TravelingSalesman,
+)
+from src.nqba_stack.benchmarks.heuristics import (
+    knapsack_is_exact,
+    nearest_neighbour_tour,
+    neighbour_lists,
+    solve_knapsack,
+    solve_tsp,
+    tour_length,
+    tour_lengths,
+)
+
+
+def random_cities(n, seed=0):
+    points = np.random.default_rng(seed).uniform(0, 100, (n, 2))
+    return np.linalg.norm(points[:, None] - points[None], axis=2)
+
+
+def brute_force_tour_length(distance_matrix):
+    n = len(distance_matrix)
+    return min(
+        tour_length((0,) + rest, distance_matrix)
+        for rest in itertools.permutations(range(1, n))
+    )
+
+
+def test_tour_lengths_match_loop():
+    distance_matrix = random_cities(30)
+    rng = np.random.default_rng(1)
+    tours = np.array([rng.permutation(30) for _ in range(5)])
+
+    expected = [
+        sum(distance_matrix[t[i], t[(i + 1) % 30]] for i in range(30)) for t in tours
+    ]
+    assert np.allclose(tour_lengths(tours, distance_matrix), expected)
+
+
+def test_neighbour_lists_are_sorted_and_exclude_self():
+    distance_matrix = random_cities(50)
+    neighbours = neighbour_lists(distance_matrix, k=5)
+
+    assert neighbours.shape == (50, 5)
+    for city, row in enumerate(neighbours):
+        assert city not in row
+        assert list(row) == list(np.argsort(distance_matrix[city])[1:6])
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_small_tsp_is_optimal(seed):
+    distance_matrix = random_cities(8, seed)
+    tour = solve_tsp(distance_matrix)
+
+    assert sorted(tour) == list(range(8))
+    assert tour[0] == 0
+    assert tour_length(tour, distance_matrix) == pytest.approx(
+        brute_force_tour_length(distance_matrix)
+    )
+
+
+def test_large_tsp_improves_on_nearest_neighbour():
+    distance_matrix = random_cities(1000)
+
+    start = time.perf_counter()
+    tour = solve_tsp(distance_matrix)
+    elapsed = time.perf_counter() - start
+
+    assert sorted(tour) == list(range(1000))
+    greedy = tour_length(nearest_neighbour_tour(distance_matrix), distance_matrix)
+    assert tour_length(tour, distance_matrix) < 0.9 * greedy
+    assert elapsed < 10
+
+
+def test_small_knapsack_is_optimal():
+    rng = np.random.default_rng(3)
+    values = rng.uniform(10, 100, 14)
+    weights = rng.uniform(1, 20, 14)
+    capacity = weights.sum() * 0.4
+
+    solution = solve_knapsack(values, weights, capacity)
+
+    best = max(
+        np.dot(x, values)
+        for x in itertools.product((0, 1), repeat=14)
+        if np.dot(x, weights) <= capacity
+    )
+    assert np.dot(solution, weights) <= capacity
+    assert np.dot(solution, values) == pytest.approx(best)
+
+
+def test_integral_knapsack_is_exact():
+    assert solve_knapsack([10, 10, 1], [3, 4, 1], 7) == [1, 1, 0]
+    assert knapsack_is_exact([3, 4, 1], 7)
+    assert not knapsack_is_exact([3.5, 4, 1], 7)
+    assert not knapsack_is_exact([3, 4, 1], 7, resolution=5)
+
+    rng = np.random.default_rng(5)
+    values = rng.integers(1, 50, 14)
+    weights = rng.integers(1, 30, 14)
+    capacity = int(weights.sum() * 0.3)
+    best = max(
+        np.dot(x, values)
+        for x in itertools.product((0, 1), repeat=14)
+        if np.dot(x, weights) <= capacity
+    )
+    solution = solve_knapsack(values, weights, capacity, resolution=capacity)
+    assert np.dot(solution, weights) <= capacity
+    assert np.dot(solution, values) == best
+
+
+def test_zero_weight_items_are_taken():
+    assert solve_knapsack([5, 1, 3], [0, 2, 1.5], 1.5) == [1, 0, 1]
+    assert solve_knapsack([5, 1], [0, 2], 0) == [1, 0]
+
+
+def test_large_knapsack_is_feasible_and_near_lp_bound():
+    rng = np.random.default_rng(4)
+    values = rng.uniform(10, 100, 2000)
+    weights = rng.uniform(1, 20, 2000)
+    capacity = weights.sum() * 0.4
+
+    solution = np.array(solve_knapsack(values, weights, capacity))
+
+    order = np.argsort(-values / weights)
+    cumulative = np.cumsum(weights[order])
+    k = np.searchsorted(cumulative, capacity)
+    lp_bound = values[order[:k]].sum() + (
+        (capacity - cumulative[k - 1]) / weights[order[k]] * values[order[k]]
+    )
+    assert np.dot(solution, weights) <= capacity
+    assert np.dot(solution, values) > 0.999 * lp_bound
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("problem", [TravelingSalesman(), KnapsackProblem()])
+async def test_reference_solver_beats_classical_fallback(problem):
+    data = problem.prepare_data(60)
+    problem._set_current_data(data)
+    solver = ReferenceSolver()
+
+    reference = problem.evaluate_solution(await solver.solve(data.data))
+    if isinstance(problem, TravelingSalesman):
+        baseline = solver._solve_tsp_fallback(data.data)
+    else:
+        baseline = solver._solve_knapsack_fallback(data.data)
+
+    assert reference >= problem.evaluate_solution(baseline)
@@ -0,0 +1,169 @@
+"""
+Tests for the async Dynex client against a local fake sampler
+"""
+
+import asyncio
+import threading
+import time
+
+import dimod
+import numpy as np
+import pytest
+
+from src.nqba_stack.dynex_client import DynexClient
+
+
+class FakeDynexSampler:
+    """
+    Stands in for the Dynex network: answers every QUBO with its all-zero
+    assignment after ``delay`` seconds, recording calls and peak concurrency.
+    """
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def sample(self, bqm, annealing_time=100):
+        with self._lock:
+            self.calls.append(bqm)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            sample = {v: 0 for v in bqm.variables}
+            sampleset = dimod.SampleSet.from_samples_bqm(sample, bqm)
+            sampleset.job_id = f"fake_{len(self.calls)}"
+            return sampleset
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def make_qubo(bias=-1.0):
+    return {"linear": {0: bias, 1: 2.0}, "quadratic": {(0, 1): 0.5}, "offset": 1.0}
+
+
+@pytest.fixture
+def fake():
+    return FakeDynexSampler()
+
+
+@pytest.fixture
+def client(fake):
+    client = DynexClient(max_concurrency=2, sampler_factory=lambda: fake)
+    yield client
+    client.close()
+
+
+class TestDynexClient:
+    """Lazy, bounded, coalescing QUBO submission"""
+
+    def test_sampler_is_created_on_first_use(self, fake):
+        created = []
+        client = DynexClient(sampler_factory=lambda: created.append(fake) or fake)
+
+        assert created == []
+        assert client.sampler is fake
+        assert client.sampler is fake
+        assert created == [fake]
+
+    @pytest.mark.asyncio
+    async def test_submission_returns_samples(self, client, fake):
+        result = await client.submit_qubo(make_qubo(), parameters={"num_reads": 10})
+
+        assert result["status"] == "completed"
+        assert result["first_sample"] == {0: 0, 1: 0}
+        assert result["first_energy"] == pytest.approx(1.0)
+        assert result["job_id"] == "fake_1"
+        assert result["parameters"] == {"num_reads": 10}
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_are_coalesced(self, client, fake):
+        dense = np.array([[-1.0, 0.5], [0.0, 2.0]])
+        requests = [client.submit_qubo(make_qubo()) for _ in range(5)]
+        requests += [client.submit_qubo(dense) for _ in range(3)]
+        requests.append(client.submit_qubo(make_qubo(bias=-2.0)))
+
+        results = await asyncio.gather(*requests)
+
+        assert len(fake.calls) == 3
+        assert client.stats["coalesced"] == 6
+        assert len({r["job_id"] for r in results[:5]}) == 1
+        assert results[0] is not results[1]
+        assert client.get_stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_parameters_are_part_of_the_key(self, client, fake):
+        await asyncio.gather(
+            client.submit_qubo(make_qubo(), parameters={"annealing_time": 10}),
+            client.submit_qubo(make_qubo(), parameters={"annealing_time": 20}),
+            client.submit_qubo(make_qubo(), algorithm="vqe"),
+        )
+
+        assert len(fake.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, client, fake):
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(client.submit_qubo(make_qubo(bias=-i)) for i in range(1, 7))
+        )
+
+        assert len(fake.calls) == 6
+        assert fake.peak == 2
+        assert time.perf_counter() - start >= 3 * fake.delay
+
+    @pytest.mark.asyncio
+    async def test_timeout_returns_timeout_status(self, client, fake):
+        fake.delay = 0.5
+
+        result = await client.submit_qubo(make_qubo(), parameters={"timeout": 0.05})
+
+        assert result["status"] == "timeout"
+        assert client.stats["timeouts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelling_last_waiter_drops_queued_call(self, client, fake):
+        fake.delay = 0.2
+        running = [
+            asyncio.ensure_future(client.submit_qubo(make_qubo(bias=-i)))
+            for i in range(1, 3)
+        ]
+        queued = [
+            asyncio.ensure_future(client.submit_qubo(make_qubo(bias=-5.0)))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0.05)
+
+        for task in queued:
+            task.cancel()
+        await asyncio.gather(*running)
+        await asyncio.sleep(0.05)
+
+        assert len(fake.calls) == 2
+        assert client.get_stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_other_waiters_survive_a_cancellation(self, client, fake):
+        first = asyncio.ensure_future(client.submit_qubo(make_qubo()))
+        second = asyncio.ensure_future(client.submit_qubo(make_qubo()))
+        await asyncio.sleep(0)
+
+        first.cancel()
+
+        assert (await second)["status"] == "completed"
+        assert first.cancelled()
+        assert len(fake.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_sdk_falls_back_to_mock(self):
+        client = DynexClient(sampler_factory=lambda: None)
+        try:
+            result = await client.submit_qubo(make_qubo())
+        finally:
+            client.close()
+
+        assert result["status"] == "mock"
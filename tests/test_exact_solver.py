@@ -0,0 +1,67 @@
+"""
+Tests for the exhaustive small-QUBO solver
+"""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from src.nqba_stack.quantum.exact_solver import MAX_EXACT_VARIABLES, solve_exact
+from src.nqba_stack.quantum.sparse_qubo import SparseQUBO
+
+
+def brute_force(matrix):
+    return min(
+        float(np.array(x) @ matrix @ np.array(x))
+        for x in itertools.product((0, 1), repeat=len(matrix))
+    )
+
+
+@pytest.mark.parametrize("n", [1, 2, 5, 9])
+@pytest.mark.parametrize("chunk_bits", [2, 20])
+def test_matches_brute_force(n, chunk_bits):
+    matrix = np.random.default_rng(n).normal(size=(n, n))
+
+    solution, energy = solve_exact(matrix, chunk_bits=chunk_bits)
+
+    assert energy == pytest.approx(brute_force(matrix))
+    assert solution @ matrix @ solution == pytest.approx(energy)
+
+
+def test_sparse_input_keeps_offset():
+    matrix = np.random.default_rng(0).normal(size=(6, 6))
+    sparse = SparseQUBO.from_dense(matrix, offset=2.5)
+
+    _, energy = solve_exact(sparse)
+
+    assert energy == pytest.approx(brute_force(matrix) + 2.5)
+
+
+def test_ties_are_deterministic():
+    matrix = -np.eye(4)
+    matrix[0, 1] = matrix[2, 3] = 1.0
+
+    first = solve_exact(matrix)[0]
+
+    assert first.tolist() == [1, 0, 1, 0]
+    assert all((solve_exact(matrix)[0] == first).all() for _ in range(5))
+
+
+def test_ties_resolve_to_lowest_index_across_chunks():
+    # x0 and x1 are free; Gray order reaches (x1, x2) = (1, 1) before (0, 1)
+    matrix = np.diag([0.0, 0.0, -1.0])
+
+    for chunk_bits in (1, 2, 3):
+        assert solve_exact(matrix, chunk_bits=chunk_bits)[0].tolist() == [0, 0, 1]
+
+
+def test_largest_supported_size():
+    n = MAX_EXACT_VARIABLES
+    matrix = np.random.default_rng(1).normal(size=(n, n))
+
+    solution, energy = solve_exact(matrix)
+
+    assert solution @ matrix @ solution == pytest.approx(energy)
+    with pytest.raises(ValueError):
+        solve_exact(np.zeros((n + 1, n + 1)))
@@ -0,0 +1,155 @@
+"""
+Tests for the concurrent ingestion scheduler against a local stub feed server
+"""
+
+import asyncio
+import random
+import time
+
+import aiohttp
+import pytest
+import pytest_asyncio
+
+from src.nqba_stack.training.ingestion_scheduler import (
+    IngestionScheduler,
+    RateLimiter,
+    RetryPolicy,
+    host_key,
+)
+from src.nqba_stack.training.stub_feed_server import StubFeedServer
+
+FAST_RETRY = RetryPolicy(attempts=3, base_delay=0.01, max_delay=0.05)
+
+
+@pytest_asyncio.fixture
+async def server():
+    async with StubFeedServer(latency=0.05) as server:
+        yield server
+
+
+class TestIngestionScheduler:
+    """Pooled, bounded, rate-limited fetching"""
+
+    @pytest.mark.asyncio
+    async def test_fetches_run_concurrently_up_to_the_limit(self, server):
+        async with IngestionScheduler(max_concurrency=4, retry=FAST_RETRY) as s:
+            start = time.perf_counter()
+            results = await asyncio.gather(
+                *(s.fetch(f"feed{i}", server.feed_url(f"feed{i}")) for i in range(12))
+            )
+            elapsed = time.perf_counter() - start
+
+        assert [len(r["data"]) for r in results] == [100] * 12
+        assert server.peak == 4
+        assert s.stats["peak_in_flight"] == 4
+        # Three waves of 4, not twelve sequential requests
+        assert elapsed < 12 * server.latency
+
+    @pytest.mark.asyncio
+    async def test_connections_are_reused_per_host(self, server):
+        async with IngestionScheduler(max_concurrency=2) as s:
+            for _ in range(3):
+                await asyncio.gather(
+                    *(s.fetch("feed", server.feed_url("feed")) for _ in range(2))
+                )
+
+            assert len(s.pool) == 1
+
+        assert sum(server.requests.values()) == 6
+        assert len(server.connections) <= 2
+
+    @pytest.mark.asyncio
+    async def test_formats_are_read_by_the_reader(self, server):
+        async with IngestionScheduler() as s:
+            text = await s.fetch(
+                "csv",
+                server.feed_url("prices", "csv") + "?records=3",
+                read=aiohttp.ClientResponse.text,
+            )
+
+        assert text.splitlines()[0] == "id,symbol,price,volume"
+        assert len(text.splitlines()) == 4
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_spaces_requests_per_source(self, server):
+        server.latency = 0.0
+        async with IngestionScheduler(max_concurrency=8) as s:
+            start = time.perf_counter()
+            await asyncio.gather(
+                *(
+                    s.fetch("limited", server.feed_url("limited"), rate_limit=600)
+                    for _ in range(4)
+                ),
+                *(s.fetch("free", server.feed_url("free")) for _ in range(4)),
+            )
+            elapsed = time.perf_counter() - start
+
+        # 600 per minute is one request every 0.1s after the first
+        assert elapsed >= 0.3
+        assert server.requests == {"limited": 4, "free": 4}
+
+    @pytest.mark.asyncio
+    async def test_failures_are_retried(self):
+        async with StubFeedServer(failures_per_feed=2) as server:
+            async with IngestionScheduler(retry=FAST_RETRY) as s:
+                result = await s.fetch("flaky", server.feed_url("flaky"))
+
+        assert len(result["data"]) == 100
+        assert server.requests["flaky"] == 3
+        assert s.stats["retries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_last_failure_is_raised(self):
+        async with StubFeedServer(failures_per_feed=5) as server:
+            async with IngestionScheduler(retry=FAST_RETRY) as s:
+                with pytest.raises(aiohttp.ClientResponseError):
+                    await s.fetch("down", server.feed_url("down"))
+
+        assert server.requests["down"] == 3
+        assert s.stats["failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_backoff_does_not_hold_a_slot(self):
+        async with StubFeedServer(failures_per_feed=1, latency=0.01) as server:
+            retry = RetryPolicy(attempts=2, base_delay=1.0, max_delay=1.0)
+            async with IngestionScheduler(max_concurrency=1, retry=retry, seed=3) as s:
+                finished = []
+
+                async def fetch(name):
+                    await s.fetch(name, server.feed_url(name))
+                    finished.append(name)
+
+                # Every feed fails once; with one slot, backoffs must overlap
+                start = time.perf_counter()
+                await asyncio.gather(*(fetch(f"feed{i}") for i in range(4)))
+                elapsed = time.perf_counter() - start
+
+        assert sorted(finished) == [f"feed{i}" for i in range(4)]
+        # Seed 3 draws backoffs of 0.24-0.60s (1.76s in total): run back to
+        # back they would take well over a second
+        assert elapsed < 1.0
+
+
+class TestRateLimiter:
+    def test_token_bucket_reservations(self):
+        now = [0.0]
+        limiter = RateLimiter(60, burst=2, clock=lambda: now[0])
+
+        assert [limiter.reserve() for _ in range(4)] == [0.0, 0.0, 1.0, 2.0]
+        now[0] = 10.0
+        assert limiter.reserve() == 0.0
+
+    def test_jittered_backoff_is_bounded(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+        rng = random.Random(0)
+
+        delays = [policy.delay(attempt, rng) for attempt in range(6) for _ in range(50)]
+
+        assert all(0.0 <= d <= 5.0 for d in delays)
+        assert max(delays[:50]) <= 1.0
+        assert len(set(delays)) == len(delays)
+
+
+def test_host_key():
+    assert host_key("https://api.example.com/v3/coins") == "https://api.example.com:443"
+    assert host_key("http://127.0.0.1:8080/feeds/a.json") == "http://127.0.0.1:8080"
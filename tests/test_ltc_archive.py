@@ -0,0 +1,145 @@
+"""
+Tests for compressed, columnar LTC archives
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.nqba_stack.ltc_archive import LTCArchiveReader, archive_path, write_archive
+from src.nqba_stack.ltc_logger import LTCConfig, LTCLogger
+
+
+@pytest.fixture
+def ltc(tmp_path):
+    config = LTCConfig(
+        storage_path=str(tmp_path),
+        async_writing=False,
+        max_entries_per_file=40,
+        archive_block_size=8,
+    )
+    ltc = LTCLogger(config)
+    yield ltc
+    ltc.shutdown()
+
+
+async def log_entries(ltc, count):
+    ids = []
+    for i in range(count):
+        ids.append(
+            await ltc.log_operation(
+                operation_type="even" if i % 2 == 0 else "odd",
+                component=f"component_{i % 3}",
+                user_id=f"user_{i % 5}",
+                session_id=f"session_{i % 7}",
+                input_data={"i": i, "payload": "x" * 50},
+            )
+        )
+    return ids
+
+
+class TestLTCArchive:
+    """Archival of closed log files"""
+
+    @pytest.mark.asyncio
+    async def test_archive_round_trips_entries_and_hashes(self, ltc, tmp_path):
+        ids = await log_entries(ltc, 100)
+        before = {e.entry_id: e for e in await ltc.search_entries(limit=1000)}
+
+        archives = ltc.archive_closed_files()
+
+        assert len(archives) == 2
+        assert list(tmp_path.glob("ltc_*.jsonl")) == [ltc.current_file]
+        assert not list(tmp_path.glob("*.idx"))
+        after = await ltc.search_entries(limit=1000)
+        assert [e.entry_id for e in after] == ids[::-1]
+        for entry in after:
+            assert entry == before[entry.entry_id]
+            assert entry.hash == ltc._generate_entry_hash(entry)
+
+    @pytest.mark.asyncio
+    async def test_search_filters_and_pagination_match_jsonl(self, ltc):
+        await log_entries(ltc, 100)
+        queries = [
+            {"operation_type": "even", "component": "component_0"},
+            {"user_id": "user_3", "session_id": "session_2"},
+            {"limit": 7, "offset": 30},
+        ]
+        expected = [await ltc.search_entries(**q) for q in queries]
+
+        ltc.archive_closed_files()
+
+        assert [await ltc.search_entries(**q) for q in queries] == expected
+
+    @pytest.mark.asyncio
+    async def test_blocks_are_pruned(self, ltc, monkeypatch):
+        await log_entries(ltc, 100)
+        ltc.archive_closed_files()
+        future = datetime.now(timezone.utc) + timedelta(days=1)
+
+        def fail(*args):
+            raise AssertionError("pruned block was decoded")
+
+        monkeypatch.setattr(LTCArchiveReader, "column", fail)
+        assert await ltc.search_entries(start_time=future) == []
+        assert await ltc.search_entries(component="missing") == []
+
+    @pytest.mark.asyncio
+    async def test_get_entry_by_id_reads_archives(self, ltc):
+        ids = await log_entries(ltc, 100)
+        await ltc.get_entry_by_id(ids[0])
+        ltc.archive_closed_files()
+
+        for entry_id in (ids[0], ids[45], ids[-1]):
+            assert (await ltc.get_entry_by_id(entry_id)).entry_id == entry_id
+
+        reopened = LTCLogger(ltc.config)
+        try:
+            entry = await reopened.get_entry_by_id(ids[50])
+            assert entry.input_data["i"] == 50
+        finally:
+            reopened.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_statistics_include_archives(self, ltc):
+        await log_entries(ltc, 100)
+        ltc.archive_closed_files()
+
+        stats = ltc.get_statistics()
+
+        assert stats["total_files"] == 3
+        assert stats["archived_files"] == 2
+        assert stats["archived_entries"] == 80
+        assert stats["archive_compression_ratio"] > 2
+
+    @pytest.mark.asyncio
+    async def test_rotation_archives_in_background(self, tmp_path):
+        config = LTCConfig(
+            storage_path=str(tmp_path),
+            async_writing=False,
+            max_entries_per_file=20,
+            archive_rotated_files=True,
+        )
+        ltc = LTCLogger(config)
+        ids = await log_entries(ltc, 50)
+        ltc.shutdown()
+
+        assert len(list(tmp_path.glob("ltc_*.ltca"))) == 2
+        assert len(list(tmp_path.glob("ltc_*.jsonl"))) == 1
+        assert [e.entry_id for e in await ltc.search_entries(limit=100)] == ids[::-1]
+
+    def test_mismatched_archive_keeps_source(self, tmp_path, monkeypatch):
+        log_file = tmp_path / "ltc_test.jsonl"
+        log_file.write_text(
+            '{"entry_id": "a", "timestamp": "2024-01-01T00:00:00", "x": 1}\n'
+        )
+        monkeypatch.setattr(
+            LTCArchiveReader, "entries", lambda self: iter([{"entry_id": "b"}])
+        )
+
+        with pytest.raises(ValueError):
+            write_archive(log_file)
+
+        assert log_file.exists()
+        assert not archive_path(log_file).exists()
+        assert not list(tmp_path.glob("*.tmp"))
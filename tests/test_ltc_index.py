@@ -0,0 +1,114 @@
+"""
+Tests for the indexed LTC JSONL query engine
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.nqba_stack.ltc_index import LTCFileIndex, index_path
+from src.nqba_stack.ltc_logger import LTCConfig, LTCLogger
+
+
+@pytest.fixture
+def ltc(tmp_path):
+    config = LTCConfig(
+        storage_path=str(tmp_path), async_writing=False, max_entries_per_file=25
+    )
+    ltc = LTCLogger(config)
+    yield ltc
+    ltc.shutdown()
+
+
+async def log_entries(ltc, count):
+    ids = []
+    for i in range(count):
+        ids.append(
+            await ltc.log_operation(
+                operation_type="even" if i % 2 == 0 else "odd",
+                component=f"component_{i % 3}",
+                user_id=f"user_{i % 5}",
+                session_id=f"session_{i % 7}",
+                input_data={"i": i},
+            )
+        )
+    return ids
+
+
+class TestLTCFileIndex:
+    """Sidecar indexes and indexed search"""
+
+    @pytest.mark.asyncio
+    async def test_rotated_files_get_sidecars(self, ltc, tmp_path):
+        await log_entries(ltc, 60)
+
+        log_files = sorted(tmp_path.glob("ltc_*.jsonl"))
+        assert len(log_files) == 3
+        closed = [f for f in log_files if f != ltc.current_file]
+        for log_file in closed:
+            index = LTCFileIndex.load(log_file)
+            assert index is not None
+            assert len(index) == 25
+
+    @pytest.mark.asyncio
+    async def test_search_is_newest_first_and_paginated(self, ltc):
+        ids = await log_entries(ltc, 60)
+
+        first_page = await ltc.search_entries(limit=10)
+        second_page = await ltc.search_entries(limit=10, offset=10)
+
+        newest = ids[::-1]
+        assert [e.entry_id for e in first_page] == newest[:10]
+        assert [e.entry_id for e in second_page] == newest[10:20]
+
+    @pytest.mark.asyncio
+    async def test_filters_use_postings(self, ltc):
+        ids = await log_entries(ltc, 60)
+
+        results = await ltc.search_entries(
+            operation_type="even", component="component_0", user_id="user_0", limit=100
+        )
+        expected = [
+            ids[i] for i in range(60) if i % 2 == 0 and i % 3 == 0 and i % 5 == 0
+        ]
+        assert [e.entry_id for e in results] == expected[::-1]
+
+        results = await ltc.search_entries(session_id="session_3", limit=100)
+        assert [e.entry_id for e in results] == [
+            ids[i] for i in range(60) if i % 7 == 3
+        ][::-1]
+
+    @pytest.mark.asyncio
+    async def test_time_range_prunes_files(self, ltc, monkeypatch):
+        await log_entries(ltc, 60)
+        future = datetime.now(timezone.utc) + timedelta(days=1)
+
+        def fail(*args):
+            raise AssertionError("pruned file was read")
+
+        monkeypatch.setattr("src.nqba_stack.ltc_logger.LTCFileReader", fail)
+        assert await ltc.search_entries(start_time=future) == []
+
+    @pytest.mark.asyncio
+    async def test_get_entry_by_id_across_files(self, ltc):
+        ids = await log_entries(ltc, 60)
+
+        for entry_id in (ids[0], ids[30], ids[-1]):
+            entry = await ltc.get_entry_by_id(entry_id)
+            assert entry.entry_id == entry_id
+        assert await ltc.get_entry_by_id("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_legacy_and_stale_files_are_reindexed(self, ltc, tmp_path):
+        ids = await log_entries(ltc, 60)
+        ltc.shutdown()
+        for sidecar in tmp_path.glob("*.idx"):
+            sidecar.unlink()
+
+        reopened = LTCLogger(ltc.config)
+        try:
+            entry = await reopened.get_entry_by_id(ids[5])
+            assert entry.input_data == {"i": 5}
+            assert index_path(sorted(tmp_path.glob("ltc_*.jsonl"))[0]).exists()
+        finally:
+            reopened.shutdown()
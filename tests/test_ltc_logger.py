@@ -0,0 +1,230 @@
+"""
+Tests for the core LTC logger's batched, non-blocking writer
+"""
+
+import threading
+
+import pytest
+
+from src.nqba_stack.core.ltc_logger import LTCLogger
+
+
+@pytest.fixture
+def ltc(tmp_path, monkeypatch):
+    ltc = LTCLogger(flush_interval=0.05)
+    ltc.db_path = tmp_path / "ltc_operations.db"
+    monkeypatch.setattr(ltc.settings, "ltc_checkpoint_key", "test-checkpoint-key")
+    yield ltc
+    ltc.close()
+
+
+class TestLTCWriter:
+    """Queue-fed writer with group commits"""
+
+    def test_database_is_created_on_first_use(self, ltc):
+        assert not ltc.db_path.exists()
+
+        ltc.log_operation("test_op", {"n": 1}, "thread_1")
+        assert ltc.flush()
+
+        assert ltc.db_path.exists()
+
+    def test_operations_are_group_committed(self, ltc, monkeypatch):
+        batches = []
+        write_batch = ltc._write_batch
+
+        def counting_write_batch(batch):
+            batches.append(len(batch))
+            write_batch(batch)
+
+        monkeypatch.setattr(ltc, "_write_batch", counting_write_batch)
+
+        ids = [
+            ltc.log_operation("test_op", {"n": i}, f"thread_{i}") for i in range(300)
+        ]
+
+        operations = ltc.query_operations(limit=1000)
+        assert {op.operation_id for op in operations} == set(ids)
+        assert sum(batches) == 300
+        assert len(batches) < 300
+
+    def test_reads_see_queued_writes_and_chain_verifies(self, ltc):
+        for i in range(20):
+            ltc.log_operation("test_op", {"n": i}, "thread")
+
+        assert ltc.get_statistics()["total_operations"] == 20
+        integrity = ltc.get_hash_chain_integrity()
+        assert integrity["integrity_verified"]
+        assert integrity["last_verified_hash"] == ltc.last_hash
+
+    def test_conflicting_row_does_not_drop_batch(self, ltc, monkeypatch):
+        monkeypatch.setattr(ltc, "_generate_operation_id", lambda *args: "same_id")
+        ltc.log_operation("first", {"n": 1}, "thread")
+        ltc.log_operation("duplicate", {"n": 2}, "thread")
+        monkeypatch.undo()
+        other = ltc.log_operation("other", {"n": 3}, "thread")
+
+        assert ltc.get_operation_by_id("same_id").operation_type == "first"
+        assert ltc.get_operation_by_id(other) is not None
+        assert ltc.get_hash_chain_integrity(full=True)["integrity_verified"]
+
+    def test_logging_does_not_touch_database_on_caller_thread(self, ltc, monkeypatch):
+        threads = []
+        get_connection = ltc._get_connection
+
+        def recording_get_connection():
+            threads.append(threading.current_thread().name)
+            return get_connection()
+
+        monkeypatch.setattr(ltc, "_get_connection", recording_get_connection)
+        for i in range(10):
+            ltc.log_operation("test_op", {"n": i}, "thread")
+        assert ltc.flush()
+
+        assert threads and set(threads) == {"ltc-writer"}
+
+    def test_close_commits_and_logging_restarts_writer(self, ltc):
+        ltc.log_operation("before_close", {}, "thread")
+        ltc.close()
+        assert ltc._writer is None
+
+        ltc.log_operation("after_close", {}, "thread")
+        types = {op.operation_type for op in ltc.query_operations()}
+        assert types == {"before_close", "after_close"}
+
+
+class TestLTCHashChainVerification:
+    """Checkpointed, streaming hash-chain verification"""
+
+    @staticmethod
+    def log_many(ltc, count, start=0):
+        for i in range(start, start + count):
+            ltc.log_operation("test_op", {"n": i}, "thread")
+
+    def test_verification_resumes_from_checkpoint(self, ltc):
+        self.log_many(ltc, 50)
+        first = ltc.get_hash_chain_integrity(checkpoint_interval=20)
+        assert first["integrity_verified"]
+        assert first["verified_operations"] == 50
+
+        self.log_many(ltc, 10, start=50)
+        second = ltc.get_hash_chain_integrity()
+
+        assert second["integrity_verified"]
+        assert second["verified_operations"] == 10
+        assert second["total_operations"] == 60
+        assert second["resumed_from_checkpoint"] is not None
+        assert second["last_verified_hash"] == ltc.last_hash
+
+    def test_tampered_row_is_reported_once(self, ltc):
+        self.log_many(ltc, 30)
+        ltc.flush()
+        conn = ltc._get_connection()
+        with conn:
+            conn.execute(
+                "UPDATE ltc_operations SET operation_data = ? WHERE rowid = 10",
+                ('{"n": 999}',),
+            )
+
+        report = ltc.get_hash_chain_integrity(full=True)
+
+        assert not report["integrity_verified"]
+        assert len(report["integrity_issues"]) == 1
+
+    def test_forged_checkpoint_is_rejected(self, ltc):
+        self.log_many(ltc, 20)
+        ltc.get_hash_chain_integrity()
+        conn = ltc._get_connection()
+        with conn:
+            conn.execute("UPDATE ltc_checkpoints SET operation_count = 1000")
+
+        report = ltc.get_hash_chain_integrity()
+
+        assert not report["integrity_verified"]
+        assert report["integrity_issues"][0]["error"] == "invalid checkpoint signature"
+        assert report["verified_operations"] == 20
+
+    def test_default_secret_key_disables_checkpoints(self, ltc, monkeypatch):
+        from src.nqba_stack.core.settings import DEFAULT_SECRET_KEY
+
+        self.log_many(ltc, 20)
+        ltc.get_hash_chain_integrity()
+        monkeypatch.setattr(ltc.settings, "ltc_checkpoint_key", None)
+        monkeypatch.setattr(ltc.settings, "SECRET_KEY", DEFAULT_SECRET_KEY)
+        self.log_many(ltc, 5, start=20)
+
+        report = ltc.get_hash_chain_integrity()
+
+        assert report["integrity_verified"]
+        assert report["checkpoints_enabled"] is False
+        assert report["resumed_from_checkpoint"] is None
+        assert report["verified_operations"] == 25
+        with ltc._connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM ltc_checkpoints").fetchone()[0] == 1
+
+    @pytest.mark.parametrize("variable", ["NQBA_LTC_CHECKPOINT_KEY", "LTC_CHECKPOINT_KEY"])
+    def test_checkpoint_key_is_read_from_environment(self, variable, monkeypatch):
+        from src.nqba_stack.core.settings import NQBASettings
+
+        monkeypatch.setenv(variable, "env-checkpoint-key")
+
+        assert NQBASettings().ltc_checkpoint_signing_key == "env-checkpoint-key"
+
+    def test_chain_continues_across_restart(self, ltc):
+        self.log_many(ltc, 5)
+        ltc.close()
+
+        restarted = LTCLogger()
+        restarted.db_path = ltc.db_path
+        self.log_many(restarted, 5, start=5)
+        report = restarted.get_hash_chain_integrity(full=True)
+        restarted.close()
+
+        assert report["integrity_verified"]
+        assert report["total_operations"] == 10
+
+    @pytest.mark.slow
+    def test_parallel_matches_serial(self, ltc):
+        self.log_many(ltc, 200)
+        ltc.flush()
+        conn = ltc._get_connection()
+        with conn:
+            conn.execute(
+                "UPDATE ltc_operations SET operation_data = ? WHERE rowid = 150",
+                ('{"n": -1}',),
+            )
+
+        serial = ltc.get_hash_chain_integrity(full=True)
+        parallel = ltc.get_hash_chain_integrity(full=True, parallel=True, max_workers=3)
+
+        assert parallel["total_operations"] == serial["total_operations"] == 200
+        assert parallel["integrity_issues"] == serial["integrity_issues"]
+        assert parallel["last_verified_hash"] == serial["last_verified_hash"]
+
+    @pytest.mark.slow
+    def test_parallel_verify_does_not_write_to_data_dir_db(self, tmp_path, monkeypatch):
+        from src.nqba_stack.core import settings
+
+        # Spawned workers build their settings from the environment
+        monkeypatch.setenv("DATA_DIR", str(tmp_path))
+        monkeypatch.setattr(settings, "_settings", None)
+        ltc = LTCLogger()
+        assert ltc.db_path == tmp_path / "ltc_operations.db"
+        try:
+            self.log_many(ltc, 500)
+            ltc.flush()
+
+            def row_count():
+                with ltc._connection() as conn:
+                    return conn.execute("SELECT COUNT(*) FROM ltc_operations").fetchone()[0]
+
+            before = row_count()
+            parallel = ltc.get_hash_chain_integrity(full=True, parallel=True, max_workers=4)
+            after = row_count()
+            serial = ltc.get_hash_chain_integrity(full=True)
+        finally:
+            ltc.close()
+
+        assert parallel["integrity_verified"]
+        assert after == before == 500
+        assert serial["integrity_verified"]
@@ -10,10 +10,13 @@ Tests the complete QIH functionality including:
 
 import pytest
 import asyncio
+import sqlite3
 import time
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch, AsyncMock
 
+import numpy as np
+
 from src.nqba_stack.quantum.qih import (
     QuantumIntegrationHub,
     QuantumJob,
@@ -26,6 +29,21 @@ from src.nqba_stack.quantum.qih import (
     RetryPolicy,
     UsageTracker,
 )
+from src.nqba_stack.quantum.adapters.annealer import NumpySimulatedAnnealer
+from src.nqba_stack.quantum.adapters.classical_adapter import DimodSolver
+from src.nqba_stack.quantum.adapters.solver_pool import (
+    SolverCancelledError,
+    SolverPool,
+)
+from src.nqba_stack.quantum.mappers import ProblemMapper, SigmaLeadMapper
+from src.nqba_stack.quantum.sparse_qubo import (
+    SparseQUBO,
+    SparseQUBOBuilder,
+    as_sparse_qubo,
+)
+from src.nqba_stack.quantum.job_store import InMemoryJobStore, SQLiteJobStore
+from src.nqba_stack.quantum.result_cache import QUBOResultCache, qubo_cache_key
+from src.nqba_stack.quantum.scheduler import JobScheduler
 from src.nqba_stack.core.entitlements import (
     EntitlementsEngine,
     Tier,
@@ -119,6 +137,67 @@ class TestQuantumIntegrationHub:
         # Should only have one job
         assert len(self.qih.jobs) == 1
 
+    def test_job_indexes(self):
+        """Test idempotency, user and status indexes track job changes"""
+        other_request = OptimizationRequest(operation="qubo", inputs={"test": "data"})
+        job_1 = self.qih.submit_job(self.test_user_id, self.test_request, "key_1")
+        job_2 = self.qih.submit_job(self.test_user_id, other_request)
+        self.qih.submit_job("other_user", other_request)
+
+        assert self.qih._find_job_by_idempotency_key("key_1").job_id == job_1
+        assert [j["job_id"] for j in self.qih.get_user_jobs(self.test_user_id)] == [
+            job_1,
+            job_2,
+        ]
+        assert self.qih.count_jobs(JobStatus.QUEUED) == 3
+
+        # Direct status assignment keeps the status index in sync
+        self.qih.jobs[job_2].status = JobStatus.COMPLETED
+        assert self.qih.count_jobs(JobStatus.QUEUED) == 2
+        completed = self.qih.get_user_jobs(self.test_user_id, JobStatus.COMPLETED)
+        assert [j["job_id"] for j in completed] == [job_2]
+
+        # Removing a job clears every index
+        self.qih._remove_job(job_1)
+        assert self.qih._find_job_by_idempotency_key("key_1") is None
+        assert job_1 not in self.qih.job_queue
+        assert self.qih.count_jobs(JobStatus.QUEUED) == 1
+        assert len(self.qih.get_user_jobs(self.test_user_id)) == 1
+
+    def test_archive_expired_jobs(self):
+        """Test TTL archiving moves jobs between status indexes"""
+        job_id = self.qih.submit_job(self.test_user_id, self.test_request)
+        job = self.qih.jobs[job_id]
+        job.status = JobStatus.COMPLETED
+        job.completed_at = datetime.utcnow() - timedelta(days=job.ttl_days + 1)
+
+        assert self.qih._archive_expired_jobs() == [job_id]
+        assert job.status == JobStatus.ARCHIVED
+        assert self.qih.count_jobs(JobStatus.COMPLETED) == 0
+        assert self.qih.count_jobs(JobStatus.ARCHIVED) == 1
+
+        # Archived jobs are still listed for their user
+        assert self.qih.get_user_jobs(self.test_user_id, JobStatus.ARCHIVED)
+
+    def test_purge_archived_jobs(self):
+        """Test archived jobs past retention are dropped from every index"""
+        job_id = self.qih.submit_job(self.test_user_id, self.test_request, "key_1")
+        job = self.qih.jobs[job_id]
+        job.status = JobStatus.COMPLETED
+        job.completed_at = datetime.utcnow() - timedelta(days=job.ttl_days + 1)
+        self.qih._archive_expired_jobs()
+
+        # Still within the archive retention
+        assert self.qih._purge_archived_jobs() == []
+
+        job.completed_at -= timedelta(days=self.qih.ARCHIVE_RETENTION_DAYS)
+        assert self.qih._purge_archived_jobs() == [job_id]
+        assert job_id not in self.qih.jobs
+        assert self.qih.count_jobs(JobStatus.ARCHIVED) == 0
+        assert self.qih.get_user_jobs(self.test_user_id) == []
+        assert self.qih._find_job_by_idempotency_key("key_1") is None
+        assert self.qih.get_job_status(job_id) is None
+
     def test_circuit_breaker(self):
         """Test circuit breaker functionality"""
         cb = self.qih.circuit_breaker
@@ -162,6 +241,854 @@ class TestQuantumIntegrationHub:
         assert delay_10 <= policy.max_delay
 
 
+class TestJobScheduler:
+    """Test the QIH priority scheduler"""
+
+    def test_priority_order(self):
+        """Higher priority jobs are dispatched first, FIFO within a level"""
+        scheduler = JobScheduler()
+        scheduler.push("low", "user_a", "low")
+        scheduler.push("normal_1", "user_a", "normal")
+        scheduler.push("urgent", "user_a", "urgent")
+        scheduler.push("normal_2", "user_a", "normal")
+
+        assert len(scheduler) == 4
+        assert list(scheduler) == ["urgent", "normal_1", "normal_2", "low"]
+        assert [scheduler.pop() for _ in range(4)] == [
+            "urgent",
+            "normal_1",
+            "normal_2",
+            "low",
+        ]
+        assert scheduler.pop() is None
+
+    def test_per_user_fairness(self):
+        """Users sharing a priority level are served round-robin"""
+        scheduler = JobScheduler()
+        for i in range(3):
+            scheduler.push(f"a{i}", "user_a", "normal")
+        scheduler.push("b0", "user_b", "normal")
+        scheduler.push("c0", "user_c", "normal")
+
+        order = [scheduler.pop() for _ in range(5)]
+        assert order == ["a0", "b0", "c0", "a1", "a2"]
+
+    def test_aging_promotes_waiting_jobs(self):
+        """LOW jobs that waited long enough overtake newer HIGH jobs"""
+        scheduler = JobScheduler(aging_interval_seconds=10)
+        scheduler.push("old_low", "user_a", "low")
+        scheduler.push("new_high", "user_b", "high")
+
+        # Pretend the LOW job has waited for three aging intervals
+        scheduler._entries["old_low"].enqueued_at -= 30
+
+        assert scheduler.pop() == "old_low"
+        assert scheduler.get_metrics()["aged_dispatches"] == 1
+
+    def test_remove_and_requeue(self):
+        """Removed jobs are skipped and can be queued again"""
+        scheduler = JobScheduler()
+        scheduler.push("job_1", "user_a", "normal")
+        scheduler.push("job_2", "user_a", "normal")
+
+        scheduler.remove("job_1")
+        assert "job_1" not in scheduler
+        with pytest.raises(ValueError):
+            scheduler.remove("job_1")
+
+        scheduler.push("job_1", "user_a", "normal")
+        assert scheduler.pop() == "job_2"
+        assert scheduler.pop() == "job_1"
+        assert scheduler.pop() is None
+
+    def test_queue_metrics(self):
+        """Queue depth and wait-time metrics are reported"""
+        scheduler = JobScheduler()
+        scheduler.push("job_1", "user_a", "high")
+        scheduler.push("job_2", "user_b", "low")
+        scheduler.pop()
+
+        metrics = scheduler.get_metrics()
+        assert metrics["queue_depth"] == 1
+        assert metrics["depth_by_priority"]["low"] == 1
+        assert metrics["depth_by_priority"]["high"] == 0
+        assert metrics["total_dispatched"] == 1
+        assert metrics["wait_time_seconds"]["samples"] == 1
+
+    @pytest.mark.asyncio
+    async def test_worker_pool_runs_jobs_concurrently(self):
+        """The worker pool executes several jobs at the same time"""
+        qih = QuantumIntegrationHub(max_workers=4)
+        running = 0
+        peak = 0
+
+        async def fake_execute(job_id):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            qih.jobs[job_id].status = JobStatus.COMPLETED
+
+        qih._execute_job = fake_execute
+        for _ in range(8):
+            qih.submit_job(
+                "pool_user", OptimizationRequest(operation="qubo", inputs={})
+            )
+
+        pool = asyncio.create_task(qih.process_job_queue())
+        for _ in range(100):
+            if all(j.status == JobStatus.COMPLETED for j in qih.jobs.values()):
+                break
+            await asyncio.sleep(0.01)
+        pool.cancel()
+
+        assert all(j.status == JobStatus.COMPLETED for j in qih.jobs.values())
+        assert peak == 4
+        assert qih.get_queue_metrics()["total_dispatched"] == 8
+
+
+class TestQUBOResultCache:
+    """Test the content-addressed QUBO result cache"""
+
+    def test_equivalent_qubos_share_a_key(self):
+        """Dict, dense and symmetric encodings of one QUBO hash the same"""
+        upper = {(0, 0): 1.0, (0, 1): -2.0, (1, 1): 3.0}
+        lower = {(1, 0): -2.0, (1, 1): 3.0, (0, 0): 1.0, (2, 2): 0.0}
+        dense = [[1.0, -1.0], [-1.0, 3.0]]
+
+        key = qubo_cache_key(upper)
+        assert qubo_cache_key(lower) == key
+        assert qubo_cache_key(dense) == key
+        assert qubo_cache_key(upper, offset=1.0) != key
+        assert qubo_cache_key(upper, params={"num_reads": 10}) != key
+
+        # Separate linear biases and SparseQUBO inputs fold the same way
+        assert qubo_cache_key({(1, 0): -2.0}, linear={0: 1.0, 1: 3.0}) == key
+        assert qubo_cache_key(SparseQUBO.from_dense(np.array(dense))) == key
+        labelled = {("b", "a"): -1.0, ("a", "b"): -1.0, ("a", "a"): 1.0}
+        assert qubo_cache_key(labelled) == qubo_cache_key(
+            {("a", "b"): -2.0}, linear={"a": 1.0, "c": 0.0}
+        )
+
+    def test_lru_byte_budget_and_ttl(self):
+        """Entries are evicted by byte budget and expire after their TTL"""
+        cache = QUBOResultCache(max_bytes=400, ttl_seconds=None)
+        cache.put("a", "x" * 150)
+        cache.put("b", "y" * 150)
+        assert cache.get("a") is not None  # "a" is now most recently used
+        cache.put("c", "z" * 150)
+
+        assert "a" in cache and "c" in cache
+        assert "b" not in cache
+        assert cache.get_stats()["evictions"] == 1
+
+        cache.put("short", {"value": 1}, ttl_seconds=-1)
+        assert cache.get("short") is None
+        assert cache.get_stats()["expirations"] == 1
+
+    def test_persistence(self, tmp_path):
+        """Entries survive a restart when a persist path is configured"""
+        path = tmp_path / "qubo_cache.db"
+        cache = QUBOResultCache(persist_path=path)
+        cache.put("key", {"solution": {0: 1}})
+        cache.close()
+
+        reopened = QUBOResultCache(persist_path=path)
+        assert reopened.get("key") == {"solution": {0: 1}}
+        assert reopened.get_stats()["disk_hits"] == 1
+        reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_hub_serves_repeated_qubo_from_cache(self):
+        """A repeated QUBO is not re-solved by the hub"""
+        qih = QuantumIntegrationHub()
+        calls = 0
+
+        async def fake_solve(job):
+            nonlocal calls
+            calls += 1
+            return OptimizationResult(
+                solution={"solution": {0: 1, 1: 0}},
+                objective_value=-1.0,
+                solver_used=SolverType.CLASSICAL_DIMOD,
+                execution_time_ms=50,
+            )
+
+        qih._solve_optimization = fake_solve
+        first = OptimizationRequest(
+            operation="qubo", inputs={"qubo_matrix": {(0, 0): -1.0, (0, 1): 2.0}}
+        )
+        second = OptimizationRequest(
+            operation="qubo", inputs={"qubo_matrix": {(1, 0): 2.0, (0, 0): -1.0}}
+        )
+
+        result_1 = await qih._run_optimization(qih.jobs[qih.submit_job("u", first)])
+        result_2 = await qih._run_optimization(qih.jobs[qih.submit_job("u", second)])
+
+        assert calls == 1
+        assert result_2.objective_value == result_1.objective_value
+        assert result_2.metadata["cache_hit"] is True
+        assert qih.get_cache_stats()["hits"] == 1
+
+
+class TestNumpySimulatedAnnealer:
+    """Test the native annealer behind the classical fallback"""
+
+    @staticmethod
+    def _random_qubo(n, density, seed):
+        import random
+
+        rng = random.Random(seed)
+        return {
+            (i, j): rng.uniform(-1, 1)
+            for i in range(n)
+            for j in range(i, n)
+            if i == j or rng.random() < density
+        }
+
+    def test_matches_exact_ground_state(self):
+        """Small sparse and dense QUBOs reach the exhaustive optimum"""
+        dimod = pytest.importorskip("dimod")
+
+        for density in (0.2, 1.0):
+            qubo = self._random_qubo(12, density, seed=7)
+            exact = dimod.ExactSolver().sample_qubo(qubo).first.energy
+
+            result = NumpySimulatedAnnealer(seed=1).sample_qubo(qubo, offset=0.5)
+            assert result.best_energy == pytest.approx(exact + 0.5)
+            assert dimod.BQM.from_qubo(qubo, 0.5).energy(
+                result.best_sample
+            ) == pytest.approx(result.best_energy)
+
+    def test_dense_matrix_input_and_seed(self):
+        """Dense matrices are accepted and a fixed seed is reproducible"""
+        matrix = [[-1.0, 2.0, 0.0], [0.0, -1.0, 2.0], [0.0, 0.0, -1.0]]
+        annealer = NumpySimulatedAnnealer(num_reads=4, seed=3)
+
+        first = annealer.sample_qubo(matrix)
+        second = annealer.sample_qubo(matrix)
+        assert first.best_energy == -2.0
+        assert first.best_sample == {0: 1, 1: 0, 2: 1}
+        assert (first.samples == second.samples).all()
+
+    def test_timeout_returns_partial_result(self):
+        """A timeout stops sweeping early and still returns samples"""
+        qubo = self._random_qubo(300, 0.05, seed=2)
+        result = NumpySimulatedAnnealer(num_sweeps=100000).sample_qubo(
+            qubo, timeout=0.05
+        )
+
+        assert result.timed_out is True
+        assert 0 < result.num_sweeps < 100000
+        assert result.samples.shape[1] == 300
+
+    def test_parallel_tempering_matches_exact_ground_state(self):
+        """Replica exchange reaches the optimum and reports swap rates"""
+        dimod = pytest.importorskip("dimod")
+
+        for density in (0.2, 1.0):
+            qubo = self._random_qubo(14, density, seed=3)
+            exact = dimod.ExactSolver().sample_qubo(qubo).first.energy
+
+            result = NumpySimulatedAnnealer(
+                num_reads=4, num_sweeps=200, seed=0
+            ).parallel_tempering(qubo, num_temperatures=6)
+            assert result.samples.shape == (4, 14)
+            assert result.best_energy == pytest.approx(exact)
+            rates = result.info["exchange_acceptance"]
+            assert len(rates) == 5
+            assert all(0 < rate <= 1 for rate in rates)
+
+    def test_parallel_tempering_keeps_best_visited_state(self):
+        """Returned energies are those of the returned samples"""
+        qubo = self._random_qubo(200, 0.05, seed=4)
+        result = NumpySimulatedAnnealer(num_reads=3, seed=5).parallel_tempering(
+            qubo, offset=1.5, num_sweeps=50
+        )
+
+        position = {var: k for k, var in enumerate(result.variables)}
+        for sample, energy in zip(result.samples, result.energies):
+            expected = 1.5 + sum(
+                bias * sample[position[u]] * sample[position[v]]
+                for (u, v), bias in qubo.items()
+            )
+            assert energy == pytest.approx(expected)
+        assert result.num_sweeps == 50
+
+    @pytest.mark.asyncio
+    async def test_dimod_solver_uses_native_annealer(self):
+        """DimodSolver anneals large problems natively for every vartype"""
+        solver = DimodSolver()
+        if not solver.available:
+            pytest.skip("dimod not installed")
+
+        qubo = await solver.solve(
+            {
+                "operation": "qubo",
+                "inputs": {"qubo_matrix": self._random_qubo(40, 0.1, 5), "seed": 1},
+            }
+        )
+        assert qubo["solver_method"] == "simulated_annealing"
+        assert qubo["num_variables"] == 40
+
+        ising = await solver.solve(
+            {
+                "operation": "ising",
+                "inputs": {"linear": {"a": 1.0}, "quadratic": {("a", "b"): -1.0}},
+            }
+        )
+        assert ising["solution"] == {"a": -1, "b": -1}
+        assert ising["objective_value"] == -2.0
+
+
+class TestSparseQUBO:
+    """Test the shared sparse QUBO representation"""
+
+    @staticmethod
+    def _all_samples(n):
+        import itertools
+
+        return list(itertools.product([0, 1], repeat=n))
+
+    def test_dense_and_dict_encodings_agree(self):
+        """Dense, dict and builder inputs give the same canonical QUBO"""
+        dense = [[-1.0, 1.0, 0.0], [1.0, 2.0, -3.0], [0.0, 0.0, 0.5]]
+        from_dense = SparseQUBO.from_dense(dense, offset=2.0)
+        from_dict = as_sparse_qubo(
+            {(0, 0): -1.0, (0, 1): 2.0, (1, 1): 2.0, (2, 1): -3.0, (2, 2): 0.5},
+            offset=2.0,
+        )
+
+        builder = SparseQUBOBuilder(3)
+        builder.add_linear([0, 1, 2], [-1.0, 2.0, 0.5])
+        builder.add_quadratic([0, 1, 1], [1, 0, 2], [1.0, 1.0, -3.0])
+        builder.add_offset(2.0)
+        built = builder.build()
+
+        for qubo in (from_dict, built):
+            assert qubo.rows.tolist() == from_dense.rows.tolist() == [0, 1]
+            assert qubo.cols.tolist() == from_dense.cols.tolist() == [1, 2]
+            assert qubo.data.tolist() == from_dense.data.tolist() == [2.0, -3.0]
+            assert qubo.linear.tolist() == from_dense.linear.tolist()
+            assert qubo.offset == 2.0
+
+        samples = self._all_samples(3)
+        expected = [
+            2.0 + sum(dense[i][j] * x[i] * x[j] for i in range(3) for j in range(3))
+            for x in samples
+        ]
+        assert from_dense.energies(samples).tolist() == pytest.approx(expected)
+        assert (from_dense.to_dense() == [[-1, 2, 0], [0, 2, -3], [0, 0, 0.5]]).all()
+
+    def test_ising_and_bqm_conversion(self):
+        """Ising and dimod conversions preserve every energy"""
+        qubo = SparseQUBO.from_dict(
+            {("a", "a"): 1.0, ("a", "b"): -2.0, ("b", "c"): 1.5}, offset=0.5
+        )
+        h, rows, cols, couplings, offset = qubo.to_ising()
+
+        for x in self._all_samples(3):
+            spins = [2 * value - 1 for value in x]
+            ising = offset + sum(h[i] * spins[i] for i in range(3))
+            ising += sum(
+                c * spins[i] * spins[j] for i, j, c in zip(rows, cols, couplings)
+            )
+            assert ising == pytest.approx(qubo.energy(list(x)))
+
+        dimod = pytest.importorskip("dimod")
+        bqm = qubo.to_bqm()
+        assert bqm.vartype is dimod.BINARY
+        sample = {"a": 1, "b": 1, "c": 1}
+        assert bqm.energy(sample) == pytest.approx(qubo.energy(sample))
+        assert SparseQUBO.from_bqm(bqm).energy(sample) == pytest.approx(1.0)
+
+    @pytest.mark.asyncio
+    async def test_map_to_ising_is_the_same_for_dense_and_sparse(self):
+        """Both QUBO result kinds give one schema under x = (1 - s) / 2"""
+        dense = [[-1.0, 2.0, 0.0], [0.0, 2.0, -3.0], [1.0, 0.0, 0.5]]
+        linear = [0.5, 0.0, -1.0]
+
+        class Mapper(ProblemMapper):
+            def __init__(self, sparse):
+                super().__init__("test", "test mapper")
+                self.sparse = sparse
+
+            async def map_to_qubo(self, problem_data):
+                if self.sparse:
+                    qubo = SparseQUBO.from_dense(dense, offset=2.0)
+                    qubo.linear += linear
+                    return {"qubo": qubo}
+                return {
+                    "qubo_matrix": dense,
+                    "linear_terms": linear,
+                    "constant_term": 2.0,
+                }
+
+            async def validate_input(self, problem_data):
+                return True
+
+            async def estimate_problem_size(self, problem_data):
+                return 3
+
+        results = [
+            await Mapper(sparse).map_to_ising({"dense_output": True})
+            for sparse in (False, True)
+        ]
+        assert results[0] == results[1]
+        ising = results[0]
+        assert ising["metadata"]["spin_convention"] == "x = (1 - s) / 2"
+
+        h, matrix = ising["ising_terms"], ising["ising_matrix"]
+        for x in self._all_samples(3):
+            spins = [1 - 2 * value for value in x]
+            energy = ising["offset"] + sum(h[i] * spins[i] for i in range(3))
+            energy += sum(
+                value * spins[i] * spins[j]
+                for (i, j), value in ising["ising_couplings"].items()
+            )
+            assert energy == pytest.approx(
+                2.0
+                + sum(linear[i] * x[i] for i in range(3))
+                + sum(dense[i][j] * x[i] * x[j] for i in range(3) for j in range(3))
+            )
+            assert energy == pytest.approx(
+                ising["offset"]
+                + sum(h[i] * spins[i] for i in range(3))
+                + sum(
+                    matrix[i][j] * spins[i] * spins[j]
+                    for i in range(3)
+                    for j in range(3)
+                )
+            )
+
+    @pytest.mark.asyncio
+    async def test_lead_mapper_emits_sparse_qubo(self):
+        """SigmaLeadMapper returns a SparseQUBO and densifies only on request"""
+        leads = [
+            {
+                "id": f"lead_{i}",
+                "engagement_score": 0.2 * i,
+                "budget_score": 0.5,
+                "authority_score": 0.5,
+            }
+            for i in range(4)
+        ]
+        problem = {"leads": leads, "channels": ["email", "phone"], "max_leads": 2}
+
+        mapped = await SigmaLeadMapper().map_to_qubo(problem)
+        assert isinstance(mapped["qubo"], SparseQUBO)
+        assert mapped["qubo"].num_variables == 12
+        assert "qubo_matrix" not in mapped
+
+        dense = await SigmaLeadMapper().map_to_qubo({**problem, "dense_output": True})
+        assert len(dense["qubo_matrix"]) == 12
+        sample = [1, 0, 1, 0] + [1, 0, 0, 0, 0, 1, 0, 0]
+        matrix = dense["qubo_matrix"]
+        quadratic = sum(
+            matrix[i][j] * sample[i] * sample[j] for i in range(12) for j in range(12)
+        )
+        assert mapped["qubo"].energy(sample) == pytest.approx(
+            quadratic + dense["constant_term"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_solvers_consume_sparse_qubo(self):
+        """The classical solver and result cache accept a SparseQUBO directly"""
+        qubo = SparseQUBO([-1.0, -1.0], [0], [1], [2.0], offset=1.0)
+        assert qubo_cache_key(qubo) == qubo_cache_key(
+            {(0, 0): -1.0, (1, 1): -1.0, (0, 1): 2.0}, offset=1.0
+        )
+
+        solver = DimodSolver()
+        if not solver.available:
+            pytest.skip("dimod not installed")
+        result = await solver.solve(
+            {"operation": "qubo", "inputs": {"qubo_matrix": qubo}}
+        )
+        assert result["objective_value"] == 0.0
+
+
+class TestBatchSubmission:
+    """Test batch submission, single-pass solving and streamed results"""
+
+    @staticmethod
+    def _qubo_request(seed, n=30):
+        return OptimizationRequest(
+            operation="qubo",
+            inputs={
+                "qubo_matrix": TestNumpySimulatedAnnealer._random_qubo(n, 0.2, seed),
+                "seed": 1,
+            },
+            solver_preference=SolverType.CLASSICAL_DIMOD,
+        )
+
+    def test_sample_many_matches_individual_ground_states(self):
+        """Block-diagonal annealing recovers each problem's optimum"""
+        dimod = pytest.importorskip("dimod")
+        qubos = [TestNumpySimulatedAnnealer._random_qubo(10, 0.4, s) for s in range(4)]
+
+        results = NumpySimulatedAnnealer(seed=2).sample_many(
+            qubos, offsets=[0.0, 1.0, 0.0, 0.0]
+        )
+
+        assert len(results) == 4
+        for qubo, offset, result in zip(qubos, [0.0, 1.0, 0.0, 0.0], results):
+            exact = dimod.ExactSolver().sample_qubo(qubo).first.energy
+            assert result.best_energy == pytest.approx(exact + offset)
+            assert result.info["batch_size"] == 4
+            assert dimod.BQM.from_qubo(qubo, offset).energy(
+                result.best_sample
+            ) == pytest.approx(result.best_energy)
+
+    def test_batch_shares_idempotency_namespace(self):
+        """Items dedupe against single jobs, each other and batch keys"""
+        hub = QuantumIntegrationHub(enable_result_cache=False)
+        single = hub.submit_job("user", self._qubo_request(0), "key-0")
+
+        batch_id = hub.submit_batch(
+            "user",
+            [self._qubo_request(0), self._qubo_request(1), self._qubo_request(1)],
+            idempotency_key="batch-key",
+            item_keys=["key-0", "key-1", "key-1"],
+        )
+        status = hub.get_batch_status(batch_id)
+
+        job_ids = [job["job_id"] for job in status["jobs"]]
+        assert job_ids[0] == single
+        assert job_ids[1] == job_ids[2]
+        assert hub.count_jobs() == 2
+        assert hub.submit_batch("user", [], idempotency_key="batch-key") == batch_id
+
+    @pytest.mark.asyncio
+    async def test_batch_solved_in_one_pass_and_streamed(self):
+        """Compatible jobs share one solve_batch call; results stream back"""
+        hub = QuantumIntegrationHub(enable_result_cache=False)
+        solver = hub.solvers.get(SolverType.CLASSICAL_DIMOD)
+        if solver is None:
+            pytest.skip("dimod not installed")
+
+        batch_id = hub.submit_batch(
+            "user", [self._qubo_request(seed) for seed in range(3)]
+        )
+        with patch.object(
+            solver, "solve_batch", wraps=solver.solve_batch
+        ) as solve_batch:
+            await hub._execute_job(hub.job_queue.pop())
+
+        assert solve_batch.call_count == 1
+        assert len(hub.job_queue) == 0
+
+        streamed = [job async for job in hub.iter_batch_results(batch_id, timeout=1)]
+        assert len(streamed) == 3
+        for job in streamed:
+            assert job["status"] == "completed"
+            assert job["batch_id"] == batch_id
+            assert job["result"]["metadata"]["batch_size"] == 3
+        assert hub.get_batch_status(batch_id)["is_finished"] is True
+
+    @pytest.mark.asyncio
+    async def test_unbatchable_siblings_stay_queued(self):
+        """Only batch-solvable siblings are pulled off the queue"""
+        hub = QuantumIntegrationHub(enable_result_cache=False)
+        solver = hub.solvers.get(SolverType.CLASSICAL_DIMOD)
+        if solver is None:
+            pytest.skip("dimod not installed")
+
+        routing = [OptimizationRequest(operation="routing", inputs={}) for _ in range(2)]
+        batch_id = hub.submit_batch(
+            "user", [self._qubo_request(0), self._qubo_request(1)] + routing
+        )
+        with patch.object(
+            solver, "solve_batch", wraps=solver.solve_batch
+        ) as solve_batch:
+            await hub._execute_job(hub.job_queue.pop())
+
+        assert solve_batch.call_count == 1
+        job_ids = hub.batches[batch_id].job_ids
+        assert [hub.jobs[job_id].status for job_id in job_ids] == [
+            JobStatus.COMPLETED,
+            JobStatus.COMPLETED,
+            JobStatus.QUEUED,
+            JobStatus.QUEUED,
+        ]
+        assert len(hub.job_queue) == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_in_completion_order(self):
+        """Results are yielded as each job finishes, not in submission order"""
+        hub = QuantumIntegrationHub(enable_result_cache=False)
+        batch_id = hub.submit_batch(
+            "user",
+            [OptimizationRequest(operation="routing", inputs={}) for _ in range(2)],
+        )
+        first, second = hub.batches[batch_id].job_ids
+        result = OptimizationResult({}, 0.0, SolverType.CLASSICAL_ORTOOLS, 1)
+
+        async def finish_later():
+            await asyncio.sleep(0.01)
+            hub.jobs[second].status = JobStatus.RUNNING
+            hub._complete_job(hub.jobs[second], result)
+            await asyncio.sleep(0.01)
+            hub.jobs[first].status = JobStatus.RUNNING
+            hub._complete_job(hub.jobs[first], result)
+
+        task = asyncio.create_task(finish_later())
+        order = [job["job_id"] async for job in hub.iter_batch_results(batch_id, 1)]
+        await task
+
+        assert order == [second, first]
+
+
+class TestJobStore:
+    """Test persistent job state and crash recovery"""
+
+    @staticmethod
+    def _request(index):
+        return OptimizationRequest(operation="routing", inputs={"index": index})
+
+    @staticmethod
+    def _result():
+        return OptimizationResult({"x": 1}, -1.0, SolverType.CLASSICAL_ORTOOLS, 5)
+
+    def test_recovers_unfinished_jobs_after_restart(self, tmp_path):
+        """Queued and running jobs are re-queued; finished ones stay put"""
+        store = SQLiteJobStore(tmp_path / "jobs.db")
+        hub = QuantumIntegrationHub(enable_result_cache=False, job_store=store)
+        queued = hub.submit_job("user", self._request(0), "key-0")
+        running = hub.submit_job("user", self._request(1))
+        done = hub.submit_job("user", self._request(2))
+
+        hub.job_queue.discard(running)
+        hub.jobs[running].status = JobStatus.RUNNING
+        hub.job_queue.discard(done)
+        hub.jobs[done].status = JobStatus.RUNNING
+        hub._complete_job(hub.jobs[done], self._result())
+        store.close()
+
+        restarted = QuantumIntegrationHub(
+            enable_result_cache=False, job_store=SQLiteJobStore(tmp_path / "jobs.db")
+        )
+        assert set(restarted.jobs) == {queued, running}
+        assert set(restarted.job_queue) == {queued, running}
+        assert restarted.jobs[running].status == JobStatus.QUEUED
+        assert restarted.jobs[queued].request.inputs == {"index": 0}
+
+        # Finished jobs and idempotency keys are served from the store
+        status = restarted.get_job_status(done)
+        assert status["status"] == "completed"
+        assert status["result"]["objective_value"] == -1.0
+        assert restarted.submit_job("user", self._request(0), "key-0") == queued
+        restarted.job_store.close()
+
+    @pytest.mark.parametrize("store_type", ["memory", "sqlite"])
+    def test_results_are_loaded_lazily(self, store_type, tmp_path):
+        """Completed results live in the store, not on the in-memory job"""
+        store = (
+            InMemoryJobStore()
+            if store_type == "memory"
+            else SQLiteJobStore(tmp_path / "jobs.db")
+        )
+        hub = QuantumIntegrationHub(enable_result_cache=False, job_store=store)
+        job_id = hub.submit_job("user", self._request(0))
+        hub.jobs[job_id].status = JobStatus.RUNNING
+        hub._complete_job(hub.jobs[job_id], self._result())
+
+        assert hub.jobs[job_id].result is None
+        assert hub.get_job_status(job_id)["result"]["solution"] == {"x": 1}
+        assert hub.get_user_jobs("user")[0]["result"]["objective_value"] == -1.0
+
+        record, _ = store.load(job_id)
+        assert record["status"] == "completed"
+        assert record["completed_at"] is not None
+        store.close()
+
+    @pytest.mark.parametrize("store_type", ["memory", "sqlite"])
+    def test_idempotency_lookup_does_not_flush(self, store_type, tmp_path):
+        """Keyed submits are answered from the key index, not by flushing"""
+        store = (
+            InMemoryJobStore()
+            if store_type == "memory"
+            else SQLiteJobStore(tmp_path / "jobs.db", flush_interval=60)
+        )
+        hub = QuantumIntegrationHub(enable_result_cache=False, job_store=store)
+        store.flush = Mock(side_effect=store.flush)
+        job_ids = [
+            hub.submit_job("user", self._request(i), f"key-{i}") for i in range(20)
+        ]
+
+        store.flush.assert_not_called()
+        assert store.find_by_idempotency_key("key-3") == job_ids[3]
+        assert store.find_by_idempotency_key("missing") is None
+
+        store.flush()
+        assert store.find_by_idempotency_key("key-3") == job_ids[3]
+        hub._remove_job(job_ids[3])
+        store.flush()
+        assert store.find_by_idempotency_key("key-3") is None
+        store.close()
+
+    def test_jobs_leased_by_live_store_are_not_reclaimed(self, tmp_path):
+        """A second hub only recovers jobs whose owner's lease has expired"""
+        path = tmp_path / "jobs.db"
+        owner = SQLiteJobStore(path)
+        hub = QuantumIntegrationHub(enable_result_cache=False, job_store=owner)
+        queued = hub.submit_job("user", self._request(0))
+        running = hub.submit_job("user", self._request(1))
+        hub.job_queue.discard(running)
+        hub.jobs[running].status = JobStatus.RUNNING
+        owner.flush()
+
+        other_store = SQLiteJobStore(path)
+        other = QuantumIntegrationHub(enable_result_cache=False, job_store=other_store)
+        assert other.jobs == {}
+        assert hub.jobs[running].status == JobStatus.RUNNING
+
+        # The owner stops renewing its leases, e.g. because its process died
+        with sqlite3.connect(path) as conn:
+            conn.execute("UPDATE qih_jobs SET lease_expires_at = 0")
+        other._recover_jobs()
+
+        assert set(other.jobs) == {queued, running}
+        assert other.jobs[running].status == JobStatus.QUEUED
+        other_store.flush()
+        with sqlite3.connect(path) as conn:
+            owners = {row[0] for row in conn.execute("SELECT owner FROM qih_jobs")}
+        assert owners == {other_store.owner_id}
+        owner.close()
+        other_store.close()
+
+    def test_transitions_are_coalesced(self, tmp_path):
+        """Several transitions before a flush become one row write"""
+        store = SQLiteJobStore(tmp_path / "jobs.db", flush_interval=60)
+        hub = QuantumIntegrationHub(enable_result_cache=False, job_store=store)
+        job_id = hub.submit_job("user", self._request(0))
+        job = hub.jobs[job_id]
+        job.status = JobStatus.RUNNING
+        job.status = JobStatus.FAILED
+
+        assert len(store._dirty) == 1
+        store.flush()
+        assert not store._dirty
+        assert store.load(job_id)[0]["status"] == "failed"
+        store.close()
+
+    def test_failed_flush_keeps_pending_changes(self, tmp_path):
+        """A flush that fails, e.g. on a locked database, is retried later"""
+        store = SQLiteJobStore(tmp_path / "jobs.db", flush_interval=60)
+        hub = QuantumIntegrationHub(enable_result_cache=False, job_store=store)
+        job_id = hub.submit_job("user", self._request(0), "key-0")
+        hub.jobs[job_id].status = JobStatus.RUNNING
+        hub._complete_job(hub.jobs[job_id], self._result())
+
+        locked = sqlite3.OperationalError("database is locked")
+        with patch.object(store, "_write", side_effect=locked):
+            store.flush()
+        assert job_id in store._dirty
+        assert store.find_by_idempotency_key("key-0") == job_id
+
+        store.flush()
+        assert not store._dirty
+        record, request = store.load(job_id)
+        assert record["status"] == "completed"
+        assert request.inputs == {"index": 0}
+        assert store.load_result(job_id).objective_value == -1.0
+        store.close()
+
+
+class TestSolverPool:
+    """Test off-loop execution, timeouts and cancellation of blocking solves"""
+
+    @pytest.mark.asyncio
+    async def test_thread_pool_timeout_and_cancel(self):
+        """Timeouts raise promptly and cancelled tasks see the stop flag"""
+        from src.nqba_stack.quantum.adapters.solver_pool import cancel_requested
+
+        pool = SolverPool("thread", max_workers=2)
+
+        def wait_for_cancel():
+            deadline = time.monotonic() + 5
+            while not cancel_requested() and time.monotonic() < deadline:
+                time.sleep(0.005)
+            return cancel_requested()
+
+        start = time.monotonic()
+        with pytest.raises(asyncio.TimeoutError):
+            await pool.run(time.sleep, 1.0, timeout=0.05)
+        assert time.monotonic() - start < 0.5
+
+        task = asyncio.create_task(pool.run(wait_for_cancel, task_id="job-1"))
+        await asyncio.sleep(0.05)
+        assert await pool.cancel("job-1") is True
+        with pytest.raises(SolverCancelledError):
+            await task
+        assert await pool.cancel("job-1") is False
+        assert pool.get_metrics()["cancelled"] == 1
+        pool.shutdown(wait=True)
+
+    @pytest.mark.asyncio
+    async def test_dimod_solve_keeps_event_loop_responsive(self):
+        """A long anneal runs in a worker process and can be cancelled"""
+        solver = DimodSolver()
+        if not solver.available:
+            pytest.skip("dimod not installed")
+        qubo = TestNumpySimulatedAnnealer._random_qubo(200, 0.05, seed=3)
+
+        gaps = []
+
+        async def ticker():
+            last = time.monotonic()
+            while True:
+                await asyncio.sleep(0.01)
+                now = time.monotonic()
+                gaps.append(now - last)
+                last = now
+
+        ticks = asyncio.create_task(ticker())
+        solve = asyncio.create_task(
+            solver.solve(
+                {
+                    "job_id": "long-job",
+                    "operation": "qubo",
+                    "inputs": {"qubo_matrix": qubo, "num_sweeps": 1000000},
+                },
+                timeout=60,
+            )
+        )
+        # Give the worker process time to start and pick up the task
+        while sum(gaps) < 0.5:
+            await asyncio.sleep(0.05)
+
+        assert await solver.cancel("long-job") is True
+        with pytest.raises(SolverCancelledError):
+            await solve
+        ticks.cancel()
+
+        assert max(gaps) < 0.25
+
+    @pytest.mark.asyncio
+    async def test_hub_cancel_discards_running_result(self):
+        """A job cancelled mid-solve stays cancelled when the solver returns"""
+        hub = QuantumIntegrationHub(enable_result_cache=False)
+
+        async def slow_solve(job):
+            await asyncio.sleep(0.1)
+            return OptimizationResult({}, 0.0, SolverType.CLASSICAL_DIMOD, 100)
+
+        hub._solve_optimization = slow_solve
+        job_id = hub.submit_job("user", OptimizationRequest("qubo", {}))
+        running = asyncio.create_task(hub._execute_job(hub.job_queue.pop()))
+        await asyncio.sleep(0.01)
+
+        assert await hub.cancel_job(job_id) is True
+        await running
+        status = hub.get_job_status(job_id)
+        assert status["status"] == "failed"
+        assert status["error"] == "Cancelled by user"
+        assert status["result"] is None
+        assert await hub.cancel_job(job_id) is False
+
+
 class TestEntitlementsEngine:
     """Test the entitlements system"""
 
@@ -0,0 +1,471 @@
+"""
+Tests for the QSAI decision engine
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+import pytest_asyncio
+
+from src.nqba_stack import qsai_engine
+from src.nqba_stack.core.ltc_logger import LTCLogger
+from src.nqba_stack.qsai_engine import (
+    ActionProposal,
+    AgentType,
+    AuditEntry,
+    AuditTrailStore,
+    ContextStore,
+    ContextVector,
+    QSAIEngine,
+    ResourceSampler,
+    ResourceSnapshot,
+)
+
+
+@pytest.fixture
+def ltc(tmp_path):
+    ltc = LTCLogger()
+    ltc.db_path = tmp_path / "ltc_operations.db"
+    yield ltc
+    ltc.close()
+
+
+@pytest.fixture
+def engine(ltc):
+    engine = QSAIEngine(ltc)
+    yield engine
+    engine.safety_arbiter.resource_sampler.stop()
+    engine.agent_manager.close()
+
+
+def make_context(user_id="user_1", safety_flags=None):
+    return ContextVector(
+        user_id=user_id,
+        timestamp=datetime.now(),
+        telemetry={},
+        business_context={},
+        market_signals={},
+        safety_flags=safety_flags or [],
+    )
+
+
+def make_proposal(action_id="offer", reward=1.0, resources=None, **kwargs):
+    return ActionProposal(
+        agent_id=f"agent_{action_id}",
+        agent_type=AgentType.OFFER,
+        action_id=action_id,
+        payload={},
+        estimated_reward=reward,
+        confidence=0.9,
+        required_resources=resources or {},
+        **kwargs,
+    )
+
+
+class TestSafetyArbiterResources:
+    """Validation against the sampled resource snapshot"""
+
+    @pytest.mark.asyncio
+    async def test_proposals_are_checked_against_snapshot(self, engine, monkeypatch):
+        arbiter = engine.safety_arbiter
+        snapshot = ResourceSnapshot(cpu_cores_available=2.0, memory_available_mb=1024.0)
+        monkeypatch.setattr(arbiter.resource_sampler, "snapshot", lambda: snapshot)
+        proposals = [
+            make_proposal("fits", resources={"cpu_cores": 1, "memory_mb": 512}),
+            make_proposal("too_big", resources={"cpu_cores": 4, "memory_mb": 4096}),
+            make_proposal("non_numeric", resources={"hmi_display": True}),
+            make_proposal("blocked", compliance_status="pending_review"),
+        ]
+
+        results = await arbiter.validate_actions(proposals, make_context())
+
+        assert [valid for valid, _, _ in results] == [True, False, True, False]
+        assert results[1][1] == ["Insufficient resources: cpu_cores, memory_mb"]
+        assert results[1][2] == "resource_violation"
+        assert results[3][2] == "compliance_violation"
+
+    @pytest.mark.asyncio
+    async def test_validation_does_not_probe(self, engine, monkeypatch):
+        arbiter = engine.safety_arbiter
+        arbiter.resource_sampler.refresh()
+
+        def fail(*args):
+            raise AssertionError("probed on the request path")
+
+        monkeypatch.setattr(ResourceSampler, "_sample", fail)
+        monkeypatch.setattr(time, "sleep", fail)
+
+        results = await arbiter.validate_actions(
+            [make_proposal(resources={"quantum_nodes": 1})] * 4, make_context()
+        )
+
+        assert all(valid for valid, _, _ in results)
+
+    def test_sampler_refreshes_in_background(self):
+        sampler = ResourceSampler(interval=0.01)
+        sampler.start()
+        try:
+            first = sampler.snapshot()
+            deadline = time.time() + 5
+            while sampler.snapshot() is first and time.time() < deadline:
+                time.sleep(0.01)
+            assert sampler.snapshot() is not first
+        finally:
+            sampler.stop()
+        assert not sampler.running
+
+
+class SleepyAgent:
+    def __init__(self, action_id, delay, fail=False):
+        self.action_id = action_id
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    def propose_action(self, context):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("agent crashed")
+        return make_proposal(self.action_id)
+
+
+class AsyncSleepyAgent(SleepyAgent):
+    async def propose_action(self, context):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return make_proposal(self.action_id)
+
+
+class TestAgentFanOut:
+    """Concurrent proposals with deadlines and circuit breakers"""
+
+    @pytest.mark.asyncio
+    async def test_agents_run_concurrently(self, engine):
+        manager = engine.agent_manager
+        for i in range(3):
+            await manager.register_agent(
+                f"async_{i}", AgentType.OFFER, AsyncSleepyAgent(f"a{i}", 0.2)
+            )
+            await manager.register_agent(
+                f"sync_{i}", AgentType.OFFER, SleepyAgent(f"s{i}", 0.2)
+            )
+
+        start = time.perf_counter()
+        proposals = await manager.get_agent_proposals(
+            make_context(), [AgentType.OFFER], timeout=2.0
+        )
+        elapsed = time.perf_counter() - start
+
+        assert [p.action_id for p in proposals] == ["a0", "s0", "a1", "s1", "a2", "s2"]
+        assert elapsed < 0.2 * 6 / 2
+
+    @pytest.mark.asyncio
+    async def test_late_agents_are_dropped(self, engine):
+        manager = engine.agent_manager
+        await manager.register_agent("fast", AgentType.OFFER, SleepyAgent("fast", 0))
+        await manager.register_agent(
+            "slow", AgentType.OFFER, AsyncSleepyAgent("slow", 5)
+        )
+
+        start = time.perf_counter()
+        proposals = await manager.get_agent_proposals(
+            make_context(), [AgentType.OFFER], timeout=0.1
+        )
+
+        assert time.perf_counter() - start < 1
+        assert [p.action_id for p in proposals] == ["fast"]
+        assert manager.get_agent_metrics()["slow"]["timeouts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failing_agent_trips_breaker(self, engine):
+        manager = engine.agent_manager
+        broken = SleepyAgent("broken", 0, fail=True)
+        await manager.register_agent("broken", AgentType.OFFER, broken)
+
+        for _ in range(5):
+            await manager.get_agent_proposals(make_context(), [AgentType.OFFER])
+
+        assert broken.calls == manager.failure_threshold
+        assert manager.circuit_breakers["broken"].state == "open"
+
+        manager.circuit_breakers["broken"].opened_at -= manager.reset_timeout
+        broken.fail = False
+        proposals = await manager.get_agent_proposals(make_context(), [AgentType.OFFER])
+        assert [p.action_id for p in proposals] == ["broken"]
+        assert manager.circuit_breakers["broken"].state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_metrics_report_latency_histograms(self, engine):
+        await engine.agent_manager.register_agent(
+            "offer", AgentType.OFFER, SleepyAgent("offer", 0.01)
+        )
+        for _ in range(3):
+            await engine.agent_manager.get_agent_proposals(
+                make_context(), [AgentType.OFFER]
+            )
+
+        metrics = await engine.get_metrics()
+
+        latency = metrics["agents"]["offer"]["latency"]
+        assert latency["count"] == 3
+        assert 0.01 <= latency["p99"] <= 0.025
+        assert sum(latency["buckets"].values()) == 3
+        assert "decision_latency" in metrics
+
+
+class FakeDynex:
+    """Records submissions and answers with a fixed sample"""
+
+    def __init__(self, selected=()):
+        self.submissions = []
+        self.selected = set(selected)
+
+    async def submit_qubo(self, qubo, algorithm="qaoa", parameters=None):
+        self.submissions.append(qubo)
+        if isinstance(qubo, dict):
+            variables = set(qubo["linear"])
+        else:
+            variables = set(range(len(qubo)))
+        sample = {v: int(v in self.selected) for v in variables}
+        return {"first_sample": sample, "status": "completed"}
+
+
+class FixedAgent:
+    def __init__(self, action_id, reward):
+        self.action_id = action_id
+        self.reward = reward
+
+    def propose_action(self, context):
+        return make_proposal(f"{self.action_id}_{context.user_id}", self.reward)
+
+
+class TestBatchedDecisions:
+    """Micro-batched action selection"""
+
+    @pytest_asyncio.fixture
+    async def batch_engine(self, engine):
+        # Send every block to (fake) Dynex instead of solving it exactly
+        engine.meta_controller.exact_max_variables = 0
+        for i, reward in enumerate((1.0, 3.0, 2.0)):
+            await engine.agent_manager.register_agent(
+                f"agent_{i}", AgentType.OFFER, FixedAgent(f"action{i}", reward)
+            )
+        return engine
+
+    def test_block_diagonal_qubo_keeps_blocks_apart(self, engine):
+        a = np.array([[-1.0, 2.0], [0.0, -3.0]])
+        b = np.array([[-5.0]])
+
+        qubo = engine.meta_controller._block_diagonal_qubo([a, b, a])
+
+        assert qubo["linear"] == {0: -1, 1: -3, 2: -5, 3: -1, 4: -3}
+        assert qubo["quadratic"] == {(0, 1): 2.0, (3, 4): 2.0}
+
+    @pytest.mark.asyncio
+    async def test_batch_uses_one_submission(self, batch_engine):
+        # Variables 1, 4, 7: the second proposal of each context
+        dynex = batch_engine.meta_controller.dynex = FakeDynex(selected={1, 4, 7})
+        contexts = [make_context(f"user_{i}") for i in range(3)]
+
+        decisions = await batch_engine.process_batch(contexts)
+
+        assert len(dynex.submissions) == 1
+        assert len(dynex.submissions[0]["linear"]) == 9
+        assert [d.expected_uplift for d in decisions] == [3.0, 3.0, 3.0]
+        assert batch_engine.metrics["decisions_made"] == 3
+
+    @pytest.mark.asyncio
+    async def test_unselected_blocks_fall_back_to_classical(self, batch_engine):
+        batch_engine.meta_controller.dynex = FakeDynex()
+
+        decisions = await batch_engine.process_batch([make_context("user_0")])
+
+        assert decisions[0].action_id == "action1_user_0"
+
+    @pytest.mark.asyncio
+    async def test_submitted_contexts_share_a_batch(self, batch_engine):
+        dynex = batch_engine.meta_controller.dynex = FakeDynex()
+        batch_engine.batch_window = 0.05
+
+        decisions = await asyncio.gather(
+            *(batch_engine.submit_context(make_context(f"user_{i}")) for i in range(5))
+        )
+
+        assert len(dynex.submissions) == 1
+        assert [d.action_id for d in decisions] == [
+            f"action1_user_{i}" for i in range(5)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_is_flushed_immediately(self, batch_engine):
+        dynex = batch_engine.meta_controller.dynex = FakeDynex()
+        batch_engine.batch_window = 60
+        batch_engine.max_batch_size = 4
+
+        decisions = await asyncio.wait_for(
+            asyncio.gather(
+                *(
+                    batch_engine.submit_context(make_context(f"user_{i}"))
+                    for i in range(4)
+                )
+            ),
+            timeout=5,
+        )
+
+        assert all(decisions)
+        assert len(dynex.submissions) == 1
+
+
+class TestExactActionSelection:
+    """Small action-selection QUBOs are solved exactly"""
+
+    @pytest.mark.asyncio
+    async def test_small_selection_skips_dynex(self, engine):
+        dynex = engine.meta_controller.dynex = FakeDynex()
+        proposals = [
+            make_proposal("offer_charging", 2.0),
+            make_proposal("offer_maintenance", 3.0),
+            make_proposal("urgent_notification", 1.0),
+        ]
+
+        decision = await engine.meta_controller.optimize_action_selection(
+            proposals, make_context()
+        )
+
+        # Charging and maintenance exclude each other
+        assert dynex.submissions == []
+        assert decision.action_id == "composite"
+        assert decision.expected_uplift == pytest.approx(4.0)
+        assert "exact QUBO enumeration" in decision.rationale
+
+    @pytest.mark.asyncio
+    async def test_larger_exact_selection_runs_off_the_event_loop(
+        self, engine, monkeypatch
+    ):
+        on_loop_thread = []
+        solve_exact = qsai_engine.solve_exact
+
+        def recording_solve_exact(qubo):
+            on_loop_thread.append(threading.current_thread() is threading.main_thread())
+            return solve_exact(qubo)
+
+        monkeypatch.setattr(qsai_engine, "solve_exact", recording_solve_exact)
+        engine.meta_controller.dynex = FakeDynex()
+        engine.meta_controller.inline_exact_max_variables = 2
+        for count in (2, 3):
+            proposals = [make_proposal(f"a{i}", 1.0) for i in range(count)]
+            await engine.meta_controller.optimize_action_selection(
+                proposals, make_context()
+            )
+
+        assert on_loop_thread == [True, False]
+
+    @pytest.mark.asyncio
+    async def test_large_selection_goes_to_dynex(self, engine):
+        dynex = engine.meta_controller.dynex = FakeDynex(selected={0})
+        engine.meta_controller.exact_max_variables = 2
+        proposals = [make_proposal(f"a{i}", 1.0) for i in range(3)]
+
+        decision = await engine.meta_controller.optimize_action_selection(
+            proposals, make_context()
+        )
+
+        assert decision is not None
+        assert len(dynex.submissions) == 1
+
+
+def make_audit_entry(user_id, timestamp):
+    return AuditEntry(
+        entry_id=f"audit_{user_id}_{timestamp.timestamp()}",
+        decision_id="dec",
+        context_hash="",
+        agent_proposals=[],
+        final_decision={},
+        model_versions={},
+        policy_versions={},
+        safety_checks=[],
+        compliance_checks=[],
+        quantum_job_ids=[],
+        qubo_snapshots=[],
+        signature="",
+        timestamp=timestamp,
+        user_id=user_id,
+    )
+
+
+class TestBoundedStores:
+    """Retention-limited context, decision and audit stores"""
+
+    def test_context_store_evicts_least_recent_users(self):
+        store = ContextStore(max_entries=3)
+        for i in range(5):
+            store[f"user_{i}"] = make_context(f"user_{i}")
+        store["user_2"] = make_context("user_2")
+        store["user_5"] = make_context("user_5")
+
+        assert list(store) == ["user_4", "user_2", "user_5"]
+        assert "user_0" not in store
+
+    def test_context_store_expires_old_contexts(self, monkeypatch):
+        store = ContextStore(retention_seconds=60)
+        now = [1000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        store["old"] = make_context("old")
+        now[0] += 30
+        store["new"] = make_context("new")
+        now[0] += 45
+
+        assert list(store) == ["new"]
+
+    def test_audit_queries_by_user_and_time(self):
+        store = AuditTrailStore(bucket_seconds=60)
+        start = datetime(2024, 1, 1, 12, 0)
+        for minute in range(10):
+            for user in ("alice", "bob"):
+                store.append(make_audit_entry(user, start + timedelta(minutes=minute)))
+
+        entries = store.query(
+            "alice",
+            start + timedelta(minutes=2),
+            start + timedelta(minutes=5, seconds=30),
+        )
+        assert [e.timestamp.minute for e in entries] == [2, 3, 4, 5]
+        assert {e.user_id for e in entries} == {"alice"}
+        assert [e.timestamp.minute for e in store.query("bob", limit=3)] == [7, 8, 9]
+        assert len(store.query(limit=0)) == 20
+
+    def test_audit_store_drops_expired_buckets(self):
+        store = AuditTrailStore(
+            retention_seconds=300, bucket_seconds=60, max_entries=1000
+        )
+        start = datetime(2024, 1, 1)
+        for minute in range(60):
+            store.append(make_audit_entry("alice", start + timedelta(minutes=minute)))
+
+        assert len(store) <= 6
+        assert min(e.timestamp for e in store) >= start + timedelta(minutes=54)
+
+    @pytest.mark.asyncio
+    async def test_engine_stores_stay_bounded(self, ltc):
+        engine = QSAIEngine(ltc, max_decisions=20, max_contexts=10)
+        engine.meta_controller.dynex = FakeDynex()
+        await engine.agent_manager.register_agent(
+            "offer", AgentType.OFFER, FixedAgent("offer", 1.0)
+        )
+        try:
+            for i in range(100):
+                await engine.process_context(make_context(f"user_{i}"))
+
+            metrics = await engine.get_metrics()
+            assert metrics["decisions_made"] == 100
+            assert metrics["decisions_stored"] == 20
+            assert metrics["contexts_stored"] == 10
+            trail = await engine.get_audit_trail(user_id="user_42")
+            assert [entry["user_id"] for entry in trail] == ["user_42"]
+        finally:
+            await engine.shutdown()
@@ -0,0 +1,178 @@
+"""
+Tests for the SigmaEQ optimization engine
+"""
+
+import itertools
+from functools import reduce
+
+import numpy as np
+import pytest
+
+from goliath.quantum.qaoa_simulator import QAOASimulator, qubo_energies
+from goliath.quantum.sigmaeq_engine import (
+    OptimizationAlgorithm,
+    OptimizationProblem,
+    ProblemType,
+    SigmaEQEngine,
+)
+from nqba_stack.quantum.sparse_qubo import SparseQUBO
+
+
+def random_qubo(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.triu(rng.normal(size=(n, n)))
+
+
+def brute_force_energies(qubo):
+    n = len(qubo)
+    # Index bit k is x_k, so the last product position is x_0
+    states = np.array(list(itertools.product((0, 1), repeat=n)))[:, ::-1]
+    return np.einsum("bi,ij,bj->b", states, qubo, states)
+
+
+class TestQAOASimulator:
+    """Statevector QAOA"""
+
+    def test_energies_match_brute_force(self):
+        qubo = random_qubo(9)
+
+        assert np.allclose(qubo_energies(qubo), brute_force_energies(qubo))
+
+    def test_statevector_matches_dense_circuit(self):
+        qubo = random_qubo(5, seed=1)
+        sim = QAOASimulator(qubo)
+        gamma, beta = np.array([0.4, 0.9]), np.array([0.7, 0.2])
+
+        state = np.full(32, 32**-0.5, dtype=complex)
+        for g, b in zip(gamma, beta):
+            state = np.exp(-1j * g * sim._cost) * state
+            rx = np.array([[np.cos(b), 1j * np.sin(b)], [1j * np.sin(b), np.cos(b)]])
+            state = reduce(np.kron, [rx] * 5) @ state
+
+        assert np.allclose(sim.statevector(gamma, beta), state)
+
+    def test_optimization_lowers_expectation(self):
+        qubo = random_qubo(8, seed=2)
+        sim = QAOASimulator(qubo)
+
+        result = sim.optimize(p=2, max_iterations=60, shots=500, seed=0)
+
+        assert result.expectation < result.history[0]
+        assert result.expectation < qubo_energies(qubo).mean()
+        assert result.energy == pytest.approx(qubo_energies(qubo).min())
+        assert sum(result.counts.values()) == 500
+        assert result.solution @ qubo @ result.solution == pytest.approx(result.energy)
+
+    def test_qubit_limit(self):
+        with pytest.raises(ValueError):
+            QAOASimulator(np.zeros((5, 5)), max_qubits=4)
+
+
+class TestSigmaEQQAOA:
+    """QAOA through the engine"""
+
+    @pytest.mark.asyncio
+    async def test_qaoa_returns_real_solution(self):
+        engine = SigmaEQEngine()
+        qubo = random_qubo(10, seed=3)
+        problem = OptimizationProblem(problem_type=ProblemType.QUBO, data=qubo)
+
+        result = await engine.optimize(
+            problem,
+            OptimizationAlgorithm.QAOA,
+            {"p": 2, "max_iterations": 40, "seed": 1},
+        )
+
+        assert result.success, result.error_message
+        assert result.metadata["backend"] == "statevector"
+        assert result.optimal_value == pytest.approx(
+            result.solution @ qubo @ result.solution
+        )
+        assert result.optimal_value <= result.metadata["expectation"]
+        assert len(result.convergence_history) == 41
+
+    @pytest.mark.asyncio
+    async def test_qaoa_circuit_is_executed(self):
+        engine = SigmaEQEngine()
+        qubo = np.diag([1.0, -1.0, 1.0])
+        circuit = engine._create_qaoa_circuit(qubo, [0.6], [0.4])
+
+        result = await engine._execute_quantum_circuit(circuit, 2000)
+
+        counts = result["counts"]
+        assert result["backend"] == "statevector"
+        assert sum(counts.values()) == 2000
+        # The ground state 010 is measured more often than uniform (1/8)
+        assert counts["010"] > 2000 / 8
+
+    @pytest.mark.asyncio
+    async def test_qaoa_rejects_oversized_problems(self):
+        engine = SigmaEQEngine(max_qubits=64)
+        problem = OptimizationProblem(
+            problem_type=ProblemType.QUBO, data=np.zeros((30, 30))
+        )
+
+        result = await engine.optimize(problem, OptimizationAlgorithm.QAOA)
+
+        assert not result.success
+        assert "at most 22 qubits" in result.error_message
+
+
+class TestSigmaEQAnnealing:
+    """Annealing and parallel tempering through the engine"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", ["anneal", "parallel_tempering"])
+    async def test_annealing_finds_ground_state(self, mode):
+        engine = SigmaEQEngine()
+        qubo = random_qubo(12, seed=4)
+        problem = OptimizationProblem(problem_type=ProblemType.QUBO, data=qubo)
+
+        result = await engine.optimize(
+            problem,
+            OptimizationAlgorithm.QUANTUM_ANNEALING,
+            {"mode": mode, "num_sweeps": 300, "seed": 2},
+        )
+
+        assert result.success, result.error_message
+        assert result.optimal_value == pytest.approx(brute_force_energies(qubo).min())
+        assert result.solution @ qubo @ result.solution == pytest.approx(
+            result.optimal_value
+        )
+        assert result.metadata["mode"] == mode
+
+    @pytest.mark.asyncio
+    async def test_annealing_scales_past_qubit_budget(self):
+        engine = SigmaEQEngine(max_qubits=64)
+        rng = np.random.default_rng(5)
+        n, m = 10_000, 30_000
+        rows, cols = rng.integers(0, n, m), rng.integers(0, n, m)
+        keep = rows != cols
+        qubo = SparseQUBO(
+            rng.uniform(-1, 1, n), rows[keep], cols[keep], rng.uniform(-1, 1, m)[keep]
+        )
+        problem = OptimizationProblem(problem_type=ProblemType.QUBO, data=qubo)
+
+        result = await engine.optimize(
+            problem,
+            OptimizationAlgorithm.QUANTUM_ANNEALING,
+            {"num_reads": 4, "num_sweeps": 50, "seed": 0},
+        )
+
+        assert result.success, result.error_message
+        assert len(result.solution) == n
+        assert qubo.energy(result.solution) == pytest.approx(result.optimal_value)
+        assert result.optimal_value < 0
+
+    @pytest.mark.asyncio
+    async def test_unknown_annealing_mode(self):
+        engine = SigmaEQEngine()
+        problem = OptimizationProblem(
+            problem_type=ProblemType.QUBO, data=random_qubo(4)
+        )
+
+        result = await engine.optimize(
+            problem, OptimizationAlgorithm.QUANTUM_ANNEALING, {"mode": "quantum"}
+        )
+
+        assert not result.success
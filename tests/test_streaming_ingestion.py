@@ -0,0 +1,196 @@
+"""
+Tests for streaming ingestion: incremental parsers and row-group storage
+"""
+
+import json
+import tracemalloc
+
+import pytest
+
+from src.nqba_stack.training.ingestion_scheduler import IngestionScheduler
+from src.nqba_stack.training.streaming_ingestion import (
+    STREAM_READ_SIZE,
+    RowGroupReader,
+    RowGroupWriter,
+    iter_batches,
+    iter_records,
+    stream_to_row_groups,
+)
+from src.nqba_stack.training.stub_feed_server import StubFeedServer, generate_records
+
+
+async def chunks_of(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def collect(records):
+    return [record async for record in records]
+
+
+async def parse(data: bytes, fmt: str, size: int = 3, **kwargs):
+    return await collect(iter_records(chunks_of(data, size), fmt, **kwargs))
+
+
+class TestIncrementalParsers:
+    """Records split at arbitrary chunk boundaries"""
+
+    @pytest.mark.asyncio
+    async def test_json_lines(self):
+        data = b'{"a": 1}\r\n\n{"a": 2, "b": [1, 2]}\n3\n{"a": 4}'
+
+        assert await parse(data, "jsonl") == [
+            {"a": 1},
+            {"a": 2, "b": [1, 2]},
+            {"value": 3},
+            {"a": 4},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_csv(self):
+        data = 'id,name,price\n1,"Café, Inc",2.5\n2,"two\nlines",\n\n3,x,-7\n'
+
+        records = await parse(data.encode(), "csv", size=1)
+
+        assert records == [
+            {"id": 1, "name": "Café, Inc", "price": 2.5},
+            {"id": 2, "name": "two\nlines", "price": None},
+            {"id": 3, "name": "x", "price": -7},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_xml_children_of_root(self):
+        data = (
+            b"<feed><record id='a'><price>1.5</price><tag>x</tag><tag>y</tag>"
+            b"</record><record id='b'><price>2</price></record></feed>"
+        )
+
+        assert await parse(data, "xml", size=5) == [
+            {"id": "a", "price": 1.5, "tag": ["x", "y"]},
+            {"id": "b", "price": 2},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_xml_record_tag_ignores_namespaces(self):
+        data = (
+            b'<feed xmlns="http://www.w3.org/2005/Atom"><title>arXiv</title>'
+            b"<entry><id>1</id><author><name>A</name></author></entry>"
+            b"<entry><id>2</id></entry></feed>"
+        )
+
+        records = await parse(data, "xml", size=7, record_tag="entry")
+
+        assert records == [{"id": 1, "author": {"name": "A"}}, {"id": 2}]
+
+    @pytest.mark.asyncio
+    async def test_unsupported_format(self):
+        with pytest.raises(ValueError):
+            iter_records(chunks_of(b"", 1), "parquet")
+
+    @pytest.mark.asyncio
+    async def test_batches(self):
+        records = iter_records(chunks_of(b'{"a": 1}\n' * 7, 4), "jsonl")
+
+        batches = await collect(iter_batches(records, 3))
+
+        assert [len(batch) for batch in batches] == [3, 3, 1]
+
+
+class TestRowGroupFile:
+    @pytest.mark.asyncio
+    async def test_round_trip(self, tmp_path):
+        path = tmp_path / "feed.nqrg"
+        records = [{"id": i, "price": i / 2} for i in range(10)]
+        records[3]["note"] = "extra"
+
+        async with RowGroupWriter(path, metadata={"source_id": "s"}) as writer:
+            await writer.write(records[:4])
+            await writer.write(records[4:])
+
+        with RowGroupReader(path) as reader:
+            assert len(reader) == 10
+            assert len(reader.row_groups) == 2
+            assert reader.metadata == {"source_id": "s"}
+            assert reader.column(1, "price") == [r["price"] for r in records[4:]]
+            assert reader.column(1, "note") == [None] * 6
+            assert list(reader) == records
+
+    @pytest.mark.asyncio
+    async def test_failed_stream_leaves_no_file(self, tmp_path):
+        path = tmp_path / "feed.nqrg"
+
+        async def prepare(batch):
+            raise RuntimeError("validation crashed")
+
+        with pytest.raises(RuntimeError):
+            await stream_to_row_groups(
+                chunks_of(b'{"a": 1}\n' * 5, 4), "jsonl", path, 2, prepare=prepare
+            )
+
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_encrypted_columns(self, tmp_path):
+        path = tmp_path / "feed.nqrg"
+
+        async def encrypt(data):
+            return bytes(b ^ 0x5A for b in data)
+
+        async with RowGroupWriter(path, encrypt=encrypt) as writer:
+            await writer.write([{"secret": "value"}])
+
+        with pytest.raises(ValueError):
+            RowGroupReader(path)
+        with RowGroupReader(path, decrypt=lambda d: bytes(b ^ 0x5A for b in d)) as r:
+            assert list(r) == [{"secret": "value"}]
+
+
+async def stream_feed(server, tmp_path, fmt, records, batch_size=1000):
+    url = server.feed_url("prices", fmt)
+
+    async def consume(response):
+        return await stream_to_row_groups(
+            response.content.iter_chunked(STREAM_READ_SIZE),
+            fmt,
+            tmp_path / f"prices_{fmt}.nqrg",
+            batch_size,
+        )
+
+    async with IngestionScheduler() as scheduler:
+        return await scheduler.fetch(
+            "prices", url, read=consume, params={"records": records}
+        )
+
+
+class TestStreamingFromServer:
+    """Feeds streamed from the stub server straight into row groups"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fmt", ["jsonl", "csv", "xml"])
+    async def test_feed_is_stored_in_row_groups(self, tmp_path, fmt):
+        async with StubFeedServer() as server:
+            storage = await stream_feed(server, tmp_path, fmt, 5000)
+
+        assert storage["rows"] == 5000
+        assert storage["row_groups"] == 5
+        expected = list(generate_records("prices", 5000))
+        with RowGroupReader(storage["file_path"]) as reader:
+            assert list(reader) == expected
+        # Columnar and compressed: far smaller than the pretty-printed JSON
+        assert storage["size_bytes"] < len(json.dumps(expected, indent=2)) / 4
+
+    @pytest.mark.asyncio
+    async def test_peak_memory_does_not_grow_with_feed_size(self, tmp_path):
+        async with StubFeedServer() as server:
+            peaks = []
+            for records in (10_000, 50_000):
+                tracemalloc.start()
+                try:
+                    storage = await stream_feed(server, tmp_path, "jsonl", records)
+                    peaks.append(tracemalloc.get_traced_memory()[1])
+                finally:
+                    tracemalloc.stop()
+                assert storage["rows"] == records
+
+        # Five times the records, about the same peak
+        assert peaks[1] < 1.5 * peaks[0]